@@ -0,0 +1,89 @@
+/**
+ * animationScheduler.js
+ * Central per-frame animation loop owned by RoomEngine.
+ * All active animations advance together on the real frame delta in a
+ * single update() call; finished ones drop out. Animations are keyed, so
+ * starting one with a key that is already running replaces it instead of
+ * stacking a second loop (e.g. repeated door clicks).
+ */
+
+const MAX_STEP = 0.1; // Seconds - keeps easing stable after stalls or tab switches
+
+/** Cubic ease-out, the curve the door always used. */
+export function easeOutCubic(t) {
+    return 1 - Math.pow(1 - t, 3);
+}
+
+export class AnimationScheduler {
+    constructor() {
+        this.animations = new Map(); // key -> update(dt) => boolean (true while still running)
+        this._nextId = 0;
+    }
+
+    get activeCount() {
+        return this.animations.size;
+    }
+
+    /**
+     * Run update(dt) every frame until it returns false.
+     * @param {string|null} key - Replaces any running animation with the same key; null for anonymous
+     * @param {Function} update - Called with the frame delta in seconds
+     * @returns {string} The key, usable with cancel()
+     */
+    add(key, update) {
+        const id = key ?? `anim_${this._nextId++}`;
+        this.animations.set(id, update);
+        return id;
+    }
+
+    /**
+     * Time-based tween between two numbers.
+     * @param {string|null} key
+     * @param {Object} options
+     * @param {number} options.from
+     * @param {number} options.to
+     * @param {number} options.duration - Seconds
+     * @param {Function} [options.easing] - Maps 0..1 progress to 0..1
+     * @param {Function} options.onUpdate - Receives the current value
+     * @param {Function} [options.onComplete]
+     * @returns {string}
+     */
+    tween(key, { from, to, duration, easing = easeOutCubic, onUpdate, onComplete = null }) {
+        let elapsed = 0;
+        return this.add(key, (dt) => {
+            elapsed += dt;
+            const p = duration > 0 ? Math.min(1, elapsed / duration) : 1;
+            onUpdate(from + (to - from) * easing(p));
+            if (p < 1) return true;
+            if (onComplete) onComplete();
+            return false;
+        });
+    }
+
+    cancel(key) {
+        this.animations.delete(key);
+    }
+
+    clear() {
+        this.animations.clear();
+    }
+
+    /**
+     * Advance every active animation.
+     * @param {number} dt - Real frame delta in seconds
+     * @returns {number} Animations that ran this frame (0 means nothing moved)
+     */
+    update(dt) {
+        const count = this.animations.size;
+        if (count === 0) return 0;
+
+        const step = Math.min(dt, MAX_STEP);
+        this.animations.forEach((update, key) => {
+            // Compare before deleting: an update may have replaced itself under the same key
+            if (!update(step) && this.animations.get(key) === update) {
+                this.animations.delete(key);
+            }
+        });
+        return count;
+    }
+}
@@ -16,9 +16,12 @@ import {
     SCENE_BACKGROUND_COLOR,
     FOG_COLOR,
     FOG_NEAR,
-    FOG_FAR
+    FOG_FAR,
+    FIRST_FRAME_MARK,
+    INTERACTIVE_MARK
 } from './constants.js';
 import { TouchControls } from './touchControls.js';
+import { PointerInput } from './pointerInput.js';
 import { closeModal, isInteracting } from './ui.js';
 
 // --- CONSTANTS ---
@@ -394,7 +397,9 @@ const handleTouchInteract = () => {
         interact();
     }
 };
-const touchControls = new TouchControls(camera, raycaster, interactables, handleTouchInteract);
+const touchControls = new TouchControls(camera, raycaster, interactables, handleTouchInteract, null, renderer.domElement);
+// Touch pointers reach TouchControls through PointerInput; animate() applies them once per frame
+const pointerInput = new PointerInput({ target: document, touchHandler: touchControls });
 
 // Keys
 const keys = {
@@ -501,6 +506,7 @@ function setGameCursor(active) {
 
 // --- ANIMATION LOOP ---
 let prevTime = performance.now();
+let firstFrameMarked = false;
 
 function animate() {
     requestAnimationFrame(animate);
@@ -510,6 +516,11 @@ function animate() {
     prevTime = time;
 
     updateTimer(delta);
+    touchControls.update();
+    if (isInteracting) {
+        // Touch drags behind a modal must not turn the camera once it closes
+        touchControls.getLookDelta();
+    }
 
     if (!isInteracting && instructions && instructions.style.display === 'none') {
         setGameCursor(true);
@@ -573,6 +584,11 @@ function animate() {
     }
 
     renderer.render(scene, camera);
+    if (!firstFrameMarked) {
+        performance.mark(FIRST_FRAME_MARK);
+        performance.mark(INTERACTIVE_MARK); // No progressive build: interactive from the first frame
+        firstFrameMarked = true;
+    }
 }
 
 window.addEventListener('resize', () => {
@@ -4,9 +4,9 @@ console.log("classroom.js loaded");
 import * as THREE from 'three';
 import { RoomEngine } from './roomEngine.js';
 import { showModal } from './ui.js';
-import { initGame } from './gameLogic.js';
+import { initGame, customDataReady } from './gameLogic.js';
 import { WALL_HEIGHT } from './constants.js';
-import * as Prefabs from './prefabs.js';
+import * as Prefabs from './commonPrefabs.js';
 
 // Room Configuration
 const CLASSROOM_WIDTH = 12;
@@ -142,7 +142,11 @@ async function initClassroom() {
     engine.createDoor();
     engine.createTimer();
 
-    // Initialize game logic (puzzles, clues, etc.)
+    // Batch static meshes into instanced/merged draw calls
+    engine.optimizeStatic();
+
+    // Initialize game logic (puzzles, clues, etc.) once any custom question link has decoded
+    await customDataReady;
     initGame();
 
     // Start the engine
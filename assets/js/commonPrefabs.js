@@ -0,0 +1,245 @@
+import * as THREE from 'three';
+import { getGeometry, getMaterial } from './resourceCache.js';
+
+/**
+ * Prefabs shared by several rooms.
+ * Kept out of prefabs.js so the classroom and science lab can load them
+ * without the whole office catalogue; prefabs.js re-exports both.
+ */
+
+export function createDesk(width = 1.5, height = 0.75, depth = 0.8) {
+    const group = new THREE.Group();
+    const woodColor = 0x654321;
+    const woodMaterial = getMaterial(THREE.MeshStandardMaterial, { color: woodColor, roughness: 0.7 });
+
+    // Desktop
+    const top = new THREE.Mesh(
+        getGeometry(THREE.BoxGeometry, width, 0.05, depth),
+        woodMaterial
+    );
+    top.position.y = height;
+    top.castShadow = true;
+    top.receiveShadow = true;
+    group.add(top);
+
+    // Legs (4 corners)
+    const legRadius = 0.04;
+    const legGeometry = getGeometry(THREE.CylinderGeometry, legRadius, legRadius, height);
+    const positions = [
+        [width / 2 - 0.1, height / 2, depth / 2 - 0.1],
+        [width / 2 - 0.1, height / 2, -depth / 2 + 0.1],
+        [-width / 2 + 0.1, height / 2, depth / 2 - 0.1],
+        [-width / 2 + 0.1, height / 2, -depth / 2 + 0.1]
+    ];
+
+    positions.forEach(pos => {
+        const leg = new THREE.Mesh(legGeometry, woodMaterial);
+        leg.position.set(...pos);
+        leg.castShadow = true;
+        group.add(leg);
+    });
+
+    // Drawers (3-drawer stack on right side)
+    const drawerWidth = width * 0.4;
+    const drawerDepth = depth - 0.1;
+    const drawerHeight = height * 0.25;
+    const drawerSpacing = height * 0.05;
+    const drawerMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x5a3a1a, roughness: 0.6 });
+    const handleMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x888888, metalness: 0.7 });
+
+    // Array to store drawer references for animation
+    group.userData.drawers = [];
+
+    for (let i = 0; i < 3; i++) {
+        // Create drawer group to move drawer + handle together
+        const drawerGroup = new THREE.Group();
+        drawerGroup.position.set(
+            width * 0.25,
+            drawerSpacing + (i * (drawerHeight + drawerSpacing)) + drawerHeight / 2,
+            0
+        );
+
+        // Drawer as an open box (front, bottom, left, right, back - no top)
+        const drawerThickness = 0.02;
+
+        // Front face
+        const drawerFront = new THREE.Mesh(
+            getGeometry(THREE.BoxGeometry, drawerWidth, drawerHeight, drawerThickness),
+            drawerMaterial
+        );
+        drawerFront.position.z = drawerDepth / 2 - drawerThickness / 2;
+        drawerFront.castShadow = true;
+        drawerFront.name = `drawer_${i}_front`; // Name for interaction
+        drawerGroup.add(drawerFront);
+
+        // Bottom
+        const drawerBottom = new THREE.Mesh(
+            getGeometry(THREE.BoxGeometry, drawerWidth, drawerThickness, drawerDepth - drawerThickness),
+            drawerMaterial
+        );
+        drawerBottom.position.y = -drawerHeight / 2 + drawerThickness / 2;
+        drawerBottom.castShadow = true;
+        drawerBottom.name = `drawer_${i}_bottom`;
+        drawerGroup.add(drawerBottom);
+
+        // Left side
+        const drawerLeft = new THREE.Mesh(
+            getGeometry(THREE.BoxGeometry, drawerThickness, drawerHeight, drawerDepth - drawerThickness),
+            drawerMaterial
+        );
+        drawerLeft.position.x = -drawerWidth / 2 + drawerThickness / 2;
+        drawerLeft.castShadow = true;
+        drawerLeft.name = `drawer_${i}_left`;
+        drawerGroup.add(drawerLeft);
+
+        // Right side
+        const drawerRight = new THREE.Mesh(
+            getGeometry(THREE.BoxGeometry, drawerThickness, drawerHeight, drawerDepth - drawerThickness),
+            drawerMaterial
+        );
+        drawerRight.position.x = drawerWidth / 2 - drawerThickness / 2;
+        drawerRight.castShadow = true;
+        drawerRight.name = `drawer_${i}_right`;
+        drawerGroup.add(drawerRight);
+
+        // Back
+        const drawerBack = new THREE.Mesh(
+            getGeometry(THREE.BoxGeometry, drawerWidth, drawerHeight, drawerThickness),
+            drawerMaterial
+        );
+        drawerBack.position.z = -drawerDepth / 2 + drawerThickness / 2;
+        drawerBack.castShadow = true;
+        drawerBack.name = `drawer_${i}_back`;
+        drawerGroup.add(drawerBack);
+
+        // Drawer handle (positioned on the front face)
+        const handle = new THREE.Mesh(
+            getGeometry(THREE.CylinderGeometry, 0.02, 0.02, 0.1),
+            handleMaterial
+        );
+        handle.rotation.z = Math.PI / 2;
+        handle.position.set(0, 0, drawerDepth / 2 + 0.01); // Just in front of drawer front
+        handle.name = `drawer_${i}_handle`; // Also make handle clickable
+        drawerGroup.add(handle);
+
+        // Store metadata on the group for animation
+        drawerGroup.userData.isOpen = false;
+        drawerGroup.userData.drawerIndex = i;
+        drawerGroup.userData.targetZ = 0; // For animation
+        drawerGroup.userData.openDistance = 0.3; // How far drawer slides out
+
+        // Store reference to drawerGroup on ALL drawer parts for easy clicking
+        drawerFront.userData.drawerGroup = drawerGroup;
+        drawerBottom.userData.drawerGroup = drawerGroup;
+        drawerLeft.userData.drawerGroup = drawerGroup;
+        drawerRight.userData.drawerGroup = drawerGroup;
+        drawerBack.userData.drawerGroup = drawerGroup;
+        handle.userData.drawerGroup = drawerGroup;
+
+        group.add(drawerGroup);
+        group.userData.drawers.push(drawerGroup);
+    }
+
+    return group;
+}
+
+export function createFireExtinguisher() {
+    const group = new THREE.Group();
+    const redMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xcc0000, metalness: 0.3, roughness: 0.4 });
+    const metalMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xaaaaaa, metalness: 0.8 });
+    const blackMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x111111 });
+
+    // Tank
+    const tank = new THREE.Mesh(
+        getGeometry(THREE.CylinderGeometry, 0.1, 0.1, 0.5, 16),
+        redMaterial
+    );
+    tank.position.y = 0.25;
+    tank.castShadow = true;
+    group.add(tank);
+
+    // Top dome
+    const dome = new THREE.Mesh(
+        getGeometry(THREE.SphereGeometry, 0.1, 16, 8, 0, Math.PI * 2, 0, Math.PI / 2),
+        redMaterial
+    );
+    dome.position.y = 0.5;
+    group.add(dome);
+
+    // Valve Assembly
+    const valve = new THREE.Mesh(
+        getGeometry(THREE.CylinderGeometry, 0.03, 0.03, 0.1),
+        metalMaterial
+    );
+    valve.position.y = 0.55;
+    group.add(valve);
+
+    // Handle (Lever)
+    const handleLower = new THREE.Mesh(
+        getGeometry(THREE.BoxGeometry, 0.02, 0.01, 0.12),
+        metalMaterial
+    );
+    handleLower.position.set(0.04, 0.54, 0);
+    group.add(handleLower);
+
+    const handleUpper = new THREE.Mesh(
+        getGeometry(THREE.BoxGeometry, 0.02, 0.01, 0.12),
+        metalMaterial
+    );
+    handleUpper.position.set(0.04, 0.58, 0);
+    handleUpper.rotation.z = 0.2;
+    group.add(handleUpper);
+
+    // Pressure Gauge
+    const gauge = new THREE.Mesh(
+        getGeometry(THREE.CylinderGeometry, 0.025, 0.025, 0.01, 16),
+        metalMaterial
+    );
+    gauge.rotation.x = Math.PI / 2;
+    gauge.position.set(0, 0.55, 0.04);
+    group.add(gauge);
+
+    const gaugeFace = new THREE.Mesh(
+        getGeometry(THREE.CircleGeometry, 0.02, 16),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0xffffff })
+    );
+    gaugeFace.rotation.y = 0; // Face Z
+    gaugeFace.position.set(0, 0.55, 0.046);
+    group.add(gaugeFace);
+
+    // Green zone on gauge
+    const gaugeGreen = new THREE.Mesh(
+        getGeometry(THREE.CircleGeometry, 0.01, 16, 0, Math.PI),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x00ff00 })
+    );
+    gaugeGreen.rotation.y = 0;
+    gaugeGreen.position.set(0, 0.55, 0.047);
+    group.add(gaugeGreen);
+
+    // Nozzle Hose
+    const hose = new THREE.Mesh(
+        getGeometry(THREE.TorusGeometry, 0.15, 0.015, 8, 16, Math.PI * 1.5),
+        blackMaterial
+    );
+    hose.position.set(-0.1, 0.3, 0);
+    hose.rotation.z = Math.PI / 2;
+    group.add(hose);
+
+    const nozzleTip = new THREE.Mesh(
+        getGeometry(THREE.ConeGeometry, 0.03, 0.1, 16),
+        blackMaterial
+    );
+    nozzleTip.position.set(-0.1, 0.15, 0.15);
+    nozzleTip.rotation.x = -Math.PI / 4;
+    group.add(nozzleTip);
+
+    // Add hitbox
+    const hitbox = new THREE.Mesh(
+        getGeometry(THREE.CylinderGeometry, 0.15, 0.15, 0.7, 8),
+        getMaterial(THREE.MeshBasicMaterial, { visible: false })
+    );
+    hitbox.position.y = 0.35;
+    group.add(hitbox);
+
+    return group;
+}
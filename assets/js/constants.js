@@ -53,6 +53,21 @@ export const FOG_FAR = 30;
 /** Default shadow map size for directional lights. */
 export const SHADOW_MAP_SIZE = 2048;
 
+/** Longest gap between frames in render-on-demand mode (ms), so timed UI changes still show. */
+export const RENDER_IDLE_INTERVAL_MS = 1000;
+
+/** performance.mark() name recorded when a room draws its first frame (read by bench_rooms.py). */
+export const FIRST_FRAME_MARK = 'room-first-frame';
+
+/** performance.mark() name recorded on the first frame drawn with interaction unlocked (time to interactive). */
+export const INTERACTIVE_MARK = 'room-interactive';
+
+/** Consecutive interactions with rising GPU geometry/texture counts before the debug leak check fires. */
+export const RESOURCE_GROWTH_LIMIT = 5;
+
+/** Layer that zones hidden behind closed portals are moved to; cameras and the raycaster never test it. */
+export const ZONE_CULLED_LAYER = 31;
+
 
 // --- OBJECT DIMENSIONS & PLACEMENT ---
 /** Height of the desk surface. */
@@ -124,9 +139,10 @@ export const LOCATIONS = [
     "keyboard", "mouse", "open_book", "chair",
     "pen_0", "pen_1", "pen_2",
     "printer", "fire_extinguisher", "lunchbox", "trophy", "radio", "typewriter", "hat",
-    // Sitting area (southwest corner)
-    "sofa", "armchair", "coffee_table", "tv", "floor_lamp",
-    "coffee_cup", "newspaper", "remote",
+    // Sitting area (southwest corner). The TV and remote run the puzzle chain and
+    // never show a question, so a clue placed on them could not be found
+    "sofa", "armchair", "coffee_table", "floor_lamp",
+    "coffee_cup", "newspaper",
     // Library bookshelf shelf rows (4 bookshelves × 4 shelves each = 16 interactive zones)
     "bookshelf_0_shelf_0", "bookshelf_0_shelf_1", "bookshelf_0_shelf_2", "bookshelf_0_shelf_3",
     "secret_bookshelf_shelf_0", "secret_bookshelf_shelf_1", "secret_bookshelf_shelf_2", "secret_bookshelf_shelf_3",
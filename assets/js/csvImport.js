@@ -0,0 +1,216 @@
+/**
+ * csvImport.js
+ * Streaming CSV question import for builder.html.
+ *
+ * CsvParser is an RFC 4180 parser that accepts input in arbitrary chunks:
+ * quoted fields may contain commas, "" escapes and line breaks, and a chunk
+ * boundary may fall anywhere (even between the two quotes of an escape).
+ * Whitespace around unquoted fields and outside quotes is trimmed, so
+ * "Math, What is 2+2?" keeps working as in the template placeholder.
+ *
+ * importCsv() drives the parser over a File (read as a byte stream) or a
+ * string, turns records into questions, validates and deduplicates them,
+ * and reports progress. It runs inside csvImportWorker.js; builder.html
+ * falls back to calling it directly when workers are unavailable.
+ */
+
+export const CHUNK_SIZE = 64 * 1024;
+const MAX_REPORTED_ERRORS = 20;
+
+export class CsvParser {
+    constructor() {
+        this.records = [];
+        this.record = [];
+        this.field = '';
+        this.quoted = false; // Current field started with a quote
+        this.inQuotes = false;
+        this.pendingQuote = false; // Saw a quote inside quotes; next char decides
+        this.pendingCR = false;
+        this.line = 1; // Line the current record starts on
+        this.nextLine = 1;
+    }
+
+    /**
+     * Feed a chunk of text.
+     * @param {string} chunk
+     * @returns {Array<{fields: string[], line: number}>} Records completed by this chunk
+     */
+    push(chunk) {
+        for (let i = 0; i < chunk.length; i++) {
+            const ch = chunk[i];
+
+            if (this.pendingCR) {
+                this.pendingCR = false;
+                if (ch === '\n') continue; // CRLF already ended the record
+            }
+
+            if (this.inQuotes) {
+                if (this.pendingQuote) {
+                    this.pendingQuote = false;
+                    if (ch === '"') {
+                        this.field += '"';
+                        continue;
+                    }
+                    this.inQuotes = false; // That quote closed the field; handle ch below
+                } else if (ch === '"') {
+                    this.pendingQuote = true;
+                    continue;
+                } else {
+                    if (ch === '\n') this.nextLine++;
+                    this.field += ch;
+                    continue;
+                }
+            }
+
+            if (ch === ',') {
+                this._endField();
+            } else if (ch === '\n' || ch === '\r') {
+                this._endField();
+                this._endRecord();
+                this.pendingCR = ch === '\r';
+                this.nextLine++;
+                this.line = this.nextLine;
+            } else if (ch === '"' && !this.quoted && this.field.trim() === '') {
+                this.quoted = true;
+                this.inQuotes = true;
+                this.field = '';
+            } else if (this.quoted) {
+                // Text after a closing quote: keep anything but padding
+                if (ch.trim() !== '') this.field += ch;
+            } else {
+                this.field += ch;
+            }
+        }
+        return this._take();
+    }
+
+    /**
+     * Flush the last record (input without a trailing newline).
+     * @returns {Array<{fields: string[], line: number}>}
+     */
+    finish() {
+        if (this.pendingQuote) {
+            this.pendingQuote = false;
+            this.inQuotes = false;
+        }
+        if (this.record.length > 0 || this.field !== '' || this.quoted) {
+            this._endField();
+            this._endRecord();
+        }
+        return this._take();
+    }
+
+    _endField() {
+        this.record.push(this.quoted ? this.field : this.field.trim());
+        this.field = '';
+        this.quoted = false;
+    }
+
+    _endRecord() {
+        // A blank line is a single empty field - skip it
+        if (!(this.record.length === 1 && this.record[0] === '')) {
+            this.records.push({ fields: this.record, line: this.line });
+        }
+        this.record = [];
+    }
+
+    _take() {
+        const done = this.records;
+        this.records = [];
+        return done;
+    }
+}
+
+/**
+ * Key used to spot duplicate questions (same topic, text and options).
+ * @param {Object} question - {t, q, o}
+ * @returns {string}
+ */
+export function questionKey(question) {
+    return [question.t, question.q, ...question.o].map(s => s.toLowerCase()).join('\u0000');
+}
+
+/**
+ * Validate one record: Topic, Question, Option 1-4, Correct Answer (1-4).
+ * @returns {{question?: Object, error?: string}}
+ */
+export function recordToQuestion(fields) {
+    if (fields.length < 7) return { error: `expected 7 columns, found ${fields.length}` };
+    const [t, q, ...rest] = fields;
+    const o = rest.slice(0, 4);
+    if (!t) return { error: 'missing topic' };
+    if (!q) return { error: 'missing question' };
+    const blank = o.findIndex(opt => !opt);
+    if (blank !== -1) return { error: `missing option ${blank + 1}` };
+    const c = Number(fields[6]);
+    if (!Number.isInteger(c) || c < 1 || c > 4) return { error: `correct answer must be 1-4, got "${fields[6]}"` };
+    return { question: { t, q, o, c: c - 1 } };
+}
+
+async function* fileChunks(file) {
+    const reader = file.stream().getReader();
+    const decoder = new TextDecoder();
+    let loaded = 0;
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        loaded += value.byteLength;
+        yield { text: decoder.decode(value, { stream: true }), loaded };
+    }
+    yield { text: decoder.decode(), loaded };
+}
+
+function* textChunks(text) {
+    for (let i = 0; i < text.length; i += CHUNK_SIZE) {
+        yield { text: text.slice(i, i + CHUNK_SIZE), loaded: Math.min(i + CHUNK_SIZE, text.length) };
+    }
+}
+
+/**
+ * Parse a CSV of questions.
+ * @param {File|Blob|string} source
+ * @param {Object} [options]
+ * @param {string[]} [options.existingKeys] - questionKey()s already in the builder
+ * @param {Function} [options.onProgress] - ({loaded, total, rows}) after each chunk
+ * @param {Function} [options.yieldEvery] - Awaited after each chunk (main-thread fallback)
+ * @returns {Promise<{questions: Object[], duplicates: number, invalid: number, errors: string[]}>}
+ */
+export async function importCsv(source, { existingKeys = [], onProgress = null, yieldEvery = null } = {}) {
+    const isText = typeof source === 'string';
+    const total = isText ? source.length : source.size;
+    const seen = new Set(existingKeys);
+    const parser = new CsvParser();
+    const result = { questions: [], duplicates: 0, invalid: 0, errors: [] };
+    let rows = 0;
+
+    const accept = (records) => {
+        for (const { fields, line } of records) {
+            rows++;
+            // Header row (heuristic: first column says "Topic")
+            if (rows === 1 && fields[0].toLowerCase().startsWith('topic')) continue;
+
+            const { question, error } = recordToQuestion(fields);
+            if (error) {
+                result.invalid++;
+                if (result.errors.length < MAX_REPORTED_ERRORS) result.errors.push(`Line ${line}: ${error}`);
+                continue;
+            }
+            const key = questionKey(question);
+            if (seen.has(key)) {
+                result.duplicates++;
+                continue;
+            }
+            seen.add(key);
+            result.questions.push(question);
+        }
+    };
+
+    const chunks = isText ? textChunks(source) : fileChunks(source);
+    for await (const { text, loaded } of chunks) {
+        accept(parser.push(text));
+        if (onProgress) onProgress({ loaded, total, rows });
+        if (yieldEvery) await yieldEvery();
+    }
+    accept(parser.finish());
+    return result;
+}
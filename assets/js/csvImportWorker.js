@@ -0,0 +1,23 @@
+/**
+ * csvImportWorker.js
+ * Runs importCsv() off the main thread for builder.html (module worker).
+ *
+ * In:  { source: File|string, existingKeys: string[] }
+ * Out: { type: 'progress', loaded, total, rows }
+ *      { type: 'done', questions, duplicates, invalid, errors }
+ *      { type: 'error', message }
+ */
+import { importCsv } from './csvImport.js';
+
+self.onmessage = async (event) => {
+    const { source, existingKeys } = event.data;
+    try {
+        const result = await importCsv(source, {
+            existingKeys,
+            onProgress: progress => self.postMessage({ type: 'progress', ...progress })
+        });
+        self.postMessage({ type: 'done', ...result });
+    } catch (e) {
+        self.postMessage({ type: 'error', message: e.message });
+    }
+};
@@ -0,0 +1,257 @@
+/**
+ * gameDriver.js
+ * Test-only driver that plays whole games inside the page.
+ *
+ * Exposed as window.gameDriver by office.js when window.__DEV__ is set. A
+ * game goes through the same ui.showModal() state machine and modal buttons
+ * a player uses. The driver knows where every clue is (gameLogic.locationMap)
+ * and clicks the buttons itself, so a complete game for any mode is one
+ * evaluate() call:
+ *
+ *   window.gameDriver.playGame({ mode: 'trail', seed: 'abc', wrongRate: 0.3 })
+ *   window.gameDriver.playGames([{ mode: 'classic', seed: 1 }, ...])
+ *
+ * wrongRate is the chance of picking a wrong answer. That sends games through
+ * moveClue() and shuffleAllClues(); the driver's choices come from their own
+ * seeded PRNG, so a (mode, seed, wrongRate) triple replays exactly. Each game
+ * returns a trace: every modal the driver saw, answer counts, clue moves and
+ * any invariant the game state broke along the way.
+ */
+
+import * as gameLogic from './gameLogic.js';
+import * as ui from './ui.js';
+import { createRng, randomInt } from './questionBank.js';
+
+export const GAME_MODES = ['classic', 'code_door', 'access_cards', 'hidden_key', 'trail'];
+
+const CLUE_COUNT = 4;
+const SAFE_CODE = '1858';
+const DEFAULT_MAX_STEPS = 1000;
+
+// Copy of gameLogic's initial puzzleState, restored before every game
+const INITIAL_PUZZLE_STATE = {
+    hasShreddedPaper: false,
+    shredderFixed: false,
+    tvChannel: 0,
+    computerUnlocked: false
+};
+
+class GameOver extends Error {}
+
+/**
+ * Play one complete game.
+ * @param {Object} [options]
+ * @param {string} [options.mode] - One of GAME_MODES
+ * @param {string|number} [options.seed] - Passed to gameLogic.initGame()
+ * @param {number} [options.wrongRate] - Chance in [0, 1] of answering a question wrong
+ * @param {number} [options.maxSteps] - Give up (stuck) after this many modals
+ * @returns {{mode: string, seed: string, won: boolean, stuck: string|null,
+ *   steps: Array<{object: string, title: string, answer?: string}>,
+ *   correct: number, wrong: number, moves: number, shuffles: number, violations: string[]}}
+ */
+export function playGame({ mode = 'classic', seed = 0, wrongRate = 0, maxSteps = DEFAULT_MAX_STEPS } = {}) {
+    if (!GAME_MODES.includes(mode)) throw new Error(`Unknown game mode "${mode}"`);
+
+    const game = {
+        mode,
+        seed: String(seed),
+        won: false,
+        stuck: null,
+        steps: [],
+        correct: 0,
+        wrong: 0,
+        moves: 0,
+        shuffles: 0,
+        violations: [],
+        rng: createRng(`${seed}:driver`),
+        wrongRate,
+        maxSteps
+    };
+
+    ui.resetGameUI();
+    gameLogic.setGameMode(mode);
+    gameLogic.setHasSkeletonKey(false);
+    Object.assign(gameLogic.puzzleState, INITIAL_PUZZLE_STATE);
+    gameLogic.initGame(game.seed);
+    checkInvariants(game);
+
+    try {
+        if (mode === 'hidden_key') findHiddenKey(game);
+        else if (mode === 'trail') followTrail(game);
+        else collectClues(game);
+        game.won = ui.gameWon;
+        if (!game.won) game.stuck = 'door did not open';
+    } catch (error) {
+        if (!(error instanceof GameOver)) throw error;
+        game.stuck = error.message;
+    }
+    ui.closeModal();
+
+    delete game.rng;
+    delete game.wrongRate;
+    delete game.maxSteps;
+    return game;
+}
+
+/**
+ * Play several games back to back in this page.
+ * @param {Object[]} runs - playGame() options for each game
+ * @returns {Object[]} Traces, in order
+ */
+export function playGames(runs) {
+    return runs.map(run => playGame(run));
+}
+
+// --- Modes ---
+
+// classic, code_door, access_cards: answer every clue, then the safe/door
+function collectClues(game) {
+    const { activeClues } = gameLogic;
+    while (activeClues.some(clue => !clue.solved)) {
+        const slot = activeClues.findIndex(clue => !clue.solved);
+        answerAt(game, clueLocation(slot));
+    }
+
+    if (game.mode === 'classic') {
+        open(game, 'safe');
+        enterCode(game);
+        if (!gameLogic.hasSkeletonKey) throw new GameOver('safe did not open');
+        click(game, '.option-btn', 'TAKE KEY');
+        open(game, 'door');
+    } else if (game.mode === 'code_door') {
+        open(game, 'door');
+        enterCode(game);
+    } else {
+        open(game, 'door');
+    }
+}
+
+function followTrail(game) {
+    while (gameLogic.currentStep < CLUE_COUNT) {
+        const step = gameLogic.currentStep;
+        if (answerAt(game, clueLocation(step)) === 'wrong') {
+            game.shuffles++;
+            if (gameLogic.currentStep !== 0) violation(game, `chain not reset after a wrong answer at step ${step}`);
+        }
+    }
+    click(game, '.option-btn', 'ESCAPE');
+}
+
+// Visit locations in a seeded order until one of them holds the key
+function findHiddenKey(game) {
+    const order = [...new Set(gameLogic.locations)];
+    for (let i = order.length - 1; i > 0; i--) {
+        const j = randomInt(game.rng, i + 1);
+        [order[i], order[j]] = [order[j], order[i]];
+    }
+    for (const location of order) {
+        // A wrong answer leaves the key where it is; ask again until it is found or ruled out
+        while (answerAt(game, location) === 'wrong');
+        if (gameLogic.hasSkeletonKey) {
+            click(game, '.option-btn', 'GO TO DOOR');
+            open(game, 'door');
+            return;
+        }
+    }
+    throw new GameOver(`key not found (winning object ${gameLogic.winningObject})`);
+}
+
+// --- Steps ---
+
+// Show the modal for `object` and record what it displayed
+function open(game, object) {
+    if (game.steps.length >= game.maxSteps) throw new GameOver(`gave up after ${game.maxSteps} steps`);
+    ui.closeModal();
+    ui.showModal(object, {});
+    const step = { object, title: document.getElementById('modalTitle').textContent };
+    game.steps.push(step);
+    return step;
+}
+
+/**
+ * Open `location` and answer its question, wrong with probability wrongRate.
+ * Objects that intercept the first look (the trash) get a second visit.
+ * @returns {'correct'|'wrong'}
+ */
+function answerAt(game, location) {
+    let step = open(game, location);
+    let prompt = document.querySelector('#clueModal .question-box strong');
+    if (!prompt) {
+        step = open(game, location);
+        prompt = document.querySelector('#clueModal .question-box strong');
+    }
+    if (!prompt) throw new GameOver(`${location} shows "${step.title}" instead of its question`);
+
+    const question = expectedQuestion(location);
+    if (!question || prompt.textContent !== question.q) {
+        violation(game, `${location} shows a question that is not the one assigned to it`);
+    }
+    const correctText = question ? question.o[question.c] : null;
+    const slot = gameLogic.locationMap[location];
+
+    const buttons = [...document.querySelectorAll('#clueModal .option-btn')];
+    const wrongButtons = buttons.filter(button => button.textContent !== correctText)
+        .sort((a, b) => a.textContent.localeCompare(b.textContent));
+    const answerWrong = wrongButtons.length > 0 && game.rng() < game.wrongRate;
+    const button = answerWrong
+        ? wrongButtons[randomInt(game.rng, wrongButtons.length)]
+        : buttons.find(b => b.textContent === correctText);
+    if (!button) throw new GameOver(`${location} has no button for the correct answer`);
+
+    button.click();
+    step.answer = button.textContent;
+    if (answerWrong) {
+        game.wrong++;
+        if (game.mode !== 'hidden_key' && game.mode !== 'trail' && gameLogic.locationMap[location] !== slot) {
+            game.moves++;
+        }
+    } else {
+        game.correct++;
+    }
+    checkInvariants(game);
+    return answerWrong ? 'wrong' : 'correct';
+}
+
+function enterCode(game) {
+    for (const key of `${SAFE_CODE}E`) click(game, '.key-btn', key);
+}
+
+function click(game, selector, text) {
+    const target = [...document.querySelectorAll(`#clueModal ${selector}`)]
+        .find(element => element.textContent === text);
+    if (!target) throw new GameOver(`no "${text}" button in "${document.getElementById('modalTitle').textContent}"`);
+    target.click();
+}
+
+// --- State checks ---
+
+function expectedQuestion(location) {
+    const value = gameLogic.locationMap[location];
+    if (value === null || value === undefined) return null;
+    const qIndex = gameLogic.gameMode === 'hidden_key' ? value : gameLogic.activeClues[value].qIndex;
+    return gameLogic.questionPool[qIndex] || null;
+}
+
+function clueLocation(slot) {
+    const location = Object.keys(gameLogic.locationMap).find(key => gameLogic.locationMap[key] === slot);
+    if (!location) throw new GameOver(`clue ${slot} is not on any location`);
+    return location;
+}
+
+function violation(game, message) {
+    game.violations.push(`step ${game.steps.length}: ${message}`);
+}
+
+function checkInvariants(game) {
+    const values = Object.values(gameLogic.locationMap);
+    if (game.mode === 'hidden_key') {
+        if (!gameLogic.locations.includes(gameLogic.winningObject)) violation(game, 'winning object is not a location');
+        if (values.some(value => value === null)) violation(game, 'a location has no question');
+        return;
+    }
+    for (let slot = 0; slot < CLUE_COUNT; slot++) {
+        const count = values.filter(value => value === slot).length;
+        if (count !== 1) violation(game, `clue ${slot} is on ${count} locations`);
+    }
+    if (gameLogic.activeClues.some(clue => clue.qIndex === -1)) violation(game, 'a clue has no question');
+}
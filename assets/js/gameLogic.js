@@ -1,4 +1,6 @@
 import { LOCATIONS, SAFE_ATTEMPTS } from './constants.js';
+import { decodePayload } from './payloadCodec.js';
+import { QuestionBank, LocationSet, createRng, randomSeed, randomInt } from './questionBank.js';
 
 let questionPool = [{
     t: "Flour Power",
@@ -80,38 +82,49 @@ let questionPool = [{
 let gameMode = "classic"; // "classic", "code_door", "access_cards", "hidden_key"
 let winningObject = null;
 
-// Check for custom data
-try {
-    let rawData = null;
-    // 1. Check for globally injected data
-    if (window.CUSTOM_GAME_DATA) {
-        rawData = window.CUSTOM_GAME_DATA;
-        console.log("Loaded custom data from global variable.");
-    }
-    // 2. Check for URL parameters
-    else {
-        const params = new URLSearchParams(window.location.search);
-        const customData = params.get('data');
-        if (customData) {
-            const decoded = atob(customData);
-            rawData = JSON.parse(decoded);
-            console.log("Loaded custom data from URL.");
+// Check for custom data. Decoding (possibly decompressing) runs asynchronously
+// while the room builds its scene; rooms await customDataReady before initGame().
+const customDataReady = loadCustomData();
+
+async function loadCustomData() {
+    try {
+        let rawData = null;
+        // 1. Check for globally injected data
+        if (window.CUSTOM_GAME_DATA) {
+            rawData = window.CUSTOM_GAME_DATA;
+            console.log("Loaded custom data from global variable.");
+        }
+        // 2. Check for URL parameters (compact v2 or legacy base64 JSON)
+        else {
+            const params = new URLSearchParams(window.location.search);
+            const customData = params.get('data');
+            if (customData) {
+                rawData = await decodePayload(customData);
+                console.log("Loaded custom data from URL.");
+            }
         }
-    }
 
-    if (rawData) {
-        if (Array.isArray(rawData)) {
-            questionPool = rawData; // Legacy format
-            gameMode = "classic";
-        } else if (rawData.questions && Array.isArray(rawData.questions)) {
-            questionPool = rawData.questions;
-            if (rawData.config && rawData.config.mode) {
-                gameMode = rawData.config.mode;
+        if (rawData) {
+            if (Array.isArray(rawData)) {
+                setQuestionPool(rawData); // Legacy format
+                gameMode = "classic";
+            } else if (rawData.questions && Array.isArray(rawData.questions)) {
+                setQuestionPool(rawData.questions);
+                if (rawData.config && rawData.config.mode) {
+                    gameMode = rawData.config.mode;
+                }
             }
+            // Keep the debug snapshot in sync when decoding finishes after it was created
+            if (window.gameLogic) window.gameLogic.gameMode = gameMode;
         }
+    } catch (e) {
+        console.error("Failed to load custom data:", e);
     }
-} catch (e) {
-    console.error("Failed to load custom data:", e);
+}
+
+// Replace the pool contents in place so references held elsewhere stay valid
+function setQuestionPool(questions) {
+    questionPool.splice(0, questionPool.length, ...questions);
 }
 
 let activeClues = [{
@@ -148,29 +161,44 @@ const locations = [...LOCATIONS];
 
 let locationMap = {};
 
-function initGame() {
+// Sampling state: questions are drawn without replacement and clues placed on free
+// locations, all from one seeded PRNG so a seed (?seed= or initGame(seed)) replays a game
+const questionBank = new QuestionBank(questionPool);
+const freeLocations = new LocationSet(locations);
+const seedParam = new URLSearchParams(window.location.search).get('seed');
+let gameSeed = seedParam ?? randomSeed();
+let rng = createRng(String(gameSeed));
+
+function initGame(seed = seedParam ?? randomSeed()) {
+    gameSeed = seed;
+    rng = createRng(String(gameSeed));
+    questionBank.reset(rng);
+
     currentStep = 0;
+    dealClues();
+    safeAttempts = SAFE_ATTEMPTS;
+}
+
+// Place questions/clues on locations for the current mode
+function dealClues() {
     locations.forEach(loc => locationMap[loc] = null);
-    questionPool.sort(() => 0.5 - Math.random());
+    freeLocations.fill();
 
     if (gameMode === "hidden_key") {
-        winningObject = locations[Math.floor(Math.random() * locations.length)];
+        winningObject = locations[randomInt(rng, locations.length)];
         // Map every location to a question index
-        locations.forEach((loc, i) => {
-            locationMap[loc] = i % questionPool.length;
+        locations.forEach(loc => {
+            locationMap[loc] = questionBank.draw();
         });
+        freeLocations.clear();
     } else {
-        // Classic / Code / Cards
+        // Classic / Code / Cards / Trail
         for (let i = 0; i < 4; i++) {
-            activeClues[i].qIndex = i % questionPool.length;
+            activeClues[i].qIndex = questionBank.draw();
             activeClues[i].solved = false;
-        }
-        const shuffledLocs = [...locations].sort(() => 0.5 - Math.random());
-        for (let i = 0; i < 4; i++) {
-            locationMap[shuffledLocs[i]] = i;
+            locationMap[freeLocations.take(rng)] = i;
         }
     }
-    safeAttempts = SAFE_ATTEMPTS;
 }
 
 function advanceStep() {
@@ -179,56 +207,35 @@ function advanceStep() {
 }
 
 function moveClue(slotIndex, fromObjName) {
-    const emptyLocs = locations.filter(loc => locationMap[loc] === null && loc !== fromObjName);
-    if (emptyLocs.length > 0) {
-        const newLoc = emptyLocs[Math.floor(Math.random() * emptyLocs.length)];
-        locationMap[newLoc] = slotIndex;
-        locationMap[fromObjName] = null;
+    // fromObjName holds the clue, so it is not in the free set
+    const newLoc = freeLocations.take(rng);
+    if (newLoc === null) return null;
+    locationMap[newLoc] = slotIndex;
+    locationMap[fromObjName] = null;
+    freeLocations.release(fromObjName);
 
-        const usedQIndices = activeClues.map(c => c.qIndex);
-        const availableQIndices = [];
-        for (let i = 0; i < questionPool.length; i++) {
-            if (!usedQIndices.includes(i)) availableQIndices.push(i);
-        }
-        if (availableQIndices.length > 0) {
-            const newQIndex = availableQIndices[Math.floor(Math.random() * availableQIndices.length)];
-            activeClues[slotIndex].qIndex = newQIndex;
-        }
-        return newLoc;
-    }
-    return null;
+    // A question that is not already on screen for another clue
+    const newQIndex = questionBank.drawExcept(new Set(activeClues.map(c => c.qIndex)));
+    if (newQIndex !== -1) activeClues[slotIndex].qIndex = newQIndex;
+    return newLoc;
 }
 
 function setHasSkeletonKey(value) {
     hasSkeletonKey = value;
 }
+
+// Rooms take the mode from custom data; the game driver switches it between games
+function setGameMode(mode) {
+    gameMode = mode;
+    if (window.gameLogic) window.gameLogic.gameMode = gameMode;
+}
 function resetChain() {
     currentStep = 0;
 }
 
+// Re-deal every clue, continuing the current seeded sequence
 function shuffleAllClues() {
-    // Reset location map
-    locations.forEach(loc => locationMap[loc] = null);
-
-    // Reshuffle questions
-    questionPool.sort(() => 0.5 - Math.random());
-
-    if (gameMode === "hidden_key") {
-        winningObject = locations[Math.floor(Math.random() * locations.length)];
-        locations.forEach((loc, i) => {
-            locationMap[loc] = i % questionPool.length;
-        });
-    } else {
-        // Classic / Code / Cards / Trail
-        for (let i = 0; i < 4; i++) {
-            activeClues[i].qIndex = i % questionPool.length;
-            activeClues[i].solved = false;
-        }
-        const shuffledLocs = [...locations].sort(() => 0.5 - Math.random());
-        for (let i = 0; i < 4; i++) {
-            locationMap[shuffledLocs[i]] = i;
-        }
-    }
+    dealClues();
 }
 
 // Expose for debugging/testing
@@ -243,11 +250,17 @@ window.gameLogic = {
     initGame,
     moveClue,
     gameMode,
+    setGameMode,
     winningObject,
     currentStep,
     advanceStep,
     resetChain,
-    shuffleAllClues
+    shuffleAllClues,
+    customDataReady,
+    questionBank,
+    get gameSeed() {
+        return gameSeed;
+    }
 };
 
 // We need to export the variables themselves so other modules can mutate them
@@ -262,10 +275,14 @@ export {
     initGame,
     moveClue,
     gameMode,
+    setGameMode,
     winningObject,
     currentStep,
     advanceStep,
     puzzleState,
     resetChain,
-    shuffleAllClues
+    shuffleAllClues,
+    customDataReady,
+    questionBank,
+    gameSeed
 };
\ No newline at end of file
@@ -0,0 +1,131 @@
+/**
+ * interactableIndex.js
+ * Bounding-volume hierarchy over the interactables array.
+ * Rays are first tested against world-space boxes so only the handful of
+ * objects the ray actually passes through get exact triangle tests.
+ * The tree is rebuilt lazily: when the interactables array changes size,
+ * when a watched mover (door, drawers, secret bookshelf) changes its world
+ * matrix, or when invalidate() is called.
+ */
+
+import * as THREE from 'three';
+
+const LEAF_SIZE = 4;
+
+export class InteractableIndex {
+    constructor(interactables) {
+        this.interactables = interactables;
+        this.root = null;
+        this.dirty = true;
+        this.version = 0; // Bumped on every rebuild so callers can re-pick
+
+        // Movers whose world matrix is compared each frame
+        this.watched = new Map(); // Object3D -> Matrix4 snapshot
+        this._indexedCount = -1;
+        this._candidates = [];
+    }
+
+    // Track an object that moves after build (pivot, drawer, ...)
+    watch(object) {
+        if (object && !this.watched.has(object)) {
+            object.updateMatrixWorld(true);
+            this.watched.set(object, object.matrixWorld.clone());
+        }
+    }
+
+    unwatch(object) {
+        this.watched.delete(object);
+    }
+
+    // Force a rebuild on next query
+    invalidate() {
+        this.dirty = true;
+    }
+
+    // Cheap per-frame check; returns true if the tree was rebuilt
+    update() {
+        if (this.interactables.length !== this._indexedCount) this.dirty = true;
+
+        this.watched.forEach((snapshot, object) => {
+            if (!object.matrixWorld.equals(snapshot)) {
+                snapshot.copy(object.matrixWorld);
+                this.dirty = true;
+            }
+        });
+
+        if (!this.dirty) return false;
+        this._rebuild();
+        return true;
+    }
+
+    /**
+     * Raycast against the indexed interactables.
+     * Same semantics as raycaster.intersectObjects(interactables, recursive).
+     * @param {THREE.Raycaster} raycaster - Already set from the camera
+     * @param {boolean} recursive
+     * @returns {Array} Intersections sorted by distance
+     */
+    intersect(raycaster, recursive = false) {
+        if (this.dirty || this.interactables.length !== this._indexedCount) this._rebuild();
+
+        const candidates = this._candidates;
+        candidates.length = 0;
+        if (this.root) this._collect(this.root, raycaster.ray, candidates);
+
+        const results = [];
+        for (let i = 0; i < candidates.length; i++) {
+            raycaster.intersectObject(candidates[i], recursive, results);
+        }
+        results.sort((a, b) => a.distance - b.distance);
+        return results;
+    }
+
+    _rebuild() {
+        const entries = [];
+        this.interactables.forEach(object => {
+            object.updateWorldMatrix(true, true);
+            // Subtree bounds are a superset of the object's own bounds,
+            // so one box serves both recursive and non-recursive queries
+            const box = new THREE.Box3().setFromObject(object);
+            if (box.isEmpty()) return;
+            entries.push({ object, box, center: box.getCenter(new THREE.Vector3()) });
+        });
+
+        this.root = entries.length > 0 ? this._buildNode(entries) : null;
+        this._indexedCount = this.interactables.length;
+        this.dirty = false;
+        this.version++;
+    }
+
+    _buildNode(entries) {
+        const box = new THREE.Box3();
+        entries.forEach(entry => box.union(entry.box));
+
+        if (entries.length <= LEAF_SIZE) {
+            return { box, objects: entries.map(entry => entry.object), left: null, right: null };
+        }
+
+        // Median split along the longest axis of the node bounds
+        const size = box.getSize(new THREE.Vector3());
+        const axis = size.x > size.y ? (size.x > size.z ? 'x' : 'z') : (size.y > size.z ? 'y' : 'z');
+        entries.sort((a, b) => a.center[axis] - b.center[axis]);
+        const mid = entries.length >> 1;
+
+        return {
+            box,
+            objects: null,
+            left: this._buildNode(entries.slice(0, mid)),
+            right: this._buildNode(entries.slice(mid))
+        };
+    }
+
+    _collect(node, ray, out) {
+        if (!ray.intersectsBox(node.box)) return;
+        if (node.objects) {
+            out.push(...node.objects);
+            return;
+        }
+        this._collect(node.left, ray, out);
+        this._collect(node.right, ray, out);
+    }
+}
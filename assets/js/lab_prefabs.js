@@ -5,11 +5,12 @@
  */
 
 import * as THREE from 'three';
+import { getGeometry, getMaterial } from './resourceCache.js';
 
 // --- SHARED MATERIALS ---
-const tableTopMat = new THREE.MeshStandardMaterial({ color: 0x111111, roughness: 0.2, metalness: 0.1 }); // Black resin
-const tableLegMat = new THREE.MeshStandardMaterial({ color: 0x888888, roughness: 0.5, metalness: 0.8 }); // Steel
-const glassMat = new THREE.MeshPhysicalMaterial({
+const tableTopMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x111111, roughness: 0.2, metalness: 0.1 }); // Black resin
+const tableLegMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x888888, roughness: 0.5, metalness: 0.8 }); // Steel
+const glassMat = getMaterial(THREE.MeshPhysicalMaterial, {
     color: 0xffffff,
     metalness: 0,
     roughness: 0,
@@ -17,17 +18,17 @@ const glassMat = new THREE.MeshPhysicalMaterial({
     transparent: true,
     thickness: 0.1
 });
-const metalMat = new THREE.MeshStandardMaterial({ color: 0xaaaaaa, roughness: 0.3, metalness: 0.9 });
-const whiteMat = new THREE.MeshStandardMaterial({ color: 0xfafafa, roughness: 0.5 });
-const darkMat = new THREE.MeshStandardMaterial({ color: 0x222222, roughness: 0.8 });
-const plasticBlackMat = new THREE.MeshStandardMaterial({ color: 0x1a1a1a, roughness: 0.4 });
-const plasticWhiteMat = new THREE.MeshStandardMaterial({ color: 0xf0f0f0, roughness: 0.4 });
+const metalMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xaaaaaa, roughness: 0.3, metalness: 0.9 });
+const whiteMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xfafafa, roughness: 0.5 });
+const darkMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x222222, roughness: 0.8 });
+const plasticBlackMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x1a1a1a, roughness: 0.4 });
+const plasticWhiteMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xf0f0f0, roughness: 0.4 });
 
 // Chemical liquid materials
-const liquidRedMat = new THREE.MeshStandardMaterial({ color: 0xff0000, transparent: true, opacity: 0.8 });
-const liquidBlueMat = new THREE.MeshStandardMaterial({ color: 0x0000ff, transparent: true, opacity: 0.8 });
-const liquidGreenMat = new THREE.MeshStandardMaterial({ color: 0x00ff00, transparent: true, opacity: 0.8 });
-const liquidYellowMat = new THREE.MeshStandardMaterial({ color: 0xffff00, transparent: true, opacity: 0.8 });
+const liquidRedMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xff0000, transparent: true, opacity: 0.8 });
+const liquidBlueMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x0000ff, transparent: true, opacity: 0.8 });
+const liquidGreenMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x00ff00, transparent: true, opacity: 0.8 });
+const liquidYellowMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xffff00, transparent: true, opacity: 0.8 });
 
 /**
  * Creates a standard lab workbench.
@@ -39,14 +40,14 @@ export function createLabTable(width = 2, depth = 0.8) {
     const height = 0.9;
 
     // Top
-    const top = new THREE.Mesh(new THREE.BoxGeometry(width, 0.05, depth), tableTopMat);
+    const top = new THREE.Mesh(getGeometry(THREE.BoxGeometry, width, 0.05, depth), tableTopMat);
     top.position.y = height;
     top.castShadow = true;
     top.receiveShadow = true;
     group.add(top);
 
     // Legs
-    const legGeo = new THREE.BoxGeometry(0.05, height, 0.05);
+    const legGeo = getGeometry(THREE.BoxGeometry, 0.05, height, 0.05);
     const positions = [
         [-width / 2 + 0.1, height / 2, -depth / 2 + 0.1],
         [width / 2 - 0.1, height / 2, -depth / 2 + 0.1],
@@ -64,7 +65,7 @@ export function createLabTable(width = 2, depth = 0.8) {
 
     // Cross bars for stability
     const crossBar = new THREE.Mesh(
-        new THREE.BoxGeometry(width - 0.2, 0.03, 0.03),
+        getGeometry(THREE.BoxGeometry, width - 0.2, 0.03, 0.03),
         tableLegMat
     );
     crossBar.position.set(0, 0.1, 0);
@@ -84,7 +85,7 @@ export function createLabCounter(width = 3, depth = 0.6) {
 
     // Cabinet body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, depth),
+        getGeometry(THREE.BoxGeometry, width, height, depth),
         whiteMat
     );
     body.position.y = height / 2;
@@ -94,7 +95,7 @@ export function createLabCounter(width = 3, depth = 0.6) {
 
     // Counter top (black resin)
     const top = new THREE.Mesh(
-        new THREE.BoxGeometry(width + 0.02, 0.05, depth + 0.02),
+        getGeometry(THREE.BoxGeometry, width + 0.02, 0.05, depth + 0.02),
         tableTopMat
     );
     top.position.y = height + 0.025;
@@ -106,14 +107,14 @@ export function createLabCounter(width = 3, depth = 0.6) {
     const doorGap = 0.02;
     const totalGaps = (doorCount - 1) * doorGap;
     const doorWidth = (width - totalGaps) / doorCount;
-    const doorMat = new THREE.MeshStandardMaterial({ color: 0xe8e8e8, roughness: 0.5 });
+    const doorMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xe8e8e8, roughness: 0.5 });
 
     for (let i = 0; i < doorCount; i++) {
         // Calculate door center position: start from left edge + half door width + door index * (door width + gap)
         const doorX = -width / 2 + doorWidth / 2 + i * (doorWidth + doorGap);
 
         const door = new THREE.Mesh(
-            new THREE.BoxGeometry(doorWidth, height - 0.1, 0.02),
+            getGeometry(THREE.BoxGeometry, doorWidth, height - 0.1, 0.02),
             doorMat
         );
         door.position.set(doorX, height / 2, depth / 2 + 0.01);
@@ -121,7 +122,7 @@ export function createLabCounter(width = 3, depth = 0.6) {
 
         // Door handle
         const handle = new THREE.Mesh(
-            new THREE.BoxGeometry(0.1, 0.02, 0.02),
+            getGeometry(THREE.BoxGeometry, 0.1, 0.02, 0.02),
             metalMat
         );
         handle.position.set(doorX, height / 2 + 0.15, depth / 2 + 0.03);
@@ -138,8 +139,8 @@ export function createFumeHood() {
     const group = new THREE.Group();
 
     // Main cabinet structure
-    const boxGeo = new THREE.BoxGeometry(1.5, 2.2, 0.8);
-    const boxMat = new THREE.MeshStandardMaterial({ color: 0xeeeeee });
+    const boxGeo = getGeometry(THREE.BoxGeometry, 1.5, 2.2, 0.8);
+    const boxMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xeeeeee });
     const box = new THREE.Mesh(boxGeo, boxMat);
     box.position.y = 1.1;
     box.castShadow = true;
@@ -148,15 +149,15 @@ export function createFumeHood() {
 
     // Interior (Hollowed out look)
     const interior = new THREE.Mesh(
-        new THREE.BoxGeometry(1.3, 1.2, 0.6),
-        new THREE.MeshStandardMaterial({ color: 0x222222 })
+        getGeometry(THREE.BoxGeometry, 1.3, 1.2, 0.6),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x222222 })
     );
     interior.position.set(0, 1.3, 0.11);
     group.add(interior);
 
     // Glass Sash
     const sash = new THREE.Mesh(
-        new THREE.BoxGeometry(1.3, 1.2, 0.02),
+        getGeometry(THREE.BoxGeometry, 1.3, 1.2, 0.02),
         glassMat
     );
     sash.position.set(0, 1.3, 0.4);
@@ -164,15 +165,15 @@ export function createFumeHood() {
 
     // Exhaust hood on top
     const exhaust = new THREE.Mesh(
-        new THREE.BoxGeometry(0.8, 0.3, 0.5),
-        new THREE.MeshStandardMaterial({ color: 0x666666 })
+        getGeometry(THREE.BoxGeometry, 0.8, 0.3, 0.5),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x666666 })
     );
     exhaust.position.set(0, 2.35, 0);
     group.add(exhaust);
 
     // Exhaust pipe
     const pipe = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.1, 0.1, 0.5, 16),
+        getGeometry(THREE.CylinderGeometry, 0.1, 0.1, 0.5, 16),
         metalMat
     );
     pipe.position.set(0, 2.75, 0);
@@ -189,7 +190,7 @@ export function createBeaker(color = 'red') {
     const group = new THREE.Group();
 
     // Glass container
-    const glassGeo = new THREE.CylinderGeometry(0.08, 0.08, 0.2, 16);
+    const glassGeo = getGeometry(THREE.CylinderGeometry, 0.08, 0.08, 0.2, 16);
     const glass = new THREE.Mesh(glassGeo, glassMat);
     glass.position.y = 0.1;
     group.add(glass);
@@ -205,7 +206,7 @@ export function createBeaker(color = 'red') {
     const liqMat = liquidMaterialMap[color] || liquidRedMat;
 
     if (color !== 'clear') {
-        const liquidGeo = new THREE.CylinderGeometry(0.07, 0.07, 0.12, 16);
+        const liquidGeo = getGeometry(THREE.CylinderGeometry, 0.07, 0.07, 0.12, 16);
         const liquid = new THREE.Mesh(liquidGeo, liqMat);
         liquid.position.y = 0.07;
         group.add(liquid);
@@ -222,13 +223,13 @@ export function createChemicalFlask(color = 'red') {
     const group = new THREE.Group();
 
     // Flask body (wider bottom, narrow neck)
-    const bodyGeo = new THREE.CylinderGeometry(0.03, 0.1, 0.15, 16);
+    const bodyGeo = getGeometry(THREE.CylinderGeometry, 0.03, 0.1, 0.15, 16);
     const body = new THREE.Mesh(bodyGeo, glassMat);
     body.position.y = 0.075;
     group.add(body);
 
     // Neck
-    const neckGeo = new THREE.CylinderGeometry(0.025, 0.03, 0.08, 16);
+    const neckGeo = getGeometry(THREE.CylinderGeometry, 0.025, 0.03, 0.08, 16);
     const neck = new THREE.Mesh(neckGeo, glassMat);
     neck.position.y = 0.19;
     group.add(neck);
@@ -242,7 +243,7 @@ export function createChemicalFlask(color = 'red') {
     };
     const liqMat = liquidMaterialMap[color] || liquidRedMat;
 
-    const liquidGeo = new THREE.CylinderGeometry(0.025, 0.085, 0.1, 16);
+    const liquidGeo = getGeometry(THREE.CylinderGeometry, 0.025, 0.085, 0.1, 16);
     const liquid = new THREE.Mesh(liquidGeo, liqMat);
     liquid.position.y = 0.05;
     group.add(liquid);
@@ -257,22 +258,22 @@ export function createMixingBeaker() {
     const group = new THREE.Group();
 
     // Large beaker
-    const glassGeo = new THREE.CylinderGeometry(0.12, 0.1, 0.25, 16, 1, true);
+    const glassGeo = getGeometry(THREE.CylinderGeometry, 0.12, 0.1, 0.25, 16, 1, true);
     const glass = new THREE.Mesh(glassGeo, glassMat);
     glass.position.y = 0.125;
     group.add(glass);
 
     // Bottom
-    const bottomGeo = new THREE.CylinderGeometry(0.1, 0.1, 0.02, 16);
+    const bottomGeo = getGeometry(THREE.CylinderGeometry, 0.1, 0.1, 0.02, 16);
     const bottom = new THREE.Mesh(bottomGeo, glassMat);
     bottom.position.y = 0.01;
     group.add(bottom);
 
     // Graduation marks (simple lines)
-    const markMat = new THREE.MeshBasicMaterial({ color: 0x666666 });
+    const markMat = getMaterial(THREE.MeshBasicMaterial, { color: 0x666666 });
     for (let i = 1; i <= 3; i++) {
         const mark = new THREE.Mesh(
-            new THREE.BoxGeometry(0.01, 0.002, 0.01),
+            getGeometry(THREE.BoxGeometry, 0.01, 0.002, 0.01),
             markMat
         );
         mark.position.set(0.11, i * 0.06, 0);
@@ -290,7 +291,7 @@ export function createMicroscope() {
 
     // Base
     const base = new THREE.Mesh(
-        new THREE.BoxGeometry(0.2, 0.05, 0.25),
+        getGeometry(THREE.BoxGeometry, 0.2, 0.05, 0.25),
         plasticBlackMat
     );
     base.position.y = 0.025;
@@ -298,7 +299,7 @@ export function createMicroscope() {
 
     // Arm (curved support)
     const arm = new THREE.Mesh(
-        new THREE.BoxGeometry(0.05, 0.35, 0.05),
+        getGeometry(THREE.BoxGeometry, 0.05, 0.35, 0.05),
         plasticBlackMat
     );
     arm.position.set(-0.05, 0.2, -0.08);
@@ -307,7 +308,7 @@ export function createMicroscope() {
 
     // Eyepiece tube
     const tube = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.025, 0.025, 0.15, 16),
+        getGeometry(THREE.CylinderGeometry, 0.025, 0.025, 0.15, 16),
         plasticBlackMat
     );
     tube.rotation.x = 1.2;
@@ -316,7 +317,7 @@ export function createMicroscope() {
 
     // Objective lens turret
     const turret = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.04, 0.04, 0.03, 16),
+        getGeometry(THREE.CylinderGeometry, 0.04, 0.04, 0.03, 16),
         metalMat
     );
     turret.position.set(0, 0.2, 0);
@@ -325,7 +326,7 @@ export function createMicroscope() {
     // Objective lenses (3 of them)
     for (let i = 0; i < 3; i++) {
         const lens = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.01, 0.015, 0.04, 8),
+            getGeometry(THREE.CylinderGeometry, 0.01, 0.015, 0.04, 8),
             metalMat
         );
         lens.position.set(
@@ -338,7 +339,7 @@ export function createMicroscope() {
 
     // Stage
     const stage = new THREE.Mesh(
-        new THREE.BoxGeometry(0.15, 0.01, 0.15),
+        getGeometry(THREE.BoxGeometry, 0.15, 0.01, 0.15),
         plasticBlackMat
     );
     stage.position.set(0, 0.15, 0);
@@ -346,7 +347,7 @@ export function createMicroscope() {
 
     // Focus knob
     const knob = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.02, 0.02, 0.03, 16),
+        getGeometry(THREE.CylinderGeometry, 0.02, 0.02, 0.03, 16),
         metalMat
     );
     knob.rotation.z = Math.PI / 2;
@@ -364,7 +365,7 @@ export function createBunsenBurner() {
 
     // Base
     const base = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.07, 0.09, 0.02, 16),
+        getGeometry(THREE.CylinderGeometry, 0.07, 0.09, 0.02, 16),
         darkMat
     );
     base.position.y = 0.01;
@@ -372,7 +373,7 @@ export function createBunsenBurner() {
 
     // Main tube
     const tube = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.02, 0.02, 0.18, 16),
+        getGeometry(THREE.CylinderGeometry, 0.02, 0.02, 0.18, 16),
         metalMat
     );
     tube.position.y = 0.1;
@@ -380,7 +381,7 @@ export function createBunsenBurner() {
 
     // Air intake collar
     const collar = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.025, 0.025, 0.03, 16),
+        getGeometry(THREE.CylinderGeometry, 0.025, 0.025, 0.03, 16),
         metalMat
     );
     collar.position.y = 0.05;
@@ -388,7 +389,7 @@ export function createBunsenBurner() {
 
     // Gas connection
     const gasConn = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.01, 0.01, 0.05, 8),
+        getGeometry(THREE.CylinderGeometry, 0.01, 0.01, 0.05, 8),
         metalMat
     );
     gasConn.rotation.z = Math.PI / 2;
@@ -396,8 +397,8 @@ export function createBunsenBurner() {
     group.add(gasConn);
 
     // Flame (hidden by default)
-    const flameGeo = new THREE.ConeGeometry(0.025, 0.1, 8);
-    const flameMat = new THREE.MeshBasicMaterial({
+    const flameGeo = getGeometry(THREE.ConeGeometry, 0.025, 0.1, 8);
+    const flameMat = getMaterial(THREE.MeshBasicMaterial, {
         color: 0x4444ff,
         transparent: true,
         opacity: 0.9
@@ -410,8 +411,8 @@ export function createBunsenBurner() {
 
     // Inner flame (hotter)
     const innerFlame = new THREE.Mesh(
-        new THREE.ConeGeometry(0.012, 0.06, 8),
-        new THREE.MeshBasicMaterial({ color: 0x00aaff, transparent: true, opacity: 0.95 })
+        getGeometry(THREE.ConeGeometry, 0.012, 0.06, 8),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x00aaff, transparent: true, opacity: 0.95 })
     );
     innerFlame.position.y = 0.22;
     innerFlame.visible = false;
@@ -428,11 +429,11 @@ export function createTestTubeRack() {
     const group = new THREE.Group();
 
     // Rack frame
-    const rackMat = new THREE.MeshStandardMaterial({ color: 0x8B4513, roughness: 0.8 });
+    const rackMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x8B4513, roughness: 0.8 });
 
     // Base
     const base = new THREE.Mesh(
-        new THREE.BoxGeometry(0.25, 0.02, 0.08),
+        getGeometry(THREE.BoxGeometry, 0.25, 0.02, 0.08),
         rackMat
     );
     base.position.y = 0.01;
@@ -440,14 +441,14 @@ export function createTestTubeRack() {
 
     // Top bar with holes
     const topBar = new THREE.Mesh(
-        new THREE.BoxGeometry(0.25, 0.015, 0.06),
+        getGeometry(THREE.BoxGeometry, 0.25, 0.015, 0.06),
         rackMat
     );
     topBar.position.y = 0.15;
     group.add(topBar);
 
     // Support posts
-    const postGeo = new THREE.BoxGeometry(0.015, 0.15, 0.015);
+    const postGeo = getGeometry(THREE.BoxGeometry, 0.015, 0.15, 0.015);
     const postPositions = [
         [-0.11, 0.08, 0.02],
         [0.11, 0.08, 0.02],
@@ -464,7 +465,7 @@ export function createTestTubeRack() {
     const tubeColors = [0xff6666, 0x6666ff, 0x66ff66, 0xffff66, 0xff66ff];
     for (let i = 0; i < 5; i++) {
         const tube = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.012, 0.012, 0.12, 8),
+            getGeometry(THREE.CylinderGeometry, 0.012, 0.012, 0.12, 8),
             glassMat
         );
         tube.position.set(-0.08 + i * 0.04, 0.08, 0);
@@ -472,8 +473,8 @@ export function createTestTubeRack() {
 
         // Liquid in tube
         const liquid = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.01, 0.01, 0.06, 8),
-            new THREE.MeshStandardMaterial({
+            getGeometry(THREE.CylinderGeometry, 0.01, 0.01, 0.06, 8),
+            getMaterial(THREE.MeshStandardMaterial, {
                 color: tubeColors[i],
                 transparent: true,
                 opacity: 0.7
@@ -494,24 +495,24 @@ export function createLabNotebook() {
 
     // Cover
     const cover = new THREE.Mesh(
-        new THREE.BoxGeometry(0.18, 0.02, 0.25),
-        new THREE.MeshStandardMaterial({ color: 0x1a1a5a, roughness: 0.8 })
+        getGeometry(THREE.BoxGeometry, 0.18, 0.02, 0.25),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x1a1a5a, roughness: 0.8 })
     );
     cover.position.y = 0.01;
     group.add(cover);
 
     // Pages
     const pages = new THREE.Mesh(
-        new THREE.BoxGeometry(0.16, 0.015, 0.23),
-        new THREE.MeshStandardMaterial({ color: 0xf5f5dc })
+        getGeometry(THREE.BoxGeometry, 0.16, 0.015, 0.23),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xf5f5dc })
     );
     pages.position.y = 0.025;
     group.add(pages);
 
     // Binding
     const binding = new THREE.Mesh(
-        new THREE.BoxGeometry(0.02, 0.025, 0.25),
-        new THREE.MeshStandardMaterial({ color: 0x111133 })
+        getGeometry(THREE.BoxGeometry, 0.02, 0.025, 0.25),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x111133 })
     );
     binding.position.set(-0.09, 0.0125, 0);
     group.add(binding);
@@ -527,7 +528,7 @@ export function createPetriDish() {
 
     // Dish bottom
     const bottom = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.06, 0.06, 0.015, 24),
+        getGeometry(THREE.CylinderGeometry, 0.06, 0.06, 0.015, 24),
         glassMat
     );
     bottom.position.y = 0.0075;
@@ -535,7 +536,7 @@ export function createPetriDish() {
 
     // Dish lid
     const lid = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.065, 0.065, 0.008, 24),
+        getGeometry(THREE.CylinderGeometry, 0.065, 0.065, 0.008, 24),
         glassMat
     );
     lid.position.y = 0.02;
@@ -543,8 +544,8 @@ export function createPetriDish() {
 
     // Growth medium (agar)
     const agar = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.055, 0.055, 0.008, 24),
-        new THREE.MeshStandardMaterial({
+        getGeometry(THREE.CylinderGeometry, 0.055, 0.055, 0.008, 24),
+        getMaterial(THREE.MeshStandardMaterial, {
             color: 0xffccaa,
             transparent: true,
             opacity: 0.8
@@ -567,7 +568,7 @@ export function createChemicalCabinet() {
 
     // Main body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, depth),
+        getGeometry(THREE.BoxGeometry, width, height, depth),
         whiteMat
     );
     body.position.y = height / 2;
@@ -577,17 +578,17 @@ export function createChemicalCabinet() {
 
     // Glass doors
     const doorGlass = new THREE.Mesh(
-        new THREE.BoxGeometry(width - 0.08, height - 0.2, 0.02),
+        getGeometry(THREE.BoxGeometry, width - 0.08, height - 0.2, 0.02),
         glassMat
     );
     doorGlass.position.set(0, height / 2, depth / 2 + 0.01);
     group.add(doorGlass);
 
     // Shelves
-    const shelfMat = new THREE.MeshStandardMaterial({ color: 0xcccccc });
+    const shelfMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xcccccc });
     for (let i = 1; i <= 3; i++) {
         const shelf = new THREE.Mesh(
-            new THREE.BoxGeometry(width - 0.1, 0.02, depth - 0.1),
+            getGeometry(THREE.BoxGeometry, width - 0.1, 0.02, depth - 0.1),
             shelfMat
         );
         shelf.position.y = i * height / 4;
@@ -595,8 +596,8 @@ export function createChemicalCabinet() {
     }
 
     // Warning label
-    const labelGeo = new THREE.PlaneGeometry(0.15, 0.1);
-    const labelMat = new THREE.MeshBasicMaterial({ color: 0xffff00 });
+    const labelGeo = getGeometry(THREE.PlaneGeometry, 0.15, 0.1);
+    const labelMat = getMaterial(THREE.MeshBasicMaterial, { color: 0xffff00 });
     const label = new THREE.Mesh(labelGeo, labelMat);
     label.position.set(0, height - 0.2, depth / 2 + 0.02);
     group.add(label);
@@ -615,7 +616,7 @@ export function createLabFridge() {
 
     // Main body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, depth),
+        getGeometry(THREE.BoxGeometry, width, height, depth),
         whiteMat
     );
     body.position.y = height / 2;
@@ -625,15 +626,15 @@ export function createLabFridge() {
 
     // Door
     const door = new THREE.Mesh(
-        new THREE.BoxGeometry(width - 0.02, height - 0.04, 0.04),
-        new THREE.MeshStandardMaterial({ color: 0xf0f0f0 })
+        getGeometry(THREE.BoxGeometry, width - 0.02, height - 0.04, 0.04),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xf0f0f0 })
     );
     door.position.set(0, height / 2, depth / 2 + 0.02);
     group.add(door);
 
     // Handle
     const handle = new THREE.Mesh(
-        new THREE.BoxGeometry(0.03, 0.3, 0.03),
+        getGeometry(THREE.BoxGeometry, 0.03, 0.3, 0.03),
         metalMat
     );
     handle.position.set(width / 2 - 0.08, height / 2, depth / 2 + 0.05);
@@ -641,8 +642,8 @@ export function createLabFridge() {
 
     // Temperature display
     const display = new THREE.Mesh(
-        new THREE.BoxGeometry(0.08, 0.04, 0.01),
-        new THREE.MeshBasicMaterial({ color: 0x00aaff })
+        getGeometry(THREE.BoxGeometry, 0.08, 0.04, 0.01),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x00aaff })
     );
     display.position.set(0, height - 0.2, depth / 2 + 0.05);
     group.add(display);
@@ -658,7 +659,7 @@ export function createLabComputer() {
 
     // Monitor
     const monitorFrame = new THREE.Mesh(
-        new THREE.BoxGeometry(0.5, 0.35, 0.03),
+        getGeometry(THREE.BoxGeometry, 0.5, 0.35, 0.03),
         plasticBlackMat
     );
     monitorFrame.position.y = 0.25;
@@ -666,8 +667,8 @@ export function createLabComputer() {
 
     // Screen
     const screen = new THREE.Mesh(
-        new THREE.BoxGeometry(0.44, 0.29, 0.01),
-        new THREE.MeshBasicMaterial({ color: 0x001100 })
+        getGeometry(THREE.BoxGeometry, 0.44, 0.29, 0.01),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x001100 })
     );
     screen.position.set(0, 0.25, 0.02);
     screen.name = "screen";
@@ -675,7 +676,7 @@ export function createLabComputer() {
 
     // Stand
     const stand = new THREE.Mesh(
-        new THREE.BoxGeometry(0.08, 0.12, 0.08),
+        getGeometry(THREE.BoxGeometry, 0.08, 0.12, 0.08),
         plasticBlackMat
     );
     stand.position.y = 0.06;
@@ -683,15 +684,15 @@ export function createLabComputer() {
 
     // Base
     const base = new THREE.Mesh(
-        new THREE.BoxGeometry(0.2, 0.02, 0.15),
+        getGeometry(THREE.BoxGeometry, 0.2, 0.02, 0.15),
         plasticBlackMat
     );
     group.add(base);
 
     // Keyboard
     const keyboard = new THREE.Mesh(
-        new THREE.BoxGeometry(0.35, 0.02, 0.12),
-        new THREE.MeshStandardMaterial({ color: 0x333333 })
+        getGeometry(THREE.BoxGeometry, 0.35, 0.02, 0.12),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x333333 })
     );
     keyboard.position.set(0, 0.01, 0.2);
     group.add(keyboard);
@@ -707,7 +708,7 @@ export function createCentrifuge() {
 
     // Main body
     const body = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.2, 0.22, 0.25, 24),
+        getGeometry(THREE.CylinderGeometry, 0.2, 0.22, 0.25, 24),
         plasticWhiteMat
     );
     body.position.y = 0.125;
@@ -716,7 +717,7 @@ export function createCentrifuge() {
 
     // Lid
     const lid = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.18, 0.2, 0.03, 24),
+        getGeometry(THREE.CylinderGeometry, 0.18, 0.2, 0.03, 24),
         plasticWhiteMat
     );
     lid.position.y = 0.265;
@@ -724,16 +725,16 @@ export function createCentrifuge() {
 
     // Control panel
     const panel = new THREE.Mesh(
-        new THREE.BoxGeometry(0.12, 0.06, 0.02),
-        new THREE.MeshBasicMaterial({ color: 0x222222 })
+        getGeometry(THREE.BoxGeometry, 0.12, 0.06, 0.02),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x222222 })
     );
     panel.position.set(0, 0.12, 0.21);
     group.add(panel);
 
     // Display
     const display = new THREE.Mesh(
-        new THREE.BoxGeometry(0.06, 0.03, 0.01),
-        new THREE.MeshBasicMaterial({ color: 0x00ff00 })
+        getGeometry(THREE.BoxGeometry, 0.06, 0.03, 0.01),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x00ff00 })
     );
     display.position.set(0, 0.14, 0.22);
     group.add(display);
@@ -741,8 +742,8 @@ export function createCentrifuge() {
     // Buttons
     for (let i = 0; i < 3; i++) {
         const btn = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.008, 0.008, 0.01, 8),
-            new THREE.MeshStandardMaterial({ color: i === 1 ? 0x00ff00 : 0xff0000 })
+            getGeometry(THREE.CylinderGeometry, 0.008, 0.008, 0.01, 8),
+            getMaterial(THREE.MeshStandardMaterial, { color: i === 1 ? 0x00ff00 : 0xff0000 })
         );
         btn.rotation.x = Math.PI / 2;
         btn.position.set(-0.03 + i * 0.03, 0.1, 0.22);
@@ -763,8 +764,8 @@ export function createLabSafe() {
 
     // Main body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, depth),
-        new THREE.MeshStandardMaterial({ color: 0x444444, metalness: 0.8, roughness: 0.3 })
+        getGeometry(THREE.BoxGeometry, width, height, depth),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x444444, metalness: 0.8, roughness: 0.3 })
     );
     body.position.y = height / 2;
     body.castShadow = true;
@@ -773,31 +774,31 @@ export function createLabSafe() {
 
     // Door frame
     const doorFrame = new THREE.Mesh(
-        new THREE.BoxGeometry(width - 0.04, height - 0.04, 0.02),
-        new THREE.MeshStandardMaterial({ color: 0x555555, metalness: 0.7 })
+        getGeometry(THREE.BoxGeometry, width - 0.04, height - 0.04, 0.02),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x555555, metalness: 0.7 })
     );
     doorFrame.position.set(0, height / 2, depth / 2 + 0.01);
     group.add(doorFrame);
 
     // Keypad
     const keypad = new THREE.Mesh(
-        new THREE.BoxGeometry(0.12, 0.15, 0.02),
-        new THREE.MeshStandardMaterial({ color: 0x222222 })
+        getGeometry(THREE.BoxGeometry, 0.12, 0.15, 0.02),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x222222 })
     );
     keypad.position.set(0, height / 2 + 0.1, depth / 2 + 0.03);
     group.add(keypad);
 
     // Keypad display
     const keypadDisplay = new THREE.Mesh(
-        new THREE.BoxGeometry(0.1, 0.03, 0.01),
-        new THREE.MeshBasicMaterial({ color: 0x003300 })
+        getGeometry(THREE.BoxGeometry, 0.1, 0.03, 0.01),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x003300 })
     );
     keypadDisplay.position.set(0, height / 2 + 0.15, depth / 2 + 0.04);
     group.add(keypadDisplay);
 
     // Handle
     const handle = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.03, 0.03, 0.04, 16),
+        getGeometry(THREE.CylinderGeometry, 0.03, 0.03, 0.04, 16),
         metalMat
     );
     handle.rotation.x = Math.PI / 2;
@@ -815,8 +816,8 @@ export function createBiohazardContainer() {
 
     // Main bin
     const bin = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.2, 0.18, 0.5, 16),
-        new THREE.MeshStandardMaterial({ color: 0xff4444, roughness: 0.6 })
+        getGeometry(THREE.CylinderGeometry, 0.2, 0.18, 0.5, 16),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xff4444, roughness: 0.6 })
     );
     bin.position.y = 0.25;
     bin.castShadow = true;
@@ -824,16 +825,16 @@ export function createBiohazardContainer() {
 
     // Lid
     const lid = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.21, 0.21, 0.05, 16),
-        new THREE.MeshStandardMaterial({ color: 0xcc0000, roughness: 0.6 })
+        getGeometry(THREE.CylinderGeometry, 0.21, 0.21, 0.05, 16),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xcc0000, roughness: 0.6 })
     );
     lid.position.y = 0.525;
     group.add(lid);
 
     // Biohazard symbol (simplified as yellow circle)
     const symbol = new THREE.Mesh(
-        new THREE.CircleGeometry(0.08, 16),
-        new THREE.MeshBasicMaterial({ color: 0xffff00 })
+        getGeometry(THREE.CircleGeometry, 0.08, 16),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0xffff00 })
     );
     symbol.position.set(0, 0.25, 0.19);
     group.add(symbol);
@@ -850,12 +851,12 @@ export function createLabWhiteboard(width = 2, height = 1.2) {
     const group = new THREE.Group();
 
     // Frame
-    const frameMat = new THREE.MeshStandardMaterial({ color: 0x888888, metalness: 0.5 });
+    const frameMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x888888, metalness: 0.5 });
 
     // Board
     const board = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, 0.03),
-        new THREE.MeshStandardMaterial({ color: 0xffffff, roughness: 0.3 })
+        getGeometry(THREE.BoxGeometry, width, height, 0.03),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xffffff, roughness: 0.3 })
     );
     group.add(board);
 
@@ -863,7 +864,7 @@ export function createLabWhiteboard(width = 2, height = 1.2) {
     const frameThickness = 0.04;
     // Top
     const topFrame = new THREE.Mesh(
-        new THREE.BoxGeometry(width + 0.08, frameThickness, 0.05),
+        getGeometry(THREE.BoxGeometry, width + 0.08, frameThickness, 0.05),
         frameMat
     );
     topFrame.position.y = height / 2 + frameThickness / 2;
@@ -871,7 +872,7 @@ export function createLabWhiteboard(width = 2, height = 1.2) {
 
     // Bottom
     const bottomFrame = new THREE.Mesh(
-        new THREE.BoxGeometry(width + 0.08, frameThickness, 0.05),
+        getGeometry(THREE.BoxGeometry, width + 0.08, frameThickness, 0.05),
         frameMat
     );
     bottomFrame.position.y = -height / 2 - frameThickness / 2;
@@ -879,7 +880,7 @@ export function createLabWhiteboard(width = 2, height = 1.2) {
 
     // Tray
     const tray = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 0.8, 0.02, 0.08),
+        getGeometry(THREE.BoxGeometry, width * 0.8, 0.02, 0.08),
         frameMat
     );
     tray.position.set(0, -height / 2 - 0.05, 0.05);
@@ -896,7 +897,7 @@ export function createEmergencyShower() {
 
     // Pole
     const pole = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.03, 0.03, 2.5, 8),
+        getGeometry(THREE.CylinderGeometry, 0.03, 0.03, 2.5, 8),
         metalMat
     );
     pole.position.y = 1.25;
@@ -904,7 +905,7 @@ export function createEmergencyShower() {
 
     // Shower head
     const head = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.15, 0.12, 0.08, 16),
+        getGeometry(THREE.CylinderGeometry, 0.15, 0.12, 0.08, 16),
         metalMat
     );
     head.position.y = 2.5;
@@ -912,15 +913,15 @@ export function createEmergencyShower() {
 
     // Pull handle
     const handle = new THREE.Mesh(
-        new THREE.BoxGeometry(0.3, 0.03, 0.03),
-        new THREE.MeshStandardMaterial({ color: 0xff0000 })
+        getGeometry(THREE.BoxGeometry, 0.3, 0.03, 0.03),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xff0000 })
     );
     handle.position.set(0, 1.5, 0.1);
     group.add(handle);
 
     // Chain
     const chain = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.005, 0.005, 0.3, 4),
+        getGeometry(THREE.CylinderGeometry, 0.005, 0.005, 0.3, 4),
         metalMat
     );
     chain.position.set(0.12, 1.65, 0.1);
@@ -928,8 +929,8 @@ export function createEmergencyShower() {
 
     // Warning sign
     const sign = new THREE.Mesh(
-        new THREE.BoxGeometry(0.2, 0.15, 0.01),
-        new THREE.MeshBasicMaterial({ color: 0x00ff00 })
+        getGeometry(THREE.BoxGeometry, 0.2, 0.15, 0.01),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x00ff00 })
     );
     sign.position.set(0.2, 1.8, 0);
     group.add(sign);
@@ -945,7 +946,7 @@ export function createEyeWashStation() {
 
     // Base unit
     const base = new THREE.Mesh(
-        new THREE.BoxGeometry(0.3, 0.15, 0.2),
+        getGeometry(THREE.BoxGeometry, 0.3, 0.15, 0.2),
         metalMat
     );
     base.position.y = 0.075;
@@ -954,7 +955,7 @@ export function createEyeWashStation() {
     // Eye wash bowls
     for (let i = -1; i <= 1; i += 2) {
         const bowl = new THREE.Mesh(
-            new THREE.SphereGeometry(0.04, 16, 8, 0, Math.PI * 2, 0, Math.PI / 2),
+            getGeometry(THREE.SphereGeometry, 0.04, 16, 8, 0, Math.PI * 2, 0, Math.PI / 2),
             metalMat
         );
         bowl.position.set(i * 0.08, 0.15, 0);
@@ -964,8 +965,8 @@ export function createEyeWashStation() {
 
     // Activation paddle
     const paddle = new THREE.Mesh(
-        new THREE.BoxGeometry(0.15, 0.02, 0.08),
-        new THREE.MeshStandardMaterial({ color: 0x00ff00 })
+        getGeometry(THREE.BoxGeometry, 0.15, 0.02, 0.08),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x00ff00 })
     );
     paddle.position.set(0, 0.18, 0.08);
     group.add(paddle);
@@ -981,22 +982,22 @@ export function createFirstAidKit() {
 
     // Box
     const box = new THREE.Mesh(
-        new THREE.BoxGeometry(0.3, 0.25, 0.1),
-        new THREE.MeshStandardMaterial({ color: 0xffffff })
+        getGeometry(THREE.BoxGeometry, 0.3, 0.25, 0.1),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xffffff })
     );
     group.add(box);
 
     // Red cross
     const crossH = new THREE.Mesh(
-        new THREE.BoxGeometry(0.12, 0.04, 0.01),
-        new THREE.MeshBasicMaterial({ color: 0xff0000 })
+        getGeometry(THREE.BoxGeometry, 0.12, 0.04, 0.01),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0xff0000 })
     );
     crossH.position.z = 0.051;
     group.add(crossH);
 
     const crossV = new THREE.Mesh(
-        new THREE.BoxGeometry(0.04, 0.12, 0.01),
-        new THREE.MeshBasicMaterial({ color: 0xff0000 })
+        getGeometry(THREE.BoxGeometry, 0.04, 0.12, 0.01),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0xff0000 })
     );
     crossV.position.z = 0.051;
     group.add(crossV);
@@ -1012,8 +1013,8 @@ export function createLabStool() {
 
     // Seat
     const seat = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.18, 0.18, 0.05, 24),
-        new THREE.MeshStandardMaterial({ color: 0x333333, roughness: 0.6 })
+        getGeometry(THREE.CylinderGeometry, 0.18, 0.18, 0.05, 24),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x333333, roughness: 0.6 })
     );
     seat.position.y = 0.65;
     seat.castShadow = true;
@@ -1021,7 +1022,7 @@ export function createLabStool() {
 
     // Central pole
     const pole = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.025, 0.03, 0.4, 12),
+        getGeometry(THREE.CylinderGeometry, 0.025, 0.03, 0.4, 12),
         metalMat
     );
     pole.position.y = 0.42;
@@ -1029,7 +1030,7 @@ export function createLabStool() {
 
     // Base ring
     const baseRing = new THREE.Mesh(
-        new THREE.TorusGeometry(0.2, 0.015, 8, 24),
+        getGeometry(THREE.TorusGeometry, 0.2, 0.015, 8, 24),
         metalMat
     );
     baseRing.rotation.x = Math.PI / 2;
@@ -1040,7 +1041,7 @@ export function createLabStool() {
     for (let i = 0; i < 5; i++) {
         const angle = (i * Math.PI * 2) / 5;
         const leg = new THREE.Mesh(
-            new THREE.BoxGeometry(0.02, 0.02, 0.25),
+            getGeometry(THREE.BoxGeometry, 0.02, 0.02, 0.25),
             metalMat
         );
         leg.position.set(
@@ -1053,7 +1054,7 @@ export function createLabStool() {
 
         // Wheel
         const wheel = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.025, 0.025, 0.02, 8),
+            getGeometry(THREE.CylinderGeometry, 0.025, 0.025, 0.02, 8),
             darkMat
         );
         wheel.rotation.z = Math.PI / 2;
@@ -1076,8 +1077,8 @@ export function createPeriodicTablePoster() {
 
     // Poster background
     const poster = new THREE.Mesh(
-        new THREE.BoxGeometry(1.2, 0.8, 0.01),
-        new THREE.MeshStandardMaterial({ color: 0xffffff })
+        getGeometry(THREE.BoxGeometry, 1.2, 0.8, 0.01),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xffffff })
     );
     group.add(poster);
 
@@ -1088,8 +1089,8 @@ export function createPeriodicTablePoster() {
     for (let row = 0; row < 6; row++) {
         for (let col = 0; col < 18; col++) {
             const block = new THREE.Mesh(
-                new THREE.BoxGeometry(blockSize, blockSize, 0.005),
-                new THREE.MeshBasicMaterial({
+                getGeometry(THREE.BoxGeometry, blockSize, blockSize, 0.005),
+                getMaterial(THREE.MeshBasicMaterial, {
                     color: colors[(row + col) % colors.length]
                 })
             );
@@ -1113,7 +1114,7 @@ export function createLabSink() {
 
     // Counter
     const counter = new THREE.Mesh(
-        new THREE.BoxGeometry(0.8, 0.9, 0.5),
+        getGeometry(THREE.BoxGeometry, 0.8, 0.9, 0.5),
         whiteMat
     );
     counter.position.y = 0.45;
@@ -1121,7 +1122,7 @@ export function createLabSink() {
 
     // Sink basin
     const basin = new THREE.Mesh(
-        new THREE.BoxGeometry(0.4, 0.2, 0.35),
+        getGeometry(THREE.BoxGeometry, 0.4, 0.2, 0.35),
         metalMat
     );
     basin.position.set(0, 0.8, 0);
@@ -1129,15 +1130,15 @@ export function createLabSink() {
 
     // Basin interior
     const basinInner = new THREE.Mesh(
-        new THREE.BoxGeometry(0.35, 0.15, 0.3),
-        new THREE.MeshStandardMaterial({ color: 0x666666, metalness: 0.9 })
+        getGeometry(THREE.BoxGeometry, 0.35, 0.15, 0.3),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x666666, metalness: 0.9 })
     );
     basinInner.position.set(0, 0.82, 0);
     group.add(basinInner);
 
     // Faucet
     const faucet = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.02, 0.02, 0.2, 8),
+        getGeometry(THREE.CylinderGeometry, 0.02, 0.02, 0.2, 8),
         metalMat
     );
     faucet.position.set(0, 1.0, -0.15);
@@ -1145,7 +1146,7 @@ export function createLabSink() {
 
     // Faucet spout
     const spout = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.015, 0.015, 0.15, 8),
+        getGeometry(THREE.CylinderGeometry, 0.015, 0.015, 0.15, 8),
         metalMat
     );
     spout.rotation.x = Math.PI / 2;
@@ -1155,7 +1156,7 @@ export function createLabSink() {
     // Handles
     for (let i = -1; i <= 1; i += 2) {
         const handle = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.015, 0.015, 0.04, 8),
+            getGeometry(THREE.CylinderGeometry, 0.015, 0.015, 0.04, 8),
             metalMat
         );
         handle.position.set(i * 0.12, 1.0, -0.15);
@@ -1172,11 +1173,11 @@ export function createHazmatSuit() {
     const group = new THREE.Group();
 
     // Suit body (simplified as box)
-    const suitMat = new THREE.MeshStandardMaterial({ color: 0xffff00, roughness: 0.6 });
+    const suitMat = getMaterial(THREE.MeshStandardMaterial, { color: 0xffff00, roughness: 0.6 });
 
     // Torso
     const torso = new THREE.Mesh(
-        new THREE.BoxGeometry(0.4, 0.5, 0.15),
+        getGeometry(THREE.BoxGeometry, 0.4, 0.5, 0.15),
         suitMat
     );
     torso.position.y = 0;
@@ -1184,7 +1185,7 @@ export function createHazmatSuit() {
 
     // Hood
     const hood = new THREE.Mesh(
-        new THREE.SphereGeometry(0.12, 16, 16),
+        getGeometry(THREE.SphereGeometry, 0.12, 16, 16),
         suitMat
     );
     hood.position.y = 0.35;
@@ -1192,7 +1193,7 @@ export function createHazmatSuit() {
 
     // Face shield
     const shield = new THREE.Mesh(
-        new THREE.BoxGeometry(0.15, 0.1, 0.02),
+        getGeometry(THREE.BoxGeometry, 0.15, 0.1, 0.02),
         glassMat
     );
     shield.position.set(0, 0.35, 0.1);
@@ -1201,7 +1202,7 @@ export function createHazmatSuit() {
     // Arms
     for (let i = -1; i <= 1; i += 2) {
         const arm = new THREE.Mesh(
-            new THREE.BoxGeometry(0.1, 0.4, 0.1),
+            getGeometry(THREE.BoxGeometry, 0.1, 0.4, 0.1),
             suitMat
         );
         arm.position.set(i * 0.25, -0.05, 0);
@@ -1210,7 +1211,7 @@ export function createHazmatSuit() {
 
     // Hanger hook
     const hook = new THREE.Mesh(
-        new THREE.TorusGeometry(0.03, 0.005, 8, 16, Math.PI),
+        getGeometry(THREE.TorusGeometry, 0.03, 0.005, 8, 16, Math.PI),
         metalMat
     );
     hook.position.y = 0.55;
@@ -2,6 +2,8 @@ import { generateProceduralObject } from './procedural.js';
 
 /**
  * Creates a procedural object.
+ * Objects of the same type are clones of one cached prototype and share its
+ * geometries and materials - assign a new material rather than editing one.
  * @param {string} type - The type of object (e.g., 'desk', 'chair', 'plant').
  * @param {object} options - { pos: [x,y,z], rot: [x,y,z], scale: [x,y,z], parent: scene }
  * @returns {Promise<THREE.Object3D|null>} - The generated object, or null if creation failed. (Returned as a Promise for async compatibility)
@@ -7,6 +7,8 @@ import { showModal } from './ui.js';
 import * as gameLogic from './gameLogic.js';
 import { WALL_HEIGHT, DESK_SURFACE_Y } from './constants.js';
 import * as Prefabs from './prefabs.js';
+import { replaceMaterial } from './resourceCache.js';
+import { SceneBuilder } from './sceneBuilder.js';
 
 // Room Configuration
 const OFFICE_WIDTH = 10;
@@ -35,8 +37,9 @@ function registerBookshelfInteractables(bookshelf, engine, prefix = "bookshelf")
     }
 }
 
-// Build the office scene
-async function buildOfficeScene(engine) {
+// Build the office scene: the shell is added immediately, furniture and props are
+// queued on the builder. Resolves once the critical (gameplay) chunks are built.
+async function buildOfficeScene(engine, builder) {
     const scene = engine.scene;
     const halfWidth = OFFICE_WIDTH / 2;
     const halfDepth = OFFICE_DEPTH / 2;
@@ -176,573 +179,6 @@ async function buildOfficeScene(engine) {
     lintel.receiveShadow = true;
     scene.add(lintel);
 
-    // ===== OBJECTS =====
-
-    // Executive Desk Area (back left corner)
-    const desk = Prefabs.createDesk(1.5, 0.75, 0.8);
-    desk.position.set(-halfWidth + 1.5, 0, -halfDepth + 1.5);
-    desk.rotation.y = Math.PI / 4; // Angled toward room
-    desk.name = "desk";
-    engine.interactables.push(desk);
-
-    // Create invisible interaction meshes for drawers (any drawer opens the top one)
-    if (desk.userData.drawers && desk.userData.drawers.length > 0) {
-        // For each drawer, add an invisible clickable mesh on the exterior
-        desk.userData.drawers.forEach((drawerGroup, index) => {
-            // Get drawer dimensions (assuming standard desk drawer from prefabs)
-            const drawerWidth = 1.5 * 0.4; // width * 0.4 from prefabs
-            const drawerHeight = 0.75 * 0.25; // height * 0.25 from prefabs
-
-            // Create invisible mesh covering the front face of the drawer
-            const clickMesh = new THREE.Mesh(
-                new THREE.BoxGeometry(drawerWidth, drawerHeight, 0.01),
-                new THREE.MeshBasicMaterial({
-                    transparent: true,
-                    opacity: 0,
-                    side: THREE.DoubleSide
-                })
-            );
-            // Position it at the front of the drawer (where the visible front is)
-            const drawerDepth = 0.8 - 0.1; // desk depth - 0.1 from prefabs
-            clickMesh.position.z = drawerDepth / 2;
-            clickMesh.name = `drawer_${index}_click`;
-            clickMesh.userData.drawerGroup = drawerGroup;
-
-            // Add to drawer group and make interactable
-            drawerGroup.add(clickMesh);
-            engine.interactables.push(clickMesh);
-        });
-
-        const topDrawer = desk.userData.drawers[2]; // Top drawer is index 2
-
-        // Add notepad with handwritten note to drawer 2
-        try {
-            // Make notepad much bigger and thicker
-            const notepad = Prefabs.createNotepad(0.15, 0.03, 0.2);
-            // Raise it up higher so it's above the drawer parts and easier to click
-            notepad.position.set(0.05, 0.02, 0.05);
-            notepad.rotation.y = Math.PI / 6; // Slight angle
-            console.log('Created notepad:', notepad);
-            // Make notepad interactable
-            notepad.children.forEach(child => {
-                if (child.name === 'notepad') {
-                    engine.interactables.push(child);
-                    console.log('Added notepad to interactables');
-                }
-            });
-            topDrawer.add(notepad);
-            console.log('Added notepad to drawer 2');
-
-            // Add pens to drawer 2 (make them much bigger)
-            const penColors = [0x0000ff, 0xff0000, 0x000000];
-            for (let i = 0; i < 3; i++) {
-                const pen = Prefabs.createPen(0.12, 0.008);  // Increased radius from 0.003 to 0.008
-                // Change pen color
-                pen.children[0].material = new THREE.MeshStandardMaterial({
-                    color: penColors[i],
-                    roughness: 0.4
-                });
-                // Raise pens to match notepad height
-                pen.position.set(-0.15 + (i * 0.04), 0.01, -0.05 + (i * 0.02));
-                pen.rotation.y = Math.random() * Math.PI / 4;
-                pen.name = `pen_${i}`;
-                engine.interactables.push(pen);
-                topDrawer.add(pen);
-            }
-            console.log('Added 3 pens to drawer 2');
-        } catch (error) {
-            console.error('Error adding notepad/pens to drawer:', error);
-        }
-    }
-
-    scene.add(desk);
-
-    // Desk Chair (facing the desk)
-    const deskChair = Prefabs.createChair(0.5, 0.9);
-    deskChair.position.set(-halfWidth + 2.3, 0, -halfDepth + 2.3);
-    deskChair.rotation.y = Math.PI / 4 + Math.PI; // Facing desk
-    deskChair.name = "chair";
-    engine.interactables.push(deskChair);
-    scene.add(deskChair);
-
-    // Computer on desk (scaled bigger and moved forward toward chair)
-    const computer = Prefabs.createComputer(0.5, 0.4);
-    computer.position.set(-halfWidth + 1.5, DESK_SURFACE_Y, -halfDepth + 1.3);
-    computer.rotation.y = Math.PI / 4; // Screen faces chair
-    computer.children[0].name = "computer"; // Make screen interactable
-    engine.interactables.push(computer.children[0]);
-    scene.add(computer);
-
-    // Keyboard on desk (in front of monitor)
-    const keyboard = Prefabs.createKeyboard(0.4, 0.15);
-    keyboard.position.set(-halfWidth + 1.7, DESK_SURFACE_Y, -halfDepth + 1.5);
-    keyboard.rotation.y = Math.PI / 4; // Aligned with monitor
-    keyboard.name = "keyboard";
-    engine.interactables.push(keyboard);
-    scene.add(keyboard);
-
-    // Mouse on desk (to the right of keyboard)
-    const mouse = Prefabs.createMouse();
-    mouse.position.set(-halfWidth + 1.9, DESK_SURFACE_Y, -halfDepth + 1.3);
-    mouse.rotation.y = Math.PI / 4; // Aligned with setup
-    mouse.name = "mouse";
-    engine.interactables.push(mouse);
-    scene.add(mouse);
-
-    // Globe on desk (SECRET DOOR TRIGGER)
-    const globe = Prefabs.createGlobe(0.15);
-    globe.position.set(-halfWidth + 0.9, DESK_SURFACE_Y, -halfDepth + 1.0);
-    globe.rotation.y = Math.PI / 6;
-    // Find the globe sphere and make it the trigger
-    const globeSphere = globe.children.find(child => child.name === "globe");
-    if (globeSphere) {
-        globeSphere.name = "secret_globe";
-        globeSphere.userData.isSecretTrigger = true;
-        engine.interactables.push(globeSphere);
-    }
-    scene.add(globe);
-
-    // NEW OBJECTS START HERE
-
-    // Trash Can (north side of desk, near the back wall)
-    const trashCan = Prefabs.createTrashCan(0.15, 0.4);
-    trashCan.position.set(-halfWidth + 1.2, 0, -halfDepth + 0.8);
-    trashCan.name = "trash"; // Flavor text key
-    engine.interactables.push(trashCan.children[0]);
-    scene.add(trashCan);
-
-    // Desk Lamp
-    const deskLamp = Prefabs.createLamp('desk');
-    deskLamp.position.set(-halfWidth + 1.2, DESK_SURFACE_Y, -halfDepth + 1.0);
-    deskLamp.rotation.y = Math.PI / 3;
-    deskLamp.name = "lamp"; // Flavor text key
-    // Add hitbox or children
-    deskLamp.children.forEach(child => {
-        if (child.geometry) engine.interactables.push(child);
-    });
-    scene.add(deskLamp);
-
-    // Filing Cabinet
-    const filingCabinet = Prefabs.createFilingCabinet(0.5, 1.0, 0.6);
-    filingCabinet.position.set(-halfWidth + 0.5, 0, -halfDepth + 3.0);
-    filingCabinet.rotation.y = Math.PI / 2; // Facing into room
-    filingCabinet.name = "filing_cabinet";
-    // Add interactable parts
-    filingCabinet.children.forEach(child => {
-        engine.interactables.push(child);
-    });
-    scene.add(filingCabinet);
-
-    // Paper Shredder (New Puzzle!)
-    const shredder = Prefabs.createPaperShredder();
-    shredder.position.set(-halfWidth + 1.2, 0, -halfDepth + 2.5); // Near desk/chair
-    shredder.rotation.y = Math.PI / 4;
-    // Find the head part for interaction
-    const shredderHead = shredder.children.find(c => c.name === "shredder");
-    const shredderHitbox = shredder.children.find(c => c.name === "shredder_hitbox");
-    if (shredderHitbox) {
-        engine.interactables.push(shredderHitbox);
-    } else if (shredderHead) {
-        engine.interactables.push(shredderHead);
-    }
-    scene.add(shredder);
-
-    // Coat Rack (near entrance - North wall is entrance)
-    const coatRack = Prefabs.createCoatRack();
-    coatRack.position.set(2, 0, -halfDepth + 0.5); // To the right of the door
-    coatRack.name = "coat_rack";
-    coatRack.children.forEach(child => {
-        if (child.geometry) engine.interactables.push(child);
-    });
-    scene.add(coatRack);
-
-    // Briefcase
-    const briefcase = Prefabs.createBriefcase();
-    briefcase.position.set(-halfWidth + 2.5, 0.45, halfDepth - 1.0); // On the sofa
-    briefcase.rotation.y = 0.2;
-    briefcase.rotation.z = 0.1; // Leaning slightly
-    briefcase.name = "briefcase";
-    // Find hitbox or just add group children
-    briefcase.children.forEach(c => {
-        if (c.geometry) engine.interactables.push(c);
-    });
-    scene.add(briefcase);
-
-    // Wall Clock
-    const clock = Prefabs.createClock(0.3);
-    clock.position.set(0, 2.5, halfDepth - 0.05); // South wall, high up
-    clock.rotation.y = Math.PI; // Face north
-    // Find the clock face and make it interactable
-    const clockFace = clock.children.find(c => c.name === 'clock');
-    if (clockFace) {
-        engine.interactables.push(clockFace);
-    } else {
-        // Fallback to first child or group
-        if (clock.children.length > 0) {
-            clock.children[0].name = "clock";
-            engine.interactables.push(clock.children[0]);
-        }
-    }
-    scene.add(clock);
-
-    // Paintings
-    const painting1 = Prefabs.createPainting(1.2, 1.0);
-    painting1.position.set(-halfWidth + 0.05, 2.0, 0); // West wall
-    painting1.rotation.y = Math.PI / 2;
-    painting1.name = "picture";
-    engine.interactables.push(painting1);
-    scene.add(painting1);
-
-    const painting2 = Prefabs.createPainting(1.0, 0.8);
-    painting2.position.set(2, 2.0, halfDepth - 0.05); // South wall
-    painting2.rotation.y = Math.PI;
-    painting2.name = "picture";
-    engine.interactables.push(painting2);
-    scene.add(painting2);
-
-    // Plants
-    const plant1 = Prefabs.createPlant();
-    plant1.position.set(-halfWidth + 0.5, 0, halfDepth - 0.5); // Southwest corner
-    plant1.name = "plant";
-    engine.interactables.push(plant1);
-    scene.add(plant1);
-
-    const plant2 = Prefabs.createPlant();
-    plant2.position.set(0, 0, halfDepth - 0.5); // South wall center (Moved from SE corner to avoid bookshelf)
-    plant2.name = "plant";
-    engine.interactables.push(plant2);
-    scene.add(plant2);
-
-    // --- NEW OBJECTS BATCH 2 ---
-
-    // Printer (Near filing cabinet)
-    const printer = Prefabs.createPrinter();
-    printer.position.set(-halfWidth + 0.5, 1.0, -halfDepth + 3.0); // On top of filing cabinet
-    printer.rotation.y = Math.PI / 2;
-    printer.name = "printer";
-    // Add interactable parts
-    printer.children.forEach(child => {
-        engine.interactables.push(child);
-    });
-    scene.add(printer);
-
-    // Fire Extinguisher (Mounted on North Wall near door)
-    const fireExtinguisher = Prefabs.createFireExtinguisher();
-    fireExtinguisher.position.set(1.5, 1.5, -halfDepth + 0.15); // Left of door
-    fireExtinguisher.name = "fire_extinguisher";
-    // Find hitbox
-    const feHitbox = fireExtinguisher.children.find(c => c.geometry && !c.visible);
-    if (feHitbox) {
-        feHitbox.name = "fire_extinguisher";
-        engine.interactables.push(feHitbox);
-    } else {
-        engine.interactables.push(fireExtinguisher.children[0]);
-    }
-    scene.add(fireExtinguisher);
-
-    // Lunchbox (On round table)
-    const lunchbox = Prefabs.createLunchbox();
-    lunchbox.position.set(2.5, 0.75, 1.5); // On meeting table
-    lunchbox.rotation.y = Math.random() * Math.PI;
-    lunchbox.name = "lunchbox";
-    engine.interactables.push(lunchbox.children[0]);
-    scene.add(lunchbox);
-
-    // Trophy (On top shelf of bookshelf 0)
-    const trophy = Prefabs.createTrophy();
-    trophy.position.set(halfWidth - 0.4, 1.6 + 0.05, -4.5); // Bookshelf 0 top shelf
-    trophy.rotation.y = -Math.PI / 2;
-    trophy.name = "trophy";
-    // Find hitbox
-    const trophyHitbox = trophy.children.find(c => c.geometry && !c.visible);
-    if (trophyHitbox) {
-        trophyHitbox.name = "trophy";
-        engine.interactables.push(trophyHitbox);
-    } else {
-        engine.interactables.push(trophy.children[0]);
-    }
-    scene.add(trophy);
-
-    // Radio (On bookshelf 3)
-    const radio = Prefabs.createRadio();
-    radio.position.set(halfWidth - 0.4, 0.8 + 0.05, 4.5); // Bookshelf 3 middle shelf
-    radio.rotation.y = -Math.PI / 2;
-    radio.name = "radio";
-    engine.interactables.push(radio.children[0]);
-    scene.add(radio);
-
-    // Typewriter (On bookshelf 2 - bottom shelf display)
-    const typewriter = Prefabs.createTypewriter();
-    typewriter.position.set(halfWidth - 0.4, 0.4 + 0.05, 1.5); // Bookshelf 2 bottom shelf
-    typewriter.rotation.y = -Math.PI / 2;
-    typewriter.name = "typewriter";
-    engine.interactables.push(typewriter.children[0]);
-    scene.add(typewriter);
-
-    // Hat (On coat rack)
-    const hat = Prefabs.createHat();
-    hat.position.set(2.05, 1.5, -halfDepth + 0.5); // Hanging on coat rack hook
-    hat.rotation.z = -0.5; // Tilted
-    hat.name = "hat";
-    // Find hitbox
-    const hatHitbox = hat.children.find(c => c.geometry && !c.visible);
-    if (hatHitbox) {
-        hatHitbox.name = "hat";
-        engine.interactables.push(hatHitbox);
-    } else {
-        engine.interactables.push(hat.children[0]);
-    }
-    scene.add(hat);
-
-    // ===== SITTING AREA (Southwest Corner) =====
-    const sittingAreaX = -halfWidth + 2.5;
-    const sittingAreaZ = halfDepth - 2.5;
-
-    // Rug (foundation of the sitting area)
-    const rug = Prefabs.createRug(3.0, 2.5);
-    rug.position.set(sittingAreaX, 0, sittingAreaZ);
-    rug.name = "rug";
-    engine.interactables.push(rug);
-    scene.add(rug);
-
-    // Sofa (against south wall, facing north)
-    const sofa = Prefabs.createSofa(2.0, 0.9, 0.45);
-    sofa.position.set(sittingAreaX, 0, halfDepth - 1.2);
-    sofa.rotation.y = Math.PI; // Face north into room
-    sofa.name = "sofa";
-    engine.interactables.push(sofa);
-    scene.add(sofa);
-
-    // Armchair (east side of coffee table, angled toward sofa and TV)
-    const armchair = Prefabs.createArmchair(0.9, 0.9, 0.45);
-    armchair.position.set(sittingAreaX + 1.2, 0, sittingAreaZ - 0.5);
-    armchair.rotation.y = -Math.PI / 2; // Rotated 135° clockwise from original
-    armchair.name = "armchair";
-    engine.interactables.push(armchair);
-    scene.add(armchair);
-
-    // Coffee Table (in front of sofa)
-    const coffeeTableHeight = 0.35;
-    const coffeeTable = Prefabs.createCoffeeTable(1.0, coffeeTableHeight, 0.6);
-    coffeeTable.position.set(sittingAreaX, 0, sittingAreaZ);
-    // Register only the glass top as interactable to avoid blocking items on the table
-    const glassTop = coffeeTable.children.find(child => child.position.y > 0.1);
-    if (glassTop) {
-        glassTop.name = "coffee_table";
-        engine.interactables.push(glassTop);
-    } else {
-        // Fallback to group
-        coffeeTable.name = "coffee_table";
-        engine.interactables.push(coffeeTable);
-    }
-    scene.add(coffeeTable);
-
-    // TV Stand with TV (against west wall, facing east)
-    const tvStand = Prefabs.createTVStand(1.2, 0.7, 1.5);
-    tvStand.position.set(-halfWidth + 0.5, 0, sittingAreaZ);
-    tvStand.rotation.y = Math.PI / 2; // Face east into room
-    // Find and register TV screen as interactable
-    const tvScreen = tvStand.children.find(child => child.name === "tv_screen");
-    if (tvScreen) {
-        tvScreen.name = "tv";
-        engine.interactables.push(tvScreen);
-    }
-    // Also register TV stand itself as interactable
-    tvStand.children.forEach(child => {
-        if (child !== tvScreen && child.geometry) {
-            child.name = "tv_stand";
-            engine.interactables.push(child);
-        }
-    });
-    scene.add(tvStand);
-
-    // Floor Lamp (beside armchair on east side)
-    const floorLamp = Prefabs.createLamp('floor');
-    floorLamp.position.set(sittingAreaX + 1.8, 0, sittingAreaZ - 1.0);
-    // Register lamp children as interactable (shade, stem, etc.)
-    floorLamp.children.forEach(child => {
-        if (child.geometry) {
-            child.name = "floor_lamp";
-            engine.interactables.push(child);
-        }
-    });
-    scene.add(floorLamp);
-
-    // Coffee Cup on table (positioned above the glass surface)
-    const coffeeCup = Prefabs.createCoffeeCup(0.04, 0.1);
-    coffeeCup.position.set(sittingAreaX - 0.2, coffeeTableHeight + 0.05, sittingAreaZ + 0.1);
-    // Register the cup body mesh (first child) as interactable
-    if (coffeeCup.children.length > 0) {
-        coffeeCup.children[0].name = "coffee_cup";
-        engine.interactables.push(coffeeCup.children[0]);
-    } else {
-        coffeeCup.name = "coffee_cup";
-        engine.interactables.push(coffeeCup);
-    }
-    scene.add(coffeeCup);
-
-    // Newspaper on table (positioned above the glass surface)
-    const newspaper = Prefabs.createNewspaper(0.3, 0.4);
-    newspaper.position.set(sittingAreaX + 0.2, coffeeTableHeight + 0.05, sittingAreaZ - 0.1);
-    newspaper.name = "newspaper";
-    // Make the newspaper mesh itself interactable (it's the first child)
-    if (newspaper.children.length > 0) {
-        newspaper.children[0].name = "newspaper";
-        engine.interactables.push(newspaper.children[0]);
-    } else {
-        engine.interactables.push(newspaper);
-    }
-    scene.add(newspaper);
-
-    // Remote Control on table
-    const remote = Prefabs.createRemote(0.15, 0.05);
-    remote.position.set(sittingAreaX - 0.3, coffeeTableHeight, sittingAreaZ - 0.2);
-    remote.rotation.y = -Math.PI / 6; // Angled
-    // Find the invisible hitbox child and register it as interactable
-    const remoteHitbox = remote.children.find(child => !child.visible && child.geometry);
-    if (remoteHitbox) {
-        remoteHitbox.name = "remote";
-        engine.interactables.push(remoteHitbox);
-    } else {
-        // Fallback to group if no hitbox found
-        remote.name = "remote";
-        engine.interactables.push(remote);
-    }
-    scene.add(remote);
-
-    // ===== CLUTTER & DECOR =====
-
-    // Paper Stack on Desk
-    const paperStack1 = Prefabs.createPaperStack(7);
-    paperStack1.position.set(-halfWidth + 1.8, DESK_SURFACE_Y, -halfDepth + 1.2);
-    paperStack1.rotation.y = Math.random() * 0.5;
-    paperStack1.name = "papers_desk";
-    engine.interactables.push(paperStack1); // Flavor text
-    scene.add(paperStack1);
-
-    // Cardboard Box near Filing Cabinet
-    const box1 = Prefabs.createCardboardBox(0.5, 0.4, 0.5);
-    box1.position.set(-halfWidth + 0.8, 0, -halfDepth + 3.8);
-    box1.rotation.y = Math.random() * 0.5;
-    box1.name = "box_storage";
-    engine.interactables.push(box1);
-    scene.add(box1);
-
-    // Cardboard Box near Coat Rack
-    const box2 = Prefabs.createCardboardBox(0.4, 0.3, 0.4);
-    box2.position.set(2.5, 0, -halfDepth + 0.8);
-    box2.rotation.y = Math.random() * 0.5 + 0.5;
-    box2.name = "box_misc";
-    engine.interactables.push(box2);
-    scene.add(box2);
-
-    // Whiteboard on West Wall
-    const whiteboard = Prefabs.createWhiteboard(2.0, 1.2);
-    whiteboard.position.set(-halfWidth + 0.05, 1.8, 2.5);
-    whiteboard.rotation.y = Math.PI / 2;
-    whiteboard.name = "whiteboard";
-    engine.interactables.push(whiteboard);
-    scene.add(whiteboard);
-
-    // Scattered Books near Sitting Area
-    const scatteredBooks = Prefabs.createScatteredBooks(4);
-    scatteredBooks.position.set(-halfWidth + 3.5, 0, halfDepth - 1.5);
-    scatteredBooks.rotation.y = Math.random() * Math.PI;
-    scatteredBooks.name = "scattered_books";
-    engine.interactables.push(scatteredBooks);
-    scene.add(scatteredBooks);
-
-    // ===== MEETING AREA (South East) =====
-    const meetingX = 2.5;
-    const meetingZ = 1.5;
-
-    // Round Table
-    const roundTable = Prefabs.createRoundTable(0.6, 0.75);
-    roundTable.position.set(meetingX, 0, meetingZ);
-    roundTable.name = "meeting_table";
-    engine.interactables.push(roundTable);
-    scene.add(roundTable);
-
-    // Chairs around table
-    const chairDist = 0.9;
-    const chairAngles = [0, Math.PI / 2, Math.PI, -Math.PI / 2];
-
-    chairAngles.forEach((angle, i) => {
-        const chair = Prefabs.createSimpleChair();
-        const cx = meetingX + Math.sin(angle) * chairDist;
-        const cz = meetingZ + Math.cos(angle) * chairDist;
-
-        chair.position.set(cx, 0, cz);
-        chair.rotation.y = angle + Math.PI; // Face table
-        chair.name = `meeting_chair_${i}`;
-        engine.interactables.push(chair);
-        scene.add(chair);
-    });
-
-    // ===== BREAK CORNER (North East) =====
-
-    // Water Cooler
-    const waterCooler = Prefabs.createWaterCooler();
-    waterCooler.position.set(4.0, 0, -4.0);
-    waterCooler.rotation.y = -Math.PI / 4; // Angled into room
-    waterCooler.name = "water_cooler";
-    engine.interactables.push(waterCooler);
-    scene.add(waterCooler);
-
-    // Corkboard on South Wall
-    const corkboard = Prefabs.createCorkboard(1.2, 0.8);
-    corkboard.position.set(3.0, 1.8, halfDepth - 0.05);
-    corkboard.rotation.y = Math.PI; // Face North
-    corkboard.name = "corkboard";
-    engine.interactables.push(corkboard);
-    scene.add(corkboard);
-
-    // ===== LIBRARY ON EAST WALL =====
-    // Create multiple bookshelves spanning the entire east wall
-    // Each bookshelf is 3 units wide, 4 bookshelves fit perfectly in 12-unit room
-    // (Shelf dimensions defined at start of function)
-    const shelfPositions = [
-        { z: -4.5 },
-        { z: -1.5 },
-        { z: 1.5 },
-        { z: 4.5 }
-    ];
-
-    // Secret bookshelf door variables
-    let secretBookshelfPivot = null;
-    let secretBookshelfOpen = false;
-
-    shelfPositions.forEach((config, idx) => {
-        let bookshelf;
-
-        // Bookshelf 2 (idx === 1) is the SECRET DOOR
-        if (idx === 1) {
-            // Create pivot point for swinging bookshelf
-            secretBookshelfPivot = new THREE.Group();
-            // Position pivot at the back edge of the bookshelf (where hinge would be, against the wall)
-            secretBookshelfPivot.position.set(halfWidth - shelfDepth / 2 - 0.3, 0, config.z - shelfWidth / 2);
-            scene.add(secretBookshelfPivot);
-
-            // Create bookshelf with pre-populated books and add to pivot
-            bookshelf = Prefabs.createBookshelf(shelfWidth, shelfHeight, shelfDepth, numShelves);
-            bookshelf.position.set(0, 0, shelfWidth / 2); // Offset from pivot point
-            bookshelf.rotation.y = -Math.PI / 2; // Rotate to face west (into room)
-            secretBookshelfPivot.add(bookshelf);
-
-            // Register shelf rows as interactables
-            registerBookshelfInteractables(bookshelf, engine, "secret_bookshelf");
-        } else {
-            // Normal static bookshelf with pre-populated books
-            bookshelf = Prefabs.createBookshelf(shelfWidth, shelfHeight, shelfDepth, numShelves);
-            bookshelf.position.set(halfWidth - shelfDepth / 2 - 0.3, 0, config.z);
-            bookshelf.rotation.y = -Math.PI / 2; // Rotate to face west (into room)
-            scene.add(bookshelf);
-
-            // Register shelf rows as interactables
-            registerBookshelfInteractables(bookshelf, engine, `bookshelf_${idx}`);
-        }
-    });
-
     // ===== HIDDEN ROOM BEHIND SECRET BOOKSHELF =====
     // Create a small secret room behind the bookshelf (idx === 1, z = -1.5)
     const hiddenRoomWidth = 3.0;
@@ -751,6 +187,12 @@ async function buildOfficeScene(engine) {
     const hiddenRoomZ = -1.5; // Same Z as secret bookshelf
     const hiddenRoomHeight = shelfHeight; // Match bookshelf height
 
+    // Everything in the hidden room goes in one group: it is a visibility zone,
+    // culled while the secret bookshelf is closed (see declareOfficeZones)
+    const hiddenRoom = new THREE.Group();
+    hiddenRoom.name = "hidden_room";
+    scene.add(hiddenRoom);
+
     const hiddenRoomMaterial = new THREE.MeshStandardMaterial({
         color: 0x8B7355,
         roughness: 0.9,
@@ -765,7 +207,7 @@ async function buildOfficeScene(engine) {
     hiddenFloor.rotation.x = -Math.PI / 2;
     hiddenFloor.position.set(hiddenRoomX, 0, hiddenRoomZ);
     hiddenFloor.receiveShadow = true;
-    scene.add(hiddenFloor);
+    hiddenRoom.add(hiddenFloor);
 
     // Hidden room back wall (east side)
     const hiddenBackWall = new THREE.Mesh(
@@ -776,7 +218,7 @@ async function buildOfficeScene(engine) {
     hiddenBackWall.rotation.y = Math.PI / 2;
     hiddenBackWall.castShadow = true;
     hiddenBackWall.receiveShadow = true;
-    scene.add(hiddenBackWall);
+    hiddenRoom.add(hiddenBackWall);
 
     // Hidden room side walls (north and south)
     const hiddenSideWall1 = new THREE.Mesh(
@@ -786,7 +228,7 @@ async function buildOfficeScene(engine) {
     hiddenSideWall1.position.set(hiddenRoomX, hiddenRoomHeight / 2, hiddenRoomZ + hiddenRoomDepth / 2);
     hiddenSideWall1.castShadow = true;
     hiddenSideWall1.receiveShadow = true;
-    scene.add(hiddenSideWall1);
+    hiddenRoom.add(hiddenSideWall1);
 
     const hiddenSideWall2 = new THREE.Mesh(
         new THREE.BoxGeometry(hiddenRoomDepth, hiddenRoomHeight, WALL_THICKNESS),
@@ -795,7 +237,7 @@ async function buildOfficeScene(engine) {
     hiddenSideWall2.position.set(hiddenRoomX, hiddenRoomHeight / 2, hiddenRoomZ - hiddenRoomDepth / 2);
     hiddenSideWall2.castShadow = true;
     hiddenSideWall2.receiveShadow = true;
-    scene.add(hiddenSideWall2);
+    hiddenRoom.add(hiddenSideWall2);
 
     // Hidden room ceiling
     const hiddenCeiling = new THREE.Mesh(
@@ -804,29 +246,692 @@ async function buildOfficeScene(engine) {
     );
     hiddenCeiling.rotation.x = Math.PI / 2;
     hiddenCeiling.position.set(hiddenRoomX, hiddenRoomHeight, hiddenRoomZ);
-    scene.add(hiddenCeiling);
-
-    // Add the SAFE to the hidden room (inside, against the back wall)
-    const safe = Prefabs.createSafe(0.8, 1.0, 0.8);
-    safe.position.set(hiddenRoomX - 0.8, 0, hiddenRoomZ); // Inside room, against back wall (the bookshelf)
-    safe.rotation.y = -Math.PI / 2; // Face west (into the room)
-    safe.children[0].name = "safe";
-    engine.interactables.push(safe.children[0]);
-    scene.add(safe);
+    hiddenRoom.add(hiddenCeiling);
 
     // Add a light in the hidden room
     const hiddenRoomLight = new THREE.PointLight(0xffaa66, 0.8, 6);
     hiddenRoomLight.position.set(hiddenRoomX, hiddenRoomHeight - 0.5, hiddenRoomZ);
     hiddenRoomLight.castShadow = true;
-    scene.add(hiddenRoomLight);
+    hiddenRoom.add(hiddenRoomLight);
+
+    // ===== OBJECTS (built progressively, nearest first) =====
+    // Critical chunks register the interactables that can hold clues or drive
+    // puzzles; interaction is blocked until they are all in.
+
+    // Built by chunks below; returned once the critical chunks are in
+    let desk = null;
+    let tvScreen = null;
+    let shredder = null;
+
+    builder.add('desk', [-halfWidth + 1.5, -halfDepth + 1.5], () => {
+        // Executive Desk Area (back left corner)
+        desk = Prefabs.createDesk(1.5, 0.75, 0.8);
+        desk.position.set(-halfWidth + 1.5, 0, -halfDepth + 1.5);
+        desk.rotation.y = Math.PI / 4; // Angled toward room
+        desk.name = "desk";
+        engine.interactables.push(desk);
+
+        // Create invisible interaction meshes for drawers (any drawer opens the top one)
+        if (desk.userData.drawers && desk.userData.drawers.length > 0) {
+            // For each drawer, add an invisible clickable mesh on the exterior
+            desk.userData.drawers.forEach((drawerGroup, index) => {
+                // Get drawer dimensions (assuming standard desk drawer from prefabs)
+                const drawerWidth = 1.5 * 0.4; // width * 0.4 from prefabs
+                const drawerHeight = 0.75 * 0.25; // height * 0.25 from prefabs
+
+                // Create invisible mesh covering the front face of the drawer
+                const clickMesh = new THREE.Mesh(
+                    new THREE.BoxGeometry(drawerWidth, drawerHeight, 0.01),
+                    new THREE.MeshBasicMaterial({
+                        transparent: true,
+                        opacity: 0,
+                        side: THREE.DoubleSide
+                    })
+                );
+                // Position it at the front of the drawer (where the visible front is)
+                const drawerDepth = 0.8 - 0.1; // desk depth - 0.1 from prefabs
+                clickMesh.position.z = drawerDepth / 2;
+                clickMesh.name = `drawer_${index}_click`;
+                clickMesh.userData.drawerGroup = drawerGroup;
+
+                // Add to drawer group and make interactable
+                drawerGroup.add(clickMesh);
+                engine.interactables.push(clickMesh);
+            });
 
-    console.log(`Office loaded: ${engine.interactables.length} interactable objects`);
+            const topDrawer = desk.userData.drawers[2]; // Top drawer is index 2
+
+            // Add notepad with handwritten note to drawer 2
+            try {
+                // Make notepad much bigger and thicker
+                const notepad = Prefabs.createNotepad(0.15, 0.03, 0.2);
+                // Raise it up higher so it's above the drawer parts and easier to click
+                notepad.position.set(0.05, 0.02, 0.05);
+                notepad.rotation.y = Math.PI / 6; // Slight angle
+                console.log('Created notepad:', notepad);
+                // Make notepad interactable
+                notepad.children.forEach(child => {
+                    if (child.name === 'notepad') {
+                        engine.interactables.push(child);
+                        console.log('Added notepad to interactables');
+                    }
+                });
+                topDrawer.add(notepad);
+                console.log('Added notepad to drawer 2');
+
+                // Add pens to drawer 2 (make them much bigger)
+                const penColors = [0x0000ff, 0xff0000, 0x000000];
+                for (let i = 0; i < 3; i++) {
+                    const pen = Prefabs.createPen(0.12, 0.008);  // Increased radius from 0.003 to 0.008
+                    // Change pen color
+                    pen.children[0].material = new THREE.MeshStandardMaterial({
+                        color: penColors[i],
+                        roughness: 0.4
+                    });
+                    // Raise pens to match notepad height
+                    pen.position.set(-0.15 + (i * 0.04), 0.01, -0.05 + (i * 0.02));
+                    pen.rotation.y = Math.random() * Math.PI / 4;
+                    pen.name = `pen_${i}`;
+                    engine.interactables.push(pen);
+                    topDrawer.add(pen);
+                }
+                console.log('Added 3 pens to drawer 2');
+            } catch (error) {
+                console.error('Error adding notepad/pens to drawer:', error);
+            }
+        }
+
+        scene.add(desk);
+    }, { critical: true });
+
+    builder.add('desk_chair', [-halfWidth + 2.3, -halfDepth + 2.3], () => {
+        // Desk Chair (facing the desk)
+        const deskChair = Prefabs.createChair(0.5, 0.9);
+        deskChair.position.set(-halfWidth + 2.3, 0, -halfDepth + 2.3);
+        deskChair.rotation.y = Math.PI / 4 + Math.PI; // Facing desk
+        deskChair.name = "chair";
+        engine.interactables.push(deskChair);
+        scene.add(deskChair);
+    }, { critical: true });
+
+    builder.add('computer', [-halfWidth + 1.5, -halfDepth + 1.3], () => {
+        // Computer on desk (scaled bigger and moved forward toward chair)
+        const computer = Prefabs.createComputer(0.5, 0.4);
+        computer.position.set(-halfWidth + 1.5, DESK_SURFACE_Y, -halfDepth + 1.3);
+        computer.rotation.y = Math.PI / 4; // Screen faces chair
+        computer.children[0].name = "computer"; // Make screen interactable
+        engine.interactables.push(computer.children[0]);
+        scene.add(computer);
+    }, { critical: true });
+
+    builder.add('keyboard', [-halfWidth + 1.7, -halfDepth + 1.5], () => {
+        // Keyboard on desk (in front of monitor)
+        const keyboard = Prefabs.createKeyboard(0.4, 0.15);
+        keyboard.position.set(-halfWidth + 1.7, DESK_SURFACE_Y, -halfDepth + 1.5);
+        keyboard.rotation.y = Math.PI / 4; // Aligned with monitor
+        keyboard.name = "keyboard";
+        engine.interactables.push(keyboard);
+        scene.add(keyboard);
+    }, { critical: true });
+
+    builder.add('mouse', [-halfWidth + 1.9, -halfDepth + 1.3], () => {
+        // Mouse on desk (to the right of keyboard)
+        const mouse = Prefabs.createMouse();
+        mouse.position.set(-halfWidth + 1.9, DESK_SURFACE_Y, -halfDepth + 1.3);
+        mouse.rotation.y = Math.PI / 4; // Aligned with setup
+        mouse.name = "mouse";
+        engine.interactables.push(mouse);
+        scene.add(mouse);
+    }, { critical: true });
+
+    builder.add('globe', [-halfWidth + 0.9, -halfDepth + 1.0], () => {
+        // Globe on desk (SECRET DOOR TRIGGER)
+        const globe = Prefabs.createGlobe(0.15);
+        globe.position.set(-halfWidth + 0.9, DESK_SURFACE_Y, -halfDepth + 1.0);
+        globe.rotation.y = Math.PI / 6;
+        // Find the globe sphere and make it the trigger
+        const globeSphere = globe.children.find(child => child.name === "globe");
+        if (globeSphere) {
+            globeSphere.name = "secret_globe";
+            globeSphere.userData.isSecretTrigger = true;
+            engine.interactables.push(globeSphere);
+        }
+        scene.add(globe);
+    }, { critical: true });
+
+    // NEW OBJECTS START HERE
+
+    builder.add('trash', [-halfWidth + 1.2, -halfDepth + 0.8], () => {
+        // Trash Can (north side of desk, near the back wall)
+        const trashCan = Prefabs.createTrashCan(0.15, 0.4);
+        trashCan.position.set(-halfWidth + 1.2, 0, -halfDepth + 0.8);
+        trashCan.name = "trash"; // Flavor text key
+        engine.interactables.push(trashCan.children[0]);
+        scene.add(trashCan);
+    }, { critical: true });
+
+    builder.add('desk_lamp', [-halfWidth + 1.2, -halfDepth + 1.0], () => {
+        // Desk Lamp
+        const deskLamp = Prefabs.createLamp('desk');
+        deskLamp.position.set(-halfWidth + 1.2, DESK_SURFACE_Y, -halfDepth + 1.0);
+        deskLamp.rotation.y = Math.PI / 3;
+        deskLamp.name = "lamp"; // Flavor text key
+        // Add hitbox or children
+        deskLamp.children.forEach(child => {
+            if (child.geometry) engine.interactables.push(child);
+        });
+        scene.add(deskLamp);
+    }, { critical: true });
+
+    builder.add('filing_cabinet', [-halfWidth + 0.5, -halfDepth + 3.0], () => {
+        // Filing Cabinet
+        const filingCabinet = Prefabs.createFilingCabinet(0.5, 1.0, 0.6);
+        filingCabinet.position.set(-halfWidth + 0.5, 0, -halfDepth + 3.0);
+        filingCabinet.rotation.y = Math.PI / 2; // Facing into room
+        filingCabinet.name = "filing_cabinet";
+        // Add interactable parts
+        filingCabinet.children.forEach(child => {
+            engine.interactables.push(child);
+        });
+        scene.add(filingCabinet);
+    }, { critical: true });
+
+    builder.add('shredder', [-halfWidth + 1.2, -halfDepth + 2.5], () => {
+        // Paper Shredder (New Puzzle!)
+        shredder = Prefabs.createPaperShredder();
+        shredder.position.set(-halfWidth + 1.2, 0, -halfDepth + 2.5); // Near desk/chair
+        shredder.rotation.y = Math.PI / 4;
+        // Find the head part for interaction
+        const shredderHead = shredder.children.find(c => c.name === "shredder");
+        const shredderHitbox = shredder.children.find(c => c.name === "shredder_hitbox");
+        if (shredderHitbox) {
+            engine.interactables.push(shredderHitbox);
+        } else if (shredderHead) {
+            engine.interactables.push(shredderHead);
+        }
+        scene.add(shredder);
+    }, { critical: true });
+
+    builder.add('coat_rack', [2, -halfDepth + 0.5], () => {
+        // Coat Rack (near entrance - North wall is entrance)
+        const coatRack = Prefabs.createCoatRack();
+        coatRack.position.set(2, 0, -halfDepth + 0.5); // To the right of the door
+        coatRack.name = "coat_rack";
+        coatRack.children.forEach(child => {
+            if (child.geometry) engine.interactables.push(child);
+        });
+        scene.add(coatRack);
+    });
+
+    builder.add('briefcase', [-halfWidth + 2.5, halfDepth - 1.0], () => {
+        // Briefcase
+        const briefcase = Prefabs.createBriefcase();
+        briefcase.position.set(-halfWidth + 2.5, 0.45, halfDepth - 1.0); // On the sofa
+        briefcase.rotation.y = 0.2;
+        briefcase.rotation.z = 0.1; // Leaning slightly
+        briefcase.name = "briefcase";
+        // Find hitbox or just add group children
+        briefcase.children.forEach(c => {
+            if (c.geometry) engine.interactables.push(c);
+        });
+        scene.add(briefcase);
+    }, { critical: true });
+
+    builder.add('clock', [0, halfDepth - 0.05], () => {
+        // Wall Clock
+        const clock = Prefabs.createClock(0.3);
+        clock.position.set(0, 2.5, halfDepth - 0.05); // South wall, high up
+        clock.rotation.y = Math.PI; // Face north
+        // Find the clock face and make it interactable
+        const clockFace = clock.children.find(c => c.name === 'clock');
+        if (clockFace) {
+            engine.interactables.push(clockFace);
+        } else {
+            // Fallback to first child or group
+            if (clock.children.length > 0) {
+                clock.children[0].name = "clock";
+                engine.interactables.push(clock.children[0]);
+            }
+        }
+        scene.add(clock);
+    }, { critical: true });
+
+    builder.add('paintings', [-halfWidth + 0.05, 0], () => {
+        // Paintings
+        const painting1 = Prefabs.createPainting(1.2, 1.0);
+        painting1.position.set(-halfWidth + 0.05, 2.0, 0); // West wall
+        painting1.rotation.y = Math.PI / 2;
+        painting1.name = "picture";
+        engine.interactables.push(painting1);
+        scene.add(painting1);
+
+        const painting2 = Prefabs.createPainting(1.0, 0.8);
+        painting2.position.set(2, 2.0, halfDepth - 0.05); // South wall
+        painting2.rotation.y = Math.PI;
+        painting2.name = "picture";
+        engine.interactables.push(painting2);
+        scene.add(painting2);
+    }, { critical: true });
+
+    builder.add('plants', [-halfWidth + 0.5, halfDepth - 0.5], () => {
+        // Plants
+        const plant1 = Prefabs.createPlant();
+        plant1.position.set(-halfWidth + 0.5, 0, halfDepth - 0.5); // Southwest corner
+        plant1.name = "plant";
+        engine.interactables.push(plant1);
+        scene.add(plant1);
+
+        const plant2 = Prefabs.createPlant();
+        plant2.position.set(0, 0, halfDepth - 0.5); // South wall center (Moved from SE corner to avoid bookshelf)
+        plant2.name = "plant";
+        engine.interactables.push(plant2);
+        scene.add(plant2);
+    }, { critical: true });
+
+    // --- NEW OBJECTS BATCH 2 ---
 
-    // Return engine, desk, and secret bookshelf for animation
+    builder.add('printer', [-halfWidth + 0.5, -halfDepth + 3.0], () => {
+        // Printer (Near filing cabinet)
+        const printer = Prefabs.createPrinter();
+        printer.position.set(-halfWidth + 0.5, 1.0, -halfDepth + 3.0); // On top of filing cabinet
+        printer.rotation.y = Math.PI / 2;
+        printer.name = "printer";
+        // Add interactable parts
+        printer.children.forEach(child => {
+            engine.interactables.push(child);
+        });
+        scene.add(printer);
+    }, { critical: true });
+
+    builder.add('fire_extinguisher', [1.5, -halfDepth + 0.15], () => {
+        // Fire Extinguisher (Mounted on North Wall near door)
+        const fireExtinguisher = Prefabs.createFireExtinguisher();
+        fireExtinguisher.position.set(1.5, 1.5, -halfDepth + 0.15); // Left of door
+        fireExtinguisher.name = "fire_extinguisher";
+        // Find hitbox
+        const feHitbox = fireExtinguisher.children.find(c => c.geometry && !c.visible);
+        if (feHitbox) {
+            feHitbox.name = "fire_extinguisher";
+            engine.interactables.push(feHitbox);
+        } else {
+            engine.interactables.push(fireExtinguisher.children[0]);
+        }
+        scene.add(fireExtinguisher);
+    }, { critical: true });
+
+    builder.add('lunchbox', [2.5, 1.5], () => {
+        // Lunchbox (On round table)
+        const lunchbox = Prefabs.createLunchbox();
+        lunchbox.position.set(2.5, 0.75, 1.5); // On meeting table
+        lunchbox.rotation.y = Math.random() * Math.PI;
+        lunchbox.name = "lunchbox";
+        engine.interactables.push(lunchbox.children[0]);
+        scene.add(lunchbox);
+    }, { critical: true });
+
+    builder.add('trophy', [halfWidth - 0.4, -4.5], () => {
+        // Trophy (On top shelf of bookshelf 0)
+        const trophy = Prefabs.createTrophy();
+        trophy.position.set(halfWidth - 0.4, 1.6 + 0.05, -4.5); // Bookshelf 0 top shelf
+        trophy.rotation.y = -Math.PI / 2;
+        trophy.name = "trophy";
+        // Find hitbox
+        const trophyHitbox = trophy.children.find(c => c.geometry && !c.visible);
+        if (trophyHitbox) {
+            trophyHitbox.name = "trophy";
+            engine.interactables.push(trophyHitbox);
+        } else {
+            engine.interactables.push(trophy.children[0]);
+        }
+        scene.add(trophy);
+    }, { critical: true });
+
+    builder.add('radio', [halfWidth - 0.4, 4.5], () => {
+        // Radio (On bookshelf 3)
+        const radio = Prefabs.createRadio();
+        radio.position.set(halfWidth - 0.4, 0.8 + 0.05, 4.5); // Bookshelf 3 middle shelf
+        radio.rotation.y = -Math.PI / 2;
+        radio.name = "radio";
+        engine.interactables.push(radio.children[0]);
+        scene.add(radio);
+    }, { critical: true });
+
+    builder.add('typewriter', [halfWidth - 0.4, 1.5], () => {
+        // Typewriter (On bookshelf 2 - bottom shelf display)
+        const typewriter = Prefabs.createTypewriter();
+        typewriter.position.set(halfWidth - 0.4, 0.4 + 0.05, 1.5); // Bookshelf 2 bottom shelf
+        typewriter.rotation.y = -Math.PI / 2;
+        typewriter.name = "typewriter";
+        engine.interactables.push(typewriter.children[0]);
+        scene.add(typewriter);
+    }, { critical: true });
+
+    builder.add('hat', [2.05, -halfDepth + 0.5], () => {
+        // Hat (On coat rack)
+        const hat = Prefabs.createHat();
+        hat.position.set(2.05, 1.5, -halfDepth + 0.5); // Hanging on coat rack hook
+        hat.rotation.z = -0.5; // Tilted
+        hat.name = "hat";
+        // Find hitbox
+        const hatHitbox = hat.children.find(c => c.geometry && !c.visible);
+        if (hatHitbox) {
+            hatHitbox.name = "hat";
+            engine.interactables.push(hatHitbox);
+        } else {
+            engine.interactables.push(hat.children[0]);
+        }
+        scene.add(hat);
+    }, { critical: true });
+
+    // ===== SITTING AREA (Southwest Corner) =====
+    const sittingAreaX = -halfWidth + 2.5;
+    const sittingAreaZ = halfDepth - 2.5;
+
+    builder.add('rug', [sittingAreaX, sittingAreaZ], () => {
+        // Rug (foundation of the sitting area)
+        const rug = Prefabs.createRug(3.0, 2.5);
+        rug.position.set(sittingAreaX, 0, sittingAreaZ);
+        rug.name = "rug";
+        engine.interactables.push(rug);
+        scene.add(rug);
+    });
+
+    builder.add('sofa', [sittingAreaX, halfDepth - 1.2], () => {
+        // Sofa (against south wall, facing north)
+        const sofa = Prefabs.createSofa(2.0, 0.9, 0.45);
+        sofa.position.set(sittingAreaX, 0, halfDepth - 1.2);
+        sofa.rotation.y = Math.PI; // Face north into room
+        sofa.name = "sofa";
+        engine.interactables.push(sofa);
+        scene.add(sofa);
+    }, { critical: true });
+
+    builder.add('armchair', [sittingAreaX + 1.2, sittingAreaZ - 0.5], () => {
+        // Armchair (east side of coffee table, angled toward sofa and TV)
+        const armchair = Prefabs.createArmchair(0.9, 0.9, 0.45);
+        armchair.position.set(sittingAreaX + 1.2, 0, sittingAreaZ - 0.5);
+        armchair.rotation.y = -Math.PI / 2; // Rotated 135° clockwise from original
+        armchair.name = "armchair";
+        engine.interactables.push(armchair);
+        scene.add(armchair);
+    }, { critical: true });
+
+    const coffeeTableHeight = 0.35;
+    builder.add('coffee_table', [sittingAreaX, sittingAreaZ], () => {
+        // Coffee Table (in front of sofa)
+        const coffeeTable = Prefabs.createCoffeeTable(1.0, coffeeTableHeight, 0.6);
+        coffeeTable.position.set(sittingAreaX, 0, sittingAreaZ);
+        // Register only the glass top as interactable to avoid blocking items on the table
+        const glassTop = coffeeTable.children.find(child => child.position.y > 0.1);
+        if (glassTop) {
+            glassTop.name = "coffee_table";
+            engine.interactables.push(glassTop);
+        } else {
+            // Fallback to group
+            coffeeTable.name = "coffee_table";
+            engine.interactables.push(coffeeTable);
+        }
+        scene.add(coffeeTable);
+    }, { critical: true });
+
+    builder.add('tv', [-halfWidth + 0.5, sittingAreaZ], () => {
+        // TV Stand with TV (against west wall, facing east)
+        const tvStand = Prefabs.createTVStand(1.2, 0.7, 1.5);
+        tvStand.position.set(-halfWidth + 0.5, 0, sittingAreaZ);
+        tvStand.rotation.y = Math.PI / 2; // Face east into room
+        // Find and register TV screen as interactable
+        tvScreen = tvStand.children.find(child => child.name === "tv_screen");
+        if (tvScreen) {
+            tvScreen.name = "tv";
+            engine.interactables.push(tvScreen);
+        }
+        // Also register TV stand itself as interactable
+        tvStand.children.forEach(child => {
+            if (child !== tvScreen && child.geometry) {
+                child.name = "tv_stand";
+                engine.interactables.push(child);
+            }
+        });
+        scene.add(tvStand);
+    }, { critical: true });
+
+    builder.add('floor_lamp', [sittingAreaX + 1.8, sittingAreaZ - 1.0], () => {
+        // Floor Lamp (beside armchair on east side)
+        const floorLamp = Prefabs.createLamp('floor');
+        floorLamp.position.set(sittingAreaX + 1.8, 0, sittingAreaZ - 1.0);
+        // Register lamp children as interactable (shade, stem, etc.)
+        floorLamp.children.forEach(child => {
+            if (child.geometry) {
+                child.name = "floor_lamp";
+                engine.interactables.push(child);
+            }
+        });
+        scene.add(floorLamp);
+    }, { critical: true });
+
+    builder.add('coffee_cup', [sittingAreaX - 0.2, sittingAreaZ + 0.1], () => {
+        // Coffee Cup on table (positioned above the glass surface)
+        const coffeeCup = Prefabs.createCoffeeCup(0.04, 0.1);
+        coffeeCup.position.set(sittingAreaX - 0.2, coffeeTableHeight + 0.05, sittingAreaZ + 0.1);
+        // Register the cup body mesh (first child) as interactable
+        if (coffeeCup.children.length > 0) {
+            coffeeCup.children[0].name = "coffee_cup";
+            engine.interactables.push(coffeeCup.children[0]);
+        } else {
+            coffeeCup.name = "coffee_cup";
+            engine.interactables.push(coffeeCup);
+        }
+        scene.add(coffeeCup);
+    }, { critical: true });
+
+    builder.add('newspaper', [sittingAreaX + 0.2, sittingAreaZ - 0.1], () => {
+        // Newspaper on table (positioned above the glass surface)
+        const newspaper = Prefabs.createNewspaper(0.3, 0.4);
+        newspaper.position.set(sittingAreaX + 0.2, coffeeTableHeight + 0.05, sittingAreaZ - 0.1);
+        newspaper.name = "newspaper";
+        // Make the newspaper mesh itself interactable (it's the first child)
+        if (newspaper.children.length > 0) {
+            newspaper.children[0].name = "newspaper";
+            engine.interactables.push(newspaper.children[0]);
+        } else {
+            engine.interactables.push(newspaper);
+        }
+        scene.add(newspaper);
+    }, { critical: true });
+
+    builder.add('remote', [sittingAreaX - 0.3, sittingAreaZ - 0.2], () => {
+        // Remote Control on table
+        const remote = Prefabs.createRemote(0.15, 0.05);
+        remote.position.set(sittingAreaX - 0.3, coffeeTableHeight, sittingAreaZ - 0.2);
+        remote.rotation.y = -Math.PI / 6; // Angled
+        // Find the invisible hitbox child and register it as interactable
+        const remoteHitbox = remote.children.find(child => !child.visible && child.geometry);
+        if (remoteHitbox) {
+            remoteHitbox.name = "remote";
+            engine.interactables.push(remoteHitbox);
+        } else {
+            // Fallback to group if no hitbox found
+            remote.name = "remote";
+            engine.interactables.push(remote);
+        }
+        scene.add(remote);
+    }, { critical: true });
+
+    // ===== CLUTTER & DECOR =====
+
+    builder.add('paper_stack', [-halfWidth + 1.8, -halfDepth + 1.2], () => {
+        // Paper Stack on Desk
+        const paperStack1 = Prefabs.createPaperStack(7);
+        paperStack1.position.set(-halfWidth + 1.8, DESK_SURFACE_Y, -halfDepth + 1.2);
+        paperStack1.rotation.y = Math.random() * 0.5;
+        paperStack1.name = "papers_desk";
+        engine.interactables.push(paperStack1); // Flavor text
+        scene.add(paperStack1);
+    });
+
+    builder.add('box_storage', [-halfWidth + 0.8, -halfDepth + 3.8], () => {
+        // Cardboard Box near Filing Cabinet
+        const box1 = Prefabs.createCardboardBox(0.5, 0.4, 0.5);
+        box1.position.set(-halfWidth + 0.8, 0, -halfDepth + 3.8);
+        box1.rotation.y = Math.random() * 0.5;
+        box1.name = "box_storage";
+        engine.interactables.push(box1);
+        scene.add(box1);
+    });
+
+    builder.add('box_misc', [2.5, -halfDepth + 0.8], () => {
+        // Cardboard Box near Coat Rack
+        const box2 = Prefabs.createCardboardBox(0.4, 0.3, 0.4);
+        box2.position.set(2.5, 0, -halfDepth + 0.8);
+        box2.rotation.y = Math.random() * 0.5 + 0.5;
+        box2.name = "box_misc";
+        engine.interactables.push(box2);
+        scene.add(box2);
+    });
+
+    builder.add('whiteboard', [-halfWidth + 0.05, 2.5], () => {
+        // Whiteboard on West Wall
+        const whiteboard = Prefabs.createWhiteboard(2.0, 1.2);
+        whiteboard.position.set(-halfWidth + 0.05, 1.8, 2.5);
+        whiteboard.rotation.y = Math.PI / 2;
+        whiteboard.name = "whiteboard";
+        engine.interactables.push(whiteboard);
+        scene.add(whiteboard);
+    });
+
+    builder.add('scattered_books', [-halfWidth + 3.5, halfDepth - 1.5], () => {
+        // Scattered Books near Sitting Area
+        const scatteredBooks = Prefabs.createScatteredBooks(4);
+        scatteredBooks.position.set(-halfWidth + 3.5, 0, halfDepth - 1.5);
+        scatteredBooks.rotation.y = Math.random() * Math.PI;
+        scatteredBooks.name = "scattered_books";
+        engine.interactables.push(scatteredBooks);
+        scene.add(scatteredBooks);
+    });
+
+    // ===== MEETING AREA (South East) =====
+    const meetingX = 2.5;
+    const meetingZ = 1.5;
+
+    builder.add('meeting_table', [meetingX, meetingZ], () => {
+        // Round Table
+        const roundTable = Prefabs.createRoundTable(0.6, 0.75);
+        roundTable.position.set(meetingX, 0, meetingZ);
+        roundTable.name = "meeting_table";
+        engine.interactables.push(roundTable);
+        scene.add(roundTable);
+
+        // Chairs around table
+        const chairDist = 0.9;
+        const chairAngles = [0, Math.PI / 2, Math.PI, -Math.PI / 2];
+
+        chairAngles.forEach((angle, i) => {
+            const chair = Prefabs.createSimpleChair();
+            const cx = meetingX + Math.sin(angle) * chairDist;
+            const cz = meetingZ + Math.cos(angle) * chairDist;
+
+            chair.position.set(cx, 0, cz);
+            chair.rotation.y = angle + Math.PI; // Face table
+            chair.name = `meeting_chair_${i}`;
+            engine.interactables.push(chair);
+            scene.add(chair);
+        });
+    });
+
+    // ===== BREAK CORNER (North East) =====
+
+    builder.add('water_cooler', [4.0, -4.0], () => {
+        // Water Cooler
+        const waterCooler = Prefabs.createWaterCooler();
+        waterCooler.position.set(4.0, 0, -4.0);
+        waterCooler.rotation.y = -Math.PI / 4; // Angled into room
+        waterCooler.name = "water_cooler";
+        engine.interactables.push(waterCooler);
+        scene.add(waterCooler);
+    });
+
+    builder.add('corkboard', [3.0, halfDepth - 0.05], () => {
+        // Corkboard on South Wall
+        const corkboard = Prefabs.createCorkboard(1.2, 0.8);
+        corkboard.position.set(3.0, 1.8, halfDepth - 0.05);
+        corkboard.rotation.y = Math.PI; // Face North
+        corkboard.name = "corkboard";
+        engine.interactables.push(corkboard);
+        scene.add(corkboard);
+    });
+
+    // ===== LIBRARY ON EAST WALL =====
+    // Create multiple bookshelves spanning the entire east wall
+    // Each bookshelf is 3 units wide, 4 bookshelves fit perfectly in 12-unit room
+    // (Shelf dimensions defined at start of function)
+    const shelfPositions = [
+        { z: -4.5 },
+        { z: -1.5 },
+        { z: 1.5 },
+        { z: 4.5 }
+    ];
+
+    // Secret bookshelf door pivot
+    let secretBookshelfPivot = null;
+
+    // One chunk per bookshelf - each is dozens of books
+    shelfPositions.forEach((config, idx) => {
+        builder.add(`bookshelf_${idx}`, [halfWidth - shelfDepth / 2 - 0.3, config.z], () => {
+            let bookshelf;
+
+            // Bookshelf 2 (idx === 1) is the SECRET DOOR
+            if (idx === 1) {
+                // Create pivot point for swinging bookshelf
+                secretBookshelfPivot = new THREE.Group();
+                // Position pivot at the back edge of the bookshelf (where hinge would be, against the wall)
+                secretBookshelfPivot.position.set(halfWidth - shelfDepth / 2 - 0.3, 0, config.z - shelfWidth / 2);
+                scene.add(secretBookshelfPivot);
+
+                // Create bookshelf with pre-populated books and add to pivot
+                bookshelf = Prefabs.createBookshelf(shelfWidth, shelfHeight, shelfDepth, numShelves);
+                bookshelf.position.set(0, 0, shelfWidth / 2); // Offset from pivot point
+                bookshelf.rotation.y = -Math.PI / 2; // Rotate to face west (into room)
+                secretBookshelfPivot.add(bookshelf);
+
+                // Register shelf rows as interactables
+                registerBookshelfInteractables(bookshelf, engine, "secret_bookshelf");
+            } else {
+                // Normal static bookshelf with pre-populated books
+                bookshelf = Prefabs.createBookshelf(shelfWidth, shelfHeight, shelfDepth, numShelves);
+                bookshelf.position.set(halfWidth - shelfDepth / 2 - 0.3, 0, config.z);
+                bookshelf.rotation.y = -Math.PI / 2; // Rotate to face west (into room)
+                scene.add(bookshelf);
+
+                // Register shelf rows as interactables
+                registerBookshelfInteractables(bookshelf, engine, `bookshelf_${idx}`);
+            }
+        }, { critical: true });
+    });
+
+    builder.add('safe', [hiddenRoomX - 0.8, hiddenRoomZ], () => {
+        // Add the SAFE to the hidden room (inside, against the back wall)
+        const safe = Prefabs.createSafe(0.8, 1.0, 0.8);
+        safe.position.set(hiddenRoomX - 0.8, 0, hiddenRoomZ); // Inside room, against back wall (the bookshelf)
+        safe.rotation.y = -Math.PI / 2; // Face west (into the room)
+        safe.children[0].name = "safe";
+        engine.interactables.push(safe.children[0]);
+        hiddenRoom.add(safe);
+    }, { critical: true });
+
+    // Everything above ran synchronously (the shell) or was queued; wait for the gameplay chunks
+    await builder.ready;
+
+    return createOfficeData(engine, { desk, secretBookshelfPivot, hiddenRoom, tvScreen, shredder });
+}
+
+// Office data for the interaction handlers, from a procedural build or a baked snapshot's refs
+function createOfficeData(engine, { desk, secretBookshelfPivot, hiddenRoom, tvScreen, shredder }) {
+    let secretBookshelfOpen = false;
     return {
         engine,
         desk,
         secretBookshelfPivot,
+        hiddenRoom,
         getSecretBookshelfState: () => secretBookshelfOpen,
         toggleSecretBookshelf: () => {
             secretBookshelfOpen = !secretBookshelfOpen;
@@ -837,6 +942,32 @@ async function buildOfficeScene(engine) {
     };
 }
 
+// Visibility zones: the hidden room is only drawn while the secret bookshelf is
+// swung open (and its opening is in view), the top drawer's contents only while
+// the drawer is pulled out
+function declareOfficeZones(engine, { desk, secretBookshelfPivot, hiddenRoom }) {
+    // Padded: the east bound is widened to 8.5 while open, past the hidden room's walls
+    engine.zones.addZone('hidden_room', {
+        objects: [hiddenRoom],
+        bounds: new THREE.Box3().setFromObject(hiddenRoom).expandByScalar(0.5)
+    });
+    // The closed bookshelf covers the opening; pad it so the edges of the doorway count
+    engine.zones.addPortal('main', 'hidden_room', {
+        isOpen: () => secretBookshelfPivot.rotation.y !== 0,
+        bounds: new THREE.Box3().setFromObject(secretBookshelfPivot).expandByScalar(0.5)
+    });
+
+    const topDrawer = (desk.userData.drawers || [])[2];
+    if (!topDrawer) return;
+    // Notepad and pens; the drawer's own panels and click mesh carry userData.drawerGroup
+    engine.zones.addZone('top_drawer', {
+        objects: topDrawer.children.filter(child => !child.userData.drawerGroup)
+    });
+    engine.zones.addPortal('main', 'top_drawer', {
+        isOpen: () => topDrawer.position.z !== 0
+    });
+}
+
 // Drawer interaction handler (any drawer opens the top one)
 function handleDrawerInteraction(clickedMesh, engine) {
     // Get the drawer group from the clicked mesh
@@ -856,6 +987,11 @@ function handleDrawerInteraction(clickedMesh, engine) {
     topDrawer.userData.isOpen = !wasOpen;
     topDrawer.userData.targetZ = topDrawer.userData.isOpen ? topDrawer.userData.openDistance : 0;
 
+    // Slide toward the new target on the engine's frame delta until settled
+    if (engine) {
+        engine.animations.add('drawers', (dt) => animateDrawers(desk, dt));
+    }
+
     // Manage click mesh interactability
     // Find the click mesh in the top drawer
     const clickMesh = topDrawer.children.find(child => child.name && child.name.includes('_click'));
@@ -875,9 +1011,11 @@ function handleDrawerInteraction(clickedMesh, engine) {
     }
 }
 
+// Returns true while any drawer is still moving
 function animateDrawers(desk, deltaTime) {
-    if (!desk.userData.drawers) return;
+    if (!desk.userData.drawers) return false;
 
+    let moving = false;
     desk.userData.drawers.forEach(drawer => {
         // Smooth animation toward target position
         const speed = 2.0; // Animation speed
@@ -885,15 +1023,18 @@ function animateDrawers(desk, deltaTime) {
 
         if (Math.abs(diff) > 0.001) {
             drawer.position.z += diff * speed * deltaTime;
-        } else {
+            moving = true;
+        } else if (drawer.position.z !== drawer.userData.targetZ) {
             drawer.position.z = drawer.userData.targetZ;
+            moving = true;
         }
     });
+    return moving;
 }
 
-// Animate secret bookshelf door
+// Animate secret bookshelf door; returns true while it is still moving
 function animateSecretBookshelf(pivot, isOpen, deltaTime) {
-    if (!pivot) return;
+    if (!pivot) return false;
 
     const targetRotation = isOpen ? -Math.PI / 2 : 0; // 90 degrees when open
     const speed = 2.0; // Animation speed
@@ -901,9 +1042,13 @@ function animateSecretBookshelf(pivot, isOpen, deltaTime) {
 
     if (Math.abs(diff) > 0.001) {
         pivot.rotation.y += diff * speed * deltaTime;
-    } else {
+        return true;
+    }
+    if (pivot.rotation.y !== targetRotation) {
         pivot.rotation.y = targetRotation;
+        return true;
     }
+    return false;
 }
 
 // Show notepad modal with handwritten note
@@ -1095,7 +1240,9 @@ function initShredderPuzzleLogic(officeState) {
 async function initOffice() {
     // Office scene data (will be set after building scene)
     let officeData = null;
+    let originalMaxX = 0;
     const officeState = { shredderSolved: false };
+    let tvClueMaterial = null;
 
     const engine = new RoomEngine({
         roomWidth: OFFICE_WIDTH,
@@ -1111,6 +1258,11 @@ async function initOffice() {
             if (name === 'secret_globe' && officeData) {
                 const isOpen = officeData.toggleSecretBookshelf();
                 console.log(`Secret bookshelf ${isOpen ? 'opening' : 'closing'}...`);
+                // Expand the east boundary so the player can walk into the hidden room
+                // (it extends to ~7.7, add buffer); restore it when closing
+                engine.roomBounds.maxX = isOpen ? 8.5 : originalMaxX;
+                engine.animations.add('secretBookshelf', (dt) =>
+                    animateSecretBookshelf(officeData.secretBookshelfPivot, officeData.getSecretBookshelfState(), dt));
                 showModal(name, {});
                 return;
             }
@@ -1148,10 +1300,9 @@ async function initOffice() {
             // Handle Remote
             if (name === 'remote') {
                 if (officeState.shredderSolved) {
-                    // Turn on TV
-                    if (officeData.tvScreen) {
-                        officeData.tvScreen.material = new THREE.MeshBasicMaterial({ color: 0x00ff00 }); // Green Screen
-                        // Better: Draw a clue on canvas texture
+                    // Turn on TV - the clue screen is drawn once; later clicks reuse it
+                    if (officeData.tvScreen && !tvClueMaterial) {
+                        // Draw a clue on canvas texture
                         const canvas = document.createElement('canvas');
                         canvas.width = 512;
                         canvas.height = 256;
@@ -1165,7 +1316,8 @@ async function initOffice() {
                         ctx.fillText("BLUE BOOK", 256, 180);
 
                         const texture = new THREE.CanvasTexture(canvas);
-                        officeData.tvScreen.material = new THREE.MeshBasicMaterial({ map: texture });
+                        tvClueMaterial = new THREE.MeshBasicMaterial({ map: texture });
+                        replaceMaterial(officeData.tvScreen, tvClueMaterial);
                     }
                     showModal('generic', {});
                     const modalTitle = document.getElementById('modalTitle');
@@ -1188,42 +1340,48 @@ async function initOffice() {
         }
     });
 
-    // Build the office scene
-    officeData = await buildOfficeScene(engine);
-    const { desk, secretBookshelfPivot, getSecretBookshelfState } = officeData;
+    // Load the baked snapshot if there is one; otherwise build the shell now and
+    // queue furniture and props on the builder
+    const snapshot = await engine.loadSnapshot('office');
+    const builder = new SceneBuilder(engine);
+    const sceneReady = snapshot
+        ? Promise.resolve(createOfficeData(engine, snapshot.refs))
+        : buildOfficeScene(engine, builder);
 
     // Create door and timer (since we're not using procedural room)
     engine.createDoor();
     engine.createTimer();
 
-    // Initialize game logic (puzzles, clues, etc.)
+    // Draw the shell straight away, then fill the room in nearest-first during idle time
+    engine.start();
+    builder.start();
+
+    officeData = await sceneReady;
+    const { desk, secretBookshelfPivot, hiddenRoom } = officeData;
+
+    // Rebuild the picking BVH whenever the drawers or the bookshelf move
+    engine.pickIndex.watch(secretBookshelfPivot);
+    (desk.userData.drawers || []).forEach(drawer => engine.pickIndex.watch(drawer));
+
+    declareOfficeZones(engine, officeData);
+
+    // Initialize game logic (puzzles, clues, etc.) once any custom question link has decoded
+    await gameLogic.customDataReady;
     gameLogic.initGame();
 
-    // Store original room bounds
-    const originalBounds = { ...engine.roomBounds };
-
-    // Add drawer and secret bookshelf animation to the render loop
-    const originalAnimate = engine.animate.bind(engine);
-    engine.animate = function (time) {
-        originalAnimate(time);
-        // Animate drawers (deltaTime is approximately 1/60 for 60fps)
-        animateDrawers(desk, 1 / 60);
-        // Animate secret bookshelf
-        animateSecretBookshelf(secretBookshelfPivot, getSecretBookshelfState(), 1 / 60);
-
-        // Dynamically adjust room bounds when secret bookshelf is open
-        // This allows the player to access the hidden room beyond the east wall
-        if (getSecretBookshelfState()) {
-            // Expand east boundary to allow access to hidden room
-            engine.roomBounds.maxX = 8.5; // Hidden room extends to ~7.7, add buffer
-        } else {
-            // Restore original bounds
-            engine.roomBounds.maxX = originalBounds.maxX;
-        }
-    };
+    // Store original east bound (widened while the secret bookshelf is open)
+    originalMaxX = engine.roomBounds.maxX;
 
-    // Start the engine
-    engine.start();
+    await builder.done;
+    console.log(`Office loaded: ${engine.interactables.length} interactable objects`);
+    engine.bakeSnapshot('office', {
+        desk, secretBookshelfPivot, hiddenRoom, tvScreen: officeData.tvScreen, shredder: officeData.shredder
+    });
+
+    // Batch static meshes; drawers and the secret bookshelf keep moving after build
+    engine.optimizeStatic({
+        exclude: [secretBookshelfPivot, ...(desk.userData.drawers || [])]
+    });
 
     // Expose for debugging
     window.engine = engine;
@@ -1231,6 +1389,9 @@ async function initOffice() {
     window.secretBookshelf = secretBookshelfPivot;
     if (window.__DEV__) {
         window.gameLogic = gameLogic;
+        window.officeState = officeState;
+        // Plays whole games in-page for the walkthrough tests; never loaded otherwise
+        window.gameDriver = await import('./gameDriver.js');
     }
 }
 
@@ -0,0 +1,242 @@
+/**
+ * payloadCodec.js
+ * Compact share-link format for custom games built in builder.html.
+ *
+ * A v2 link looks like `?data=2.<base64url>`. The bytes are:
+ *   [0]  format version (2)
+ *   [1]  flags - bit 0 set when the body is deflate-raw compressed
+ *   body:
+ *     varint mode index into MODES (== MODES.length -> followed by a string)
+ *     varint question count
+ *     per question: string title, string text, varint option count, option strings
+ *     byte  bits per correct-answer index
+ *     correct-answer indices, bit-packed
+ * Strings are a varint byte length followed by UTF-8.
+ *
+ * Anything without the `2.` prefix is treated as a legacy link:
+ * plain base64 of the JSON payload.
+ */
+
+export const PAYLOAD_VERSION = 2;
+const PREFIX = `${PAYLOAD_VERSION}.`;
+const FLAG_DEFLATE = 1;
+
+// Known game modes, by index (append only - indices are part of the format)
+const MODES = ['classic', 'code_door', 'access_cards', 'trail', 'hidden_key'];
+
+// --- Byte helpers ---
+
+class ByteWriter {
+    constructor() {
+        this.bytes = [];
+        this.encoder = new TextEncoder();
+    }
+
+    varint(value) {
+        let v = value >>> 0;
+        while (v >= 0x80) {
+            this.bytes.push((v & 0x7f) | 0x80);
+            v >>>= 7;
+        }
+        this.bytes.push(v);
+    }
+
+    string(value) {
+        const utf8 = this.encoder.encode(String(value ?? ''));
+        this.varint(utf8.length);
+        for (let i = 0; i < utf8.length; i++) this.bytes.push(utf8[i]);
+    }
+
+    packed(values, bits) {
+        let acc = 0;
+        let filled = 0;
+        values.forEach(value => {
+            acc |= (value & ((1 << bits) - 1)) << filled;
+            filled += bits;
+            while (filled >= 8) {
+                this.bytes.push(acc & 0xff);
+                acc >>>= 8;
+                filled -= 8;
+            }
+        });
+        if (filled > 0) this.bytes.push(acc & 0xff);
+    }
+
+    toUint8Array() {
+        return Uint8Array.from(this.bytes);
+    }
+}
+
+class ByteReader {
+    constructor(bytes) {
+        this.bytes = bytes;
+        this.pos = 0;
+        this.decoder = new TextDecoder();
+    }
+
+    byte() {
+        if (this.pos >= this.bytes.length) throw new Error('Payload truncated');
+        return this.bytes[this.pos++];
+    }
+
+    varint() {
+        let result = 0;
+        let shift = 0;
+        let b;
+        do {
+            b = this.byte();
+            result |= (b & 0x7f) << shift;
+            shift += 7;
+        } while (b & 0x80);
+        return result >>> 0;
+    }
+
+    string() {
+        const length = this.varint();
+        if (this.pos + length > this.bytes.length) throw new Error('Payload truncated');
+        const value = this.decoder.decode(this.bytes.subarray(this.pos, this.pos + length));
+        this.pos += length;
+        return value;
+    }
+
+    packed(count, bits) {
+        const values = [];
+        let acc = 0;
+        let filled = 0;
+        for (let i = 0; i < count; i++) {
+            while (filled < bits) {
+                acc |= this.byte() << filled;
+                filled += 8;
+            }
+            values.push(acc & ((1 << bits) - 1));
+            acc >>>= bits;
+            filled -= bits;
+        }
+        return values;
+    }
+}
+
+// --- base64url ---
+
+function toBase64Url(bytes) {
+    let binary = '';
+    for (let i = 0; i < bytes.length; i++) binary += String.fromCharCode(bytes[i]);
+    return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+}
+
+function fromBase64Url(text) {
+    const base64 = text.replace(/-/g, '+').replace(/_/g, '/');
+    const binary = atob(base64 + '='.repeat((4 - base64.length % 4) % 4));
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    return bytes;
+}
+
+// --- Compression (optional; not every browser has CompressionStream) ---
+
+async function transform(bytes, stream) {
+    const response = new Response(new Blob([bytes]).stream().pipeThrough(stream));
+    return new Uint8Array(await response.arrayBuffer());
+}
+
+function canCompress() {
+    return typeof CompressionStream !== 'undefined' && typeof DecompressionStream !== 'undefined';
+}
+
+// --- Public API ---
+
+/**
+ * Encode a builder payload ({config: {mode}, questions: [{t, q, o, c}]}) for a share link.
+ * @param {Object} payload
+ * @returns {Promise<string>} Value for the `data` URL parameter
+ */
+export async function encodePayload(payload) {
+    const questions = payload.questions || [];
+    const mode = (payload.config && payload.config.mode) || 'classic';
+
+    const writer = new ByteWriter();
+    const modeIndex = MODES.indexOf(mode);
+    writer.varint(modeIndex >= 0 ? modeIndex : MODES.length);
+    if (modeIndex < 0) writer.string(mode);
+
+    writer.varint(questions.length);
+    let maxOptions = 1;
+    questions.forEach(q => {
+        const options = q.o || [];
+        writer.string(q.t);
+        writer.string(q.q);
+        writer.varint(options.length);
+        options.forEach(option => writer.string(option));
+        maxOptions = Math.max(maxOptions, options.length);
+    });
+
+    const bits = Math.max(1, Math.ceil(Math.log2(maxOptions)));
+    writer.bytes.push(bits);
+    writer.packed(questions.map(q => q.c || 0), bits);
+
+    let body = writer.toUint8Array();
+    let flags = 0;
+    if (canCompress()) {
+        const compressed = await transform(body, new CompressionStream('deflate-raw'));
+        if (compressed.length < body.length) {
+            body = compressed;
+            flags |= FLAG_DEFLATE;
+        }
+    }
+
+    const bytes = new Uint8Array(body.length + 2);
+    bytes[0] = PAYLOAD_VERSION;
+    bytes[1] = flags;
+    bytes.set(body, 2);
+    return PREFIX + toBase64Url(bytes);
+}
+
+/**
+ * Decode a `data` URL parameter, accepting both v2 and legacy base64 JSON links.
+ * @param {string} data
+ * @returns {Promise<Object|Array>} The payload (legacy links may be a bare question array)
+ */
+export async function decodePayload(data) {
+    if (!data.startsWith(PREFIX)) {
+        return JSON.parse(atob(data)); // Legacy link
+    }
+
+    const bytes = fromBase64Url(data.slice(PREFIX.length));
+    if (bytes[0] !== PAYLOAD_VERSION) throw new Error(`Unsupported payload version ${bytes[0]}`);
+
+    let body = bytes.subarray(2);
+    if (bytes[1] & FLAG_DEFLATE) {
+        if (!canCompress()) throw new Error('This browser cannot decompress the game link');
+        body = await transform(body, new DecompressionStream('deflate-raw'));
+    }
+
+    const reader = new ByteReader(body);
+    const modeIndex = reader.varint();
+    const mode = modeIndex < MODES.length ? MODES[modeIndex] : reader.string();
+
+    const count = reader.varint();
+    const questions = [];
+    for (let i = 0; i < count; i++) {
+        const t = reader.string();
+        const q = reader.string();
+        const optionCount = reader.varint();
+        const o = [];
+        for (let j = 0; j < optionCount; j++) o.push(reader.string());
+        questions.push({ t, q, o, c: 0 });
+    }
+
+    const bits = reader.byte();
+    reader.packed(count, bits).forEach((c, i) => { questions[i].c = c; });
+
+    return { config: { mode }, questions };
+}
+
+/**
+ * Length of the legacy `btoa(JSON)` encoding, for showing the saving in the builder.
+ * @param {Object} payload
+ * @returns {number}
+ */
+export function legacyEncodedLength(payload) {
+    const utf8Length = new TextEncoder().encode(JSON.stringify(payload)).length;
+    return Math.ceil(utf8Length / 3) * 4;
+}
@@ -0,0 +1,216 @@
+/**
+ * perfBeacon.js
+ * Field performance reports for RoomEngine, sent to server.js.
+ *
+ * Each room page reports what it actually costs on the machine it runs on:
+ * load timings (navigation timing), time to first frame and to interactive,
+ * frame-time percentiles over the reporting interval, renderer.info counts,
+ * the quality tier the governor settled on and a coarse device tier.
+ *
+ * Reports are queued and sent in batches with navigator.sendBeacon to
+ * BEACON_URL, which server.js appends to rotating NDJSON files and folds
+ * into per-room / per-device aggregates (perf_report.html, perf_report.py).
+ * Nothing leaves the machine serving the game.
+ *
+ * The first report is taken FIRST_REPORT_DELAY_MS after start(), then one
+ * every REPORT_INTERVAL_MS; a batch goes out once MAX_BATCH reports are
+ * queued or when the page is hidden or unloaded.
+ *
+ * Beacons are only sent from pages served by server.js, which marks them with
+ * a BEACON_SERVER_TIMING Server-Timing entry; static hosts have no endpoint.
+ * ?beacon=1|0 or the `beacon: true|false` engine config option overrides that.
+ */
+
+import { RollingHistogram } from './perfProfiler.js';
+import { FIRST_FRAME_MARK, INTERACTIVE_MARK } from './constants.js';
+
+export const BEACON_URL = '/api/perf';
+export const BEACON_VERSION = 1;
+export const BEACON_SERVER_TIMING = 'perf-beacon'; // Matches BEACON_SERVER_TIMING in server.js
+
+const FIRST_REPORT_DELAY_MS = 15000;
+const REPORT_INTERVAL_MS = 60000;
+const MAX_BATCH = 5;
+const FRAME_WINDOW = 2048; // Frame times kept per report (~34 s of continuous 60 fps rendering)
+const MAX_FRAME_MS = 1000; // Longer gaps (stalls, resumed timers) are counted as stalls, not frame times
+
+/**
+ * Resolve whether beacons are sent from ?beacon, the config value and the server's mark.
+ * @param {boolean|undefined} configured
+ * @returns {{enabled: boolean}}
+ */
+export function resolveBeaconOptions(configured) {
+    if (typeof navigator.sendBeacon !== 'function') return { enabled: false };
+    const fromUrl = new URLSearchParams(window.location.search).get('beacon');
+    if (fromUrl !== null) return { enabled: fromUrl !== '0' && fromUrl !== 'false' };
+    if (typeof configured === 'boolean') return { enabled: configured };
+    return { enabled: servedWithBeaconEndpoint() };
+}
+
+// Whether the page response carried server.js's Server-Timing mark
+function servedWithBeaconEndpoint() {
+    const nav = performance.getEntriesByType('navigation')[0];
+    return !!nav && Array.isArray(nav.serverTiming) &&
+        nav.serverTiming.some(entry => entry.name === BEACON_SERVER_TIMING);
+}
+
+/**
+ * Coarse hardware class, so reports from similar machines aggregate together.
+ * deviceMemory is Chromium-only; unknown values never push a device down a tier.
+ * @returns {'low'|'mid'|'high'}
+ */
+export function deviceTier() {
+    const cores = navigator.hardwareConcurrency || 0;
+    const memoryGb = navigator.deviceMemory || 0;
+    const mobile = /Mobi|Android|iPhone|iPad/i.test(navigator.userAgent);
+    if ((memoryGb && memoryGb <= 2) || (cores && cores <= 2)) return 'low';
+    if (mobile || (memoryGb && memoryGb <= 4) || (cores && cores <= 4)) return 'mid';
+    return 'high';
+}
+
+// Room name from the page, e.g. /science_lab.html -> science_lab
+function roomName() {
+    const page = window.location.pathname.split('/').pop();
+    return page.replace(/\.html$/, '') || 'office';
+}
+
+function markTime(name) {
+    const entry = performance.getEntriesByName(name)[0];
+    return entry ? entry.startTime : undefined;
+}
+
+export class PerfBeacon {
+    /**
+     * @param {RoomEngine} engine - Read for renderer stats, quality tier and snapshot state
+     * @param {{enabled: boolean}} options - From resolveBeaconOptions()
+     */
+    constructor(engine, { enabled = false } = {}) {
+        this.engine = engine;
+        this.enabled = enabled;
+        this.room = roomName();
+        this.session = Math.random().toString(36).slice(2, 10);
+        this.queue = [];
+        this.sent = 0; // Reports handed to sendBeacon
+        this.frames = new RollingHistogram(FRAME_WINDOW);
+        this.stalls = 0; // Gaps over MAX_FRAME_MS since the last report
+
+        this._seq = 0;
+        this._device = null;
+        this._timer = null;
+        this._onHide = () => {
+            if (document.visibilityState === 'hidden') this.flush('hidden');
+        };
+        this._onPageHide = () => this.flush('pagehide');
+    }
+
+    start() {
+        if (!this.enabled || this._timer !== null) return;
+        document.addEventListener('visibilitychange', this._onHide);
+        window.addEventListener('pagehide', this._onPageHide);
+        this._timer = setTimeout(() => {
+            this.report('interval');
+            this._timer = setInterval(() => this.report('interval'), REPORT_INTERVAL_MS);
+        }, FIRST_REPORT_DELAY_MS);
+    }
+
+    // Duration of one rendered frame (ms); called by RoomEngine.animate()
+    sampleFrame(ms) {
+        if (!this.enabled) return;
+        if (ms > MAX_FRAME_MS) this.stalls++;
+        else this.frames.add(ms);
+    }
+
+    /**
+     * Queue a report covering the frames since the last one.
+     * @param {string} reason - 'interval', 'hidden', 'pagehide', ...
+     * @returns {Object|null} The queued report
+     */
+    report(reason) {
+        if (!this.enabled) return null;
+        const report = this._buildReport(reason);
+        this.frames.reset();
+        this.stalls = 0;
+        this.queue.push(report);
+        if (this.queue.length >= MAX_BATCH) this.flush();
+        return report;
+    }
+
+    /**
+     * Send every queued report in one beacon. With a reason, a final report is taken first.
+     * @param {string} [reason]
+     * @returns {boolean} Whether the browser accepted the beacon
+     */
+    flush(reason) {
+        if (!this.enabled) return false;
+        if (reason && (this.frames.count > 0 || this.stalls > 0)) this.report(reason);
+        if (this.queue.length === 0) return false;
+
+        const payload = JSON.stringify({ v: BEACON_VERSION, reports: this.queue });
+        const accepted = navigator.sendBeacon(BEACON_URL, new Blob([payload], { type: 'application/json' }));
+        // A refused beacon (payload too large, quota) is dropped rather than retried
+        this.sent += this.queue.length;
+        this.queue = [];
+        return accepted;
+    }
+
+    dispose() {
+        if (this._timer !== null) {
+            clearTimeout(this._timer);
+            clearInterval(this._timer);
+            this._timer = null;
+        }
+        document.removeEventListener('visibilitychange', this._onHide);
+        window.removeEventListener('pagehide', this._onPageHide);
+        this.flush('dispose');
+        this.enabled = false;
+    }
+
+    _buildReport(reason) {
+        const { renderer } = this.engine;
+        const nav = performance.getEntriesByType('navigation')[0];
+        const frames = this.frames.summary();
+        return {
+            room: this.room,
+            session: this.session,
+            seq: this._seq++,
+            reason,
+            device: this._deviceInfo(),
+            quality: this.engine.quality.tier.name,
+            snapshot: this.engine.snapshotLoaded,
+            metrics: {
+                ttfbMs: nav ? nav.responseStart : undefined,
+                domContentLoadedMs: nav ? nav.domContentLoadedEventEnd : undefined,
+                loadMs: nav && nav.loadEventEnd > 0 ? nav.loadEventEnd : undefined,
+                ttffMs: markTime(FIRST_FRAME_MARK),
+                ttiMs: markTime(INTERACTIVE_MARK),
+                frames: frames.count,
+                stalls: this.stalls,
+                frameP50: frames.count ? frames.p50 : undefined,
+                frameP95: frames.count ? frames.p95 : undefined,
+                frameP99: frames.count ? frames.p99 : undefined,
+                drawCalls: renderer.info.render.calls,
+                triangles: renderer.info.render.triangles,
+                geometries: renderer.info.memory.geometries,
+                textures: renderer.info.memory.textures
+            }
+        };
+    }
+
+    // Static per page; the GPU string is read once
+    _deviceInfo() {
+        if (!this._device) {
+            const gl = this.engine.renderer.getContext();
+            const debugInfo = gl.getExtension('WEBGL_debug_renderer_info');
+            this._device = {
+                tier: deviceTier(),
+                cores: navigator.hardwareConcurrency || null,
+                memoryGb: navigator.deviceMemory || null,
+                dpr: window.devicePixelRatio,
+                screen: `${window.screen.width}x${window.screen.height}`,
+                touch: navigator.maxTouchPoints > 0,
+                gpu: String(gl.getParameter(debugInfo ? debugInfo.UNMASKED_RENDERER_WEBGL : gl.RENDERER))
+            };
+        }
+        return this._device;
+    }
+}
@@ -0,0 +1,259 @@
+/**
+ * perfProfiler.js
+ * Opt-in per-phase frame profiler for RoomEngine.
+ * Enabled with ?perf in the URL (which also shows the overlay), by
+ * window.__DEV__, or by the `profile` engine config option. When disabled
+ * every call returns immediately.
+ *
+ * Read it from tests or the console through window.engine.perf:
+ *   perf.enabled          - whether samples are being recorded
+ *   perf.snapshot()       - {frames, overBudgetFrames, budgetMs, edges, phases: {name: summary}}
+ *                           summary = {count, mean, p50, p95, p99, max, buckets} in ms over the
+ *                           last WINDOW_SIZE samples; buckets[i] counts samples <= edges[i]
+ *                           (the final bucket is everything above the last edge)
+ *   perf.reset()          - clear all samples
+ *   perf.enable() / perf.disable() / perf.showOverlay(visible)
+ *   perf.time(name, fn)   - time extra work (e.g. a room's event handler) as its own phase
+ *   perf.sample(name, ms) - record a duration measured elsewhere as its own phase
+ *                           (RoomEngine records 'inputLatency': pointer event to the frame applying it)
+ */
+
+const WINDOW_SIZE = 300;           // Samples kept per phase (~5 s at 60 fps)
+const FRAME_BUDGET_MS = 1000 / 60;
+const OVERLAY_INTERVAL_MS = 500;   // Overlay refresh rate; the DOM is not touched every frame
+
+/** Histogram bucket upper edges in ms. */
+export const HISTOGRAM_EDGES_MS = [0.25, 0.5, 1, 2, 4, 8, 16.7, 33.3, 66.7];
+
+/**
+ * Fixed-size ring of samples with bucket counts kept in step,
+ * so old samples age out of both the percentiles and the histogram.
+ */
+export class RollingHistogram {
+    constructor(size = WINDOW_SIZE) {
+        this.samples = new Float64Array(size);
+        this.buckets = new Uint32Array(HISTOGRAM_EDGES_MS.length + 1);
+        this.count = 0;
+        this.next = 0;
+        this.total = 0;
+    }
+
+    add(ms) {
+        if (this.count === this.samples.length) {
+            const old = this.samples[this.next];
+            this.total -= old;
+            this.buckets[bucketIndex(old)]--;
+        } else {
+            this.count++;
+        }
+        this.samples[this.next] = ms;
+        this.total += ms;
+        this.buckets[bucketIndex(ms)]++;
+        this.next = (this.next + 1) % this.samples.length;
+    }
+
+    summary() {
+        const { count } = this;
+        if (count === 0) {
+            return { count: 0, mean: 0, p50: 0, p95: 0, p99: 0, max: 0, buckets: Array.from(this.buckets) };
+        }
+        const sorted = Array.from(this.samples.subarray(0, count)).sort((a, b) => a - b);
+        const at = (p) => sorted[Math.min(count - 1, Math.max(0, Math.ceil(p / 100 * count) - 1))];
+        return {
+            count,
+            mean: this.total / count,
+            p50: at(50),
+            p95: at(95),
+            p99: at(99),
+            max: sorted[count - 1],
+            buckets: Array.from(this.buckets)
+        };
+    }
+
+    reset() {
+        this.buckets.fill(0);
+        this.count = 0;
+        this.next = 0;
+        this.total = 0;
+    }
+}
+
+function bucketIndex(ms) {
+    let i = 0;
+    while (i < HISTOGRAM_EDGES_MS.length && ms > HISTOGRAM_EDGES_MS[i]) i++;
+    return i;
+}
+
+/**
+ * Resolve profiler options from ?perf, window.__DEV__ and the config value.
+ * @param {boolean|undefined} configured
+ * @returns {{enabled: boolean, overlay: boolean}}
+ */
+export function resolveProfilerOptions(configured) {
+    const fromUrl = new URLSearchParams(window.location.search).get('perf');
+    if (fromUrl !== null) {
+        const enabled = fromUrl !== '0' && fromUrl !== 'false';
+        return { enabled, overlay: enabled };
+    }
+    return { enabled: configured === true || !!window.__DEV__, overlay: false };
+}
+
+export class PerfProfiler {
+    constructor({ enabled = false, overlay = false } = {}) {
+        this.enabled = enabled;
+        this.budgetMs = FRAME_BUDGET_MS;
+        this.phases = new Map(); // name -> RollingHistogram, in first-recorded order
+        this.frames = 0;
+        this.overBudgetFrames = 0;
+
+        this._frameStart = 0;
+        this._lapStart = 0;
+        this._overlay = null;
+        this._lastOverlayUpdate = 0;
+
+        if (overlay) this.showOverlay(true);
+    }
+
+    enable() {
+        this.enabled = true;
+    }
+
+    disable() {
+        this.enabled = false;
+    }
+
+    // Start of a frame; phases are timed as laps from here
+    beginFrame() {
+        if (!this.enabled) return;
+        this._frameStart = this._lapStart = performance.now();
+    }
+
+    /**
+     * Record the time since the previous lap (or beginFrame) under `phase`.
+     * @param {string} phase
+     */
+    lap(phase) {
+        if (!this.enabled) return;
+        const now = performance.now();
+        this._record(phase, now - this._lapStart);
+        this._lapStart = now;
+    }
+
+    /**
+     * Time fn() as `phase`. Meant for work outside animate(); inside a frame the
+     * time is also counted in whichever lap is open.
+     * @param {string} phase
+     * @param {Function} fn
+     * @returns {*} fn's return value
+     */
+    time(phase, fn) {
+        if (!this.enabled) return fn();
+        const start = performance.now();
+        try {
+            return fn();
+        } finally {
+            this._record(phase, performance.now() - start);
+        }
+    }
+
+    /**
+     * Record a duration measured elsewhere (e.g. input-to-frame latency) under `phase`.
+     * @param {string} phase
+     * @param {number} ms
+     */
+    sample(phase, ms) {
+        if (!this.enabled) return;
+        this._record(phase, ms);
+    }
+
+    // End of a frame: records the whole frame as 'frame' and refreshes the overlay
+    endFrame() {
+        if (!this.enabled) return;
+        const now = performance.now();
+        const frameMs = now - this._frameStart;
+        this._record('frame', frameMs);
+        this.frames++;
+        if (frameMs > this.budgetMs) this.overBudgetFrames++;
+
+        if (this._overlay && now - this._lastOverlayUpdate >= OVERLAY_INTERVAL_MS) {
+            this._lastOverlayUpdate = now;
+            this._renderOverlay();
+        }
+    }
+
+    snapshot() {
+        const phases = {};
+        this.phases.forEach((histogram, name) => { phases[name] = histogram.summary(); });
+        return {
+            frames: this.frames,
+            overBudgetFrames: this.overBudgetFrames,
+            budgetMs: this.budgetMs,
+            edges: HISTOGRAM_EDGES_MS.slice(),
+            phases
+        };
+    }
+
+    reset() {
+        this.phases.forEach(histogram => histogram.reset());
+        this.frames = 0;
+        this.overBudgetFrames = 0;
+    }
+
+    showOverlay(visible) {
+        if (visible && !this._overlay) {
+            this._overlay = document.createElement('pre');
+            this._overlay.id = 'perfOverlay';
+            Object.assign(this._overlay.style, {
+                position: 'fixed',
+                top: '8px',
+                left: '8px',
+                margin: '0',
+                padding: '6px 8px',
+                font: '11px/1.35 monospace',
+                color: '#cfc',
+                background: 'rgba(0, 0, 0, 0.7)',
+                pointerEvents: 'none',
+                zIndex: '10000'
+            });
+            document.body.appendChild(this._overlay);
+        } else if (!visible && this._overlay) {
+            this._overlay.remove();
+            this._overlay = null;
+        }
+    }
+
+    dispose() {
+        this.showOverlay(false);
+        this.phases.clear();
+    }
+
+    _record(phase, ms) {
+        let histogram = this.phases.get(phase);
+        if (!histogram) {
+            histogram = new RollingHistogram();
+            this.phases.set(phase, histogram);
+        }
+        histogram.add(ms);
+    }
+
+    // One row per phase; the costliest non-frame phase (by p95) is highlighted
+    _renderOverlay() {
+        const { phases, frames, overBudgetFrames } = this.snapshot();
+        let worst = null;
+        Object.entries(phases).forEach(([name, s]) => {
+            if (name !== 'frame' && (!worst || s.p95 > phases[worst].p95)) worst = name;
+        });
+
+        const fmt = (ms) => ms.toFixed(2).padStart(7);
+        const rows = Object.entries(phases).map(([name, s]) => {
+            const row = `${name.padEnd(11)}${fmt(s.p50)}${fmt(s.p95)}${fmt(s.max)}`;
+            return name === worst ? `<span style="color:#ff6">${row}</span>` : row;
+        });
+        const overPct = frames ? (overBudgetFrames / frames * 100).toFixed(1) : '0.0';
+        this._overlay.innerHTML = [
+            `phase (ms)     p50    p95    max`,
+            ...rows,
+            `over ${this.budgetMs.toFixed(1)} ms: ${overPct}%`
+        ].join('\n');
+    }
+}
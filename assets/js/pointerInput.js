@@ -0,0 +1,159 @@
+/**
+ * pointerInput.js
+ * Frame-coalesced pointer input for RoomEngine.
+ *
+ * One set of Pointer Events listeners replaces the old mousemove/touchmove
+ * handlers. Events only record state: the latest pointer position, the
+ * drag (mouse-look) delta summed over getCoalescedEvents(), and touch
+ * samples forwarded to a touch handler (TouchControls). Nothing touches the
+ * DOM or the camera at event rate; RoomEngine.animate() calls flush() once
+ * per frame and applies what accumulated.
+ *
+ * Touch pointers go to the touch handler's pointerDown/pointerMove/pointerUp.
+ * Mouse and pen pointers drive the crosshair and drag-to-look.
+ */
+
+// Clicks this soon after a touch ended were synthesized from that touch
+const TOUCH_CLICK_WINDOW_MS = 600;
+
+/**
+ * The samples a pointermove stands for (several per event when the browser
+ * batched them), oldest first.
+ * @param {PointerEvent} event
+ * @returns {PointerEvent[]}
+ */
+export function coalescedSamples(event) {
+    if (typeof event.getCoalescedEvents === 'function') {
+        const samples = event.getCoalescedEvents();
+        if (samples.length > 0) return samples;
+    }
+    return [event];
+}
+
+export class PointerInput {
+    /**
+     * @param {Object} [options]
+     * @param {EventTarget} [options.target] - Where to listen (default: document)
+     * @param {Object} [options.touchHandler] - Receives touch pointers (TouchControls)
+     * @param {Function} [options.onActivity] - Called on any pointer event (e.g. requestRender)
+     */
+    constructor({ target = document, touchHandler = null, onActivity = null } = {}) {
+        this.target = target;
+        this.touchHandler = touchHandler;
+        this.onActivity = onActivity;
+
+        // Latest mouse/pen position in client pixels; null until the pointer moves
+        this.clientX = null;
+        this.clientY = null;
+        this.positionChanged = false;
+
+        // Drag-to-look: buttons held and the movement accumulated since the last flush
+        this.isDown = false;
+        this.dragX = 0;
+        this.dragY = 0;
+        this._lastX = 0;
+        this._lastY = 0;
+
+        // Oldest event not yet applied by a frame (for latency measurement)
+        this._pendingSince = null;
+        this._lastTouchEnd = -Infinity;
+
+        this._handlers = {
+            pointerdown: this._onDown.bind(this),
+            pointermove: this._onMove.bind(this),
+            pointerup: this._onUp.bind(this),
+            pointercancel: this._onUp.bind(this)
+        };
+        for (const [type, handler] of Object.entries(this._handlers)) {
+            target.addEventListener(type, handler, { passive: true });
+        }
+    }
+
+    _onDown(event) {
+        this._markPending(event);
+        if (event.pointerType === 'touch') {
+            if (this.touchHandler) this.touchHandler.pointerDown(event);
+            return;
+        }
+        this.isDown = true;
+        this._lastX = event.clientX;
+        this._lastY = event.clientY;
+        this._setPosition(event.clientX, event.clientY);
+    }
+
+    _onMove(event) {
+        this._markPending(event);
+        const samples = coalescedSamples(event);
+        if (event.pointerType === 'touch') {
+            if (this.touchHandler) this.touchHandler.pointerMove(event, samples);
+            return;
+        }
+        if (this.isDown) {
+            for (const sample of samples) {
+                this.dragX += sample.clientX - this._lastX;
+                this.dragY += sample.clientY - this._lastY;
+                this._lastX = sample.clientX;
+                this._lastY = sample.clientY;
+            }
+        }
+        this._setPosition(event.clientX, event.clientY);
+    }
+
+    _onUp(event) {
+        this._markPending(event);
+        if (event.pointerType === 'touch') {
+            this._lastTouchEnd = performance.now();
+            if (this.touchHandler) this.touchHandler.pointerUp(event);
+            return;
+        }
+        this.isDown = false;
+    }
+
+    _setPosition(x, y) {
+        if (x === this.clientX && y === this.clientY) return;
+        this.clientX = x;
+        this.clientY = y;
+        this.positionChanged = true;
+    }
+
+    _markPending(event) {
+        if (this._pendingSince === null) this._pendingSince = event.timeStamp;
+        if (this.onActivity) this.onActivity();
+    }
+
+    /**
+     * Whether a click was synthesized from a touch (taps are handled by the touch handler).
+     * @param {MouseEvent} event
+     */
+    isTouchClick(event) {
+        return event.pointerType === 'touch' ||
+            performance.now() - this._lastTouchEnd < TOUCH_CLICK_WINDOW_MS;
+    }
+
+    /**
+     * Take the input accumulated since the last call. Called once per frame.
+     * @returns {{dragX: number, dragY: number, moved: boolean, latencyMs: number|null}}
+     *   moved - the pointer position changed; latencyMs - age of the oldest applied event
+     */
+    flush() {
+        const result = {
+            dragX: this.dragX,
+            dragY: this.dragY,
+            moved: this.positionChanged,
+            latencyMs: this._pendingSince === null ? null : performance.now() - this._pendingSince
+        };
+        this.dragX = 0;
+        this.dragY = 0;
+        this.positionChanged = false;
+        this._pendingSince = null;
+        return result;
+    }
+
+    dispose() {
+        for (const [type, handler] of Object.entries(this._handlers)) {
+            this.target.removeEventListener(type, handler, { passive: true });
+        }
+        this.touchHandler = null;
+        this.onActivity = null;
+    }
+}
@@ -1,4 +1,8 @@
 import * as THREE from 'three';
+import { getGeometry, getMaterial } from './resourceCache.js';
+
+// Props shared with the classroom and science lab live in commonPrefabs.js
+export { createDesk, createFireExtinguisher } from './commonPrefabs.js';
 
 /**
  * Comprehensive procedural object generators for escape rooms.
@@ -8,149 +12,13 @@ import * as THREE from 'three';
 
 // ===== FURNITURE =====
 
-export function createDesk(width = 1.5, height = 0.75, depth = 0.8) {
-    const group = new THREE.Group();
-    const woodColor = 0x654321;
-    const woodMaterial = new THREE.MeshStandardMaterial({ color: woodColor, roughness: 0.7 });
-
-    // Desktop
-    const top = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.05, depth),
-        woodMaterial
-    );
-    top.position.y = height;
-    top.castShadow = true;
-    top.receiveShadow = true;
-    group.add(top);
-
-    // Legs (4 corners)
-    const legRadius = 0.04;
-    const legGeometry = new THREE.CylinderGeometry(legRadius, legRadius, height);
-    const positions = [
-        [width / 2 - 0.1, height / 2, depth / 2 - 0.1],
-        [width / 2 - 0.1, height / 2, -depth / 2 + 0.1],
-        [-width / 2 + 0.1, height / 2, depth / 2 - 0.1],
-        [-width / 2 + 0.1, height / 2, -depth / 2 + 0.1]
-    ];
-
-    positions.forEach(pos => {
-        const leg = new THREE.Mesh(legGeometry, woodMaterial);
-        leg.position.set(...pos);
-        leg.castShadow = true;
-        group.add(leg);
-    });
-
-    // Drawers (3-drawer stack on right side)
-    const drawerWidth = width * 0.4;
-    const drawerDepth = depth - 0.1;
-    const drawerHeight = height * 0.25;
-    const drawerSpacing = height * 0.05;
-    const drawerMaterial = new THREE.MeshStandardMaterial({ color: 0x5a3a1a, roughness: 0.6 });
-    const handleMaterial = new THREE.MeshStandardMaterial({ color: 0x888888, metalness: 0.7 });
-
-    // Array to store drawer references for animation
-    group.userData.drawers = [];
-
-    for (let i = 0; i < 3; i++) {
-        // Create drawer group to move drawer + handle together
-        const drawerGroup = new THREE.Group();
-        drawerGroup.position.set(
-            width * 0.25,
-            drawerSpacing + (i * (drawerHeight + drawerSpacing)) + drawerHeight / 2,
-            0
-        );
-
-        // Drawer as an open box (front, bottom, left, right, back - no top)
-        const drawerThickness = 0.02;
-
-        // Front face
-        const drawerFront = new THREE.Mesh(
-            new THREE.BoxGeometry(drawerWidth, drawerHeight, drawerThickness),
-            drawerMaterial
-        );
-        drawerFront.position.z = drawerDepth / 2 - drawerThickness / 2;
-        drawerFront.castShadow = true;
-        drawerFront.name = `drawer_${i}_front`; // Name for interaction
-        drawerGroup.add(drawerFront);
-
-        // Bottom
-        const drawerBottom = new THREE.Mesh(
-            new THREE.BoxGeometry(drawerWidth, drawerThickness, drawerDepth - drawerThickness),
-            drawerMaterial
-        );
-        drawerBottom.position.y = -drawerHeight / 2 + drawerThickness / 2;
-        drawerBottom.castShadow = true;
-        drawerBottom.name = `drawer_${i}_bottom`;
-        drawerGroup.add(drawerBottom);
-
-        // Left side
-        const drawerLeft = new THREE.Mesh(
-            new THREE.BoxGeometry(drawerThickness, drawerHeight, drawerDepth - drawerThickness),
-            drawerMaterial
-        );
-        drawerLeft.position.x = -drawerWidth / 2 + drawerThickness / 2;
-        drawerLeft.castShadow = true;
-        drawerLeft.name = `drawer_${i}_left`;
-        drawerGroup.add(drawerLeft);
-
-        // Right side
-        const drawerRight = new THREE.Mesh(
-            new THREE.BoxGeometry(drawerThickness, drawerHeight, drawerDepth - drawerThickness),
-            drawerMaterial
-        );
-        drawerRight.position.x = drawerWidth / 2 - drawerThickness / 2;
-        drawerRight.castShadow = true;
-        drawerRight.name = `drawer_${i}_right`;
-        drawerGroup.add(drawerRight);
-
-        // Back
-        const drawerBack = new THREE.Mesh(
-            new THREE.BoxGeometry(drawerWidth, drawerHeight, drawerThickness),
-            drawerMaterial
-        );
-        drawerBack.position.z = -drawerDepth / 2 + drawerThickness / 2;
-        drawerBack.castShadow = true;
-        drawerBack.name = `drawer_${i}_back`;
-        drawerGroup.add(drawerBack);
-
-        // Drawer handle (positioned on the front face)
-        const handle = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.02, 0.02, 0.1),
-            handleMaterial
-        );
-        handle.rotation.z = Math.PI / 2;
-        handle.position.set(0, 0, drawerDepth / 2 + 0.01); // Just in front of drawer front
-        handle.name = `drawer_${i}_handle`; // Also make handle clickable
-        drawerGroup.add(handle);
-
-        // Store metadata on the group for animation
-        drawerGroup.userData.isOpen = false;
-        drawerGroup.userData.drawerIndex = i;
-        drawerGroup.userData.targetZ = 0; // For animation
-        drawerGroup.userData.openDistance = 0.3; // How far drawer slides out
-
-        // Store reference to drawerGroup on ALL drawer parts for easy clicking
-        drawerFront.userData.drawerGroup = drawerGroup;
-        drawerBottom.userData.drawerGroup = drawerGroup;
-        drawerLeft.userData.drawerGroup = drawerGroup;
-        drawerRight.userData.drawerGroup = drawerGroup;
-        drawerBack.userData.drawerGroup = drawerGroup;
-        handle.userData.drawerGroup = drawerGroup;
-
-        group.add(drawerGroup);
-        group.userData.drawers.push(drawerGroup);
-    }
-
-    return group;
-}
-
 export function createChair(seatHeight = 0.5, backHeight = 0.9) {
     const group = new THREE.Group();
-    const chairMaterial = new THREE.MeshStandardMaterial({ color: 0x2a2a2a, roughness: 0.6 });
+    const chairMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a, roughness: 0.6 });
 
     // Seat
     const seat = new THREE.Mesh(
-        new THREE.BoxGeometry(0.45, 0.05, 0.45),
+        getGeometry(THREE.BoxGeometry, 0.45, 0.05, 0.45),
         chairMaterial
     );
     seat.position.y = seatHeight;
@@ -159,7 +27,7 @@ export function createChair(seatHeight = 0.5, backHeight = 0.9) {
 
     // Backrest
     const back = new THREE.Mesh(
-        new THREE.BoxGeometry(0.45, backHeight - seatHeight, 0.05),
+        getGeometry(THREE.BoxGeometry, 0.45, backHeight - seatHeight, 0.05),
         chairMaterial
     );
     back.position.set(0, seatHeight + (backHeight - seatHeight) / 2, -0.2);
@@ -167,7 +35,7 @@ export function createChair(seatHeight = 0.5, backHeight = 0.9) {
     group.add(back);
 
     // Legs (4)
-    const legGeometry = new THREE.CylinderGeometry(0.025, 0.025, seatHeight);
+    const legGeometry = getGeometry(THREE.CylinderGeometry, 0.025, 0.025, seatHeight);
     const legPositions = [
         [0.2, seatHeight / 2, 0.2],
         [0.2, seatHeight / 2, -0.2],
@@ -187,7 +55,7 @@ export function createChair(seatHeight = 0.5, backHeight = 0.9) {
 
 export function createBookshelf(width = 3.0, height = 2.0, depth = 0.4, shelves = 4) {
     const group = new THREE.Group();
-    const woodMaterial = new THREE.MeshStandardMaterial({ color: 0x8B4513, roughness: 0.8 });
+    const woodMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x8B4513, roughness: 0.8 });
 
     // Precise dimensions for perfect fit
     const sideThickness = 0.05;
@@ -205,7 +73,7 @@ export function createBookshelf(width = 3.0, height = 2.0, depth = 0.4, shelves
 
     // Back panel
     const back = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, backThickness),
+        getGeometry(THREE.BoxGeometry, width, height, backThickness),
         woodMaterial
     );
     back.position.set(0, height / 2, -depth / 2 + backThickness / 2);
@@ -216,7 +84,7 @@ export function createBookshelf(width = 3.0, height = 2.0, depth = 0.4, shelves
     // Sides
     [width / 2, -width / 2].forEach(x => {
         const side = new THREE.Mesh(
-            new THREE.BoxGeometry(sideThickness, height, depth),
+            getGeometry(THREE.BoxGeometry, sideThickness, height, depth),
             woodMaterial
         );
         side.position.set(x - (x > 0 ? sideThickness / 2 : -sideThickness / 2), height / 2, 0);
@@ -228,7 +96,7 @@ export function createBookshelf(width = 3.0, height = 2.0, depth = 0.4, shelves
     const shelfSpacing = height / shelves;
     for (let i = 0; i <= shelves; i++) {
         const shelf = new THREE.Mesh(
-            new THREE.BoxGeometry(interiorWidth, shelfThickness, depth),
+            getGeometry(THREE.BoxGeometry, interiorWidth, shelfThickness, depth),
             woodMaterial
         );
         shelf.position.set(0, shelfSpacing * i, 0);
@@ -261,8 +129,8 @@ export function createBookshelf(width = 3.0, height = 2.0, depth = 0.4, shelves
             const spineWidth = bookSpacing * (0.85 + Math.random() * 0.3); // 85%-115% of average
 
             const book = new THREE.Mesh(
-                new THREE.BoxGeometry(spineWidth, bookHeight, bookDepth),
-                new THREE.MeshStandardMaterial({
+                getGeometry(THREE.BoxGeometry, spineWidth, bookHeight, bookDepth),
+                getMaterial(THREE.MeshStandardMaterial, {
                     color: bookColors[(shelfIdx * booksPerRow + bookIdx) % bookColors.length],
                     roughness: 0.8
                 })
@@ -288,8 +156,8 @@ export function createBookshelf(width = 3.0, height = 2.0, depth = 0.4, shelves
 
         // Add invisible hitbox for easier interaction with shelf row
         const hitbox = new THREE.Mesh(
-            new THREE.BoxGeometry(interiorWidth, bookHeight * 1.2, bookDepth * 1.3),
-            new THREE.MeshBasicMaterial({ visible: false })
+            getGeometry(THREE.BoxGeometry, interiorWidth, bookHeight * 1.2, bookDepth * 1.3),
+            getMaterial(THREE.MeshBasicMaterial, { visible: false })
         );
         hitbox.position.set(
             0,
@@ -310,19 +178,19 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
     const group = new THREE.Group();
 
     // Materials with better appearance
-    const cabinetMaterial = new THREE.MeshStandardMaterial({
+    const cabinetMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0x3a3a3a, // Darker gray
         metalness: 0.7,
         roughness: 0.3
     });
 
-    const drawerMaterial = new THREE.MeshStandardMaterial({
+    const drawerMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0x4a4a4a,
         metalness: 0.6,
         roughness: 0.4
     });
 
-    const handleMaterial = new THREE.MeshStandardMaterial({
+    const handleMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0xaaaaaa,
         metalness: 0.9,
         roughness: 0.2
@@ -333,7 +201,7 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
     // Back panel
     const back = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, bodyThickness),
+        getGeometry(THREE.BoxGeometry, width, height, bodyThickness),
         cabinetMaterial
     );
     back.position.set(0, height / 2, -depth / 2 + bodyThickness / 2);
@@ -343,7 +211,7 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
     // Left side
     const leftSide = new THREE.Mesh(
-        new THREE.BoxGeometry(bodyThickness, height, depth),
+        getGeometry(THREE.BoxGeometry, bodyThickness, height, depth),
         cabinetMaterial
     );
     leftSide.position.set(-width / 2 + bodyThickness / 2, height / 2, 0);
@@ -353,7 +221,7 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
     // Right side
     const rightSide = new THREE.Mesh(
-        new THREE.BoxGeometry(bodyThickness, height, depth),
+        getGeometry(THREE.BoxGeometry, bodyThickness, height, depth),
         cabinetMaterial
     );
     rightSide.position.set(width / 2 - bodyThickness / 2, height / 2, 0);
@@ -363,7 +231,7 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
     // Top
     const top = new THREE.Mesh(
-        new THREE.BoxGeometry(width, bodyThickness, depth),
+        getGeometry(THREE.BoxGeometry, width, bodyThickness, depth),
         cabinetMaterial
     );
     top.position.set(0, height - bodyThickness / 2, 0);
@@ -374,8 +242,8 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
     // Base/feet (slightly raised)
     const baseHeight = 0.05;
     const base = new THREE.Mesh(
-        new THREE.BoxGeometry(width - 0.04, baseHeight, depth - 0.04),
-        new THREE.MeshStandardMaterial({ color: 0x2a2a2a, metalness: 0.5, roughness: 0.5 })
+        getGeometry(THREE.BoxGeometry, width - 0.04, baseHeight, depth - 0.04),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a, metalness: 0.5, roughness: 0.5 })
     );
     base.position.set(0, baseHeight / 2, 0);
     base.castShadow = true;
@@ -390,7 +258,7 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
         // Drawer front (beveled appearance)
         const drawerFront = new THREE.Mesh(
-            new THREE.BoxGeometry(
+            getGeometry(THREE.BoxGeometry,
                 width - bodyThickness * 2 - drawerInset * 2,
                 drawerHeight - drawerInset * 2,
                 0.03
@@ -403,7 +271,7 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
         // Label holder (metal card holder on drawer)
         const labelHolder = new THREE.Mesh(
-            new THREE.BoxGeometry(width * 0.5, drawerHeight * 0.2, 0.015),
+            getGeometry(THREE.BoxGeometry, width * 0.5, drawerHeight * 0.2, 0.015),
             handleMaterial
         );
         labelHolder.position.set(0, drawerY, depth / 2 + 0.005);
@@ -411,8 +279,8 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
         // Label background (white paper look)
         const label = new THREE.Mesh(
-            new THREE.BoxGeometry(width * 0.45, drawerHeight * 0.15, 0.01),
-            new THREE.MeshStandardMaterial({ color: 0xf5f5f5, roughness: 0.8 })
+            getGeometry(THREE.BoxGeometry, width * 0.45, drawerHeight * 0.15, 0.01),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0xf5f5f5, roughness: 0.8 })
         );
         label.position.set(0, drawerY, depth / 2 + 0.012);
         group.add(label);
@@ -423,7 +291,7 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
         const handleDepth = 0.02;
 
         const handle = new THREE.Mesh(
-            new THREE.BoxGeometry(handleWidth, handleHeight, handleDepth),
+            getGeometry(THREE.BoxGeometry, handleWidth, handleHeight, handleDepth),
             handleMaterial
         );
         handle.position.set(0, drawerY - drawerHeight * 0.25, depth / 2 + handleDepth / 2);
@@ -432,8 +300,8 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
         // Lock mechanism (small circle)
         const lock = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.008, 0.008, 0.01, 16),
-            new THREE.MeshStandardMaterial({ color: 0x222222, metalness: 0.8 })
+            getGeometry(THREE.CylinderGeometry, 0.008, 0.008, 0.01, 16),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0x222222, metalness: 0.8 })
         );
         lock.rotation.x = Math.PI / 2;
         lock.position.set(0, drawerY + drawerHeight * 0.25, depth / 2 + 0.005);
@@ -445,11 +313,11 @@ export function createFilingCabinet(width = 0.5, height = 1.0, depth = 0.6, draw
 
 export function createSofa(width = 2.0, depth = 0.9, seatHeight = 0.45) {
     const group = new THREE.Group();
-    const fabricMaterial = new THREE.MeshStandardMaterial({ color: 0x4a4a4a, roughness: 0.9 });
+    const fabricMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x4a4a4a, roughness: 0.9 });
 
     // Seat
     const seat = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.2, depth),
+        getGeometry(THREE.BoxGeometry, width, 0.2, depth),
         fabricMaterial
     );
     seat.position.y = seatHeight;
@@ -458,7 +326,7 @@ export function createSofa(width = 2.0, depth = 0.9, seatHeight = 0.45) {
 
     // Backrest
     const back = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.6, 0.2),
+        getGeometry(THREE.BoxGeometry, width, 0.6, 0.2),
         fabricMaterial
     );
     back.position.set(0, seatHeight + 0.4, -depth / 2 + 0.1);
@@ -468,7 +336,7 @@ export function createSofa(width = 2.0, depth = 0.9, seatHeight = 0.45) {
     // Armrests
     [-width / 2 + 0.1, width / 2 - 0.1].forEach(x => {
         const arm = new THREE.Mesh(
-            new THREE.BoxGeometry(0.2, 0.4, depth),
+            getGeometry(THREE.BoxGeometry, 0.2, 0.4, depth),
             fabricMaterial
         );
         arm.position.set(x, seatHeight + 0.2, 0);
@@ -477,7 +345,7 @@ export function createSofa(width = 2.0, depth = 0.9, seatHeight = 0.45) {
     });
 
     // Legs (simple)
-    const legGeometry = new THREE.CylinderGeometry(0.04, 0.04, seatHeight - 0.1);
+    const legGeometry = getGeometry(THREE.CylinderGeometry, 0.04, 0.04, seatHeight - 0.1);
     const legPositions = [
         [width / 2 - 0.2, seatHeight / 2 - 0.05, depth / 2 - 0.2],
         [width / 2 - 0.2, seatHeight / 2 - 0.05, -depth / 2 + 0.2],
@@ -486,7 +354,7 @@ export function createSofa(width = 2.0, depth = 0.9, seatHeight = 0.45) {
     ];
 
     legPositions.forEach(pos => {
-        const leg = new THREE.Mesh(legGeometry, new THREE.MeshStandardMaterial({ color: 0x2a2a2a }));
+        const leg = new THREE.Mesh(legGeometry, getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a }));
         leg.position.set(...pos);
         group.add(leg);
     });
@@ -496,7 +364,7 @@ export function createSofa(width = 2.0, depth = 0.9, seatHeight = 0.45) {
 
 export function createCoffeeTable(width = 1.0, height = 0.35, depth = 0.6) {
     const group = new THREE.Group();
-    const glassMaterial = new THREE.MeshStandardMaterial({
+    const glassMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0xaaaaaa,
         transparent: true,
         opacity: 0.3,
@@ -506,7 +374,7 @@ export function createCoffeeTable(width = 1.0, height = 0.35, depth = 0.6) {
 
     // Glass top
     const top = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.03, depth),
+        getGeometry(THREE.BoxGeometry, width, 0.03, depth),
         glassMaterial
     );
     top.position.y = height;
@@ -515,8 +383,8 @@ export function createCoffeeTable(width = 1.0, height = 0.35, depth = 0.6) {
     group.add(top);
 
     // Metal legs
-    const legMaterial = new THREE.MeshStandardMaterial({ color: 0x888888, metalness: 0.8 });
-    const legGeometry = new THREE.CylinderGeometry(0.03, 0.03, height - 0.05);
+    const legMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x888888, metalness: 0.8 });
+    const legGeometry = getGeometry(THREE.CylinderGeometry, 0.03, 0.03, height - 0.05);
     const legPositions = [
         [width / 2 - 0.1, height / 2, depth / 2 - 0.1],
         [width / 2 - 0.1, height / 2, -depth / 2 + 0.1],
@@ -535,12 +403,12 @@ export function createCoffeeTable(width = 1.0, height = 0.35, depth = 0.6) {
 
 export function createArmchair(width = 0.9, depth = 0.9, seatHeight = 0.45) {
     const group = new THREE.Group();
-    const fabricMaterial = new THREE.MeshStandardMaterial({ color: 0x5a4a3a, roughness: 0.9 });
-    const cushionMaterial = new THREE.MeshStandardMaterial({ color: 0x6b5a4a, roughness: 0.85 });
+    const fabricMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x5a4a3a, roughness: 0.9 });
+    const cushionMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x6b5a4a, roughness: 0.85 });
 
     // Seat cushion
     const seat = new THREE.Mesh(
-        new THREE.BoxGeometry(width - 0.2, 0.15, depth - 0.2),
+        getGeometry(THREE.BoxGeometry, width - 0.2, 0.15, depth - 0.2),
         cushionMaterial
     );
     seat.position.y = seatHeight;
@@ -549,7 +417,7 @@ export function createArmchair(width = 0.9, depth = 0.9, seatHeight = 0.45) {
 
     // Backrest
     const back = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.7, 0.15),
+        getGeometry(THREE.BoxGeometry, width, 0.7, 0.15),
         fabricMaterial
     );
     back.position.set(0, seatHeight + 0.45, -depth / 2 + 0.075);
@@ -559,7 +427,7 @@ export function createArmchair(width = 0.9, depth = 0.9, seatHeight = 0.45) {
     // Armrests
     [-width / 2 + 0.1, width / 2 - 0.1].forEach(x => {
         const arm = new THREE.Mesh(
-            new THREE.BoxGeometry(0.2, 0.5, depth - 0.2),
+            getGeometry(THREE.BoxGeometry, 0.2, 0.5, depth - 0.2),
             fabricMaterial
         );
         arm.position.set(x, seatHeight + 0.15, 0);
@@ -569,16 +437,16 @@ export function createArmchair(width = 0.9, depth = 0.9, seatHeight = 0.45) {
 
     // Base/frame (slightly visible under seat)
     const base = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.1, depth),
-        new THREE.MeshStandardMaterial({ color: 0x3a2a1a })
+        getGeometry(THREE.BoxGeometry, width, 0.1, depth),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x3a2a1a })
     );
     base.position.y = seatHeight - 0.1;
     base.castShadow = true;
     group.add(base);
 
     // Legs (simple)
-    const legGeometry = new THREE.CylinderGeometry(0.04, 0.04, seatHeight - 0.15);
-    const legMaterial = new THREE.MeshStandardMaterial({ color: 0x3a2a1a });
+    const legGeometry = getGeometry(THREE.CylinderGeometry, 0.04, 0.04, seatHeight - 0.15);
+    const legMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x3a2a1a });
     const legPositions = [
         [width / 2 - 0.15, (seatHeight - 0.15) / 2, depth / 2 - 0.15],
         [width / 2 - 0.15, (seatHeight - 0.15) / 2, -depth / 2 + 0.15],
@@ -597,14 +465,14 @@ export function createArmchair(width = 0.9, depth = 0.9, seatHeight = 0.45) {
 
 export function createRug(width = 2.5, depth = 2.0) {
     const group = new THREE.Group();
-    const rugMaterial = new THREE.MeshStandardMaterial({
+    const rugMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0x8B4726,
         roughness: 0.95
     });
 
     // Main rug body
     const rug = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.02, depth),
+        getGeometry(THREE.BoxGeometry, width, 0.02, depth),
         rugMaterial
     );
     rug.position.y = 0.01;
@@ -612,7 +480,7 @@ export function createRug(width = 2.5, depth = 2.0) {
     group.add(rug);
 
     // Decorative border pattern
-    const borderMaterial = new THREE.MeshStandardMaterial({
+    const borderMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0x6a3819,
         roughness: 0.95
     });
@@ -621,7 +489,7 @@ export function createRug(width = 2.5, depth = 2.0) {
     // Top and bottom borders
     [depth / 2 - borderThickness / 2, -depth / 2 + borderThickness / 2].forEach(z => {
         const border = new THREE.Mesh(
-            new THREE.BoxGeometry(width, 0.025, borderThickness),
+            getGeometry(THREE.BoxGeometry, width, 0.025, borderThickness),
             borderMaterial
         );
         border.position.set(0, 0.015, z);
@@ -631,7 +499,7 @@ export function createRug(width = 2.5, depth = 2.0) {
     // Left and right borders
     [-width / 2 + borderThickness / 2, width / 2 - borderThickness / 2].forEach(x => {
         const border = new THREE.Mesh(
-            new THREE.BoxGeometry(borderThickness, 0.025, depth - 2 * borderThickness),
+            getGeometry(THREE.BoxGeometry, borderThickness, 0.025, depth - 2 * borderThickness),
             borderMaterial
         );
         border.position.set(x, 0.015, 0);
@@ -648,8 +516,8 @@ export function createComputer(screenWidth = 0.4, screenHeight = 0.3) {
 
     // Monitor screen (black rectangle)
     const screen = new THREE.Mesh(
-        new THREE.BoxGeometry(screenWidth, screenHeight, 0.02),
-        new THREE.MeshStandardMaterial({ color: 0x1a1a1a, roughness: 0.2 })
+        getGeometry(THREE.BoxGeometry, screenWidth, screenHeight, 0.02),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x1a1a1a, roughness: 0.2 })
     );
     screen.position.set(0, 0.05 + screenHeight / 2, 0);
     screen.castShadow = true;
@@ -657,8 +525,8 @@ export function createComputer(screenWidth = 0.4, screenHeight = 0.3) {
 
     // Base/stand
     const stand = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.06, 0.08, 0.05),
-        new THREE.MeshStandardMaterial({ color: 0x2a2a2a })
+        getGeometry(THREE.CylinderGeometry, 0.06, 0.08, 0.05),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a })
     );
     stand.position.y = 0.025;
     group.add(stand);
@@ -671,18 +539,18 @@ export function createKeyboard(width = 0.4, depth = 0.15) {
 
     // Main body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.02, depth),
-        new THREE.MeshStandardMaterial({ color: 0x2a2a2a, roughness: 0.6 })
+        getGeometry(THREE.BoxGeometry, width, 0.02, depth),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a, roughness: 0.6 })
     );
     body.position.y = 0.01;
     group.add(body);
 
     // Keys (simple grid)
-    const keyMaterial = new THREE.MeshStandardMaterial({ color: 0x1a1a1a });
+    const keyMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x1a1a1a });
     for (let row = 0; row < 4; row++) {
         for (let col = 0; col < 10; col++) {
             const key = new THREE.Mesh(
-                new THREE.BoxGeometry(0.03, 0.01, 0.03),
+                getGeometry(THREE.BoxGeometry, 0.03, 0.01, 0.03),
                 keyMaterial
             );
             key.position.set(
@@ -701,13 +569,13 @@ export function createMouse() {
     const group = new THREE.Group();
 
     const mouse = new THREE.Mesh(
-        new THREE.BoxGeometry(0.06, 0.02, 0.09),
-        new THREE.MeshStandardMaterial({ color: 0x2a2a2a, roughness: 0.5 })
+        getGeometry(THREE.BoxGeometry, 0.06, 0.02, 0.09),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a, roughness: 0.5 })
     );
     mouse.position.y = 0.01;
 
-    // Rounded top
-    mouse.geometry.scale(1, 1.2, 1);
+    // Rounded top (scale the mesh - the geometry is shared)
+    mouse.scale.set(1, 1.2, 1);
     group.add(mouse);
 
     return group;
@@ -715,7 +583,7 @@ export function createMouse() {
 
 export function createSafe(width = 0.8, height = 1.0, depth = 0.8) {
     const group = new THREE.Group();
-    const safeMaterial = new THREE.MeshStandardMaterial({
+    const safeMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0x2a2a2a,
         metalness: 0.8,
         roughness: 0.3
@@ -723,7 +591,7 @@ export function createSafe(width = 0.8, height = 1.0, depth = 0.8) {
 
     // Main body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, depth),
+        getGeometry(THREE.BoxGeometry, width, height, depth),
         safeMaterial
     );
     body.position.y = height / 2;
@@ -733,16 +601,16 @@ export function createSafe(width = 0.8, height = 1.0, depth = 0.8) {
 
     // Door (front face)
     const door = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 0.9, height * 0.9, 0.02),
-        new THREE.MeshStandardMaterial({ color: 0x1a1a1a })
+        getGeometry(THREE.BoxGeometry, width * 0.9, height * 0.9, 0.02),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x1a1a1a })
     );
     door.position.set(0, height / 2, depth / 2 + 0.01);
     group.add(door);
 
     // Combination dial
     const dial = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.1, 0.1, 0.05, 16),
-        new THREE.MeshStandardMaterial({ color: 0xcccccc, metalness: 0.9 })
+        getGeometry(THREE.CylinderGeometry, 0.1, 0.1, 0.05, 16),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xcccccc, metalness: 0.9 })
     );
     dial.rotation.x = Math.PI / 2;
     dial.position.set(0, height / 2 + 0.2, depth / 2 + 0.03);
@@ -750,8 +618,8 @@ export function createSafe(width = 0.8, height = 1.0, depth = 0.8) {
 
     // Handle
     const handle = new THREE.Mesh(
-        new THREE.BoxGeometry(0.05, 0.2, 0.05),
-        new THREE.MeshStandardMaterial({ color: 0xcccccc, metalness: 0.9 })
+        getGeometry(THREE.BoxGeometry, 0.05, 0.2, 0.05),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xcccccc, metalness: 0.9 })
     );
     handle.position.set(0.2, height / 2, depth / 2 + 0.03);
     group.add(handle);
@@ -766,8 +634,8 @@ export function createPaperShredder() {
 
     // Bin (Bottom)
     const bin = new THREE.Mesh(
-        new THREE.BoxGeometry(0.3, 0.4, 0.2),
-        new THREE.MeshStandardMaterial({ color: bodyColor, roughness: 0.7 })
+        getGeometry(THREE.BoxGeometry, 0.3, 0.4, 0.2),
+        getMaterial(THREE.MeshStandardMaterial, { color: bodyColor, roughness: 0.7 })
     );
     bin.position.y = 0.2;
     bin.castShadow = true;
@@ -775,8 +643,8 @@ export function createPaperShredder() {
 
     // Shredder Head (Top)
     const head = new THREE.Mesh(
-        new THREE.BoxGeometry(0.32, 0.1, 0.22),
-        new THREE.MeshStandardMaterial({ color: topColor, roughness: 0.5 })
+        getGeometry(THREE.BoxGeometry, 0.32, 0.1, 0.22),
+        getMaterial(THREE.MeshStandardMaterial, { color: topColor, roughness: 0.5 })
     );
     head.position.y = 0.45;
     head.castShadow = true;
@@ -785,16 +653,16 @@ export function createPaperShredder() {
 
     // Slot
     const slot = new THREE.Mesh(
-        new THREE.BoxGeometry(0.2, 0.01, 0.02),
-        new THREE.MeshStandardMaterial({ color: 0x000000 })
+        getGeometry(THREE.BoxGeometry, 0.2, 0.01, 0.02),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x000000 })
     );
     slot.position.y = 0.5;
     group.add(slot);
 
     // Add invisible hitbox for easier clicking
     const hitbox = new THREE.Mesh(
-        new THREE.BoxGeometry(0.4, 0.6, 0.3),
-        new THREE.MeshBasicMaterial({ visible: false })
+        getGeometry(THREE.BoxGeometry, 0.4, 0.6, 0.3),
+        getMaterial(THREE.MeshBasicMaterial, { visible: false })
     );
     hitbox.position.y = 0.3;
     hitbox.name = "shredder_hitbox";
@@ -807,7 +675,7 @@ export function createPaperShredder() {
 
 export function createPaperStack(count = 5) {
     const group = new THREE.Group();
-    const paperMaterial = new THREE.MeshStandardMaterial({
+    const paperMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0xfffdf0,
         roughness: 0.9,
         side: THREE.DoubleSide
@@ -818,7 +686,7 @@ export function createPaperStack(count = 5) {
         const height = 0.297;
 
         const paper = new THREE.Mesh(
-            new THREE.BoxGeometry(width, 0.001, height),
+            getGeometry(THREE.BoxGeometry, width, 0.001, height),
             paperMaterial
         );
 
@@ -837,18 +705,18 @@ export function createPaperStack(count = 5) {
 
 export function createCardboardBox(width = 0.4, height = 0.3, depth = 0.4) {
     const group = new THREE.Group();
-    const cardboardMaterial = new THREE.MeshStandardMaterial({
+    const cardboardMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0x8d6e63, // Brown
         roughness: 0.9
     });
-    const tapeMaterial = new THREE.MeshStandardMaterial({
+    const tapeMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0xd7ccc8, // Lighter tape
         roughness: 0.6
     });
 
     // Main box
     const box = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, depth),
+        getGeometry(THREE.BoxGeometry, width, height, depth),
         cardboardMaterial
     );
     box.position.y = height / 2;
@@ -858,7 +726,7 @@ export function createCardboardBox(width = 0.4, height = 0.3, depth = 0.4) {
 
     // Tape across top
     const tape = new THREE.Mesh(
-        new THREE.BoxGeometry(width + 0.01, 0.005, 0.05),
+        getGeometry(THREE.BoxGeometry, width + 0.01, 0.005, 0.05),
         tapeMaterial
     );
     tape.position.y = height;
@@ -873,23 +741,23 @@ export function createWhiteboard(width = 2.0, height = 1.2) {
     // Frame
     const frameThickness = 0.02;
     const frameDepth = 0.02;
-    const frameMaterial = new THREE.MeshStandardMaterial({ color: 0xc0c0c0, metalness: 0.6 }); // Silver
+    const frameMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xc0c0c0, metalness: 0.6 }); // Silver
 
     const frame = new THREE.Mesh(
-        new THREE.BoxGeometry(width + frameThickness * 2, height + frameThickness * 2, frameDepth),
+        getGeometry(THREE.BoxGeometry, width + frameThickness * 2, height + frameThickness * 2, frameDepth),
         frameMaterial
     );
     frame.castShadow = true;
     group.add(frame);
 
     // Board surface
-    const boardMaterial = new THREE.MeshStandardMaterial({
+    const boardMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0xffffff,
         roughness: 0.2,
         metalness: 0.1
     });
     const board = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, frameDepth / 2),
+        getGeometry(THREE.BoxGeometry, width, height, frameDepth / 2),
         boardMaterial
     );
     board.position.z = frameDepth / 2 + 0.001;
@@ -897,7 +765,7 @@ export function createWhiteboard(width = 2.0, height = 1.2) {
 
     // Tray
     const tray = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.05, 0.1),
+        getGeometry(THREE.BoxGeometry, width, 0.05, 0.1),
         frameMaterial
     );
     tray.position.set(0, -height / 2 - 0.025, 0.05);
@@ -905,8 +773,8 @@ export function createWhiteboard(width = 2.0, height = 1.2) {
 
     // Eraser
     const eraser = new THREE.Mesh(
-        new THREE.BoxGeometry(0.15, 0.03, 0.05),
-        new THREE.MeshStandardMaterial({ color: 0x333333 })
+        getGeometry(THREE.BoxGeometry, 0.15, 0.03, 0.05),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x333333 })
     );
     eraser.position.set(width / 3, -height / 2 - 0.01, 0.05);
     eraser.rotation.x = 0.2;
@@ -916,8 +784,8 @@ export function createWhiteboard(width = 2.0, height = 1.2) {
     const markerColors = [0xff0000, 0x0000ff, 0x000000];
     markerColors.forEach((col, i) => {
         const marker = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.01, 0.01, 0.12),
-            new THREE.MeshStandardMaterial({ color: col })
+            getGeometry(THREE.CylinderGeometry, 0.01, 0.01, 0.12),
+            getMaterial(THREE.MeshStandardMaterial, { color: col })
         );
         marker.rotation.z = Math.PI / 2;
         marker.position.set(-width / 3 + i * 0.05, -height / 2 - 0.015, 0.05);
@@ -937,8 +805,8 @@ export function createScatteredBooks(count = 3) {
         const thickness = 0.03 + Math.random() * 0.04;
 
         const book = new THREE.Mesh(
-            new THREE.BoxGeometry(width, thickness, length),
-            new THREE.MeshStandardMaterial({
+            getGeometry(THREE.BoxGeometry, width, thickness, length),
+            getMaterial(THREE.MeshStandardMaterial, {
                 color: bookColors[Math.floor(Math.random() * bookColors.length)],
                 roughness: 0.7
             })
@@ -959,11 +827,11 @@ export function createScatteredBooks(count = 3) {
 
 export function createRoundTable(radius = 0.6, height = 0.75) {
     const group = new THREE.Group();
-    const woodMaterial = new THREE.MeshStandardMaterial({ color: 0x8B4513, roughness: 0.6 });
+    const woodMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x8B4513, roughness: 0.6 });
 
     // Table Top
     const top = new THREE.Mesh(
-        new THREE.CylinderGeometry(radius, radius, 0.05, 32),
+        getGeometry(THREE.CylinderGeometry, radius, radius, 0.05, 32),
         woodMaterial
     );
     top.position.y = height;
@@ -973,7 +841,7 @@ export function createRoundTable(radius = 0.6, height = 0.75) {
 
     // Central Leg
     const leg = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.08, 0.08, height),
+        getGeometry(THREE.CylinderGeometry, 0.08, 0.08, height),
         woodMaterial
     );
     leg.position.y = height / 2;
@@ -982,7 +850,7 @@ export function createRoundTable(radius = 0.6, height = 0.75) {
 
     // Base
     const base = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.3, 0.4, 0.05, 16),
+        getGeometry(THREE.CylinderGeometry, 0.3, 0.4, 0.05, 16),
         woodMaterial
     );
     base.position.y = 0.025;
@@ -994,11 +862,11 @@ export function createRoundTable(radius = 0.6, height = 0.75) {
 
 export function createSimpleChair(seatHeight = 0.45) {
     const group = new THREE.Group();
-    const material = new THREE.MeshStandardMaterial({ color: 0x333333, roughness: 0.8 });
+    const material = getMaterial(THREE.MeshStandardMaterial, { color: 0x333333, roughness: 0.8 });
 
     // Seat
     const seat = new THREE.Mesh(
-        new THREE.BoxGeometry(0.4, 0.05, 0.4),
+        getGeometry(THREE.BoxGeometry, 0.4, 0.05, 0.4),
         material
     );
     seat.position.y = seatHeight;
@@ -1007,7 +875,7 @@ export function createSimpleChair(seatHeight = 0.45) {
 
     // Back
     const back = new THREE.Mesh(
-        new THREE.BoxGeometry(0.4, 0.4, 0.05),
+        getGeometry(THREE.BoxGeometry, 0.4, 0.4, 0.05),
         material
     );
     back.position.set(0, seatHeight + 0.2, -0.175);
@@ -1015,7 +883,7 @@ export function createSimpleChair(seatHeight = 0.45) {
     group.add(back);
 
     // Legs
-    const legGeo = new THREE.CylinderGeometry(0.03, 0.03, seatHeight);
+    const legGeo = getGeometry(THREE.CylinderGeometry, 0.03, 0.03, seatHeight);
     const legPos = [
         [0.15, seatHeight / 2, 0.15],
         [0.15, seatHeight / 2, -0.15],
@@ -1024,7 +892,7 @@ export function createSimpleChair(seatHeight = 0.45) {
     ];
 
     legPos.forEach(pos => {
-        const leg = new THREE.Mesh(legGeo, new THREE.MeshStandardMaterial({ color: 0x666666 }));
+        const leg = new THREE.Mesh(legGeo, getMaterial(THREE.MeshStandardMaterial, { color: 0x666666 }));
         leg.position.set(...pos);
         group.add(leg);
     });
@@ -1037,8 +905,8 @@ export function createWaterCooler() {
 
     // Base unit
     const base = new THREE.Mesh(
-        new THREE.BoxGeometry(0.35, 1.0, 0.35),
-        new THREE.MeshStandardMaterial({ color: 0xeeeeee, roughness: 0.4 })
+        getGeometry(THREE.BoxGeometry, 0.35, 1.0, 0.35),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xeeeeee, roughness: 0.4 })
     );
     base.position.y = 0.5;
     base.castShadow = true;
@@ -1046,8 +914,8 @@ export function createWaterCooler() {
 
     // Water Bottle
     const bottle = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.14, 0.14, 0.4, 16),
-        new THREE.MeshStandardMaterial({
+        getGeometry(THREE.CylinderGeometry, 0.14, 0.14, 0.4, 16),
+        getMaterial(THREE.MeshStandardMaterial, {
             color: 0x00aaff,
             transparent: true,
             opacity: 0.6,
@@ -1059,15 +927,15 @@ export function createWaterCooler() {
 
     // Taps
     const tapRed = new THREE.Mesh(
-        new THREE.BoxGeometry(0.03, 0.05, 0.05),
-        new THREE.MeshStandardMaterial({ color: 0xff0000 })
+        getGeometry(THREE.BoxGeometry, 0.03, 0.05, 0.05),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xff0000 })
     );
     tapRed.position.set(0.08, 0.75, 0.18);
     group.add(tapRed);
 
     const tapBlue = new THREE.Mesh(
-        new THREE.BoxGeometry(0.03, 0.05, 0.05),
-        new THREE.MeshStandardMaterial({ color: 0x0000ff })
+        getGeometry(THREE.BoxGeometry, 0.03, 0.05, 0.05),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x0000ff })
     );
     tapBlue.position.set(-0.08, 0.75, 0.18);
     group.add(tapBlue);
@@ -1080,15 +948,15 @@ export function createCorkboard(width = 1.2, height = 0.8) {
 
     // Frame
     const frame = new THREE.Mesh(
-        new THREE.BoxGeometry(width + 0.04, height + 0.04, 0.02),
-        new THREE.MeshStandardMaterial({ color: 0x5d4037 })
+        getGeometry(THREE.BoxGeometry, width + 0.04, height + 0.04, 0.02),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x5d4037 })
     );
     group.add(frame);
 
     // Cork
     const cork = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, 0.025),
-        new THREE.MeshStandardMaterial({ color: 0xc19a6b, roughness: 0.9 })
+        getGeometry(THREE.BoxGeometry, width, height, 0.025),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xc19a6b, roughness: 0.9 })
     );
     group.add(cork);
 
@@ -1096,8 +964,8 @@ export function createCorkboard(width = 1.2, height = 0.8) {
     const noteColors = [0xffffcc, 0xffccff, 0xccffff];
     for (let i = 0; i < 5; i++) {
         const note = new THREE.Mesh(
-            new THREE.PlaneGeometry(0.1, 0.1),
-            new THREE.MeshBasicMaterial({ color: noteColors[i % 3], side: THREE.DoubleSide })
+            getGeometry(THREE.PlaneGeometry, 0.1, 0.1),
+            getMaterial(THREE.MeshBasicMaterial, { color: noteColors[i % 3], side: THREE.DoubleSide })
         );
         note.position.set(
             (Math.random() - 0.5) * width * 0.8,
@@ -1109,8 +977,8 @@ export function createCorkboard(width = 1.2, height = 0.8) {
 
         // Pin
         const pin = new THREE.Mesh(
-            new THREE.SphereGeometry(0.005),
-            new THREE.MeshBasicMaterial({ color: 0xff0000 })
+            getGeometry(THREE.SphereGeometry, 0.005),
+            getMaterial(THREE.MeshBasicMaterial, { color: 0xff0000 })
         );
         pin.position.copy(note.position);
         pin.position.z += 0.005;
@@ -1125,15 +993,15 @@ export function createGlobe(radius = 0.2) {
 
     // Base
     const base = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.08, 0.08, 0.05),
-        new THREE.MeshStandardMaterial({ color: 0x8B4513 })
+        getGeometry(THREE.CylinderGeometry, 0.08, 0.08, 0.05),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x8B4513 })
     );
     group.add(base);
 
     // Globe sphere
     const globe = new THREE.Mesh(
-        new THREE.SphereGeometry(radius, 32, 32),
-        new THREE.MeshStandardMaterial({ color: 0x4682B4, roughness: 0.6 })
+        getGeometry(THREE.SphereGeometry, radius, 32, 32),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x4682B4, roughness: 0.6 })
     );
     globe.position.y = 0.025 + radius;
     globe.name = "globe";
@@ -1142,8 +1010,8 @@ export function createGlobe(radius = 0.2) {
 
     // Add larger invisible hitbox for easier interaction
     const hitbox = new THREE.Mesh(
-        new THREE.SphereGeometry(radius * 2, 16, 16),
-        new THREE.MeshBasicMaterial({ visible: false })
+        getGeometry(THREE.SphereGeometry, radius * 2, 16, 16),
+        getMaterial(THREE.MeshBasicMaterial, { visible: false })
     );
     hitbox.position.y = 0.025 + radius;
     group.add(hitbox);
@@ -1156,8 +1024,8 @@ export function createClock(radius = 0.3) {
 
     // Frame
     const frame = new THREE.Mesh(
-        new THREE.CylinderGeometry(radius, radius, 0.1, 32),
-        new THREE.MeshStandardMaterial({ color: 0x222222 })
+        getGeometry(THREE.CylinderGeometry, radius, radius, 0.1, 32),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x222222 })
     );
     frame.rotation.x = Math.PI / 2;
     frame.castShadow = true;
@@ -1165,19 +1033,19 @@ export function createClock(radius = 0.3) {
 
     // Face
     const face = new THREE.Mesh(
-        new THREE.CircleGeometry(radius * 0.93, 32),
-        new THREE.MeshStandardMaterial({ color: 0xffffff })
+        getGeometry(THREE.CircleGeometry, radius * 0.93, 32),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xffffff })
     );
     face.position.z = 0.051;
     face.name = "clock";
     group.add(face);
 
     // Hour markers (simple)
-    const markerMaterial = new THREE.MeshStandardMaterial({ color: 0x000000 });
+    const markerMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x000000 });
     for (let i = 0; i < 12; i++) {
         const angle = (i / 12) * Math.PI * 2;
         const marker = new THREE.Mesh(
-            new THREE.BoxGeometry(0.02, i % 3 === 0 ? 0.05 : 0.03, 0.01),
+            getGeometry(THREE.BoxGeometry, 0.02, i % 3 === 0 ? 0.05 : 0.03, 0.01),
             markerMaterial
         );
         marker.position.set(
@@ -1191,7 +1059,7 @@ export function createClock(radius = 0.3) {
 
     // Hour hand
     const hourHand = new THREE.Mesh(
-        new THREE.BoxGeometry(0.03, radius * 0.5, 0.01),
+        getGeometry(THREE.BoxGeometry, 0.03, radius * 0.5, 0.01),
         markerMaterial
     );
     hourHand.position.set(0, radius * 0.25, 0.065);
@@ -1200,7 +1068,7 @@ export function createClock(radius = 0.3) {
 
     // Minute hand
     const minuteHand = new THREE.Mesh(
-        new THREE.BoxGeometry(0.02, radius * 0.7, 0.01),
+        getGeometry(THREE.BoxGeometry, 0.02, radius * 0.7, 0.01),
         markerMaterial
     );
     minuteHand.position.set(0, radius * 0.35, 0.07);
@@ -1216,15 +1084,15 @@ export function createPainting(width = 1.0, height = 0.8) {
     // Frame
     const frameWidth = 0.05;
     const frame = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, 0.05),
-        new THREE.MeshStandardMaterial({ color: 0x3d2f1f }) // Dark wood
+        getGeometry(THREE.BoxGeometry, width, height, 0.05),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x3d2f1f }) // Dark wood
     );
     group.add(frame);
 
     // Canvas/Picture
     const canvas = new THREE.Mesh(
-        new THREE.BoxGeometry(width - frameWidth * 2, height - frameWidth * 2, 0.02),
-        new THREE.MeshStandardMaterial({ color: Math.random() * 0xffffff }) // Random color abstract art
+        getGeometry(THREE.BoxGeometry, width - frameWidth * 2, height - frameWidth * 2, 0.02),
+        getMaterial(THREE.MeshStandardMaterial, { color: Math.random() * 0xffffff }) // Random color abstract art
     );
     canvas.position.z = 0.02;
     group.add(canvas);
@@ -1246,8 +1114,8 @@ export function createBooks(count = 5) {
         const spineWidth = 0.025 + Math.random() * 0.035; // Random width 0.025-0.06
 
         const book = new THREE.Mesh(
-            new THREE.BoxGeometry(spineWidth, bookHeight, bookDepth),
-            new THREE.MeshStandardMaterial({ color: colors[i % colors.length], roughness: 0.8 })
+            getGeometry(THREE.BoxGeometry, spineWidth, bookHeight, bookDepth),
+            getMaterial(THREE.MeshStandardMaterial, { color: colors[i % colors.length], roughness: 0.8 })
         );
 
         // Position books side by side along X axis
@@ -1270,8 +1138,8 @@ export function createBooks(count = 5) {
     // Add a larger invisible hitbox for easier interaction
     const totalWidth = xOffset;
     const hitbox = new THREE.Mesh(
-        new THREE.BoxGeometry(totalWidth * 1.5, bookHeight * 1.5, bookDepth * 1.5),
-        new THREE.MeshBasicMaterial({ visible: false })
+        getGeometry(THREE.BoxGeometry, totalWidth * 1.5, bookHeight * 1.5, bookDepth * 1.5),
+        getMaterial(THREE.MeshBasicMaterial, { visible: false })
     );
     hitbox.position.set(totalWidth / 2 - xOffset / 2, bookHeight / 2, 0);
     group.add(hitbox);
@@ -1287,8 +1155,8 @@ export function createPlant(potRadius = 0.1, plantHeight = 0.4) {
 
     // Pot
     const pot = new THREE.Mesh(
-        new THREE.CylinderGeometry(potRadius, potRadius * 0.8, potRadius * 1.5, 16),
-        new THREE.MeshStandardMaterial({ color: 0x8B4513, roughness: 0.7 })
+        getGeometry(THREE.CylinderGeometry, potRadius, potRadius * 0.8, potRadius * 1.5, 16),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x8B4513, roughness: 0.7 })
     );
     pot.position.y = potRadius * 0.75;
     pot.castShadow = true;
@@ -1296,18 +1164,18 @@ export function createPlant(potRadius = 0.1, plantHeight = 0.4) {
 
     // Soil
     const soil = new THREE.Mesh(
-        new THREE.CircleGeometry(potRadius, 16),
-        new THREE.MeshStandardMaterial({ color: 0x3d2817 })
+        getGeometry(THREE.CircleGeometry, potRadius, 16),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x3d2817 })
     );
     soil.rotation.x = -Math.PI / 2;
     soil.position.y = potRadius * 1.5;
     group.add(soil);
 
     // Simple leaves (green spheres)
-    const leafMaterial = new THREE.MeshStandardMaterial({ color: 0x228B22 });
+    const leafMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x228B22 });
     for (let i = 0; i < 5; i++) {
         const leaf = new THREE.Mesh(
-            new THREE.SphereGeometry(potRadius * 0.8, 8, 8),
+            getGeometry(THREE.SphereGeometry, potRadius * 0.8, 8, 8),
             leafMaterial
         );
         const angle = (i / 5) * Math.PI * 2;
@@ -1322,8 +1190,8 @@ export function createPlant(potRadius = 0.1, plantHeight = 0.4) {
 
     // Add larger invisible hitbox for easier interaction
     const hitbox = new THREE.Mesh(
-        new THREE.CylinderGeometry(potRadius * 3, potRadius * 2.5, potRadius * 1.5 + plantHeight, 8),
-        new THREE.MeshBasicMaterial({ visible: false })
+        getGeometry(THREE.CylinderGeometry, potRadius * 3, potRadius * 2.5, potRadius * 1.5 + plantHeight, 8),
+        getMaterial(THREE.MeshBasicMaterial, { visible: false })
     );
     hitbox.position.y = (potRadius * 1.5 + plantHeight) / 2;
     group.add(hitbox);
@@ -1337,24 +1205,24 @@ export function createLamp(type = 'desk') {
     if (type === 'desk') {
         // Base
         const base = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.08, 0.1, 0.02),
-            new THREE.MeshStandardMaterial({ color: 0x2a2a2a })
+            getGeometry(THREE.CylinderGeometry, 0.08, 0.1, 0.02),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a })
         );
         base.position.y = 0.01;
         group.add(base);
 
         // Stem
         const stem = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.02, 0.02, 0.4),
-            new THREE.MeshStandardMaterial({ color: 0x2a2a2a })
+            getGeometry(THREE.CylinderGeometry, 0.02, 0.02, 0.4),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a })
         );
         stem.position.y = 0.2;
         group.add(stem);
 
         // Shade
         const shade = new THREE.Mesh(
-            new THREE.ConeGeometry(0.12, 0.15, 16),
-            new THREE.MeshStandardMaterial({ color: 0x4a4a4a })
+            getGeometry(THREE.ConeGeometry, 0.12, 0.15, 16),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0x4a4a4a })
         );
         shade.position.y = 0.475;
         shade.rotation.x = Math.PI;
@@ -1362,32 +1230,32 @@ export function createLamp(type = 'desk') {
 
         // Add larger invisible hitbox for desk lamp
         const hitbox = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.25, 0.25, 0.55, 8),
-            new THREE.MeshBasicMaterial({ visible: false })
+            getGeometry(THREE.CylinderGeometry, 0.25, 0.25, 0.55, 8),
+            getMaterial(THREE.MeshBasicMaterial, { visible: false })
         );
         hitbox.position.y = 0.275;
         group.add(hitbox);
     } else {
         // Floor lamp
         const pole = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.03, 0.03, 1.6),
-            new THREE.MeshStandardMaterial({ color: 0x2a2a2a })
+            getGeometry(THREE.CylinderGeometry, 0.03, 0.03, 1.6),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a })
         );
         pole.position.y = 0.8;
         group.add(pole);
 
         // Base
         const base = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.15, 0.2, 0.05),
-            new THREE.MeshStandardMaterial({ color: 0x2a2a2a })
+            getGeometry(THREE.CylinderGeometry, 0.15, 0.2, 0.05),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a })
         );
         base.position.y = 0.025;
         group.add(base);
 
         // Shade
         const shade = new THREE.Mesh(
-            new THREE.ConeGeometry(0.2, 0.25, 16),
-            new THREE.MeshStandardMaterial({ color: 0x4a4a4a })
+            getGeometry(THREE.ConeGeometry, 0.2, 0.25, 16),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0x4a4a4a })
         );
         shade.position.y = 1.725;
         shade.rotation.x = Math.PI;
@@ -1395,8 +1263,8 @@ export function createLamp(type = 'desk') {
 
         // Add larger invisible hitbox for floor lamp
         const hitbox = new THREE.Mesh(
-            new THREE.CylinderGeometry(0.4, 0.4, 1.85, 8),
-            new THREE.MeshBasicMaterial({ visible: false })
+            getGeometry(THREE.CylinderGeometry, 0.4, 0.4, 1.85, 8),
+            getMaterial(THREE.MeshBasicMaterial, { visible: false })
         );
         hitbox.position.y = 0.925;
         group.add(hitbox);
@@ -1407,14 +1275,14 @@ export function createLamp(type = 'desk') {
 
 export function createBriefcase(width = 0.6, height = 0.15, depth = 0.4) {
     const group = new THREE.Group();
-    const leatherMaterial = new THREE.MeshStandardMaterial({
+    const leatherMaterial = getMaterial(THREE.MeshStandardMaterial, {
         color: 0x3d2817,
         roughness: 0.5
     });
 
     // Main body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, depth),
+        getGeometry(THREE.BoxGeometry, width, height, depth),
         leatherMaterial
     );
     body.castShadow = true;
@@ -1422,8 +1290,8 @@ export function createBriefcase(width = 0.6, height = 0.15, depth = 0.4) {
 
     // Handle
     const handle = new THREE.Mesh(
-        new THREE.TorusGeometry(0.08, 0.015, 8, 16, Math.PI),
-        new THREE.MeshStandardMaterial({ color: 0x2a2a2a })
+        getGeometry(THREE.TorusGeometry, 0.08, 0.015, 8, 16, Math.PI),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a })
     );
     handle.rotation.z = Math.PI / 2;
     handle.position.y = height / 2 + 0.05;
@@ -1432,8 +1300,8 @@ export function createBriefcase(width = 0.6, height = 0.15, depth = 0.4) {
     // Latches
     [-width / 4, width / 4].forEach(x => {
         const latch = new THREE.Mesh(
-            new THREE.BoxGeometry(0.05, 0.02, 0.02),
-            new THREE.MeshStandardMaterial({ color: 0x888888, metalness: 0.8 })
+            getGeometry(THREE.BoxGeometry, 0.05, 0.02, 0.02),
+            getMaterial(THREE.MeshStandardMaterial, { color: 0x888888, metalness: 0.8 })
         );
         latch.position.set(x, 0, depth / 2 + 0.01);
         group.add(latch);
@@ -1441,8 +1309,8 @@ export function createBriefcase(width = 0.6, height = 0.15, depth = 0.4) {
 
     // Add larger invisible hitbox for easier interaction
     const hitbox = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 1.5, height * 3, depth * 1.5),
-        new THREE.MeshBasicMaterial({ visible: false })
+        getGeometry(THREE.BoxGeometry, width * 1.5, height * 3, depth * 1.5),
+        getMaterial(THREE.MeshBasicMaterial, { visible: false })
     );
     hitbox.position.y = height / 2;
     group.add(hitbox);
@@ -1454,8 +1322,8 @@ export function createTrashCan(radius = 0.15, height = 0.4) {
     const group = new THREE.Group();
 
     const can = new THREE.Mesh(
-        new THREE.CylinderGeometry(radius, radius * 0.9, height, 16),
-        new THREE.MeshStandardMaterial({ color: 0x2a2a2a, roughness: 0.6 })
+        getGeometry(THREE.CylinderGeometry, radius, radius * 0.9, height, 16),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a, roughness: 0.6 })
     );
     can.position.y = height / 2;
     can.castShadow = true;
@@ -1466,11 +1334,11 @@ export function createTrashCan(radius = 0.15, height = 0.4) {
 
 export function createCoatRack(height = 1.8) {
     const group = new THREE.Group();
-    const woodMaterial = new THREE.MeshStandardMaterial({ color: 0x654321 });
+    const woodMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x654321 });
 
     // Central pole
     const pole = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.04, 0.06, height, 8),
+        getGeometry(THREE.CylinderGeometry, 0.04, 0.06, height, 8),
         woodMaterial
     );
     pole.position.y = height / 2;
@@ -1481,7 +1349,7 @@ export function createCoatRack(height = 1.8) {
     for (let i = 0; i < 3; i++) {
         const angle = (i / 3) * Math.PI * 2;
         const leg = new THREE.Mesh(
-            new THREE.BoxGeometry(0.4, 0.05, 0.05),
+            getGeometry(THREE.BoxGeometry, 0.4, 0.05, 0.05),
             woodMaterial
         );
         leg.position.set(
@@ -1495,11 +1363,11 @@ export function createCoatRack(height = 1.8) {
     }
 
     // Hooks
-    const hookMaterial = new THREE.MeshStandardMaterial({ color: 0x8B4513 });
+    const hookMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x8B4513 });
     for (let i = 0; i < 4; i++) {
         const angle = (i / 4) * Math.PI * 2;
         const hook = new THREE.Mesh(
-            new THREE.BoxGeometry(0.15, 0.03, 0.03),
+            getGeometry(THREE.BoxGeometry, 0.15, 0.03, 0.03),
             hookMaterial
         );
         hook.position.set(
@@ -1519,21 +1387,21 @@ export function createChalkboard(width = 4.0, height = 2.0) {
 
     // Board
     const board = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, 0.1),
-        new THREE.MeshStandardMaterial({ color: 0x1a1a1a, roughness: 0.7 })
+        getGeometry(THREE.BoxGeometry, width, height, 0.1),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x1a1a1a, roughness: 0.7 })
     );
     board.castShadow = true;
     board.name = "chalkboard";
     group.add(board);
 
     // Frame
-    const frameMaterial = new THREE.MeshStandardMaterial({ color: 0x8B4513 });
+    const frameMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x8B4513 });
     const frameThickness = 0.08;
 
     // Top/Bottom
     [height / 2, -height / 2].forEach(y => {
         const frame = new THREE.Mesh(
-            new THREE.BoxGeometry(width + frameThickness * 2, frameThickness, 0.12),
+            getGeometry(THREE.BoxGeometry, width + frameThickness * 2, frameThickness, 0.12),
             frameMaterial
         );
         frame.position.y = y;
@@ -1543,7 +1411,7 @@ export function createChalkboard(width = 4.0, height = 2.0) {
     // Left/Right
     [-width / 2, width / 2].forEach(x => {
         const frame = new THREE.Mesh(
-            new THREE.BoxGeometry(frameThickness, height, 0.12),
+            getGeometry(THREE.BoxGeometry, frameThickness, height, 0.12),
             frameMaterial
         );
         frame.position.x = x;
@@ -1552,7 +1420,7 @@ export function createChalkboard(width = 4.0, height = 2.0) {
 
     // Chalk tray
     const tray = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.05, 0.15),
+        getGeometry(THREE.BoxGeometry, width, 0.05, 0.15),
         frameMaterial
     );
     tray.position.set(0, -height / 2 - 0.05, 0.05);
@@ -1567,10 +1435,10 @@ export function createTVStand(screenWidth = 1.2, screenHeight = 0.7, standWidth
     // TV Stand/Cabinet
     const standHeight = 0.5;
     const standDepth = 0.4;
-    const standMaterial = new THREE.MeshStandardMaterial({ color: 0x3a3a3a, roughness: 0.6 });
+    const standMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x3a3a3a, roughness: 0.6 });
 
     const stand = new THREE.Mesh(
-        new THREE.BoxGeometry(standWidth, standHeight, standDepth),
+        getGeometry(THREE.BoxGeometry, standWidth, standHeight, standDepth),
         standMaterial
     );
     stand.position.y = standHeight / 2;
@@ -1580,8 +1448,8 @@ export function createTVStand(screenWidth = 1.2, screenHeight = 0.7, standWidth
     // TV Screen (mounted on top of stand)
     const tvThickness = 0.08;
     const screen = new THREE.Mesh(
-        new THREE.BoxGeometry(screenWidth, screenHeight, tvThickness),
-        new THREE.MeshStandardMaterial({ color: 0x0a0a0a, roughness: 0.2 })
+        getGeometry(THREE.BoxGeometry, screenWidth, screenHeight, tvThickness),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x0a0a0a, roughness: 0.2 })
     );
     screen.position.set(0, standHeight + screenHeight / 2 + 0.05, 0);
     screen.castShadow = true;
@@ -1589,13 +1457,13 @@ export function createTVStand(screenWidth = 1.2, screenHeight = 0.7, standWidth
     group.add(screen);
 
     // TV Frame
-    const frameMaterial = new THREE.MeshStandardMaterial({ color: 0x1a1a1a, roughness: 0.3 });
+    const frameMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x1a1a1a, roughness: 0.3 });
     const frameThickness = 0.05;
 
     // Top/Bottom frame
     [screenHeight / 2, -screenHeight / 2].forEach(y => {
         const frame = new THREE.Mesh(
-            new THREE.BoxGeometry(screenWidth + frameThickness * 2, frameThickness, tvThickness),
+            getGeometry(THREE.BoxGeometry, screenWidth + frameThickness * 2, frameThickness, tvThickness),
             frameMaterial
         );
         frame.position.set(0, standHeight + screenHeight / 2 + 0.05 + y, 0);
@@ -1605,7 +1473,7 @@ export function createTVStand(screenWidth = 1.2, screenHeight = 0.7, standWidth
     // Left/Right frame
     [-screenWidth / 2 - frameThickness / 2, screenWidth / 2 + frameThickness / 2].forEach(x => {
         const frame = new THREE.Mesh(
-            new THREE.BoxGeometry(frameThickness, screenHeight, tvThickness),
+            getGeometry(THREE.BoxGeometry, frameThickness, screenHeight, tvThickness),
             frameMaterial
         );
         frame.position.set(x, standHeight + screenHeight / 2 + 0.05, 0);
@@ -1617,11 +1485,11 @@ export function createTVStand(screenWidth = 1.2, screenHeight = 0.7, standWidth
 
 export function createCoffeeCup(radius = 0.04, height = 0.1) {
     const group = new THREE.Group();
-    const cupMaterial = new THREE.MeshStandardMaterial({ color: 0xf5f5dc, roughness: 0.6 });
+    const cupMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xf5f5dc, roughness: 0.6 });
 
     // Cup body
     const cup = new THREE.Mesh(
-        new THREE.CylinderGeometry(radius * 0.9, radius * 0.8, height, 16),
+        getGeometry(THREE.CylinderGeometry, radius * 0.9, radius * 0.8, height, 16),
         cupMaterial
     );
     cup.position.y = height / 2;
@@ -1630,14 +1498,14 @@ export function createCoffeeCup(radius = 0.04, height = 0.1) {
 
     // Coffee inside
     const coffee = new THREE.Mesh(
-        new THREE.CylinderGeometry(radius * 0.85, radius * 0.85, 0.01, 16),
-        new THREE.MeshStandardMaterial({ color: 0x3e2723, roughness: 0.4 })
+        getGeometry(THREE.CylinderGeometry, radius * 0.85, radius * 0.85, 0.01, 16),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x3e2723, roughness: 0.4 })
     );
     coffee.position.y = height * 0.9;
     group.add(coffee);
 
     // Handle
-    const handleGeometry = new THREE.TorusGeometry(radius * 0.6, radius * 0.15, 8, 12, Math.PI);
+    const handleGeometry = getGeometry(THREE.TorusGeometry, radius * 0.6, radius * 0.15, 8, 12, Math.PI);
     const handle = new THREE.Mesh(
         handleGeometry,
         cupMaterial
@@ -1737,7 +1605,7 @@ export function createNewspaper(width = 0.3, height = 0.4) {
     const texture = new THREE.CanvasTexture(canvas);
     texture.needsUpdate = true;
 
-    const paperMaterial = new THREE.MeshStandardMaterial({
+    const paperMaterial = getMaterial(THREE.MeshStandardMaterial, {
         map: texture,
         roughness: 0.9,
         side: THREE.DoubleSide
@@ -1745,7 +1613,7 @@ export function createNewspaper(width = 0.3, height = 0.4) {
 
     // Single sheet newspaper (flat on table with slight wrinkle)
     const newspaper = new THREE.Mesh(
-        new THREE.PlaneGeometry(width, height),
+        getGeometry(THREE.PlaneGeometry, width, height),
         paperMaterial
     );
     newspaper.rotation.x = -Math.PI / 2; // Lay flat
@@ -1759,11 +1627,11 @@ export function createNewspaper(width = 0.3, height = 0.4) {
 
 export function createRemote(length = 0.15, width = 0.05) {
     const group = new THREE.Group();
-    const remoteMaterial = new THREE.MeshStandardMaterial({ color: 0x2a2a2a, roughness: 0.5 });
+    const remoteMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x2a2a2a, roughness: 0.5 });
 
     // Remote body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.015, length),
+        getGeometry(THREE.BoxGeometry, width, 0.015, length),
         remoteMaterial
     );
     body.position.y = 0.0075;
@@ -1771,14 +1639,14 @@ export function createRemote(length = 0.15, width = 0.05) {
     group.add(body);
 
     // Buttons (simple colored squares)
-    const buttonMaterial = new THREE.MeshStandardMaterial({ color: 0x4a4a4a, roughness: 0.3 });
+    const buttonMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x4a4a4a, roughness: 0.3 });
     const buttonSize = width * 0.15;
 
     // Create a grid of buttons
     for (let row = 0; row < 4; row++) {
         for (let col = 0; col < 2; col++) {
             const button = new THREE.Mesh(
-                new THREE.BoxGeometry(buttonSize, 0.003, buttonSize),
+                getGeometry(THREE.BoxGeometry, buttonSize, 0.003, buttonSize),
                 buttonMaterial
             );
             button.position.set(
@@ -1792,8 +1660,8 @@ export function createRemote(length = 0.15, width = 0.05) {
 
     // Power button (red)
     const powerButton = new THREE.Mesh(
-        new THREE.CylinderGeometry(buttonSize * 0.5, buttonSize * 0.5, 0.003, 12),
-        new THREE.MeshStandardMaterial({ color: 0x8B0000, roughness: 0.3 })
+        getGeometry(THREE.CylinderGeometry, buttonSize * 0.5, buttonSize * 0.5, 0.003, 12),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x8B0000, roughness: 0.3 })
     );
     powerButton.rotation.x = Math.PI / 2;
     powerButton.position.set(0, 0.017, length * 0.35);
@@ -1801,8 +1669,8 @@ export function createRemote(length = 0.15, width = 0.05) {
 
     // Add larger invisible hitbox for easier interaction
     const hitbox = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 2.5, 0.05, length * 1.5),
-        new THREE.MeshBasicMaterial({ color: 0x000000 })
+        getGeometry(THREE.BoxGeometry, width * 2.5, 0.05, length * 1.5),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0x000000 })
     );
     hitbox.position.y = 0.025;
     hitbox.visible = false;
@@ -1816,16 +1684,16 @@ export function createNotepad(width = 0.15, height = 0.005, depth = 0.2) {
 
     // Notepad cover/backing (slightly bigger)
     const cover = new THREE.Mesh(
-        new THREE.BoxGeometry(width + 0.005, height, depth + 0.005),
-        new THREE.MeshStandardMaterial({ color: 0x8B4513, roughness: 0.6 })
+        getGeometry(THREE.BoxGeometry, width + 0.005, height, depth + 0.005),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x8B4513, roughness: 0.6 })
     );
     cover.castShadow = true;
     group.add(cover);
 
     // Paper pages (stack of thin white sheets)
     const paper = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height * 0.8, depth - 0.01),
-        new THREE.MeshStandardMaterial({ color: 0xf5f5dc, roughness: 0.8 })
+        getGeometry(THREE.BoxGeometry, width, height * 0.8, depth - 0.01),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xf5f5dc, roughness: 0.8 })
     );
     paper.position.y = height * 0.4;
     paper.name = "notepad";
@@ -1833,10 +1701,10 @@ export function createNotepad(width = 0.15, height = 0.005, depth = 0.2) {
     group.add(paper);
 
     // Spiral binding (left edge)
-    const bindingMaterial = new THREE.MeshStandardMaterial({ color: 0x888888, metalness: 0.7 });
+    const bindingMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x888888, metalness: 0.7 });
     for (let i = 0; i < 8; i++) {
         const coil = new THREE.Mesh(
-            new THREE.TorusGeometry(0.005, 0.002, 8, 8),
+            getGeometry(THREE.TorusGeometry, 0.005, 0.002, 8, 8),
             bindingMaterial
         );
         coil.rotation.y = Math.PI / 2;
@@ -1856,8 +1724,8 @@ export function createPen(length = 0.12, radius = 0.003) {
 
     // Pen body
     const body = new THREE.Mesh(
-        new THREE.CylinderGeometry(radius, radius, length, 8),
-        new THREE.MeshStandardMaterial({ color: 0x0000ff, roughness: 0.4 })
+        getGeometry(THREE.CylinderGeometry, radius, radius, length, 8),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x0000ff, roughness: 0.4 })
     );
     body.rotation.z = Math.PI / 2;
     body.castShadow = true;
@@ -1865,8 +1733,8 @@ export function createPen(length = 0.12, radius = 0.003) {
 
     // Pen tip (darker)
     const tip = new THREE.Mesh(
-        new THREE.CylinderGeometry(radius * 0.5, radius * 0.3, length * 0.1, 8),
-        new THREE.MeshStandardMaterial({ color: 0x333333, metalness: 0.6 })
+        getGeometry(THREE.CylinderGeometry, radius * 0.5, radius * 0.3, length * 0.1, 8),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x333333, metalness: 0.6 })
     );
     tip.rotation.z = Math.PI / 2;
     tip.position.x = length / 2 + (length * 0.05);
@@ -1874,8 +1742,8 @@ export function createPen(length = 0.12, radius = 0.003) {
 
     // Pen clip
     const clip = new THREE.Mesh(
-        new THREE.BoxGeometry(length * 0.15, radius * 4, radius * 0.5),
-        new THREE.MeshStandardMaterial({ color: 0x888888, metalness: 0.8 })
+        getGeometry(THREE.BoxGeometry, length * 0.15, radius * 4, radius * 0.5),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x888888, metalness: 0.8 })
     );
     clip.position.set(-length * 0.35, radius * 2, 0);
     group.add(clip);
@@ -1885,13 +1753,13 @@ export function createPen(length = 0.12, radius = 0.003) {
 
 export function createPrinter(width = 0.6, height = 0.5, depth = 0.5) {
     const group = new THREE.Group();
-    const bodyMaterial = new THREE.MeshStandardMaterial({ color: 0xeeeeee, roughness: 0.4 });
-    const darkMaterial = new THREE.MeshStandardMaterial({ color: 0x333333, roughness: 0.5 });
-    const paperMaterial = new THREE.MeshStandardMaterial({ color: 0xffffff, roughness: 0.9 });
+    const bodyMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xeeeeee, roughness: 0.4 });
+    const darkMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x333333, roughness: 0.5 });
+    const paperMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xffffff, roughness: 0.9 });
 
     // Main Body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(width, height, depth),
+        getGeometry(THREE.BoxGeometry, width, height, depth),
         bodyMaterial
     );
     body.position.y = height / 2;
@@ -1900,7 +1768,7 @@ export function createPrinter(width = 0.6, height = 0.5, depth = 0.5) {
 
     // Paper Tray (Bottom)
     const tray = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 0.8, height * 0.2, depth + 0.15),
+        getGeometry(THREE.BoxGeometry, width * 0.8, height * 0.2, depth + 0.15),
         bodyMaterial
     );
     tray.position.set(0, height * 0.15, 0.075);
@@ -1908,7 +1776,7 @@ export function createPrinter(width = 0.6, height = 0.5, depth = 0.5) {
 
     // Paper stack in tray
     const paperStack = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 0.7, 0.05, depth * 0.8),
+        getGeometry(THREE.BoxGeometry, width * 0.7, 0.05, depth * 0.8),
         paperMaterial
     );
     paperStack.position.set(0, height * 0.15 + 0.02, 0.1);
@@ -1916,7 +1784,7 @@ export function createPrinter(width = 0.6, height = 0.5, depth = 0.5) {
 
     // Top Scanner Lid
     const lid = new THREE.Mesh(
-        new THREE.BoxGeometry(width, 0.05, depth),
+        getGeometry(THREE.BoxGeometry, width, 0.05, depth),
         darkMaterial
     );
     lid.position.y = height + 0.025;
@@ -1928,22 +1796,22 @@ export function createPrinter(width = 0.6, height = 0.5, depth = 0.5) {
     panelGroup.rotation.x = -0.3;
 
     const panelBase = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 0.35, 0.02, depth * 0.35),
+        getGeometry(THREE.BoxGeometry, width * 0.35, 0.02, depth * 0.35),
         darkMaterial
     );
     panelGroup.add(panelBase);
 
     // Screen on panel
     const screen = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 0.2, 0.01, depth * 0.2),
-        new THREE.MeshStandardMaterial({ color: 0x00ff00, emissive: 0x003300 })
+        getGeometry(THREE.BoxGeometry, width * 0.2, 0.01, depth * 0.2),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x00ff00, emissive: 0x003300 })
     );
     screen.position.y = 0.015;
     panelGroup.add(screen);
 
     // Buttons
-    const btnGeo = new THREE.CylinderGeometry(0.01, 0.01, 0.01, 8);
-    const btnMat = new THREE.MeshStandardMaterial({ color: 0x999999 });
+    const btnGeo = getGeometry(THREE.CylinderGeometry, 0.01, 0.01, 0.01, 8);
+    const btnMat = getMaterial(THREE.MeshStandardMaterial, { color: 0x999999 });
     for (let i = 0; i < 3; i++) {
         const btn = new THREE.Mesh(btnGeo, btnMat);
         btn.position.set(0.08, 0.015, -0.05 + i * 0.03);
@@ -1954,7 +1822,7 @@ export function createPrinter(width = 0.6, height = 0.5, depth = 0.5) {
 
     // Output Tray (Top Indent simulated)
     const outputTray = new THREE.Mesh(
-        new THREE.BoxGeometry(width * 0.6, 0.02, depth * 0.6),
+        getGeometry(THREE.BoxGeometry, width * 0.6, 0.02, depth * 0.6),
         darkMaterial
     );
     outputTray.position.set(-0.1, height - 0.01, 0);
@@ -1962,7 +1830,7 @@ export function createPrinter(width = 0.6, height = 0.5, depth = 0.5) {
 
     // Printed Page
     const printedPage = new THREE.Mesh(
-        new THREE.PlaneGeometry(0.21, 0.297), // A4 size roughly
+        getGeometry(THREE.PlaneGeometry, 0.21, 0.297), // A4 size roughly
         paperMaterial
     );
     printedPage.rotation.x = -Math.PI / 2;
@@ -1972,116 +1840,15 @@ export function createPrinter(width = 0.6, height = 0.5, depth = 0.5) {
     return group;
 }
 
-export function createFireExtinguisher() {
-    const group = new THREE.Group();
-    const redMaterial = new THREE.MeshStandardMaterial({ color: 0xcc0000, metalness: 0.3, roughness: 0.4 });
-    const metalMaterial = new THREE.MeshStandardMaterial({ color: 0xaaaaaa, metalness: 0.8 });
-    const blackMaterial = new THREE.MeshStandardMaterial({ color: 0x111111 });
-
-    // Tank
-    const tank = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.1, 0.1, 0.5, 16),
-        redMaterial
-    );
-    tank.position.y = 0.25;
-    tank.castShadow = true;
-    group.add(tank);
-
-    // Top dome
-    const dome = new THREE.Mesh(
-        new THREE.SphereGeometry(0.1, 16, 8, 0, Math.PI * 2, 0, Math.PI / 2),
-        redMaterial
-    );
-    dome.position.y = 0.5;
-    group.add(dome);
-
-    // Valve Assembly
-    const valve = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.03, 0.03, 0.1),
-        metalMaterial
-    );
-    valve.position.y = 0.55;
-    group.add(valve);
-
-    // Handle (Lever)
-    const handleLower = new THREE.Mesh(
-        new THREE.BoxGeometry(0.02, 0.01, 0.12),
-        metalMaterial
-    );
-    handleLower.position.set(0.04, 0.54, 0);
-    group.add(handleLower);
-
-    const handleUpper = new THREE.Mesh(
-        new THREE.BoxGeometry(0.02, 0.01, 0.12),
-        metalMaterial
-    );
-    handleUpper.position.set(0.04, 0.58, 0);
-    handleUpper.rotation.z = 0.2;
-    group.add(handleUpper);
-
-    // Pressure Gauge
-    const gauge = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.025, 0.025, 0.01, 16),
-        metalMaterial
-    );
-    gauge.rotation.x = Math.PI / 2;
-    gauge.position.set(0, 0.55, 0.04);
-    group.add(gauge);
-
-    const gaugeFace = new THREE.Mesh(
-        new THREE.CircleGeometry(0.02, 16),
-        new THREE.MeshBasicMaterial({ color: 0xffffff })
-    );
-    gaugeFace.rotation.y = 0; // Face Z
-    gaugeFace.position.set(0, 0.55, 0.046);
-    group.add(gaugeFace);
-
-    // Green zone on gauge
-    const gaugeGreen = new THREE.Mesh(
-        new THREE.CircleGeometry(0.01, 16, 0, Math.PI),
-        new THREE.MeshBasicMaterial({ color: 0x00ff00 })
-    );
-    gaugeGreen.rotation.y = 0;
-    gaugeGreen.position.set(0, 0.55, 0.047);
-    group.add(gaugeGreen);
-
-    // Nozzle Hose
-    const hose = new THREE.Mesh(
-        new THREE.TorusGeometry(0.15, 0.015, 8, 16, Math.PI * 1.5),
-        blackMaterial
-    );
-    hose.position.set(-0.1, 0.3, 0);
-    hose.rotation.z = Math.PI / 2;
-    group.add(hose);
-
-    const nozzleTip = new THREE.Mesh(
-        new THREE.ConeGeometry(0.03, 0.1, 16),
-        blackMaterial
-    );
-    nozzleTip.position.set(-0.1, 0.15, 0.15);
-    nozzleTip.rotation.x = -Math.PI / 4;
-    group.add(nozzleTip);
-
-    // Add hitbox
-    const hitbox = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.15, 0.15, 0.7, 8),
-        new THREE.MeshBasicMaterial({ visible: false })
-    );
-    hitbox.position.y = 0.35;
-    group.add(hitbox);
-
-    return group;
-}
-
 export function createLunchbox() {
     const group = new THREE.Group();
-    const boxMaterial = new THREE.MeshStandardMaterial({ color: 0x3f51b5, roughness: 0.6, metalness: 0.3 }); // Indigo Metal
-    const handleMaterial = new THREE.MeshStandardMaterial({ color: 0x222222 });
-    const latchMaterial = new THREE.MeshStandardMaterial({ color: 0xcccccc, metalness: 0.8 });
+    const boxMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x3f51b5, roughness: 0.6, metalness: 0.3 }); // Indigo Metal
+    const handleMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x222222 });
+    const latchMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xcccccc, metalness: 0.8 });
 
     // Main box (Bottom)
     const box = new THREE.Mesh(
-        new THREE.BoxGeometry(0.25, 0.12, 0.15),
+        getGeometry(THREE.BoxGeometry, 0.25, 0.12, 0.15),
         boxMaterial
     );
     box.position.y = 0.06;
@@ -2089,7 +1856,7 @@ export function createLunchbox() {
     group.add(box);
 
     // Dome Lid
-    const lidGeo = new THREE.CylinderGeometry(0.125, 0.125, 0.25, 16, 1, false, 0, Math.PI);
+    const lidGeo = getGeometry(THREE.CylinderGeometry, 0.125, 0.125, 0.25, 16, 1, false, 0, Math.PI);
     const lid = new THREE.Mesh(lidGeo, boxMaterial);
     lid.rotation.z = Math.PI / 2;
     lid.position.y = 0.12;
@@ -2097,14 +1864,14 @@ export function createLunchbox() {
 
     // Handle
     const handle = new THREE.Mesh(
-        new THREE.TorusGeometry(0.04, 0.006, 8, 16, Math.PI),
+        getGeometry(THREE.TorusGeometry, 0.04, 0.006, 8, 16, Math.PI),
         handleMaterial
     );
     handle.position.y = 0.25;
     group.add(handle);
 
     // Latches
-    const latchGeo = new THREE.BoxGeometry(0.02, 0.04, 0.005);
+    const latchGeo = getGeometry(THREE.BoxGeometry, 0.02, 0.04, 0.005);
     const latch1 = new THREE.Mesh(latchGeo, latchMaterial);
     latch1.position.set(-0.06, 0.12, 0.075);
     group.add(latch1);
@@ -2118,13 +1885,13 @@ export function createLunchbox() {
 
 export function createTrophy() {
     const group = new THREE.Group();
-    const goldMaterial = new THREE.MeshStandardMaterial({ color: 0xffd700, metalness: 0.8, roughness: 0.2 });
-    const baseMaterial = new THREE.MeshStandardMaterial({ color: 0x111111, roughness: 0.1 });
-    const plaqueMaterial = new THREE.MeshStandardMaterial({ color: 0xc0c0c0, metalness: 0.6 });
+    const goldMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xffd700, metalness: 0.8, roughness: 0.2, side: THREE.DoubleSide });
+    const baseMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x111111, roughness: 0.1 });
+    const plaqueMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xc0c0c0, metalness: 0.6 });
 
     // Base (Tiered)
     const base1 = new THREE.Mesh(
-        new THREE.BoxGeometry(0.12, 0.02, 0.12),
+        getGeometry(THREE.BoxGeometry, 0.12, 0.02, 0.12),
         baseMaterial
     );
     base1.position.y = 0.01;
@@ -2132,7 +1899,7 @@ export function createTrophy() {
     group.add(base1);
 
     const base2 = new THREE.Mesh(
-        new THREE.BoxGeometry(0.1, 0.04, 0.1),
+        getGeometry(THREE.BoxGeometry, 0.1, 0.04, 0.1),
         baseMaterial
     );
     base2.position.y = 0.04;
@@ -2140,7 +1907,7 @@ export function createTrophy() {
 
     // Plaque on base
     const plaque = new THREE.Mesh(
-        new THREE.PlaneGeometry(0.08, 0.02),
+        getGeometry(THREE.PlaneGeometry, 0.08, 0.02),
         plaqueMaterial
     );
     plaque.position.set(0, 0.04, 0.051);
@@ -2148,7 +1915,7 @@ export function createTrophy() {
 
     // Stem (Decorative)
     const stem = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.015, 0.025, 0.08, 8),
+        getGeometry(THREE.CylinderGeometry, 0.015, 0.025, 0.08, 8),
         goldMaterial
     );
     stem.position.y = 0.1;
@@ -2159,14 +1926,13 @@ export function createTrophy() {
     for (let i = 0; i < 10; i++) {
         points.push(new THREE.Vector2(Math.sin(i * 0.2) * 0.06 + 0.01, (i * 0.015)));
     }
-    const cupGeo = new THREE.LatheGeometry(points, 16);
+    const cupGeo = getGeometry(THREE.LatheGeometry, points, 16);
     const cup = new THREE.Mesh(cupGeo, goldMaterial);
     cup.position.y = 0.14;
-    cup.material.side = THREE.DoubleSide;
     group.add(cup);
 
     // Handles
-    const handleGeo = new THREE.TorusGeometry(0.035, 0.004, 8, 16, Math.PI);
+    const handleGeo = getGeometry(THREE.TorusGeometry, 0.035, 0.004, 8, 16, Math.PI);
     const leftHandle = new THREE.Mesh(handleGeo, goldMaterial);
     leftHandle.position.set(-0.05, 0.2, 0);
     leftHandle.rotation.z = Math.PI / 2;
@@ -2179,8 +1945,8 @@ export function createTrophy() {
 
     // Hitbox
     const hitbox = new THREE.Mesh(
-        new THREE.BoxGeometry(0.15, 0.3, 0.15),
-        new THREE.MeshBasicMaterial({ visible: false })
+        getGeometry(THREE.BoxGeometry, 0.15, 0.3, 0.15),
+        getMaterial(THREE.MeshBasicMaterial, { visible: false })
     );
     hitbox.position.y = 0.15;
     group.add(hitbox);
@@ -2190,14 +1956,14 @@ export function createTrophy() {
 
 export function createRadio() {
     const group = new THREE.Group();
-    const caseMaterial = new THREE.MeshStandardMaterial({ color: 0x8d6e63, roughness: 0.7 }); // Wood/Brown
-    const grillMaterial = new THREE.MeshStandardMaterial({ color: 0x4e342e, roughness: 0.9 });
-    const knobMaterial = new THREE.MeshStandardMaterial({ color: 0xeeeeee, metalness: 0.5 });
-    const dialMaterial = new THREE.MeshStandardMaterial({ color: 0xfff8e1, emissive: 0x333300 });
+    const caseMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x8d6e63, roughness: 0.7 }); // Wood/Brown
+    const grillMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x4e342e, roughness: 0.9 });
+    const knobMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xeeeeee, metalness: 0.5 });
+    const dialMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xfff8e1, emissive: 0x333300 });
 
     // Case
     const radioCase = new THREE.Mesh(
-        new THREE.BoxGeometry(0.3, 0.18, 0.12),
+        getGeometry(THREE.BoxGeometry, 0.3, 0.18, 0.12),
         caseMaterial
     );
     radioCase.position.y = 0.09;
@@ -2206,7 +1972,7 @@ export function createRadio() {
 
     // Speaker Grill (Textured look via geometry strips)
     const grillBg = new THREE.Mesh(
-        new THREE.BoxGeometry(0.14, 0.14, 0.01),
+        getGeometry(THREE.BoxGeometry, 0.14, 0.14, 0.01),
         grillMaterial
     );
     grillBg.position.set(-0.06, 0.09, 0.06);
@@ -2215,7 +1981,7 @@ export function createRadio() {
     // Horizontal slats
     for (let i = 0; i < 5; i++) {
         const slat = new THREE.Mesh(
-            new THREE.BoxGeometry(0.14, 0.005, 0.015),
+            getGeometry(THREE.BoxGeometry, 0.14, 0.005, 0.015),
             caseMaterial
         );
         slat.position.set(-0.06, 0.04 + i * 0.025, 0.06);
@@ -2224,15 +1990,15 @@ export function createRadio() {
 
     // Tuning Dial Area
     const dialBg = new THREE.Mesh(
-        new THREE.BoxGeometry(0.1, 0.06, 0.01),
-        new THREE.MeshStandardMaterial({ color: 0x222222 })
+        getGeometry(THREE.BoxGeometry, 0.1, 0.06, 0.01),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x222222 })
     );
     dialBg.position.set(0.08, 0.12, 0.06);
     group.add(dialBg);
 
     // Lit Dial
     const dial = new THREE.Mesh(
-        new THREE.BoxGeometry(0.09, 0.01, 0.012),
+        getGeometry(THREE.BoxGeometry, 0.09, 0.01, 0.012),
         dialMaterial
     );
     dial.position.set(0.08, 0.12, 0.06);
@@ -2240,15 +2006,15 @@ export function createRadio() {
 
     // Indicator Needle
     const needle = new THREE.Mesh(
-        new THREE.BoxGeometry(0.002, 0.04, 0.015),
-        new THREE.MeshBasicMaterial({ color: 0xff0000 })
+        getGeometry(THREE.BoxGeometry, 0.002, 0.04, 0.015),
+        getMaterial(THREE.MeshBasicMaterial, { color: 0xff0000 })
     );
     needle.position.set(0.08, 0.12, 0.06);
     group.add(needle);
 
     // Knobs
     const knob1 = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.015, 0.015, 0.02),
+        getGeometry(THREE.CylinderGeometry, 0.015, 0.015, 0.02),
         knobMaterial
     );
     knob1.rotation.x = Math.PI / 2;
@@ -2256,7 +2022,7 @@ export function createRadio() {
     group.add(knob1);
 
     const knob2 = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.015, 0.015, 0.02),
+        getGeometry(THREE.CylinderGeometry, 0.015, 0.015, 0.02),
         knobMaterial
     );
     knob2.rotation.x = Math.PI / 2;
@@ -2265,8 +2031,8 @@ export function createRadio() {
 
     // Antenna
     const antenna = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.003, 0.003, 0.3),
-        new THREE.MeshStandardMaterial({ color: 0xaaaaaa, metalness: 0.8 })
+        getGeometry(THREE.CylinderGeometry, 0.003, 0.003, 0.3),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xaaaaaa, metalness: 0.8 })
     );
     antenna.position.set(-0.12, 0.3, -0.04);
     antenna.rotation.z = 0.1;
@@ -2277,13 +2043,13 @@ export function createRadio() {
 
 export function createTypewriter() {
     const group = new THREE.Group();
-    const bodyMaterial = new THREE.MeshStandardMaterial({ color: 0x263238, roughness: 0.4 }); // Dark Blue-Grey
-    const keyMaterial = new THREE.MeshStandardMaterial({ color: 0xeeeeee });
-    const paperMaterial = new THREE.MeshStandardMaterial({ color: 0xffffff, side: THREE.DoubleSide });
+    const bodyMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x263238, roughness: 0.4 }); // Dark Blue-Grey
+    const keyMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xeeeeee });
+    const paperMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0xffffff, side: THREE.DoubleSide });
 
     // Body
     const body = new THREE.Mesh(
-        new THREE.BoxGeometry(0.35, 0.1, 0.35),
+        getGeometry(THREE.BoxGeometry, 0.35, 0.1, 0.35),
         bodyMaterial
     );
     body.position.y = 0.05;
@@ -2292,7 +2058,7 @@ export function createTypewriter() {
 
     // Carriage (Top part)
     const carriage = new THREE.Mesh(
-        new THREE.BoxGeometry(0.4, 0.08, 0.1),
+        getGeometry(THREE.BoxGeometry, 0.4, 0.08, 0.1),
         bodyMaterial
     );
     carriage.position.set(0, 0.12, -0.08);
@@ -2300,8 +2066,8 @@ export function createTypewriter() {
 
     // Roller
     const roller = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.03, 0.03, 0.35),
-        new THREE.MeshStandardMaterial({ color: 0x111111 })
+        getGeometry(THREE.CylinderGeometry, 0.03, 0.03, 0.35),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x111111 })
     );
     roller.rotation.z = Math.PI / 2;
     roller.position.set(0, 0.14, -0.08);
@@ -2309,7 +2075,7 @@ export function createTypewriter() {
 
     // Paper in roller
     const paper = new THREE.Mesh(
-        new THREE.PlaneGeometry(0.21, 0.25),
+        getGeometry(THREE.PlaneGeometry, 0.21, 0.25),
         paperMaterial
     );
     paper.position.set(0, 0.22, -0.1);
@@ -2318,8 +2084,8 @@ export function createTypewriter() {
 
     // Return Lever
     const lever = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.005, 0.005, 0.1),
-        new THREE.MeshStandardMaterial({ color: 0xcccccc })
+        getGeometry(THREE.CylinderGeometry, 0.005, 0.005, 0.1),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xcccccc })
     );
     lever.position.set(-0.22, 0.15, -0.05);
     lever.rotation.z = Math.PI / 4;
@@ -2327,8 +2093,8 @@ export function createTypewriter() {
 
     // Keys area (sloped)
     const keysBase = new THREE.Mesh(
-        new THREE.BoxGeometry(0.3, 0.02, 0.15),
-        new THREE.MeshStandardMaterial({ color: 0x111111 })
+        getGeometry(THREE.BoxGeometry, 0.3, 0.02, 0.15),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0x111111 })
     );
     keysBase.position.set(0, 0.06, 0.1);
     keysBase.rotation.x = 0.2;
@@ -2338,7 +2104,7 @@ export function createTypewriter() {
     for (let i = 0; i < 3; i++) {
         for (let j = 0; j < 8; j++) {
             const key = new THREE.Mesh(
-                new THREE.CylinderGeometry(0.01, 0.01, 0.01),
+                getGeometry(THREE.CylinderGeometry, 0.01, 0.01, 0.01),
                 keyMaterial
             );
             key.position.set(
@@ -2356,26 +2122,26 @@ export function createTypewriter() {
 
 export function createHat() {
     const group = new THREE.Group();
-    const hatMaterial = new THREE.MeshStandardMaterial({ color: 0x3e2723, roughness: 1.0 }); // Dark Brown Felt
-    const bandMaterial = new THREE.MeshStandardMaterial({ color: 0x1a1a1a, roughness: 0.8 }); // Black Ribbon
+    const hatMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x3e2723, roughness: 1.0 }); // Dark Brown Felt
+    const bandMaterial = getMaterial(THREE.MeshStandardMaterial, { color: 0x1a1a1a, roughness: 0.8 }); // Black Ribbon
 
     // Brim (Curved)
-    const brimGeo = new THREE.TorusGeometry(0.12, 0.04, 8, 32);
-    // Flatten torus to make a brim
-    brimGeo.scale(1, 0.1, 1);
+    const brimGeo = getGeometry(THREE.TorusGeometry, 0.12, 0.04, 8, 32);
     const brim = new THREE.Mesh(brimGeo, hatMaterial);
+    // Flatten torus to make a brim (scale the mesh - the geometry is shared)
+    brim.scale.set(1, 0.1, 1);
     group.add(brim);
 
     // Fill brim center
     const brimFill = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.12, 0.12, 0.01, 32),
+        getGeometry(THREE.CylinderGeometry, 0.12, 0.12, 0.01, 32),
         hatMaterial
     );
     group.add(brimFill);
 
     // Crown (Tapered)
     const crown = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.07, 0.09, 0.12, 32),
+        getGeometry(THREE.CylinderGeometry, 0.07, 0.09, 0.12, 32),
         hatMaterial
     );
     crown.position.y = 0.06;
@@ -2383,7 +2149,7 @@ export function createHat() {
 
     // Indent on top (Fedora style)
     const indent = new THREE.Mesh(
-        new THREE.BoxGeometry(0.14, 0.02, 0.02),
+        getGeometry(THREE.BoxGeometry, 0.14, 0.02, 0.02),
         hatMaterial
     );
     indent.position.set(0, 0.12, 0);
@@ -2391,7 +2157,7 @@ export function createHat() {
 
     // Band
     const band = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.091, 0.091, 0.025, 32),
+        getGeometry(THREE.CylinderGeometry, 0.091, 0.091, 0.025, 32),
         bandMaterial
     );
     band.position.y = 0.02;
@@ -2399,8 +2165,8 @@ export function createHat() {
 
     // Feather
     const feather = new THREE.Mesh(
-        new THREE.ConeGeometry(0.01, 0.08, 8),
-        new THREE.MeshStandardMaterial({ color: 0xff0000 })
+        getGeometry(THREE.ConeGeometry, 0.01, 0.08, 8),
+        getMaterial(THREE.MeshStandardMaterial, { color: 0xff0000 })
     );
     feather.position.set(0.08, 0.08, 0);
     feather.rotation.z = -0.3;
@@ -2408,8 +2174,8 @@ export function createHat() {
 
     // Hitbox
     const hitbox = new THREE.Mesh(
-        new THREE.CylinderGeometry(0.16, 0.16, 0.15, 16),
-        new THREE.MeshBasicMaterial({ visible: false })
+        getGeometry(THREE.CylinderGeometry, 0.16, 0.16, 0.15, 16),
+        getMaterial(THREE.MeshBasicMaterial, { visible: false })
     );
     hitbox.position.y = 0.05;
     group.add(hitbox);
@@ -2431,8 +2197,8 @@ export function createHat() {
  */
 export function addInvisibleHitbox(object, size = { width: 0.3, height: 0.3, depth: 0.3 }, offset = { x: 0, y: 0, z: 0 }, name = null) {
     const hitbox = new THREE.Mesh(
-        new THREE.BoxGeometry(size.width, size.height, size.depth),
-        new THREE.MeshBasicMaterial({
+        getGeometry(THREE.BoxGeometry, size.width, size.height, size.depth),
+        getMaterial(THREE.MeshBasicMaterial, {
             transparent: true,
             opacity: 0,
             side: THREE.DoubleSide
@@ -243,63 +243,125 @@ function genCouch() {
 }
 
 // Fallback for unknown items
-function genFallback(name) {
+const fallbackMat = new THREE.MeshBasicMaterial({ color: 0xff00ff, wireframe: true });
+
+function genFallback() {
     const group = new THREE.Group();
     // Debug mesh: Wireframe to indicate missing/fallback object
-    const m = mesh(boxGeo, new THREE.MeshBasicMaterial({ color: 0xff00ff, wireframe: true }), 0, 0.5, 0);
+    const m = mesh(boxGeo, fallbackMat, 0, 0.5, 0);
     group.add(m);
     return group;
 }
 
-// Main Registry
+// Main Registry: normalized type -> generator name
 const generators = {
-    'desk': genDesk,
-    'chair': genChair,
-    'computerscreen': genComputerScreen,
-    'computerkeyboard': genKeyboard,
-    'computermouse': genMouse,
-    'bookcaseopen': genBookcaseOpen,
-    'books': genBooks,
-    'plantsmall1': genPlantSmall,
-    'plantsmall2': genPlantSmall,
-    'plantsmall3': genPlantSmall,
-    'radio': genRadio,
-    'doorway': genDoorway,
-    'lamproundtable': genLamp,
-    'loungesofa': genCouch,
-    'floor': genFloor,
-    'wall': genWall
+    'desk': 'desk',
+    'chair': 'chair',
+    'computerscreen': 'computerScreen',
+    'computerkeyboard': 'keyboard',
+    'computermouse': 'mouse',
+    'bookcaseopen': 'bookcaseOpen',
+    'books': 'books',
+    'plantsmall1': 'plantSmall',
+    'plantsmall2': 'plantSmall',
+    'plantsmall3': 'plantSmall',
+    'radio': 'radio',
+    'doorway': 'doorway',
+    'lamproundtable': 'lamp',
+    'loungesofa': 'couch',
+    'floor': 'floor',
+    'wall': 'wall'
+};
+
+// Generators, with the variant of a type each one actually distinguishes.
+// Types that map to the same generator and variant share one prototype.
+const generatorSpecs = {
+    desk: { generate: genDesk },
+    chair: { generate: genChair },
+    computerScreen: { generate: genComputerScreen },
+    keyboard: { generate: genKeyboard },
+    mouse: { generate: genMouse },
+    bookcaseOpen: { generate: genBookcaseOpen },
+    books: { generate: genBooks },
+    plantSmall: { generate: genPlantSmall },
+    radio: { generate: genRadio },
+    doorway: { generate: genDoorway },
+    couch: { generate: genCouch },
+    floor: { generate: genFloor },
+    wall: {
+        generate: genWall,
+        variant: (type) => ['Window', 'Doorway', 'Corner'].find(v => type.includes(v)) || 'plain'
+    },
+    lamp: {
+        generate: genLamp,
+        variant: (type) => ['SquareTable', 'RoundFloor', 'Wall'].find(v => type.includes(v)) || 'default'
+    },
+    fallback: { generate: genFallback }
 };
 
+// Substring rules, in priority order. wall/lamp/floor come before exact matches
+// because their variants are read from the original type string.
+const variantRules = [['wall', 'wall'], ['lamp', 'lamp'], ['floor', 'floor']];
+const fuzzyRules = [
+    [['chair'], 'chair'],
+    [['desk'], 'desk'],
+    [['bookcase'], 'bookcaseOpen'],
+    [['plant'], 'plantSmall'],
+    [['sofa', 'couch'], 'couch'],
+    [['door'], 'doorway'],
+    [['screen', 'monitor'], 'computerScreen'],
+    [['keyboard'], 'keyboard'],
+    [['mouse'], 'mouse'],
+    [['radio'], 'radio'],
+    [['book'], 'books']
+];
+
+const resolvedTypes = new Map(); // type string -> {generator, variant, key}
+const prototypes = new Map();    // resolution key -> built Object3D, cloned per request
+
+function normalizeType(type) {
+    return type.toLowerCase().replace('.glb', '').replace(/_/g, '');
+}
+
+/**
+ * Resolve a type string to a generator and variant. Results are memoized per
+ * type string, so the substring rules run once per distinct type.
+ * @param {string} type - e.g. 'plantSmall2', 'wallWindow', 'office_chair'
+ * @returns {{generator: string, variant: string, key: string}} generator is 'fallback' when nothing matched
+ */
+export function resolveProceduralType(type) {
+    let resolution = resolvedTypes.get(type);
+    if (resolution) return resolution;
+
+    const key = normalizeType(type);
+    let generator = variantRules.find(([match]) => key.includes(match))?.[1] ||
+        generators[key] ||
+        fuzzyRules.find(([matches]) => matches.some(match => key.includes(match)))?.[1];
+    if (!generator) {
+        console.warn(`No procedural generator for: ${type}, using fallback.`);
+        generator = 'fallback';
+    }
+
+    const spec = generatorSpecs[generator];
+    const variant = spec.variant ? spec.variant(type) : '';
+    resolution = { generator, variant, key: variant ? `${generator}:${variant}` : generator };
+    resolvedTypes.set(type, resolution);
+    return resolution;
+}
+
 /**
  * Main function to generate a procedural object by name/type.
- * Matches broadly against the type string.
+ * Matches broadly against the type string. The first request for a
+ * generator/variant builds a prototype; every request returns a clone of it,
+ * sharing its geometries and materials.
  */
 export function generateProceduralObject(type) {
-    // Normalization should typically be done by caller, but we handle basic cleanup here
-    const key = type.toLowerCase().replace('.glb', '').replace(/_/g, '');
-
-    // Pass original type string to generators if they need specific details (like 'wallWindow')
-    if (key.includes('wall')) return genWall(type);
-    if (key.includes('lamp')) return genLamp(type);
-    if (key.includes('floor')) return genFloor(type);
-
-    // Exact match or prefix match
-    if (generators[key]) return generators[key]();
-
-    // Fuzzy matching
-    if (key.includes('chair')) return genChair();
-    if (key.includes('desk')) return genDesk();
-    if (key.includes('bookcase')) return genBookcaseOpen();
-    if (key.includes('plant')) return genPlantSmall();
-    if (key.includes('sofa') || key.includes('couch')) return genCouch();
-    if (key.includes('door')) return genDoorway();
-    if (key.includes('screen') || key.includes('monitor')) return genComputerScreen();
-    if (key.includes('keyboard')) return genKeyboard();
-    if (key.includes('mouse')) return genMouse();
-    if (key.includes('radio')) return genRadio();
-    if (key.includes('book')) return genBooks();
-
-    console.warn(`No procedural generator for: ${type}, using fallback.`);
-    return genFallback(type);
+    const { generator, variant, key } = resolveProceduralType(type);
+    let prototype = prototypes.get(key);
+    if (!prototype) {
+        // Pass the original type string to generators that read variants from it (like 'wallWindow')
+        prototype = generatorSpecs[generator].generate(type);
+        prototypes.set(key, prototype);
+    }
+    return prototype.clone();
 }
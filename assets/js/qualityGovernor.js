@@ -0,0 +1,240 @@
+/**
+ * qualityGovernor.js
+ * Adaptive rendering quality for RoomEngine.
+ * Samples frame time while the scene is actively rendering and steps
+ * through quality tiers (pixel ratio, shadow map size/type, small-prop
+ * shadow casting, baked vs. live shadows). A tier can be pinned with
+ * ?quality=<name> in the URL or the `quality` engine config option.
+ */
+
+import * as THREE from 'three';
+
+// Ordered best -> cheapest. Antialiasing can only be chosen when the
+// renderer is created, so it follows the starting tier. The top tier matches
+// the renderer defaults the rooms always used (pixel ratio 1, 2048 PCF soft).
+export const QUALITY_TIERS = [
+    {
+        name: 'high',
+        antialias: true,
+        maxPixelRatio: 1,
+        shadows: true,
+        shadowMapSize: 2048,
+        shadowType: THREE.PCFSoftShadowMap,
+        smallPropShadows: true,
+        bakedShadows: false
+    },
+    {
+        name: 'medium',
+        antialias: true,
+        maxPixelRatio: 1,
+        shadows: true,
+        shadowMapSize: 1024,
+        shadowType: THREE.PCFShadowMap,
+        smallPropShadows: true,
+        bakedShadows: true
+    },
+    {
+        name: 'low',
+        antialias: false,
+        maxPixelRatio: 0.75,
+        shadows: true,
+        shadowMapSize: 512,
+        shadowType: THREE.BasicShadowMap,
+        smallPropShadows: false,
+        bakedShadows: true
+    },
+    {
+        name: 'minimal',
+        antialias: false,
+        maxPixelRatio: 0.5,
+        shadows: false,
+        shadowMapSize: 512,
+        shadowType: THREE.BasicShadowMap,
+        smallPropShadows: false,
+        bakedShadows: true
+    }
+];
+
+const SAMPLE_WINDOW = 60;          // Frames per decision
+const DOWNGRADE_FRAME_MS = 1000 / 30; // Average slower than ~30 fps -> step down
+const UPGRADE_FRAME_MS = 1000 / 55;   // Average faster than ~55 fps -> consider stepping up
+const UPGRADE_STABLE_WINDOWS = 5;  // Consecutive fast windows needed before stepping up
+const MAX_SAMPLE_MS = 250;         // Ignore stalls (tab switches, GC pauses, breakpoints)
+const SMALL_PROP_RADIUS = 0.2;     // World-space bounding radius below which a mesh counts as a small prop
+
+/**
+ * Resolve a tier name from ?quality= or the config value.
+ * @param {string|undefined} configured
+ * @returns {{index: number, pinned: boolean}}
+ */
+export function resolveQualityTier(configured) {
+    const fromUrl = new URLSearchParams(window.location.search).get('quality');
+    const requested = fromUrl || configured;
+    if (!requested || requested === 'auto') return { index: 0, pinned: false };
+
+    const index = QUALITY_TIERS.findIndex(tier => tier.name === requested);
+    if (index < 0) {
+        console.warn(`Unknown quality tier "${requested}", using auto`);
+        return { index: 0, pinned: false };
+    }
+    return { index, pinned: true };
+}
+
+const _sphere = new THREE.Sphere();
+
+/**
+ * Whether a mesh is a small prop whose shadow the low tiers drop. Measured once from its
+ * world bounds and kept in userData.smallProp; static batches copy the flag from their
+ * source meshes (RoomEngine._addStaticBatch). Expects an up-to-date matrixWorld.
+ * @param {THREE.Mesh} mesh
+ * @returns {boolean}
+ */
+export function isSmallProp(mesh) {
+    if (mesh.userData.smallProp === undefined) {
+        if (mesh.isInstancedMesh) return false;
+        if (!mesh.geometry.boundingSphere) mesh.geometry.computeBoundingSphere();
+        _sphere.copy(mesh.geometry.boundingSphere).applyMatrix4(mesh.matrixWorld);
+        mesh.userData.smallProp = _sphere.radius < SMALL_PROP_RADIUS;
+    }
+    return mesh.userData.smallProp;
+}
+
+export class QualityGovernor {
+    constructor(engine, { index = 0, pinned = false } = {}) {
+        this.engine = engine;
+        this.tierIndex = index;
+        this.pinned = pinned;
+
+        this.samples = [];
+        this.fastWindows = 0;
+        this._smallProps = null; // Meshes whose castShadow we toggle; collected on first use, reset when the scene changes
+        this._lastFrameRendered = false;
+    }
+
+    get tier() {
+        return QUALITY_TIERS[this.tierIndex];
+    }
+
+    /**
+     * Feed one frame. Only frames that rendered back-to-back are sampled,
+     * so idle on-demand frames don't read as "fast".
+     * @param {number} deltaMs - Time since the previous frame
+     * @param {boolean} rendered - Whether this frame called renderer.render()
+     */
+    sample(deltaMs, rendered) {
+        const continuous = rendered && this._lastFrameRendered;
+        this._lastFrameRendered = rendered;
+        if (this.pinned || !continuous || deltaMs > MAX_SAMPLE_MS) return;
+
+        this.samples.push(deltaMs);
+        if (this.samples.length < SAMPLE_WINDOW) return;
+
+        const average = this.samples.reduce((sum, ms) => sum + ms, 0) / this.samples.length;
+        this.samples.length = 0;
+
+        if (average > DOWNGRADE_FRAME_MS && this.tierIndex < QUALITY_TIERS.length - 1) {
+            this.fastWindows = 0;
+            this.setTier(this.tierIndex + 1);
+        } else if (average < UPGRADE_FRAME_MS && this.tierIndex > 0) {
+            if (++this.fastWindows >= UPGRADE_STABLE_WINDOWS) {
+                this.fastWindows = 0;
+                this.setTier(this.tierIndex - 1);
+            }
+        } else {
+            this.fastWindows = 0;
+        }
+    }
+
+    /**
+     * Apply a tier by index or name.
+     * @param {number|string} tier
+     */
+    setTier(tier) {
+        const index = typeof tier === 'string' ? QUALITY_TIERS.findIndex(t => t.name === tier) : tier;
+        if (index < 0 || index >= QUALITY_TIERS.length) return;
+        this.tierIndex = index;
+        this.apply();
+        console.log(`Quality tier: ${this.tier.name}`);
+    }
+
+    // Push the current tier's settings into the renderer and scene
+    apply() {
+        const { renderer, scene } = this.engine;
+        const tier = this.tier;
+
+        renderer.setPixelRatio(Math.min(window.devicePixelRatio || 1, tier.maxPixelRatio));
+        renderer.setSize(window.innerWidth, window.innerHeight);
+
+        const shadowModeChanged = renderer.shadowMap.enabled !== tier.shadows ||
+            renderer.shadowMap.type !== tier.shadowType;
+        renderer.shadowMap.enabled = tier.shadows;
+        renderer.shadowMap.type = tier.shadowType;
+        // Baked: static geometry doesn't move, so only re-render shadows on invalidateShadows()
+        renderer.shadowMap.autoUpdate = !tier.bakedShadows;
+
+        scene.traverse(obj => {
+            if (!obj.isLight || !obj.castShadow || !obj.shadow) return;
+            if (obj.userData.baseShadowMapSize === undefined) {
+                obj.userData.baseShadowMapSize = obj.shadow.mapSize.width;
+            }
+            const size = Math.min(obj.userData.baseShadowMapSize, tier.shadowMapSize);
+            if (obj.shadow.mapSize.width !== size) {
+                obj.shadow.mapSize.set(size, size);
+                if (obj.shadow.map) {
+                    obj.shadow.map.dispose();
+                    obj.shadow.map = null;
+                }
+            }
+        });
+
+        this._applySmallPropShadows(tier.smallPropShadows);
+
+        // Shader programs bake in the shadow mode, so materials must recompile
+        if (shadowModeChanged) {
+            scene.traverse(obj => {
+                if (!obj.material) return;
+                (Array.isArray(obj.material) ? obj.material : [obj.material]).forEach(m => { m.needsUpdate = true; });
+            });
+        }
+
+        this.invalidateShadows();
+        this.engine.requestRender();
+    }
+
+    // Re-render the shadow map on the next frame (needed when baked shadows are stale)
+    invalidateShadows() {
+        this.engine.renderer.shadowMap.needsUpdate = true;
+    }
+
+    /**
+     * Give every toggled small prop its shadow back and forget the list. Call before
+     * meshes are batched (optimizeStatic), so batches inherit the authored castShadow.
+     */
+    resetSmallProps() {
+        if (!this._smallProps) return;
+        this._smallProps.forEach(mesh => { mesh.castShadow = true; });
+        this._smallProps = null;
+    }
+
+    /**
+     * The scene gained or lost meshes (a build slice, optimizeStatic): find small props
+     * again so new ones follow the current tier, and re-render baked shadows.
+     */
+    refreshSmallProps() {
+        this.resetSmallProps();
+        this._applySmallPropShadows(this.tier.smallPropShadows);
+        this.invalidateShadows();
+    }
+
+    _applySmallPropShadows(enabled) {
+        if (!this._smallProps) {
+            if (enabled) return; // Nothing toggled yet
+            this._smallProps = [];
+            this.engine.scene.updateMatrixWorld(true);
+            this.engine.scene.traverse(obj => {
+                if (obj.isMesh && obj.castShadow && isSmallProp(obj)) this._smallProps.push(obj);
+            });
+        }
+        this._smallProps.forEach(mesh => { mesh.castShadow = enabled; });
+    }
+}
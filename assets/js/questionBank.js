@@ -0,0 +1,205 @@
+/**
+ * questionBank.js
+ * Seeded, unbiased sampling for gameLogic.js.
+ * QuestionBank hands out question indices without replacement using a
+ * Fisher-Yates cursor: each draw swaps one random remaining index into place,
+ * so a draw is O(1) however large the bank is, and every ordering is equally
+ * likely. Once every question has been drawn the cursor starts a new pass.
+ * The question array itself is never reordered - indices stay valid for
+ * activeClues/locationMap. LocationSet tracks the locations without a clue
+ * with O(1) take/release. Both draw from the same seedable PRNG, so a seed
+ * replays a game exactly.
+ */
+
+/**
+ * Seeded PRNG (mulberry32).
+ * @param {number|string} seed - Strings are hashed (FNV-1a)
+ * @returns {Function} () => float in [0, 1)
+ */
+export function createRng(seed) {
+    let state = typeof seed === 'string' ? hashString(seed) : seed >>> 0;
+    return () => {
+        state = (state + 0x6d2b79f5) >>> 0;
+        let t = state;
+        t = Math.imul(t ^ (t >>> 15), t | 1);
+        t ^= t + Math.imul(t ^ (t >>> 7), t | 61);
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+function hashString(text) {
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < text.length; i++) {
+        hash ^= text.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return hash >>> 0;
+}
+
+/** A fresh 32-bit seed. */
+export function randomSeed() {
+    if (window.crypto && window.crypto.getRandomValues) {
+        return window.crypto.getRandomValues(new Uint32Array(1))[0];
+    }
+    return Math.floor(Math.random() * 4294967296);
+}
+
+/** Uniform integer in [0, n). */
+export function randomInt(rng, n) {
+    return Math.floor(rng() * n);
+}
+
+export class QuestionBank {
+    /**
+     * @param {Object[]} questions - {t, q, o, c}; held by reference, never reordered
+     */
+    constructor(questions) {
+        this.questions = questions;
+        this.rng = Math.random;
+        this.order = new Uint32Array(0);
+        this.cursor = 0;
+        this._topics = null; // topic -> question indices
+        this._topicsSize = 0;
+    }
+
+    get size() {
+        return this.questions.length;
+    }
+
+    /**
+     * Start a new sampling sequence, e.g. after the pool was replaced.
+     * @param {Function} rng - From createRng()
+     */
+    reset(rng) {
+        this.rng = rng;
+        this.order = Uint32Array.from(this.questions, (_, i) => i);
+        this.cursor = 0;
+        this._topics = null;
+    }
+
+    /**
+     * Next question index. No index repeats until every question has been drawn.
+     * @returns {number} -1 when the bank is empty
+     */
+    draw() {
+        const n = this.questions.length;
+        if (n === 0) return -1;
+        if (this.order.length !== n) this.reset(this.rng);
+        if (this.cursor >= n) this.cursor = 0; // Start the next pass
+
+        const j = this.cursor + randomInt(this.rng, n - this.cursor);
+        const picked = this.order[j];
+        this.order[j] = this.order[this.cursor];
+        this.order[this.cursor] = picked;
+        this.cursor++;
+        return picked;
+    }
+
+    /**
+     * Next question index that is not in `exclude` (e.g. questions already on screen).
+     * @param {Set<number>} exclude
+     * @returns {number} -1 when every question is excluded
+     */
+    drawExcept(exclude) {
+        const n = this.questions.length;
+        let excluded = 0;
+        exclude.forEach(index => { if (index >= 0 && index < n) excluded++; });
+        if (excluded >= n) return -1;
+
+        // The rest of the current pass plus one full pass draws every index at least
+        // once, so a candidate is always found; at most 2 * |exclude| draws are wasted.
+        const remaining = this.order.length === n && this.cursor < n ? n - this.cursor : 0;
+        for (let tries = remaining + n; tries > 0; tries--) {
+            const index = this.draw();
+            if (!exclude.has(index)) return index;
+        }
+        return -1;
+    }
+
+    /**
+     * Question indices for a topic (the `t` field), built on first use.
+     * @param {string} topic
+     * @returns {number[]}
+     */
+    byTopic(topic) {
+        if (!this._topics || this._topicsSize !== this.questions.length) {
+            this._topics = new Map();
+            this._topicsSize = this.questions.length;
+            this.questions.forEach((question, i) => {
+                const list = this._topics.get(question.t);
+                if (list) list.push(i);
+                else this._topics.set(question.t, [i]);
+            });
+        }
+        return this._topics.get(topic) || [];
+    }
+
+    /** @returns {string[]} Every topic in the bank */
+    topics() {
+        this.byTopic('');
+        return [...this._topics.keys()];
+    }
+}
+
+/**
+ * Set of free (clue-less) locations with O(1) random take and release.
+ * Duplicate names in the source list collapse to one location.
+ */
+export class LocationSet {
+    constructor(locations) {
+        this.known = new Set(locations);
+        this.items = [];
+        this.positions = new Map(); // location -> index in items
+        this.fill();
+    }
+
+    get size() {
+        return this.items.length;
+    }
+
+    // Mark every location free
+    fill() {
+        this.items = [...this.known];
+        this.positions.clear();
+        this.items.forEach((loc, i) => this.positions.set(loc, i));
+    }
+
+    // Mark every location taken
+    clear() {
+        this.items.length = 0;
+        this.positions.clear();
+    }
+
+    has(location) {
+        return this.positions.has(location);
+    }
+
+    /**
+     * Remove and return a random free location.
+     * @param {Function} rng
+     * @returns {string|null}
+     */
+    take(rng) {
+        if (this.items.length === 0) return null;
+        const location = this.items[randomInt(rng, this.items.length)];
+        this.remove(location);
+        return location;
+    }
+
+    remove(location) {
+        const i = this.positions.get(location);
+        if (i === undefined) return;
+        const last = this.items.pop();
+        if (i < this.items.length) {
+            this.items[i] = last;
+            this.positions.set(last, i);
+        }
+        this.positions.delete(location);
+    }
+
+    release(location) {
+        if (this.positions.has(location) || !this.known.has(location)) return;
+        this.positions.set(location, this.items.length);
+        this.items.push(location);
+    }
+}
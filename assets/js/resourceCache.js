@@ -0,0 +1,151 @@
+/**
+ * resourceCache.js
+ * Keyed cache for geometries and materials.
+ * Prefab factories request resources through here so that identical
+ * parameters share one GPU buffer / shader program instead of uploading
+ * a duplicate per object. Also home to the disposal helpers, which need to
+ * know which resources are shared.
+ *
+ * Cached resources live until disposeResourceCache() (RoomEngine.dispose).
+ * Nothing tracks which meshes use them, so the disposal helpers and
+ * optimizeStatic() never free a shared resource on their own.
+ */
+
+const geometryCache = new Map(); // key -> resource
+const materialCache = new Map(); // key -> resource
+
+let geometryRequests = 0;
+let materialRequests = 0;
+
+/**
+ * Builds a stable string for a constructor argument or material parameter.
+ * Colors collapse to hex, textures to their uuid, vectors to components.
+ */
+function serialize(value) {
+    if (value === null || value === undefined) return String(value);
+    if (typeof value === 'number') return Number.isFinite(value) ? String(value) : `${value}`;
+    if (typeof value !== 'object') return JSON.stringify(value);
+    if (value.isColor) return `#${value.getHexString()}`;
+    if (value.isTexture) return `tex:${value.uuid}`;
+    if (value.isVector2) return `v2(${value.x},${value.y})`;
+    if (value.isVector3) return `v3(${value.x},${value.y},${value.z})`;
+    if (Array.isArray(value)) return `[${value.map(serialize).join(',')}]`;
+    return `{${Object.keys(value).sort().map(k => `${k}:${serialize(value[k])}`).join(',')}}`;
+}
+
+function acquire(cache, key, create) {
+    let resource = cache.get(key);
+    if (!resource) {
+        resource = create();
+        resource.userData.sharedResource = true;
+        resource.userData.cacheKey = key;
+        cache.set(key, resource);
+    }
+    return resource;
+}
+
+/**
+ * Returns a shared geometry for the given constructor and arguments.
+ * The result must be treated as read-only - scale the mesh, not the geometry.
+ * @param {Function} GeometryClass - e.g. THREE.BoxGeometry
+ * @param {...*} args - Constructor arguments
+ * @returns {THREE.BufferGeometry}
+ */
+export function getGeometry(GeometryClass, ...args) {
+    geometryRequests++;
+    const key = `${GeometryClass.name}(${args.map(serialize).join(',')})`;
+    return acquire(geometryCache, key, () => new GeometryClass(...args));
+}
+
+/**
+ * Returns a shared material for the given constructor and parameters.
+ * The result must be treated as read-only - assign a new material to change a mesh.
+ * @param {Function} MaterialClass - e.g. THREE.MeshStandardMaterial
+ * @param {Object} params - Material parameters
+ * @returns {THREE.Material}
+ */
+export function getMaterial(MaterialClass, params = {}) {
+    materialRequests++;
+    const key = `${MaterialClass.name}${serialize(params)}`;
+    return acquire(materialCache, key, () => new MaterialClass(params));
+}
+
+/**
+ * Debug counters for confirming buffer/program savings.
+ * @returns {{geometries: {unique: number, requested: number}, materials: {unique: number, requested: number}}}
+ */
+export function getResourceStats() {
+    return {
+        geometries: { unique: geometryCache.size, requested: geometryRequests },
+        materials: { unique: materialCache.size, requested: materialRequests }
+    };
+}
+
+// --- Disposal ---
+
+/**
+ * Disposes a material and every texture it references.
+ * Shared (cached) materials are left alone - they are freed by disposeResourceCache().
+ * @param {THREE.Material} material
+ * @returns {boolean} True if the material was disposed
+ */
+export function disposeMaterial(material) {
+    if (!material || material.userData.sharedResource) return false;
+    Object.values(material).forEach(value => {
+        if (value && value.isTexture) value.dispose();
+    });
+    material.dispose();
+    return true;
+}
+
+/**
+ * Assigns a new material to a mesh and frees the one it replaces,
+ * so runtime swaps (screens turning on, textures redrawn) don't leak.
+ * @param {THREE.Mesh} mesh
+ * @param {THREE.Material} material
+ */
+export function replaceMaterial(mesh, material) {
+    const previous = mesh.material;
+    if (previous === material) return;
+    mesh.material = material;
+    (Array.isArray(previous) ? previous : [previous]).forEach(disposeMaterial);
+}
+
+/**
+ * Frees the geometries, materials and textures of an object and its descendants.
+ * Cached resources are skipped, since other objects may still use them.
+ * @param {THREE.Object3D} root
+ * @returns {{geometries: number, materials: number}} How many were disposed
+ */
+export function disposeObject(root) {
+    const geometries = new Set();
+    const materials = new Set();
+    root.traverse(obj => {
+        if (obj.isInstancedMesh) obj.dispose(); // Frees the per-instance buffers
+        if (obj.geometry && !obj.geometry.userData.sharedResource) geometries.add(obj.geometry);
+        if (obj.material) {
+            (Array.isArray(obj.material) ? obj.material : [obj.material]).forEach(m => materials.add(m));
+        }
+    });
+
+    geometries.forEach(geometry => geometry.dispose());
+    let disposedMaterials = 0;
+    materials.forEach(material => { if (disposeMaterial(material)) disposedMaterials++; });
+    return { geometries: geometries.size, materials: disposedMaterials };
+}
+
+/**
+ * Disposes every cached geometry and material.
+ * Only for full teardown (RoomEngine.dispose), when nothing can still be using them.
+ */
+export function disposeResourceCache() {
+    geometryCache.forEach(resource => resource.dispose());
+    materialCache.forEach(resource => {
+        Object.values(resource).forEach(value => {
+            if (value && value.isTexture) value.dispose();
+        });
+        resource.dispose();
+    });
+    geometryCache.clear();
+    materialCache.clear();
+}
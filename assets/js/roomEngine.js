@@ -2,6 +2,7 @@
 // This provides the foundation: controls, camera, raycasting, timer, door, etc.
 
 import * as THREE from 'three';
+import { mergeGeometries } from 'three/addons/utils/BufferGeometryUtils.js';
 import {
     ROOM_SIZE,
     WALL_HEIGHT,
@@ -16,13 +17,35 @@ import {
     FOG_COLOR,
     FOG_NEAR,
     FOG_FAR,
-    MOBILE_BREAKPOINT_WIDTH
+    MOBILE_BREAKPOINT_WIDTH,
+    RENDER_IDLE_INTERVAL_MS,
+    SHADOW_MAP_SIZE,
+    FIRST_FRAME_MARK,
+    INTERACTIVE_MARK,
+    RESOURCE_GROWTH_LIMIT
 } from './constants.js';
 import { TouchControls } from './touchControls.js';
+import { PointerInput } from './pointerInput.js';
 import { closeModal, isInteracting } from './ui.js';
+import { getResourceStats, disposeObject, disposeResourceCache } from './resourceCache.js';
+import { InteractableIndex } from './interactableIndex.js';
+import { VisibilityZones } from './visibilityZones.js';
+import { TimerDisplay } from './timerDisplay.js';
+import { AnimationScheduler } from './animationScheduler.js';
+import { QualityGovernor, QUALITY_TIERS, isSmallProp, resolveQualityTier } from './qualityGovernor.js';
+import { PerfProfiler, resolveProfilerOptions } from './perfProfiler.js';
+import { PerfBeacon, resolveBeaconOptions } from './perfBeacon.js';
+import {
+    parseRoomSnapshot, resolveSnapshotMode, serializeRoom, snapshotToBase64, snapshotUrl
+} from './roomSnapshot.js';
 
-export class RoomEngine {
+// Dispatches countdown events:
+//   'timertick' { timeLeft, timeStr } - whenever the displayed MM:SS changes
+//   'timeup'    { }                   - once, when the countdown reaches zero before a win
+export class RoomEngine extends THREE.EventDispatcher {
     constructor(config = {}) {
+        super();
+
         // Configuration
         this.config = {
             roomWidth: config.roomWidth || 10,
@@ -31,6 +54,7 @@ export class RoomEngine {
             enableDoor: config.enableDoor !== false,
             enableTimer: config.enableTimer !== false,
             enableProceduralRoom: config.enableProceduralRoom !== false,
+            renderOnDemand: config.renderOnDemand !== false,
             onInteract: config.onInteract || null,
             ...config
         };
@@ -47,14 +71,48 @@ export class RoomEngine {
             config.cameraZ || 0
         );
 
-        this.renderer = new THREE.WebGLRenderer({ antialias: true });
+        // Starting quality tier (?quality=high|medium|low|minimal or config.quality pins it)
+        const qualityTier = resolveQualityTier(config.quality);
+
+        this.renderer = new THREE.WebGLRenderer({ antialias: QUALITY_TIERS[qualityTier.index].antialias });
         this.renderer.setSize(window.innerWidth, window.innerHeight);
         this.renderer.shadowMap.enabled = true;
         this.renderer.shadowMap.type = THREE.PCFSoftShadowMap;
         document.body.appendChild(this.renderer.domElement);
 
-        // Interactables array
+        // Adapts pixel ratio / shadows to measured frame time; applied on start()
+        this.quality = new QualityGovernor(this, qualityTier);
+
+        // Per-phase frame timings (?perf, window.__DEV__ or config.profile); read via engine.perf
+        this.perf = new PerfProfiler(resolveProfilerOptions(config.profile));
+
+        // Field reports to server.js (/api/perf) from pages it serves; ?beacon or config.beacon overrides
+        this.beacon = new PerfBeacon(this, resolveBeaconOptions(config.beacon));
+
+        // Interactables array, plus a BVH over it for picking
         this.interactables = [];
+        this.pickIndex = new InteractableIndex(this.interactables);
+
+        // Zones behind doors/pivots/drawers (hidden room, drawer contents); see visibilityZones.js
+        this.zones = new VisibilityZones(this.camera);
+
+        // Debug: flag GPU resource counts that keep growing across interactions
+        this.debugResources = config.debugResources === true || !!window.__DEV__;
+        this.resourceLeakWarnings = 0;
+        this._lastResourceTotal = 0;
+        this._resourceGrowthStreak = 0;
+        this.disposed = false;
+
+        // Baked room snapshots (?bake, ?snapshot=0 or config.snapshot); see roomSnapshot.js
+        this.snapshot = resolveSnapshotMode(config.snapshot);
+        this.snapshotLoaded = false;
+        // Scene children the engine adds itself (lights, door, timer) - never part of a snapshot
+        this._engineObjects = new Set();
+
+        // Progressive build (SceneBuilder): input is ignored until the gameplay chunks exist
+        this.interactionLocked = false;
+        this.loading = false;
+        this._loadProgress = null;
 
         // Game state
         this.gameWon = false;
@@ -65,11 +123,18 @@ export class RoomEngine {
         this._PI_2 = Math.PI / 2;
         this._vector = new THREE.Vector3();
         this.mouse = new THREE.Vector2(0, 0);
-        this.mouseDelta = new THREE.Vector2();
-        this.lastMousePos = new THREE.Vector2();
+        this.mouseDelta = new THREE.Vector2(); // Drag-to-look movement for this frame
         this.isMouseDown = false;
+        this.pointer = null; // PointerInput - applied once per frame by _applyPointerInput()
+        this._crosshairX = null; // Client position the crosshair was last moved to
+        this._crosshairY = null;
         this.raycaster = new THREE.Raycaster();
 
+        // Last view/pointer used for hover picking (re-pick only when these change)
+        this._pickMouse = new THREE.Vector2(NaN, NaN);
+        this._pickCameraMatrix = new THREE.Matrix4();
+        this._pickIndexVersion = -1;
+
         // Room bounds
         const boundSize = (Math.max(this.config.roomWidth, this.config.roomDepth) / 2) - 0.5;
         this.roomBounds = {
@@ -88,10 +153,12 @@ export class RoomEngine {
         this.doorHitbox = null;
 
         // Timer reference
+        this.timerDisplay = null;
         this.timerTexture = null;
         this.timerCanvas = null;
         this.timerCtx = null;
         this.finalTimeStr = "00:00";
+        this._timeUpDispatched = false;
 
         // Input handling
         this.keys = {
@@ -102,10 +169,24 @@ export class RoomEngine {
         };
 
         this.touchControls = null;
+        this._listeners = []; // {target, type, handler, options}, removed by dispose()
 
         // Animation loop reference
         this.prevTime = performance.now();
+        this._hiddenAt = null; // performance.now() when the loop was paused for a hidden tab
         this.animationId = null;
+        this.running = false;
+        this.framesRendered = 0;
+        this._interactiveMarked = false;
+
+        // Door tweens, drawer/bookshelf easing, ... - all advanced once per frame on the real delta
+        this.animations = new AnimationScheduler();
+
+        // Render-on-demand state: a frame is drawn only when something marked the scene dirty
+        this.needsRender = true;
+        this._lastRenderTime = 0;
+        this._renderCameraPos = new THREE.Vector3(NaN, NaN, NaN);
+        this._renderCameraQuat = new THREE.Quaternion();
 
         // Initialize
         this._setupLighting();
@@ -114,6 +195,7 @@ export class RoomEngine {
         }
         this._setupInputHandlers();
         this._setupWindowResize();
+        this._setupVisibilityHandling();
 
         // Expose for debugging
         window.camera = this.camera;
@@ -126,6 +208,7 @@ export class RoomEngine {
         const hemiLight = new THREE.HemisphereLight(0xffffff, 0x444444, 0.8);
         hemiLight.position.set(0, 20, 0);
         this.scene.add(hemiLight);
+        this._engineObjects.add(hemiLight);
 
         const dirLight = new THREE.DirectionalLight(0xffffff, 0.8);
         dirLight.position.set(-5, 10, -5);
@@ -134,14 +217,17 @@ export class RoomEngine {
         dirLight.shadow.camera.right = 10;
         dirLight.shadow.camera.top = 10;
         dirLight.shadow.camera.bottom = -10;
-        dirLight.shadow.mapSize.width = 2048;
-        dirLight.shadow.mapSize.height = 2048;
+        dirLight.shadow.mapSize.width = SHADOW_MAP_SIZE;
+        dirLight.shadow.mapSize.height = SHADOW_MAP_SIZE;
         this.scene.add(dirLight);
+        this._engineObjects.add(dirLight);
+        this.dirLight = dirLight;
     }
 
     _createProceduralRoom() {
         const roomGroup = new THREE.Group();
         this.scene.add(roomGroup);
+        this._engineObjects.add(roomGroup);
 
         const halfW = this.config.roomWidth / 2;
         const halfD = this.config.roomDepth / 2;
@@ -254,6 +340,7 @@ export class RoomEngine {
         this.doorPivot = new THREE.Group();
         this.doorPivot.position.set(-doorW / 2, 0, wallZ);
         roomGroup.add(this.doorPivot);
+        this.pickIndex.watch(this.doorPivot);
 
         const doorThickness = 0.1;
         const doorMesh = new THREE.Mesh(
@@ -338,11 +425,11 @@ export class RoomEngine {
         const timerBox = new THREE.Mesh(new THREE.BoxGeometry(0.8, 0.3, 0.1), timerBoxMat);
         timerGroup.add(timerBox);
 
-        this.timerCanvas = document.createElement('canvas');
-        this.timerCanvas.width = 512;
-        this.timerCanvas.height = 256;
-        this.timerCtx = this.timerCanvas.getContext('2d');
-        this.timerTexture = new THREE.CanvasTexture(this.timerCanvas);
+        this.timerDisplay = new TimerDisplay(512, 256);
+        this.timerCanvas = this.timerDisplay.canvas;
+        this.timerCtx = this.timerDisplay.ctx;
+        this.timerTexture = this.timerDisplay.texture;
+        this.timerDisplay.setText(this.finalTimeStr);
 
         const displayMesh = new THREE.Mesh(
             new THREE.PlaneGeometry(0.7, 0.25),
@@ -353,23 +440,29 @@ export class RoomEngine {
     }
 
     _updateTimer(dt) {
-        if (!this.config.enableTimer || !this.timerCtx) return;
+        if (!this.config.enableTimer || !this.timerDisplay) return;
         if (!this.gameWon) this.timeLeft = Math.max(0, this.timeLeft - dt);
 
         const m = Math.floor(this.timeLeft / 60);
         const s = Math.floor(this.timeLeft % 60);
         this.finalTimeStr = `${m.toString().padStart(2, '0')}:${s.toString().padStart(2, '0')}`;
 
-        this.timerCtx.fillStyle = '#000000';
-        this.timerCtx.fillRect(0, 0, 512, 256);
-        this.timerCtx.shadowColor = "#00ff00";
-        this.timerCtx.shadowBlur = 20;
-        this.timerCtx.fillStyle = '#00ff00';
-        this.timerCtx.font = 'bold 120px "Courier New", monospace';
-        this.timerCtx.textAlign = 'center';
-        this.timerCtx.textBaseline = 'middle';
-        this.timerCtx.fillText(this.finalTimeStr, 256, 128);
-        this.timerTexture.needsUpdate = true;
+        // Redraw/re-upload only when the visible text changes (about once a second)
+        if (this.timerDisplay.setText(this.finalTimeStr)) {
+            this.requestRender();
+            this.dispatchEvent({ type: 'timertick', timeLeft: this.timeLeft, timeStr: this.finalTimeStr });
+        }
+
+        if (this.timeLeft <= 0 && !this.gameWon && !this._timeUpDispatched) {
+            this._timeUpDispatched = true;
+            this.dispatchEvent({ type: 'timeup' });
+        }
+    }
+
+    // addEventListener that dispose() will undo
+    _listen(target, type, handler, options) {
+        target.addEventListener(type, handler, options);
+        this._listeners.push({ target, type, handler, options });
     }
 
     _setupInputHandlers() {
@@ -380,8 +473,8 @@ export class RoomEngine {
                 e.stopPropagation(); // Prevent click from bubbling to document handler
                 this.instructions.style.display = 'none';
             };
-            this.instructions.addEventListener('click', dismissInstructions);
-            this.instructions.addEventListener('touchstart', (e) => {
+            this._listen(this.instructions, 'click', dismissInstructions);
+            this._listen(this.instructions, 'touchstart', (e) => {
                 e.preventDefault();
                 e.stopPropagation(); // Prevent touch from bubbling to document handler
                 this.instructions.style.display = 'none';
@@ -389,7 +482,8 @@ export class RoomEngine {
         }
 
         // Keyboard
-        document.addEventListener('keydown', (e) => {
+        this._listen(document, 'keydown', (e) => {
+            this.requestRender();
             if (this.keys.hasOwnProperty(e.key) || this.keys.hasOwnProperty(e.code)) {
                 this.keys[e.key] = true;
                 this.keys[e.code] = true;
@@ -404,46 +498,28 @@ export class RoomEngine {
             }
         });
 
-        document.addEventListener('keyup', (e) => {
+        this._listen(document, 'keyup', (e) => {
+            this.requestRender();
             if (this.keys.hasOwnProperty(e.key) || this.keys.hasOwnProperty(e.code)) {
                 this.keys[e.key] = false;
                 this.keys[e.code] = false;
             }
         });
 
-        // Mouse
-        document.addEventListener('mousedown', () => { this.isMouseDown = true; });
-        document.addEventListener('mouseup', () => { this.isMouseDown = false; });
-        document.addEventListener('mousemove', (event) => {
-            // On mobile (small screens), keep mouse at center (0,0) and crosshair fixed
-            if (window.innerWidth <= MOBILE_BREAKPOINT_WIDTH) return;
-
-            const currentlyInteracting = isInteracting;
-            this.mouse.x = (event.clientX / window.innerWidth) * 2 - 1;
-            this.mouse.y = -(event.clientY / window.innerHeight) * 2 + 1;
-
-            if (this.isMouseDown && !currentlyInteracting) {
-                const deltaX = event.clientX - this.lastMousePos.x;
-                const deltaY = event.clientY - this.lastMousePos.y;
-                this.mouseDelta.x += deltaX;
-                this.mouseDelta.y += deltaY;
-            }
-            this.lastMousePos.set(event.clientX, event.clientY);
-
-            if (!currentlyInteracting && this.crosshair) {
-                this.crosshair.style.left = event.clientX + 'px';
-                this.crosshair.style.top = event.clientY + 'px';
-            }
-        });
-
-        document.addEventListener('click', () => {
-            if (isInteracting) return;
+        this._listen(document, 'click', (event) => {
+            // UI buttons change scene state too (items hidden, screens swapped)
+            this.requestRender();
+            this.quality.invalidateShadows();
+            // Taps interact through TouchControls; their synthesized clicks must not pick again
+            if (isInteracting || this.pointer.isTouchClick(event)) return;
+            this._applyPointerInput(false); // Pick where the pointer is now, not where the last frame saw it
             this.interact();
         });
 
         // Touch controls
         const handleTouchInteract = (touchObject) => {
-            if (!isInteracting && touchObject) {
+            if (!isInteracting && touchObject && !this.interactionLocked) {
+                this._checkResourceGrowth();
                 // Use the object from touch raycast, don't do another raycast
                 if (this.config.onInteract) {
                     this.config.onInteract(touchObject.name, touchObject);
@@ -454,27 +530,80 @@ export class RoomEngine {
                 }
             }
         };
-        this.touchControls = new TouchControls(this.camera, this.raycaster, this.interactables, handleTouchInteract);
+        this.touchControls = new TouchControls(
+            this.camera, this.raycaster, this.interactables, handleTouchInteract, this.pickIndex, this.renderer.domElement
+        );
+
+        // Mouse, pen and touch: events only record state, animate() applies it once per frame
+        this.pointer = new PointerInput({
+            touchHandler: this.touchControls,
+            onActivity: () => this.requestRender()
+        });
+    }
+
+    /**
+     * Apply pointer input gathered since the last frame: the picking ray follows the
+     * pointer and the crosshair is moved with a transform (no layout).
+     * @param {boolean} [consumeLook=true] - Also take this frame's drag-to-look and touch input
+     */
+    _applyPointerInput(consumeLook = true) {
+        const pointer = this.pointer;
+        const isMobile = window.innerWidth <= MOBILE_BREAKPOINT_WIDTH;
+        this.isMouseDown = pointer.isDown;
+
+        // On mobile (small screens), keep mouse at center (0,0) and crosshair fixed
+        if (!isMobile && pointer.clientX !== null) {
+            this.mouse.x = (pointer.clientX / window.innerWidth) * 2 - 1;
+            this.mouse.y = -(pointer.clientY / window.innerHeight) * 2 + 1;
+
+            if (!isInteracting && this.crosshair &&
+                (pointer.clientX !== this._crosshairX || pointer.clientY !== this._crosshairY)) {
+                this._crosshairX = pointer.clientX;
+                this._crosshairY = pointer.clientY;
+                // The stylesheet centers the crosshair; offset it from the viewport center
+                const x = pointer.clientX - window.innerWidth / 2;
+                const y = pointer.clientY - window.innerHeight / 2;
+                this.crosshair.style.transform = `translate3d(${x}px, ${y}px, 0) translate(-50%, -50%)`;
+            }
+        }
+        if (!consumeLook) return;
+
+        const input = pointer.flush();
+        if (input.latencyMs !== null) this.perf.sample('inputLatency', input.latencyMs);
+        if (this.touchControls) this.touchControls.update();
+
+        if (isInteracting) {
+            // Drags behind a modal must not turn the camera once it closes
+            this.mouseDelta.set(0, 0);
+            if (this.touchControls) this.touchControls.getLookDelta();
+            return;
+        }
+        this.mouseDelta.set(input.dragX, input.dragY);
     }
 
     _setupWindowResize() {
-        window.addEventListener('resize', () => {
+        this._listen(window, 'resize', () => {
             this.camera.aspect = window.innerWidth / window.innerHeight;
             this.camera.updateProjectionMatrix();
             this.renderer.setSize(window.innerWidth, window.innerHeight);
+            this.requestRender();
 
             // If resizing to mobile, reset mouse to center so crosshair logic works correctly
             if (window.innerWidth <= MOBILE_BREAKPOINT_WIDTH) {
                 this.mouse.set(0, 0);
+                if (this.crosshair) this.crosshair.style.transform = '';
             }
+            this._crosshairX = this._crosshairY = null; // Viewport center moved
         });
     }
 
     interact() {
+        if (this.interactionLocked) return;
+        this._checkResourceGrowth();
         this.raycaster.setFromCamera(this.mouse, this.camera);
         // Use recursive: false to only detect objects directly in interactables array
         // This prevents parent objects from blocking child objects
-        const intersects = this.raycaster.intersectObjects(this.interactables, false);
+        const intersects = this.pickIndex.intersect(this.raycaster, false);
         if (intersects.length > 0) {
             const obj = intersects[0].object;
 
@@ -493,31 +622,16 @@ export class RoomEngine {
     toggleDoor() {
         if (!this.doorPivot) return;
 
-        if (this.doorPivot.rotation.y === 0) {
-            // Open
-            const targetRot = -Math.PI / 2;
-            const duration = 1000;
-            const start = performance.now();
-            const animateDoor = (now) => {
-                const p = Math.min(1, (now - start) / duration);
-                const ease = 1 - Math.pow(1 - p, 3);
-                this.doorPivot.rotation.y = targetRot * ease;
-                if (p < 1) requestAnimationFrame(animateDoor);
-            };
-            requestAnimationFrame(animateDoor);
-        } else {
-            // Close
-            const startRot = this.doorPivot.rotation.y;
-            const duration = 1000;
-            const start = performance.now();
-            const animateDoorClose = (now) => {
-                const p = Math.min(1, (now - start) / duration);
-                const ease = 1 - Math.pow(1 - p, 3);
-                this.doorPivot.rotation.y = startRot * (1 - ease);
-                if (p < 1) requestAnimationFrame(animateDoorClose);
-            };
-            requestAnimationFrame(animateDoorClose);
-        }
+        // Open if closed, otherwise close from wherever it is. Keyed, so a click
+        // mid-swing replaces the running tween rather than adding another one.
+        const targetRot = this.doorPivot.rotation.y === 0 ? -Math.PI / 2 : 0;
+        this.animations.tween('door', {
+            from: this.doorPivot.rotation.y,
+            to: targetRot,
+            duration: 1,
+            onUpdate: (value) => { this.doorPivot.rotation.y = value; }
+        });
+        this.requestRender();
     }
 
     moveForward(distance) {
@@ -545,8 +659,21 @@ export class RoomEngine {
         const time = performance.now();
         const delta = (time - this.prevTime) / 1000;
         this.prevTime = time;
+        this.perf.beginFrame();
 
         this._updateTimer(delta);
+        this.perf.lap('timer');
+
+        // Advance all running animations; keep rendering while any are active
+        if (this.animations.update(delta) > 0) this.requestRender();
+        this.perf.lap('animations');
+
+        // Movers (door, drawers, bookshelf) changed: picking BVH was rebuilt and baked shadows are stale
+        if (this.pickIndex.update()) {
+            this.quality.invalidateShadows();
+            this.requestRender();
+        }
+        this.perf.lap('pickIndex');
 
         // Cursor state
         if (!isInteracting && this.instructions && this.instructions.style.display === 'none') {
@@ -555,18 +682,30 @@ export class RoomEngine {
             this.setGameCursor(false);
         }
 
+        this._applyPointerInput();
+        this.perf.lap('pointer');
+
         if (!isInteracting) {
-            // Crosshair highlight
-            this.raycaster.setFromCamera(this.mouse, this.camera);
-            // Enable recursive raycasting to detect nested objects
-            const intersects = this.raycaster.intersectObjects(this.interactables, true);
-            if (this.crosshair) {
-                if (intersects.length > 0) {
-                    this.crosshair.classList.add('active');
-                } else {
-                    this.crosshair.classList.remove('active');
+            // Crosshair highlight - only re-pick when the camera, pointer or index changed
+            if (this.pickIndex.version !== this._pickIndexVersion ||
+                !this._pickMouse.equals(this.mouse) ||
+                !this._pickCameraMatrix.equals(this.camera.matrixWorld)) {
+                this._pickIndexVersion = this.pickIndex.version;
+                this._pickMouse.copy(this.mouse);
+                this._pickCameraMatrix.copy(this.camera.matrixWorld);
+
+                this.raycaster.setFromCamera(this.mouse, this.camera);
+                // Recursive so nested meshes of grouped interactables count
+                const intersects = this.pickIndex.intersect(this.raycaster, true);
+                if (this.crosshair) {
+                    if (intersects.length > 0) {
+                        this.crosshair.classList.add('active');
+                    } else {
+                        this.crosshair.classList.remove('active');
+                    }
                 }
             }
+            this.perf.lap('hover');
 
             // Camera look
             this._euler.setFromQuaternion(this.camera.quaternion);
@@ -604,14 +743,94 @@ export class RoomEngine {
                 if (moveState.left) this.moveRight(-actualSpeed);
                 if (moveState.right) this.moveRight(actualSpeed);
             }
+            this.perf.lap('input');
 
             // Collision bounds
             const pos = this.camera.position;
             pos.x = Math.max(this.roomBounds.minX, Math.min(this.roomBounds.maxX, pos.x));
             pos.z = Math.max(this.roomBounds.minZ, Math.min(this.roomBounds.maxZ, pos.z));
+            this.perf.lap('collision');
         }
 
-        this.renderer.render(this.scene, this.camera);
+        // Zones that can't be seen through any open portal are not drawn, shadow-mapped or picked
+        if (this.zones.update()) {
+            this._pickIndexVersion = -1; // Re-pick: hidden interactables dropped out or came back
+            this.quality.invalidateShadows();
+            this.requestRender();
+        }
+        this.perf.lap('zones');
+
+        // Render only when something changed, at least every RENDER_IDLE_INTERVAL_MS
+        if (this._cameraMovedSinceRender()) this.needsRender = true;
+        const shouldRender = !this.config.renderOnDemand || this.needsRender ||
+            time - this._lastRenderTime >= RENDER_IDLE_INTERVAL_MS;
+        if (shouldRender) {
+            this.renderer.render(this.scene, this.camera);
+            if (this.framesRendered++ === 0) performance.mark(FIRST_FRAME_MARK);
+            if (!this._interactiveMarked && !this.interactionLocked) {
+                this._interactiveMarked = true;
+                performance.mark(INTERACTIVE_MARK);
+            }
+            this.needsRender = false;
+            this._lastRenderTime = time;
+            this._renderCameraPos.copy(this.camera.position);
+            this._renderCameraQuat.copy(this.camera.quaternion);
+            this.perf.lap('render'); // Only frames that drew, so idle frames don't dilute it
+        }
+
+        // Slices of a progressive build land in these frames; don't let them lower the quality tier
+        this.quality.sample(delta * 1000, shouldRender && !this.loading);
+        if (shouldRender && !this.loading) this.beacon.sampleFrame(delta * 1000);
+        this.perf.endFrame();
+    }
+
+    // Show build progress inside the instructions overlay; removed once everything is built
+    showLoadProgress(built, total) {
+        if (!this.instructions) return;
+        if (built >= total) {
+            if (this._loadProgress) this._loadProgress.remove();
+            this._loadProgress = null;
+            return;
+        }
+        if (!this._loadProgress) {
+            this._loadProgress = document.createElement('p');
+            this._loadProgress.id = 'loadProgress';
+            this.instructions.appendChild(this._loadProgress);
+        }
+        this._loadProgress.textContent = `Loading room... ${Math.round(built / total * 100)}%`;
+    }
+
+    // Mark the scene dirty so the next frame is rendered (render-on-demand mode)
+    requestRender() {
+        this.needsRender = true;
+    }
+
+    _cameraMovedSinceRender() {
+        return !this._renderCameraPos.equals(this.camera.position) ||
+            !this._renderCameraQuat.equals(this.camera.quaternion);
+    }
+
+    // Stop the loop entirely while the tab is hidden; resume (and redraw) when shown
+    _setupVisibilityHandling() {
+        this._listen(document, 'visibilitychange', () => {
+            if (!this.running) return;
+            if (document.hidden) {
+                if (this.animationId) {
+                    cancelAnimationFrame(this.animationId);
+                    this.animationId = null;
+                    this._hiddenAt = performance.now();
+                }
+            } else if (!this.animationId) {
+                // The countdown keeps running while hidden; movement, animations and the
+                // scheduler restart from a fresh clock instead of one huge delta
+                const now = performance.now();
+                if (this._hiddenAt !== null) this._updateTimer((now - this._hiddenAt) / 1000);
+                this._hiddenAt = null;
+                this.prevTime = now;
+                this.requestRender();
+                this.animate();
+            }
+        });
     }
 
     // Public method to create door for custom rooms
@@ -629,6 +848,7 @@ export class RoomEngine {
         // Create a group for the door if we don't have a room group
         const doorGroup = new THREE.Group();
         this.scene.add(doorGroup);
+        this._engineObjects.add(doorGroup);
 
         this._createDoor(doorGroup, doorW, doorH, wallZ, doorMat, handleMat);
 
@@ -636,6 +856,7 @@ export class RoomEngine {
         const doorLight = new THREE.PointLight(0xffaa00, 0.5, 10);
         doorLight.position.set(0, 2, wallZ + 1);
         this.scene.add(doorLight);
+        this._engineObjects.add(doorLight);
     }
 
     // Public method to create timer for custom rooms
@@ -649,18 +870,272 @@ export class RoomEngine {
         // Create a group for the timer
         const timerGroup = new THREE.Group();
         this.scene.add(timerGroup);
+        this._engineObjects.add(timerGroup);
 
         this._createTimer(timerGroup, doorH, wallZ);
     }
 
+    /**
+     * Load the room's baked snapshot into the scene, registering its interactables.
+     * Resolves to null - build procedurally instead - when snapshots are turned off,
+     * the file is missing or it cannot be read.
+     * @param {string} room - e.g. 'office'
+     * @returns {Promise<{refs: Object<string, THREE.Object3D>}|null>}
+     */
+    async loadSnapshot(room) {
+        if (this.snapshot.mode !== 'load') return null;
+        let snapshot;
+        try {
+            const response = await fetch(snapshotUrl(room));
+            if (!response.ok) return null;
+            snapshot = await parseRoomSnapshot(await response.arrayBuffer());
+        } catch (error) {
+            console.warn(`Snapshot for ${room} not used:`, error);
+            return null;
+        }
+
+        const { header, objects, interactables, refs } = snapshot;
+        if (header.background !== null) this.scene.background = new THREE.Color(header.background);
+        if (header.fog) this.scene.fog = new THREE.Fog(header.fog.color, header.fog.near, header.fog.far);
+        objects.forEach(obj => this.scene.add(obj));
+        this.interactables.push(...interactables);
+        this.snapshotLoaded = true;
+        this.requestRender();
+        return { refs };
+    }
+
+    /**
+     * In ?bake mode, serialize everything the room added to the scene and expose it
+     * (base64) as window.roomSnapshot for bake_rooms.py. Call once the room is fully
+     * built and before optimizeStatic().
+     * @param {string} room
+     * @param {Object<string, THREE.Object3D>} refs - Objects the room code needs back after loading
+     */
+    bakeSnapshot(room, refs) {
+        if (this.snapshot.mode !== 'bake') return;
+        const objects = this.scene.children.filter(obj => !this._engineObjects.has(obj) && !obj.isCamera);
+        const roots = new Set(objects);
+        const inSnapshot = (obj) => {
+            while (obj.parent && obj.parent !== this.scene) obj = obj.parent;
+            return roots.has(obj);
+        };
+        const buffer = serializeRoom({
+            room,
+            objects,
+            interactables: this.interactables.filter(inSnapshot),
+            refs,
+            scene: this.scene,
+            source: this.snapshot.source
+        });
+        window.roomSnapshot = snapshotToBase64(buffer);
+        console.log(`Baked ${room} snapshot: ${(buffer.byteLength / 1024).toFixed(0)} KiB`);
+    }
+
+    // Batch static, non-interactive meshes to cut draw calls. Call once the room is built.
+    // Meshes sharing geometry + material become one InstancedMesh; the remaining meshes
+    // that share a material are merged into a single BufferGeometry.
+    // Interactables, the door, visibility zone contents and anything in options.exclude
+    // (or flagged userData.dynamic) are left untouched, including their children.
+    optimizeStatic(options = {}) {
+        const minBatch = options.minBatch ?? 2;
+        const excluded = new Set([...this.interactables, ...this.zones.objects, ...(options.exclude || [])]);
+        if (this.doorPivot) excluded.add(this.doorPivot);
+
+        this.scene.updateMatrixWorld(true);
+        // Batch with authored shadows; the tier's small-prop setting is re-applied at the end
+        this.quality.resetSmallProps();
+        const meshesBefore = this._countMeshes();
+        const drawCallsBefore = this._measureDrawCalls();
+
+        // Collect candidates, skipping excluded subtrees entirely
+        const candidates = [];
+        const visit = (obj) => {
+            if (excluded.has(obj) || obj.userData.dynamic || !obj.visible) return;
+            if (this._isStaticBatchable(obj)) candidates.push(obj);
+            obj.children.forEach(visit);
+        };
+        this.scene.children.forEach(visit);
+
+        // Small props only batch with each other, so low tiers can still drop their shadows
+        const shadowKey = (mesh) =>
+            `${mesh.castShadow ? 1 : 0}${mesh.receiveShadow ? 1 : 0}${mesh.castShadow && isSmallProp(mesh) ? 1 : 0}`;
+        const groupBy = (meshes, keyFn) => {
+            const groups = new Map();
+            meshes.forEach(mesh => {
+                const key = keyFn(mesh);
+                if (!groups.has(key)) groups.set(key, []);
+                groups.get(key).push(mesh);
+            });
+            return groups;
+        };
+
+        const removed = [];
+        const leftovers = [];
+        let instancedBatches = 0;
+        let mergedBatches = 0;
+
+        // Pass 1: identical geometry + material -> InstancedMesh
+        groupBy(candidates, m => `${m.geometry.uuid}|${m.material.uuid}|${shadowKey(m)}`).forEach(meshes => {
+            if (meshes.length < minBatch) {
+                leftovers.push(...meshes);
+                return;
+            }
+            const batch = new THREE.InstancedMesh(meshes[0].geometry, meshes[0].material, meshes.length);
+            meshes.forEach((mesh, i) => batch.setMatrixAt(i, mesh.matrixWorld));
+            batch.instanceMatrix.needsUpdate = true;
+            batch.computeBoundingSphere();
+            this._addStaticBatch(batch, meshes[0]);
+            removed.push(...meshes);
+            instancedBatches++;
+        });
+
+        // Pass 2: same material, different geometry -> one merged geometry in world space
+        groupBy(leftovers, m => `${m.material.uuid}|${shadowKey(m)}`).forEach(meshes => {
+            if (meshes.length < minBatch) return;
+            const parts = meshes.map(mesh => mesh.geometry.clone().applyMatrix4(mesh.matrixWorld));
+            const merged = mergeGeometries(parts, false);
+            parts.forEach(part => part.dispose());
+            if (!merged) return; // Incompatible attributes - leave these meshes as they are
+
+            this._addStaticBatch(new THREE.Mesh(merged, meshes[0].material), meshes[0]);
+            removed.push(...meshes);
+            mergedBatches++;
+        });
+
+        removed.forEach(mesh => mesh.removeFromParent());
+
+        // Free GPU buffers that no longer back any mesh in the scene. Cached (shared)
+        // geometries stay in resourceCache.js until disposeResourceCache().
+        const inUse = new Set();
+        this.scene.traverse(obj => { if (obj.geometry) inUse.add(obj.geometry); });
+        new Set(removed.map(mesh => mesh.geometry)).forEach(geo => {
+            if (!inUse.has(geo) && !geo.userData.sharedResource) geo.dispose();
+        });
+
+        // Batches replaced their meshes: re-apply small-prop shadows and re-bake the shadow map
+        this.quality.refreshSmallProps();
+
+        this.staticStats = {
+            meshesBefore,
+            meshesAfter: this._countMeshes(),
+            drawCallsBefore,
+            drawCallsAfter: this._measureDrawCalls(),
+            instancedBatches,
+            mergedBatches
+        };
+        console.log(`optimizeStatic: ${this.staticStats.drawCallsBefore} -> ${this.staticStats.drawCallsAfter} draw calls ` +
+            `(${instancedBatches} instanced, ${mergedBatches} merged batches)`);
+        return this.staticStats;
+    }
+
+    _isStaticBatchable(obj) {
+        if (!obj.isMesh || obj.isInstancedMesh || obj.isSkinnedMesh) return false;
+        // Named meshes and meshes carrying userData may be looked up or toggled later
+        if (obj.name || Object.keys(obj.userData).length > 0) return false;
+        if (obj.children.length > 0 || Array.isArray(obj.material)) return false;
+        // Transparent meshes rely on per-object depth sorting
+        return obj.material.visible && !obj.material.transparent;
+    }
+
+    _addStaticBatch(batch, template) {
+        batch.name = 'static_batch';
+        batch.castShadow = template.castShadow;
+        batch.receiveShadow = template.receiveShadow;
+        batch.userData.smallProp = template.castShadow && isSmallProp(template);
+        batch.matrixAutoUpdate = false;
+        batch.updateMatrix();
+        this.scene.add(batch);
+    }
+
+    _countMeshes() {
+        let count = 0;
+        this.scene.traverseVisible(obj => { if (obj.isMesh) count++; });
+        return count;
+    }
+
+    _measureDrawCalls() {
+        this.renderer.render(this.scene, this.camera);
+        return this.renderer.info.render.calls;
+    }
+
+    // Debug counter for the shared geometry/material cache (unique vs requested)
+    get resourceStats() {
+        return getResourceStats();
+    }
+
     start() {
+        this.running = true;
+        this.quality.apply();
+        this.beacon.start();
+        this.requestRender();
         this.animate();
     }
 
     stop() {
+        this.running = false;
         if (this.animationId) {
             cancelAnimationFrame(this.animationId);
             this.animationId = null;
         }
     }
+
+    // Tear the room down without a page reload: stop the loop, detach every
+    // listener and free all GPU resources. Dispatches 'dispose' first so room
+    // modules can remove their own listeners.
+    dispose() {
+        if (this.disposed) return;
+        this.dispatchEvent({ type: 'dispose' });
+        this.stop();
+
+        this._listeners.forEach(({ target, type, handler, options }) => {
+            target.removeEventListener(type, handler, options);
+        });
+        this._listeners.length = 0;
+
+        if (this.pointer) {
+            this.pointer.dispose();
+            this.pointer = null;
+        }
+        if (this.touchControls) {
+            this.touchControls.dispose();
+            this.touchControls = null;
+        }
+        this.animations.clear();
+        this.perf.dispose();
+        this.beacon.dispose(); // Before the renderer goes: the last report reads renderer.info
+        this.showLoadProgress(1, 1);
+
+        this.scene.traverse(obj => {
+            if (obj.isLight && obj.shadow) obj.shadow.dispose();
+        });
+        disposeObject(this.scene);
+        disposeResourceCache();
+        if (this.timerDisplay) {
+            this.timerDisplay.dispose();
+            this.timerDisplay = null;
+        }
+        this.scene.clear();
+        this.zones.clear();
+        this.interactables.length = 0;
+        this.pickIndex.invalidate();
+
+        this.renderer.dispose();
+        this.renderer.domElement.remove();
+        this.disposed = true;
+    }
+
+    // Debug check run before each interaction: a swap that never frees its predecessor
+    // shows up as geometry/texture counts rising interaction after interaction
+    _checkResourceGrowth() {
+        if (!this.debugResources) return;
+        const { geometries, textures } = this.renderer.info.memory;
+        const total = geometries + textures;
+        this._resourceGrowthStreak = total > this._lastResourceTotal ? this._resourceGrowthStreak + 1 : 0;
+        this._lastResourceTotal = total;
+        if (this._resourceGrowthStreak >= RESOURCE_GROWTH_LIMIT) {
+            this.resourceLeakWarnings++;
+            console.assert(false, `GPU resources grew across ${this._resourceGrowthStreak} interactions ` +
+                `(${geometries} geometries, ${textures} textures) - possible leak`);
+        }
+    }
 }
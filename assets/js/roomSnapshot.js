@@ -0,0 +1,373 @@
+/**
+ * roomSnapshot.js
+ * Baked room snapshots: a fully built room serialized to one binary file so
+ * a page load can skip the procedural generators.
+ *
+ * File layout (little endian):
+ *   [0]  uint32 magic 'ERSN'
+ *   [4]  uint32 format version (SNAPSHOT_FORMAT)
+ *   [8]  uint32 byte length of the JSON header
+ *   [12] JSON header, UTF-8, padded with spaces to a multiple of 4
+ *        then every geometry buffer back to back, each 4-byte aligned
+ *
+ * The header holds the buffer table, geometries (attributes point into the
+ * buffer table), materials/textures/images in three's own JSON format, a
+ * flat node list (parent index, transform, geometry/material indices,
+ * userData) and the interactables and named refs as node indices. Object
+ * references inside userData (drawers, shelfRows, drawerGroup) are stored as
+ * {"$ref": nodeIndex}. Geometries and materials shared between meshes stay
+ * shared after loading.
+ *
+ * Snapshots are written by bake_rooms.py (see GEMINI.md); rooms without one
+ * are built procedurally as before.
+ */
+
+import * as THREE from 'three';
+
+export const SNAPSHOT_FORMAT = 1;
+const MAGIC = 0x4e535245; // 'ERSN'
+const HEADER_BYTES = 12;
+
+const ARRAY_TYPES = {
+    Float32Array, Uint32Array, Uint16Array, Uint8Array, Int32Array, Int16Array, Int8Array
+};
+
+const LIGHT_PROPS = ['intensity', 'distance', 'decay', 'angle', 'penumbra'];
+
+/**
+ * URL of a room's baked snapshot.
+ * @param {string} room - e.g. 'office'
+ * @returns {string}
+ */
+export function snapshotUrl(room) {
+    return `assets/snapshots/${room}.bin`;
+}
+
+/**
+ * Decide whether a room loads, skips or bakes its snapshot.
+ * ?bake[=<source hash>] builds procedurally and exposes the snapshot for
+ * bake_rooms.py; ?snapshot=0 (or config.snapshot === false) always builds
+ * procedurally.
+ * @param {boolean|undefined} configured
+ * @returns {{mode: 'load'|'off'|'bake', source: string}}
+ */
+export function resolveSnapshotMode(configured) {
+    const params = new URLSearchParams(window.location.search);
+    if (params.has('bake')) return { mode: 'bake', source: params.get('bake') };
+    const fromUrl = params.get('snapshot');
+    const off = fromUrl === '0' || fromUrl === 'false' || (fromUrl === null && configured === false);
+    return { mode: off ? 'off' : 'load', source: '' };
+}
+
+/**
+ * Base64 of a snapshot, for handing it to Playwright via page.evaluate().
+ * @param {ArrayBuffer} buffer
+ * @returns {string}
+ */
+export function snapshotToBase64(buffer) {
+    const bytes = new Uint8Array(buffer);
+    let binary = '';
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    return btoa(binary);
+}
+
+// --- Writing ---
+
+/**
+ * Serialize objects (and everything below them) to a snapshot.
+ * @param {Object} options
+ * @param {string} options.room
+ * @param {THREE.Object3D[]} options.objects - Top-level room objects (children of the scene)
+ * @param {THREE.Object3D[]} options.interactables - Must all be inside `objects`
+ * @param {Object<string, THREE.Object3D>} [options.refs] - Named objects the room code needs back
+ * @param {THREE.Scene} [options.scene] - Source of background colour and fog
+ * @param {string} [options.source] - Hash of the generator sources, checked by bake_rooms.py --check
+ * @returns {ArrayBuffer}
+ */
+export function serializeRoom({ room, objects, interactables, refs = {}, scene = null, source = '' }) {
+    const nodes = [];
+    const nodeIndex = new Map();
+    const geometries = [];
+    const geometryIndex = new Map();
+    const materials = [];
+    const materialIndex = new Map();
+    const buffers = [];
+    const chunks = [];
+    let binLength = 0;
+    const meta = { textures: {}, images: {} };
+
+    const addBuffer = (array) => {
+        const bytes = new Uint8Array(array.buffer, array.byteOffset, array.byteLength);
+        buffers.push({ type: array.constructor.name, byteOffset: binLength, length: array.length });
+        chunks.push({ offset: binLength, bytes });
+        binLength += Math.ceil(bytes.byteLength / 4) * 4;
+        return buffers.length - 1;
+    };
+
+    const addGeometry = (geometry) => {
+        if (geometryIndex.has(geometry)) return geometryIndex.get(geometry);
+        const json = { attributes: {}, index: null, groups: geometry.groups.map(g => ({ ...g })) };
+        Object.entries(geometry.attributes).forEach(([name, attribute]) => {
+            if (attribute.isInterleavedBufferAttribute) {
+                throw new Error(`Interleaved attribute "${name}" is not supported in snapshots`);
+            }
+            json.attributes[name] = {
+                buffer: addBuffer(attribute.array),
+                itemSize: attribute.itemSize,
+                normalized: attribute.normalized
+            };
+        });
+        if (geometry.index) json.index = addBuffer(geometry.index.array);
+        geometries.push(json);
+        geometryIndex.set(geometry, geometries.length - 1);
+        return geometries.length - 1;
+    };
+
+    const addMaterial = (material) => {
+        if (!materialIndex.has(material)) {
+            // three's own format; textures/images land in meta and are written once
+            const json = material.toJSON(meta);
+            delete json.metadata;
+            delete json.userData;
+            materials.push(json);
+            materialIndex.set(material, materials.length - 1);
+        }
+        return materialIndex.get(material);
+    };
+
+    // Pass 1: number every node so userData can reference any of them
+    const collect = (obj) => {
+        nodeIndex.set(obj, nodes.length);
+        nodes.push(null);
+        obj.children.forEach(collect);
+    };
+    objects.forEach(collect);
+
+    const encodeValue = (value) => {
+        if (value && value.isObject3D) {
+            if (!nodeIndex.has(value)) throw new Error(`userData references "${value.name}" outside the snapshot`);
+            return { $ref: nodeIndex.get(value) };
+        }
+        if (Array.isArray(value)) return value.map(encodeValue);
+        if (value && typeof value === 'object') {
+            const out = {};
+            Object.entries(value).forEach(([key, v]) => { out[key] = encodeValue(v); });
+            return out;
+        }
+        return typeof value === 'function' ? undefined : value;
+    };
+
+    // Pass 2: describe each node
+    nodeIndex.forEach((i, obj) => {
+        const node = {
+            type: nodeType(obj),
+            name: obj.name,
+            parent: obj.parent && nodeIndex.has(obj.parent) ? nodeIndex.get(obj.parent) : -1,
+            position: obj.position.toArray(),
+            quaternion: obj.quaternion.toArray(),
+            scale: obj.scale.toArray()
+        };
+        if (!obj.visible) node.visible = false;
+        if (obj.castShadow) node.castShadow = true;
+        if (obj.receiveShadow) node.receiveShadow = true;
+        if (obj.renderOrder) node.renderOrder = obj.renderOrder;
+        if (!obj.frustumCulled) node.frustumCulled = false;
+        if (Object.keys(obj.userData).length > 0) node.userData = encodeValue(obj.userData);
+
+        if (obj.isMesh || obj.isLine || obj.isPoints) {
+            node.geometry = addGeometry(obj.geometry);
+            node.material = Array.isArray(obj.material)
+                ? obj.material.map(addMaterial)
+                : addMaterial(obj.material);
+            if (obj.isInstancedMesh) {
+                node.count = obj.count;
+                node.instanceMatrix = addBuffer(obj.instanceMatrix.array);
+            }
+        } else if (obj.isLight) {
+            node.color = obj.color.getHex();
+            if (obj.groundColor) node.groundColor = obj.groundColor.getHex();
+            LIGHT_PROPS.forEach(prop => { if (prop in obj) node[prop] = obj[prop]; });
+            if (obj.shadow) node.shadowMapSize = obj.shadow.mapSize.toArray();
+        }
+        nodes[i] = node;
+    });
+
+    const toIndex = (obj) => {
+        if (!nodeIndex.has(obj)) throw new Error(`"${obj.name}" is not part of the snapshot`);
+        return nodeIndex.get(obj);
+    };
+    const refIndices = {};
+    Object.entries(refs).forEach(([name, obj]) => { refIndices[name] = obj ? toIndex(obj) : -1; });
+
+    const header = {
+        room,
+        format: SNAPSHOT_FORMAT,
+        source,
+        background: scene && scene.background && scene.background.isColor ? scene.background.getHex() : null,
+        fog: scene && scene.fog && scene.fog.isFog
+            ? { color: scene.fog.color.getHex(), near: scene.fog.near, far: scene.fog.far }
+            : null,
+        buffers,
+        geometries,
+        materials,
+        textures: Object.values(meta.textures),
+        images: Object.values(meta.images),
+        nodes,
+        interactables: interactables.map(toIndex),
+        refs: refIndices
+    };
+
+    let json = new TextEncoder().encode(JSON.stringify(header));
+    const padded = Math.ceil(json.length / 4) * 4;
+    if (padded !== json.length) {
+        const withPadding = new Uint8Array(padded).fill(0x20);
+        withPadding.set(json);
+        json = withPadding;
+    }
+
+    const out = new Uint8Array(HEADER_BYTES + json.length + binLength);
+    const view = new DataView(out.buffer);
+    view.setUint32(0, MAGIC, true);
+    view.setUint32(4, SNAPSHOT_FORMAT, true);
+    view.setUint32(8, json.length, true);
+    out.set(json, HEADER_BYTES);
+    const binStart = HEADER_BYTES + json.length;
+    chunks.forEach(({ offset, bytes }) => out.set(bytes, binStart + offset));
+    return out.buffer;
+}
+
+// Constructor to rebuild obj with; helpers such as GridHelper come back as their base class
+function nodeType(obj) {
+    if (obj.isInstancedMesh) return 'InstancedMesh';
+    if (obj.isMesh) return 'Mesh';
+    if (obj.isLineSegments) return 'LineSegments';
+    if (obj.isLine) return 'Line';
+    if (obj.isPoints) return 'Points';
+    if (obj.isLight) return obj.type;
+    return obj.isGroup ? 'Group' : 'Object3D';
+}
+
+// --- Reading ---
+
+/**
+ * Parse a snapshot file back into objects.
+ * @param {ArrayBuffer} buffer
+ * @returns {Promise<{header: Object, objects: THREE.Object3D[], interactables: THREE.Object3D[],
+ *   refs: Object<string, THREE.Object3D|null>}>}
+ */
+export async function parseRoomSnapshot(buffer) {
+    const view = new DataView(buffer);
+    if (buffer.byteLength < HEADER_BYTES || view.getUint32(0, true) !== MAGIC) {
+        throw new Error('Not a room snapshot');
+    }
+    const format = view.getUint32(4, true);
+    if (format !== SNAPSHOT_FORMAT) throw new Error(`Unsupported snapshot format ${format}`);
+
+    const jsonLength = view.getUint32(8, true);
+    const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, HEADER_BYTES, jsonLength)));
+    const binStart = HEADER_BYTES + jsonLength;
+
+    // Views straight into the file - no copies
+    const arrays = header.buffers.map(({ type, byteOffset, length }) =>
+        new ARRAY_TYPES[type](buffer, binStart + byteOffset, length));
+
+    const geometries = header.geometries.map(json => {
+        const geometry = new THREE.BufferGeometry();
+        Object.entries(json.attributes).forEach(([name, attr]) => {
+            geometry.setAttribute(name, new THREE.BufferAttribute(arrays[attr.buffer], attr.itemSize, attr.normalized));
+        });
+        if (json.index !== null) geometry.setIndex(new THREE.BufferAttribute(arrays[json.index], 1));
+        json.groups.forEach(g => geometry.addGroup(g.start, g.count, g.materialIndex));
+        geometry.computeBoundingSphere();
+        return geometry;
+    });
+
+    const loader = new THREE.ObjectLoader();
+    const images = await loader.parseImagesAsync(header.images);
+    const textures = loader.parseTextures(header.textures, images);
+    const materialsByUuid = loader.parseMaterials(header.materials, textures);
+    const materials = header.materials.map(json => materialsByUuid[json.uuid]);
+
+    const decodeValue = (value, objects) => {
+        if (Array.isArray(value)) return value.map(v => decodeValue(v, objects));
+        if (value && typeof value === 'object') {
+            if ('$ref' in value) return objects[value.$ref];
+            const out = {};
+            Object.entries(value).forEach(([key, v]) => { out[key] = decodeValue(v, objects); });
+            return out;
+        }
+        return value;
+    };
+
+    const objects = header.nodes.map(node => createNode(node, geometries, materials, arrays));
+    header.nodes.forEach((node, i) => {
+        const obj = objects[i];
+        if (node.parent >= 0) objects[node.parent].add(obj);
+        if (node.userData) obj.userData = decodeValue(node.userData, objects);
+    });
+
+    const refs = {};
+    Object.entries(header.refs).forEach(([name, i]) => { refs[name] = i >= 0 ? objects[i] : null; });
+
+    return {
+        header,
+        objects: objects.filter((obj, i) => header.nodes[i].parent < 0),
+        interactables: header.interactables.map(i => objects[i]),
+        refs
+    };
+}
+
+function createNode(node, geometries, materials, arrays) {
+    let obj;
+    const material = Array.isArray(node.material)
+        ? node.material.map(i => materials[i])
+        : materials[node.material];
+
+    switch (node.type) {
+        case 'Mesh':
+            obj = new THREE.Mesh(geometries[node.geometry], material);
+            break;
+        case 'InstancedMesh':
+            obj = new THREE.InstancedMesh(geometries[node.geometry], material, node.count);
+            obj.instanceMatrix.array.set(arrays[node.instanceMatrix]);
+            break;
+        case 'LineSegments':
+            obj = new THREE.LineSegments(geometries[node.geometry], material);
+            break;
+        case 'Line':
+            obj = new THREE.Line(geometries[node.geometry], material);
+            break;
+        case 'Points':
+            obj = new THREE.Points(geometries[node.geometry], material);
+            break;
+        case 'PointLight':
+        case 'SpotLight':
+        case 'DirectionalLight':
+        case 'AmbientLight':
+        case 'HemisphereLight':
+            obj = new THREE[node.type]();
+            obj.color.setHex(node.color);
+            if (obj.groundColor) obj.groundColor.setHex(node.groundColor);
+            LIGHT_PROPS.forEach(prop => { if (prop in node) obj[prop] = node[prop]; });
+            if (obj.shadow && node.shadowMapSize) obj.shadow.mapSize.fromArray(node.shadowMapSize);
+            break;
+        case 'Group':
+            obj = new THREE.Group();
+            break;
+        default:
+            obj = new THREE.Object3D();
+    }
+
+    obj.name = node.name;
+    obj.position.fromArray(node.position);
+    obj.quaternion.fromArray(node.quaternion);
+    obj.scale.fromArray(node.scale);
+    obj.visible = node.visible !== false;
+    obj.castShadow = node.castShadow === true;
+    obj.receiveShadow = node.receiveShadow === true;
+    obj.renderOrder = node.renderOrder || 0;
+    obj.frustumCulled = node.frustumCulled !== false;
+    return obj;
+}
@@ -0,0 +1,128 @@
+/**
+ * sceneBuilder.js
+ * Time-sliced, progressive scene construction.
+ * A room builds its shell (floor, walls, door, timer) synchronously, queues
+ * furniture and props here as labelled chunks, starts the engine and then
+ * calls start(). Chunks run in idle time a few milliseconds at a time -
+ * critical (gameplay) chunks first, then the rest, each time picking the
+ * chunk nearest the camera - so the first frame is drawn before the room is
+ * full. Interaction stays locked only until the critical chunks are built.
+ *
+ *   builder.ready - resolves once every critical chunk has been built
+ *   builder.done  - resolves once every chunk has been built
+ *
+ * Tiers with baked shadows only re-render the shadow map when asked, so every
+ * slice invalidates it, and small-prop shadows are re-applied once building ends.
+ */
+
+const SLICE_BUDGET_MS = 8;     // Build time per slice; leaves room for the frame itself
+const IDLE_TIMEOUT_MS = 50;    // Run a slice at least this often even when the page is never idle
+
+// requestIdleCallback is missing in Safari; fall back to one slice per animation frame
+const scheduleSlice = typeof requestIdleCallback === 'function'
+    ? (fn) => requestIdleCallback(fn, { timeout: IDLE_TIMEOUT_MS })
+    : (fn) => requestAnimationFrame(() => fn(null));
+
+export class SceneBuilder {
+    /**
+     * @param {RoomEngine} engine
+     * @param {Object} [options]
+     * @param {Function} [options.onProgress] - Called with (built, total) after each slice;
+     *   defaults to engine.showLoadProgress
+     */
+    constructor(engine, { onProgress = null } = {}) {
+        this.engine = engine;
+        this.onProgress = onProgress || ((built, total) => engine.showLoadProgress(built, total));
+        this.tasks = [];   // Pending {label, x, z, build, critical}
+        this.built = 0;
+        this.total = 0;
+        this.started = false;
+
+        this.ready = new Promise(resolve => { this._resolveReady = resolve; });
+        this.done = new Promise(resolve => { this._resolveDone = resolve; });
+    }
+
+    get criticalRemaining() {
+        return this.tasks.reduce((count, task) => count + (task.critical ? 1 : 0), 0);
+    }
+
+    /**
+     * Queue a chunk of scene construction.
+     * @param {string} label - Shown in errors
+     * @param {number[]} position - [x, z] of the chunk, for nearest-first ordering
+     * @param {Function} build - Adds the chunk's objects to the scene
+     * @param {Object} [options]
+     * @param {boolean} [options.critical=false] - Registers interactables the game needs;
+     *   interaction is locked until every critical chunk is built
+     */
+    add(label, [x, z], build, { critical = false } = {}) {
+        this.tasks.push({ label, x, z, build, critical });
+        this.total++;
+    }
+
+    // Begin building queued chunks; call after engine.start() so the shell is already on screen
+    start() {
+        if (this.started) return;
+        this.started = true;
+        this.engine.loading = true;
+        if (this.criticalRemaining > 0) this.engine.interactionLocked = true;
+        this._checkMilestones();
+        if (this.tasks.length > 0) scheduleSlice((deadline) => this._runSlice(deadline));
+    }
+
+    _runSlice(deadline) {
+        if (this.engine.disposed) return;
+
+        const sliceStart = performance.now();
+        const hasTime = () => deadline && !deadline.didTimeout
+            ? deadline.timeRemaining() > 1
+            : performance.now() - sliceStart < SLICE_BUDGET_MS;
+
+        // Always build at least one chunk so a busy page still makes progress
+        do {
+            const task = this._takeNext();
+            try {
+                task.build();
+            } catch (error) {
+                console.error(`Scene chunk "${task.label}" failed:`, error);
+            }
+            this.built++;
+        } while (this.tasks.length > 0 && hasTime());
+
+        this.engine.quality.invalidateShadows(); // Baked shadow maps must include the new objects
+        this.engine.requestRender();
+        this.onProgress(this.built, this.total);
+        this._checkMilestones();
+
+        if (this.tasks.length > 0) scheduleSlice((next) => this._runSlice(next));
+    }
+
+    // Nearest chunk to the camera, critical chunks before the rest
+    _takeNext() {
+        const critical = this.criticalRemaining > 0;
+        const { x: camX, z: camZ } = this.engine.camera.position;
+        let best = -1;
+        let bestDist = Infinity;
+        this.tasks.forEach((task, i) => {
+            if (task.critical !== critical) return;
+            const dist = (task.x - camX) ** 2 + (task.z - camZ) ** 2;
+            if (dist < bestDist) {
+                bestDist = dist;
+                best = i;
+            }
+        });
+        return this.tasks.splice(best, 1)[0];
+    }
+
+    _checkMilestones() {
+        if (this.criticalRemaining === 0) {
+            this.engine.interactionLocked = false;
+            this._resolveReady();
+        }
+        if (this.tasks.length === 0) {
+            this.engine.loading = false;
+            this.engine.quality.refreshSmallProps(); // Also re-bakes the shadow map
+            this._resolveDone();
+        }
+    }
+}
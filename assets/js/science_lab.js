@@ -11,8 +11,9 @@ import { RoomEngine } from './roomEngine.js';
 import { showModal, closeModal, initInventoryUI, isInteracting } from './ui.js';
 import { WALL_HEIGHT, CAMERA_HEIGHT } from './constants.js';
 import * as LabPrefabs from './lab_prefabs.js';
-import * as Prefabs from './prefabs.js';
+import * as Prefabs from './commonPrefabs.js';
 import { addItem, removeItem, getSelectedItem, hasItem, selectSlot, inventory } from './inventory.js';
+import { SceneBuilder } from './sceneBuilder.js';
 
 // Room Configuration
 const LAB_WIDTH = 12;
@@ -85,8 +86,9 @@ const materials = {
     cabinetWhite: new THREE.MeshStandardMaterial({ color: 0xfafafa, roughness: 0.5 })
 };
 
-// Build the science lab scene
-async function buildLabScene(engine) {
+// Build the science lab scene: the room shell is added immediately, equipment is
+// queued on the builder. Resolves once the puzzle (critical) chunks are built.
+async function buildLabScene(engine, builder) {
     const scene = engine.scene;
     const halfWidth = LAB_WIDTH / 2;
     const halfDepth = LAB_DEPTH / 2;
@@ -121,6 +123,15 @@ async function buildLabScene(engine) {
     // Ceiling lights (fluorescent panels)
     createCeilingLights(scene, LAB_WIDTH, LAB_DEPTH);
 
+    // Custom lab lighting
+    const labLight1 = new THREE.PointLight(0x00ffff, 0.3, 15);
+    labLight1.position.set(-3, 2.5, -3);
+    scene.add(labLight1);
+
+    const labLight2 = new THREE.PointLight(0x00ffff, 0.3, 15);
+    labLight2.position.set(3, 2.5, 3);
+    scene.add(labLight2);
+
     // Walls
     // North wall (Z = -halfDepth) - With door opening
     const doorW = 1.2;
@@ -185,228 +196,275 @@ async function buildLabScene(engine) {
     westWall.receiveShadow = true;
     scene.add(westWall);
 
-    // ===== LAB EQUIPMENT & FURNITURE =====
+    // ===== LAB EQUIPMENT & FURNITURE (built progressively, nearest first) =====
+    // Objects the puzzles need are kept in outer variables for handleLabInteraction
+    let bunsenBurner = null;
+    let mixingBeaker = null;
+    let greenChemical = null;
+    let redChemical = null;
+    let blueChemical = null;
+    let yellowChemical = null;
+    let labFridge = null;
 
     // --- CENTRAL WORKBENCH (Island) ---
-    const centerTable = LabPrefabs.createLabTable(3.0, 1.5);
-    centerTable.position.set(0, 0, 0);
-    centerTable.name = "center_workbench";
-    scene.add(centerTable);
-
-    // Bunsen Burner on center table
-    const bunsenBurner = LabPrefabs.createBunsenBurner();
-    bunsenBurner.position.set(-0.5, LAB_TABLE_HEIGHT, 0);
-    bunsenBurner.name = "bunsen_burner";
-    engine.interactables.push(bunsenBurner);
-    scene.add(bunsenBurner);
-
-    // Mixing Beaker (empty) on center table
-    const mixingBeaker = LabPrefabs.createMixingBeaker();
-    mixingBeaker.position.set(0.3, LAB_TABLE_HEIGHT, 0);
-    mixingBeaker.name = "mixing_beaker";
-    engine.interactables.push(mixingBeaker);
-    scene.add(mixingBeaker);
-
-    // Test tube rack on center table
-    const testTubeRack = LabPrefabs.createTestTubeRack();
-    testTubeRack.position.set(0.8, LAB_TABLE_HEIGHT, -0.3);
-    testTubeRack.name = "test_tube_rack";
-    engine.interactables.push(testTubeRack);
-    scene.add(testTubeRack);
-
-    // Lab notebook on center table
-    const labNotebook = LabPrefabs.createLabNotebook();
-    labNotebook.position.set(-0.8, LAB_TABLE_HEIGHT, 0.4);
-    labNotebook.name = "lab_notebook";
-    engine.interactables.push(labNotebook);
-    scene.add(labNotebook);
+    builder.add('center_workbench', [0, 0], () => {
+        const centerTable = LabPrefabs.createLabTable(3.0, 1.5);
+        centerTable.position.set(0, 0, 0);
+        centerTable.name = "center_workbench";
+        scene.add(centerTable);
+
+        // Bunsen Burner on center table
+        bunsenBurner = LabPrefabs.createBunsenBurner();
+        bunsenBurner.position.set(-0.5, LAB_TABLE_HEIGHT, 0);
+        bunsenBurner.name = "bunsen_burner";
+        engine.interactables.push(bunsenBurner);
+        scene.add(bunsenBurner);
+
+        // Mixing Beaker (empty) on center table
+        mixingBeaker = LabPrefabs.createMixingBeaker();
+        mixingBeaker.position.set(0.3, LAB_TABLE_HEIGHT, 0);
+        mixingBeaker.name = "mixing_beaker";
+        engine.interactables.push(mixingBeaker);
+        scene.add(mixingBeaker);
+
+        // Test tube rack on center table
+        const testTubeRack = LabPrefabs.createTestTubeRack();
+        testTubeRack.position.set(0.8, LAB_TABLE_HEIGHT, -0.3);
+        testTubeRack.name = "test_tube_rack";
+        engine.interactables.push(testTubeRack);
+        scene.add(testTubeRack);
+
+        // Lab notebook on center table
+        const labNotebook = LabPrefabs.createLabNotebook();
+        labNotebook.position.set(-0.8, LAB_TABLE_HEIGHT, 0.4);
+        labNotebook.name = "lab_notebook";
+        engine.interactables.push(labNotebook);
+        scene.add(labNotebook);
+    }, { critical: true });
 
     // --- FUME HOOD (North wall, left of door) ---
-    const fumeHood = LabPrefabs.createFumeHood();
-    fumeHood.position.set(-halfWidth + 2, 0, -halfDepth + 0.8);
-    fumeHood.name = "fume_hood";
-    engine.interactables.push(fumeHood);
-    scene.add(fumeHood);
-
-    // Green chemical inside fume hood
-    const greenChemical = LabPrefabs.createChemicalFlask('green');
-    greenChemical.position.set(-halfWidth + 2, 1.1, -halfDepth + 0.9);
-    greenChemical.name = "chemical_green";
-    engine.interactables.push(greenChemical);
-    scene.add(greenChemical);
+    builder.add('fume_hood', [-halfWidth + 2, -halfDepth + 0.8], () => {
+        const fumeHood = LabPrefabs.createFumeHood();
+        fumeHood.position.set(-halfWidth + 2, 0, -halfDepth + 0.8);
+        fumeHood.name = "fume_hood";
+        engine.interactables.push(fumeHood);
+        scene.add(fumeHood);
+
+        // Green chemical inside fume hood
+        greenChemical = LabPrefabs.createChemicalFlask('green');
+        greenChemical.position.set(-halfWidth + 2, 1.1, -halfDepth + 0.9);
+        greenChemical.name = "chemical_green";
+        engine.interactables.push(greenChemical);
+        scene.add(greenChemical);
+    }, { critical: true });
 
     // --- MICROSCOPE STATION (East wall) ---
-    const microscopeTable = LabPrefabs.createLabTable(1.5, 0.8);
-    microscopeTable.position.set(halfWidth - 0.6, 0, -2);
-    microscopeTable.rotation.y = -Math.PI / 2;
-    scene.add(microscopeTable);
-
-    const microscope = LabPrefabs.createMicroscope();
-    microscope.position.set(halfWidth - 0.6, LAB_TABLE_HEIGHT, -2);
-    microscope.rotation.y = -Math.PI / 2;
-    microscope.name = "microscope";
-    engine.interactables.push(microscope);
-    scene.add(microscope);
-
-    // Petri dishes near microscope
-    const petriDish1 = LabPrefabs.createPetriDish();
-    petriDish1.position.set(halfWidth - 0.6, LAB_TABLE_HEIGHT, -1.5);
-    petriDish1.name = "petri_dish";
-    engine.interactables.push(petriDish1);
-    scene.add(petriDish1);
+    builder.add('microscope_station', [halfWidth - 0.6, -2], () => {
+        const microscopeTable = LabPrefabs.createLabTable(1.5, 0.8);
+        microscopeTable.position.set(halfWidth - 0.6, 0, -2);
+        microscopeTable.rotation.y = -Math.PI / 2;
+        scene.add(microscopeTable);
+
+        const microscope = LabPrefabs.createMicroscope();
+        microscope.position.set(halfWidth - 0.6, LAB_TABLE_HEIGHT, -2);
+        microscope.rotation.y = -Math.PI / 2;
+        microscope.name = "microscope";
+        engine.interactables.push(microscope);
+        scene.add(microscope);
+
+        // Petri dishes near microscope
+        const petriDish1 = LabPrefabs.createPetriDish();
+        petriDish1.position.set(halfWidth - 0.6, LAB_TABLE_HEIGHT, -1.5);
+        petriDish1.name = "petri_dish";
+        engine.interactables.push(petriDish1);
+        scene.add(petriDish1);
+    }, { critical: true });
 
     // --- CHEMICAL STORAGE (West wall) ---
-    const chemicalCabinet = LabPrefabs.createChemicalCabinet();
-    chemicalCabinet.position.set(-halfWidth + 0.4, 0, 0);
-    chemicalCabinet.rotation.y = Math.PI / 2;
-    chemicalCabinet.name = "chemical_cabinet";
-    engine.interactables.push(chemicalCabinet);
-    scene.add(chemicalCabinet);
-
-    // Red chemical on storage shelf
-    const redChemical = LabPrefabs.createChemicalFlask('red');
-    redChemical.position.set(-halfWidth + 0.5, 1.2, -0.3);
-    redChemical.name = "chemical_red";
-    engine.interactables.push(redChemical);
-    scene.add(redChemical);
-
-    // Blue chemical on storage shelf
-    const blueChemical = LabPrefabs.createChemicalFlask('blue');
-    blueChemical.position.set(-halfWidth + 0.5, 1.2, 0.3);
-    blueChemical.name = "chemical_blue";
-    engine.interactables.push(blueChemical);
-    scene.add(blueChemical);
+    builder.add('chemical_storage', [-halfWidth + 0.4, 0], () => {
+        const chemicalCabinet = LabPrefabs.createChemicalCabinet();
+        chemicalCabinet.position.set(-halfWidth + 0.4, 0, 0);
+        chemicalCabinet.rotation.y = Math.PI / 2;
+        chemicalCabinet.name = "chemical_cabinet";
+        engine.interactables.push(chemicalCabinet);
+        scene.add(chemicalCabinet);
+
+        // Red chemical on storage shelf
+        redChemical = LabPrefabs.createChemicalFlask('red');
+        redChemical.position.set(-halfWidth + 0.5, 1.2, -0.3);
+        redChemical.name = "chemical_red";
+        engine.interactables.push(redChemical);
+        scene.add(redChemical);
+
+        // Blue chemical on storage shelf
+        blueChemical = LabPrefabs.createChemicalFlask('blue');
+        blueChemical.position.set(-halfWidth + 0.5, 1.2, 0.3);
+        blueChemical.name = "chemical_blue";
+        engine.interactables.push(blueChemical);
+        scene.add(blueChemical);
+    }, { critical: true });
 
     // --- REFRIGERATOR (West wall, south) ---
-    const labFridge = LabPrefabs.createLabFridge();
-    labFridge.position.set(-halfWidth + 0.5, 0, 3);
-    labFridge.rotation.y = Math.PI / 2;
-    labFridge.name = "lab_fridge";
-    engine.interactables.push(labFridge);
-    scene.add(labFridge);
-
-    // Yellow chemical inside fridge (hidden puzzle)
-    const yellowChemical = LabPrefabs.createChemicalFlask('yellow');
-    yellowChemical.position.set(-halfWidth + 0.6, 0.8, 3);
-    yellowChemical.name = "chemical_yellow";
-    yellowChemical.visible = false; // Hidden until fridge is opened
-    engine.interactables.push(yellowChemical);
-    scene.add(yellowChemical);
+    builder.add('lab_fridge', [-halfWidth + 0.5, 3], () => {
+        labFridge = LabPrefabs.createLabFridge();
+        labFridge.position.set(-halfWidth + 0.5, 0, 3);
+        labFridge.rotation.y = Math.PI / 2;
+        labFridge.name = "lab_fridge";
+        engine.interactables.push(labFridge);
+        scene.add(labFridge);
+
+        // Yellow chemical inside fridge (hidden puzzle)
+        yellowChemical = LabPrefabs.createChemicalFlask('yellow');
+        yellowChemical.position.set(-halfWidth + 0.6, 0.8, 3);
+        yellowChemical.name = "chemical_yellow";
+        yellowChemical.visible = false; // Hidden until fridge is opened
+        engine.interactables.push(yellowChemical);
+        scene.add(yellowChemical);
+    }, { critical: true });
 
     // --- COMPUTER WORKSTATION (East wall, south) ---
-    const computerDesk = LabPrefabs.createLabTable(1.5, 0.8);
-    computerDesk.position.set(halfWidth - 0.6, 0, 2);
-    computerDesk.rotation.y = -Math.PI / 2;
-    scene.add(computerDesk);
-
-    const labComputer = LabPrefabs.createLabComputer();
-    labComputer.position.set(halfWidth - 0.6, LAB_TABLE_HEIGHT, 2);
-    labComputer.rotation.y = -Math.PI / 2;
-    labComputer.name = "lab_computer";
-    engine.interactables.push(labComputer);
-    scene.add(labComputer);
+    builder.add('computer_workstation', [halfWidth - 0.6, 2], () => {
+        const computerDesk = LabPrefabs.createLabTable(1.5, 0.8);
+        computerDesk.position.set(halfWidth - 0.6, 0, 2);
+        computerDesk.rotation.y = -Math.PI / 2;
+        scene.add(computerDesk);
+
+        const labComputer = LabPrefabs.createLabComputer();
+        labComputer.position.set(halfWidth - 0.6, LAB_TABLE_HEIGHT, 2);
+        labComputer.rotation.y = -Math.PI / 2;
+        labComputer.name = "lab_computer";
+        engine.interactables.push(labComputer);
+        scene.add(labComputer);
+    }, { critical: true });
 
     // --- CENTRIFUGE (South wall) ---
-    const centrifuge = LabPrefabs.createCentrifuge();
-    centrifuge.position.set(2, LAB_TABLE_HEIGHT - 0.2, halfDepth - 1);
-    centrifuge.rotation.y = Math.PI;
-    centrifuge.name = "centrifuge";
-    engine.interactables.push(centrifuge);
-    scene.add(centrifuge);
+    builder.add('centrifuge', [2, halfDepth - 1], () => {
+        const centrifuge = LabPrefabs.createCentrifuge();
+        centrifuge.position.set(2, LAB_TABLE_HEIGHT - 0.2, halfDepth - 1);
+        centrifuge.rotation.y = Math.PI;
+        centrifuge.name = "centrifuge";
+        engine.interactables.push(centrifuge);
+        scene.add(centrifuge);
+    }, { critical: true });
 
     // Lab counter along south wall
-    const southCounter = LabPrefabs.createLabCounter(4, 0.6);
-    southCounter.position.set(0, 0, halfDepth - 0.5);
-    southCounter.rotation.y = Math.PI;
-    scene.add(southCounter);
+    builder.add('south_counter', [0, halfDepth - 0.5], () => {
+        const southCounter = LabPrefabs.createLabCounter(4, 0.6);
+        southCounter.position.set(0, 0, halfDepth - 0.5);
+        southCounter.rotation.y = Math.PI;
+        scene.add(southCounter);
+    });
 
     // --- SAFE (hidden behind equipment panel) ---
-    const safe = LabPrefabs.createLabSafe();
-    safe.position.set(halfWidth - 0.5, 0, -4);
-    safe.rotation.y = -Math.PI / 2;
-    safe.name = "lab_safe";
-    engine.interactables.push(safe);
-    scene.add(safe);
+    builder.add('lab_safe', [halfWidth - 0.5, -4], () => {
+        const safe = LabPrefabs.createLabSafe();
+        safe.position.set(halfWidth - 0.5, 0, -4);
+        safe.rotation.y = -Math.PI / 2;
+        safe.name = "lab_safe";
+        engine.interactables.push(safe);
+        scene.add(safe);
+    }, { critical: true });
 
     // --- BIOHAZARD CONTAINER ---
-    const biohazardBin = LabPrefabs.createBiohazardContainer();
-    biohazardBin.position.set(-2, 0, halfDepth - 1);
-    biohazardBin.name = "biohazard_bin";
-    engine.interactables.push(biohazardBin);
-    scene.add(biohazardBin);
+    builder.add('biohazard_bin', [-2, halfDepth - 1], () => {
+        const biohazardBin = LabPrefabs.createBiohazardContainer();
+        biohazardBin.position.set(-2, 0, halfDepth - 1);
+        biohazardBin.name = "biohazard_bin";
+        engine.interactables.push(biohazardBin);
+        scene.add(biohazardBin);
+    });
 
     // --- WHITEBOARD (East wall) ---
-    const whiteboard = LabPrefabs.createLabWhiteboard(2.5, 1.5);
-    whiteboard.position.set(halfWidth - 0.1, 1.8, 0);
-    whiteboard.rotation.y = -Math.PI / 2;
-    whiteboard.name = "whiteboard";
-    engine.interactables.push(whiteboard);
-    scene.add(whiteboard);
+    builder.add('whiteboard', [halfWidth - 0.1, 0], () => {
+        const whiteboard = LabPrefabs.createLabWhiteboard(2.5, 1.5);
+        whiteboard.position.set(halfWidth - 0.1, 1.8, 0);
+        whiteboard.rotation.y = -Math.PI / 2;
+        whiteboard.name = "whiteboard";
+        engine.interactables.push(whiteboard);
+        scene.add(whiteboard);
+    }, { critical: true });
 
     // --- EMERGENCY SHOWER (Northwest corner) ---
-    const emergencyShower = LabPrefabs.createEmergencyShower();
-    emergencyShower.position.set(-halfWidth + 0.5, 0, -halfDepth + 0.5);
-    emergencyShower.name = "emergency_shower";
-    engine.interactables.push(emergencyShower);
-    scene.add(emergencyShower);
+    builder.add('emergency_shower', [-halfWidth + 0.5, -halfDepth + 0.5], () => {
+        const emergencyShower = LabPrefabs.createEmergencyShower();
+        emergencyShower.position.set(-halfWidth + 0.5, 0, -halfDepth + 0.5);
+        emergencyShower.name = "emergency_shower";
+        engine.interactables.push(emergencyShower);
+        scene.add(emergencyShower);
+    });
 
     // --- EYE WASH STATION ---
-    const eyeWash = LabPrefabs.createEyeWashStation();
-    eyeWash.position.set(halfWidth - 0.5, 1.0, -halfDepth + 0.5);
-    eyeWash.rotation.y = Math.PI;
-    eyeWash.name = "eyewash_station";
-    engine.interactables.push(eyeWash);
-    scene.add(eyeWash);
+    builder.add('eyewash_station', [halfWidth - 0.5, -halfDepth + 0.5], () => {
+        const eyeWash = LabPrefabs.createEyeWashStation();
+        eyeWash.position.set(halfWidth - 0.5, 1.0, -halfDepth + 0.5);
+        eyeWash.rotation.y = Math.PI;
+        eyeWash.name = "eyewash_station";
+        engine.interactables.push(eyeWash);
+        scene.add(eyeWash);
+    });
 
     // --- FIRE EXTINGUISHER ---
-    const fireExtinguisher = Prefabs.createFireExtinguisher();
-    fireExtinguisher.position.set(halfWidth - 0.2, 1.2, halfDepth - 2);
-    fireExtinguisher.name = "fire_extinguisher";
-    engine.interactables.push(fireExtinguisher);
-    scene.add(fireExtinguisher);
+    builder.add('fire_extinguisher', [halfWidth - 0.2, halfDepth - 2], () => {
+        const fireExtinguisher = Prefabs.createFireExtinguisher();
+        fireExtinguisher.position.set(halfWidth - 0.2, 1.2, halfDepth - 2);
+        fireExtinguisher.name = "fire_extinguisher";
+        engine.interactables.push(fireExtinguisher);
+        scene.add(fireExtinguisher);
+    });
 
     // --- FIRST AID KIT ---
-    const firstAidKit = LabPrefabs.createFirstAidKit();
-    firstAidKit.position.set(-halfWidth + 0.15, 1.5, -2);
-    firstAidKit.rotation.y = Math.PI / 2;
-    firstAidKit.name = "first_aid_kit";
-    engine.interactables.push(firstAidKit);
-    scene.add(firstAidKit);
+    builder.add('first_aid_kit', [-halfWidth + 0.15, -2], () => {
+        const firstAidKit = LabPrefabs.createFirstAidKit();
+        firstAidKit.position.set(-halfWidth + 0.15, 1.5, -2);
+        firstAidKit.rotation.y = Math.PI / 2;
+        firstAidKit.name = "first_aid_kit";
+        engine.interactables.push(firstAidKit);
+        scene.add(firstAidKit);
+    });
 
     // --- LAB STOOL ---
-    const labStool1 = LabPrefabs.createLabStool();
-    labStool1.position.set(-1, 0, 1);
-    scene.add(labStool1);
-
-    const labStool2 = LabPrefabs.createLabStool();
-    labStool2.position.set(1, 0, 1);
-    scene.add(labStool2);
+    builder.add('lab_stools', [0, 1], () => {
+        const labStool1 = LabPrefabs.createLabStool();
+        labStool1.position.set(-1, 0, 1);
+        scene.add(labStool1);
+
+        const labStool2 = LabPrefabs.createLabStool();
+        labStool2.position.set(1, 0, 1);
+        scene.add(labStool2);
+    });
 
     // --- PERIODIC TABLE POSTER ---
-    const periodicTable = LabPrefabs.createPeriodicTablePoster();
-    periodicTable.position.set(2, 1.8, halfDepth - 0.1);
-    periodicTable.rotation.y = Math.PI;
-    periodicTable.name = "periodic_table";
-    engine.interactables.push(periodicTable);
-    scene.add(periodicTable);
+    builder.add('periodic_table', [2, halfDepth - 0.1], () => {
+        const periodicTable = LabPrefabs.createPeriodicTablePoster();
+        periodicTable.position.set(2, 1.8, halfDepth - 0.1);
+        periodicTable.rotation.y = Math.PI;
+        periodicTable.name = "periodic_table";
+        engine.interactables.push(periodicTable);
+        scene.add(periodicTable);
+    }, { critical: true });
 
     // --- SINK ---
-    const sink = LabPrefabs.createLabSink();
-    sink.position.set(-3, 0, halfDepth - 0.5);
-    sink.rotation.y = Math.PI;
-    sink.name = "lab_sink";
-    engine.interactables.push(sink);
-    scene.add(sink);
+    builder.add('lab_sink', [-3, halfDepth - 0.5], () => {
+        const sink = LabPrefabs.createLabSink();
+        sink.position.set(-3, 0, halfDepth - 0.5);
+        sink.rotation.y = Math.PI;
+        sink.name = "lab_sink";
+        engine.interactables.push(sink);
+        scene.add(sink);
+    });
 
     // --- HAZMAT SUIT (hint/decoration) ---
-    const hazmatSuit = LabPrefabs.createHazmatSuit();
-    hazmatSuit.position.set(-halfWidth + 0.3, 1.5, 5);
-    hazmatSuit.rotation.y = Math.PI / 2;
-    hazmatSuit.name = "hazmat_suit";
-    engine.interactables.push(hazmatSuit);
-    scene.add(hazmatSuit);
+    builder.add('hazmat_suit', [-halfWidth + 0.3, 5], () => {
+        const hazmatSuit = LabPrefabs.createHazmatSuit();
+        hazmatSuit.position.set(-halfWidth + 0.3, 1.5, 5);
+        hazmatSuit.rotation.y = Math.PI / 2;
+        hazmatSuit.name = "hazmat_suit";
+        engine.interactables.push(hazmatSuit);
+        scene.add(hazmatSuit);
+    });
 
-    console.log(`Lab scene loaded: ${engine.interactables.length} interactable objects`);
+    // Everything above is queued; wait until the puzzle objects exist
+    await builder.ready;
 
     return {
         engine,
@@ -1282,8 +1340,13 @@ async function initScienceLab() {
         }
     });
 
-    // Build the lab scene
-    labData = await buildLabScene(engine);
+    // Load the baked snapshot if there is one; otherwise build the shell now and
+    // queue equipment on the builder
+    const snapshot = await engine.loadSnapshot('science_lab');
+    const builder = new SceneBuilder(engine);
+    const sceneReady = snapshot
+        ? Promise.resolve({ engine, ...snapshot.refs })
+        : buildLabScene(engine, builder);
 
     // Create door and timer
     engine.createDoor();
@@ -1302,26 +1365,20 @@ async function initScienceLab() {
         maxZ: LAB_DEPTH/2 - 0.8
     };
 
-    // Add custom lab lighting
-    const labLight1 = new THREE.PointLight(0x00ffff, 0.3, 15);
-    labLight1.position.set(-3, 2.5, -3);
-    engine.scene.add(labLight1);
-
-    const labLight2 = new THREE.PointLight(0x00ffff, 0.3, 15);
-    labLight2.position.set(3, 2.5, 3);
-    engine.scene.add(labLight2);
-
     // Store engine reference for victory screen
     engineRef = engine;
 
-    // Start the engine
+    // Draw the shell straight away, then fill the lab in nearest-first during idle time
     engine.start();
+    builder.start();
 
-    // Check for time up every second
-    setInterval(checkTimeUp, 1000);
+    labData = await sceneReady;
+
+    // Show the time-up screen when the engine's countdown runs out
+    engine.addEventListener('timeup', checkTimeUp);
 
     // Setup keyboard shortcuts for inventory
-    document.addEventListener('keydown', (e) => {
+    const handleInventoryKey = (e) => {
         // Number keys 1-3 for inventory slots
         if (e.key >= '1' && e.key <= '3') {
             const slotIndex = parseInt(e.key) - 1;
@@ -1330,8 +1387,26 @@ async function initScienceLab() {
                 slots[slotIndex].click();
             }
         }
+    };
+    document.addEventListener('keydown', handleInventoryKey);
+    engine.addEventListener('dispose', () => {
+        document.removeEventListener('keydown', handleInventoryKey);
+        engine.removeEventListener('timeup', checkTimeUp);
     });
 
+    await builder.done;
+    console.log(`Lab scene loaded: ${engine.interactables.length} interactable objects`);
+    const { bunsenBurner, mixingBeaker, greenChemical, redChemical, blueChemical, yellowChemical, labFridge } = labData;
+    engine.bakeSnapshot('science_lab', {
+        bunsenBurner, mixingBeaker, greenChemical, redChemical, blueChemical, yellowChemical, labFridge
+    });
+
+    // Batch static meshes into instanced/merged draw calls
+    engine.optimizeStatic();
+
+    // Expose for debugging
+    window.engine = engine;
+
     // Debug access only in development (check for localhost or file://)
     if (typeof window !== 'undefined' &&
         (window.location.hostname === 'localhost' ||
@@ -0,0 +1,89 @@
+/**
+ * timerDisplay.js
+ * Countdown display texture for the door timer.
+ * The glowing digits are rendered once into a glyph atlas; each update
+ * only blits the glyphs for the new string, and the canvas is redrawn and
+ * re-uploaded only when the displayed text actually changes.
+ */
+
+import * as THREE from 'three';
+
+const GLYPHS = '0123456789:';
+const FONT = 'bold 120px "Courier New", monospace';
+const GLOW_COLOR = '#00ff00';
+const GLOW_BLUR = 20;
+const GLOW_PAD = GLOW_BLUR * 2; // Room around each glyph for the blur halo
+
+export class TimerDisplay {
+    constructor(width = 512, height = 256) {
+        this.canvas = document.createElement('canvas');
+        this.canvas.width = width;
+        this.canvas.height = height;
+        this.ctx = this.canvas.getContext('2d');
+        this.texture = new THREE.CanvasTexture(this.canvas);
+        this.text = null;
+
+        this._buildAtlas();
+    }
+
+    // Draw every glyph once, with the glow, into a single-row atlas
+    _buildAtlas() {
+        const measure = document.createElement('canvas').getContext('2d');
+        measure.font = FONT;
+        this.glyphWidth = Math.ceil(measure.measureText('0').width); // Monospace: all glyphs share a width
+
+        this.cellWidth = this.glyphWidth + GLOW_PAD * 2;
+        this.cellHeight = Math.min(this.canvas.height, 120 + GLOW_PAD * 2);
+
+        this.atlas = document.createElement('canvas');
+        this.atlas.width = this.cellWidth * GLYPHS.length;
+        this.atlas.height = this.cellHeight;
+
+        const ctx = this.atlas.getContext('2d');
+        ctx.font = FONT;
+        ctx.textAlign = 'center';
+        ctx.textBaseline = 'middle';
+        ctx.shadowColor = GLOW_COLOR;
+        ctx.shadowBlur = GLOW_BLUR;
+        ctx.fillStyle = GLOW_COLOR;
+
+        for (let i = 0; i < GLYPHS.length; i++) {
+            ctx.fillText(GLYPHS[i], i * this.cellWidth + this.cellWidth / 2, this.cellHeight / 2);
+        }
+    }
+
+    /**
+     * Show a new string (e.g. "09:59").
+     * @param {string} text
+     * @returns {boolean} True if the texture was redrawn
+     */
+    setText(text) {
+        if (text === this.text) return false;
+        this.text = text;
+
+        const { ctx, canvas } = this;
+        ctx.fillStyle = '#000000';
+        ctx.fillRect(0, 0, canvas.width, canvas.height);
+
+        const startX = (canvas.width - text.length * this.glyphWidth) / 2 - GLOW_PAD;
+        const y = (canvas.height - this.cellHeight) / 2;
+
+        for (let i = 0; i < text.length; i++) {
+            const index = GLYPHS.indexOf(text[i]);
+            if (index < 0) continue; // Unknown characters render as a gap
+            ctx.drawImage(
+                this.atlas,
+                index * this.cellWidth, 0, this.cellWidth, this.cellHeight,
+                startX + i * this.glyphWidth, y, this.cellWidth, this.cellHeight
+            );
+        }
+
+        this.texture.needsUpdate = true;
+        return true;
+    }
+
+    dispose() {
+        this.texture.dispose();
+        this.atlas = null;
+    }
+}
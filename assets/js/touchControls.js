@@ -1,6 +1,10 @@
 /**
  * Mobile Touch Controls for Escape Room
  * Provides virtual joystick, drag-to-look, and tap-to-interact functionality
+ *
+ * Touch pointers arrive from PointerInput (pointerDown/pointerMove/pointerUp),
+ * which listens passively. Move events only record the latest joystick
+ * position and accumulate look deltas; update() applies them once per frame.
  */
 
 export class TouchControls {
@@ -10,16 +14,20 @@ export class TouchControls {
     static LOOK_SENSITIVITY = 0.003;
     static TAP_THRESHOLD = 20;  // Increased from 10 to make tapping easier
 
-    // Read dimensional values from CSS custom properties
-    static getCSSValue(property) {
-        return parseInt(getComputedStyle(document.documentElement).getPropertyValue(property)) || 0;
-    }
-
-    constructor(camera, raycaster, interactables, onInteract) {
+    /**
+     * @param {THREE.Camera} camera
+     * @param {THREE.Raycaster} raycaster
+     * @param {THREE.Object3D[]} interactables
+     * @param {Function} onInteract - Called when an object is tapped
+     * @param {InteractableIndex} [pickIndex] - BVH shared with the engine
+     * @param {HTMLElement} [touchSurface] - The renderer's canvas; only touches that start on it steer
+     */
+    constructor(camera, raycaster, interactables, onInteract, pickIndex = null, touchSurface = null) {
         this.camera = camera;
         this.raycaster = raycaster;
         this.interactables = interactables;
         this.onInteract = onInteract; // Callback for when object is tapped
+        this.pickIndex = pickIndex; // Optional InteractableIndex (BVH) shared with the engine
 
         // Movement state (simulates WASD keys)
         this.moveState = {
@@ -32,33 +40,28 @@ export class TouchControls {
         // Camera look state - accumulates deltas
         this.lookDelta = { x: 0, y: 0 };
 
-        // Touch tracking
-        this.touches = new Map(); // Track multiple touches
-        this.joystickTouch = null; // Touch controlling joystick
-        this.lookTouch = null; // Touch controlling camera look
+        // Touch tracking (pointerId -> {x, y, startX, startY, maxDistance})
+        this.touches = new Map();
+        this.joystickTouch = null; // Pointer controlling joystick
+        this.lookTouch = null; // Pointer controlling camera look
 
-        // Joystick state
+        // Joystick state; joystickTarget is the latest finger position, applied by update()
         this.joystickActive = false;
         this.joystickCenter = { x: 0, y: 0 };
         this.joystickCurrent = { x: 0, y: 0 };
+        this.joystickTarget = null;
 
         // UI Elements
         this.joystickBase = null;
         this.joystickStick = null;
         this.interactButton = null;
 
-        // Dimensional values from CSS
-        this.joystickSize = 0;
-        this.joystickStickSize = 0;
-        this.centerOffset = 0;
+        // Only touches that start on the game canvas steer (not modals, HUD or other canvases)
+        this.touchSurface = touchSurface;
 
         // Store bound event handlers for cleanup
         this.boundHandlers = {
-            touchStart: this.onTouchStart.bind(this),
-            touchMove: this.onTouchMove.bind(this),
-            touchEnd: this.onTouchEnd.bind(this),
-            interactTouch: this.handleInteractTouch.bind(this),
-            resize: this.onResize.bind(this)
+            interactTouch: this.handleInteractTouch.bind(this)
         };
 
         this.createUI();
@@ -91,35 +94,14 @@ export class TouchControls {
         this.interactButton.innerHTML = '⊕<br><span class="interact-label">INTERACT</span>';
         this.interactButton.setAttribute('aria-label', 'Interact with object');
         document.body.appendChild(this.interactButton);
-
-        // Read dimensional values from CSS after elements are added to DOM
-        this.updateDimensionsFromCSS();
-    }
-
-    updateDimensionsFromCSS() {
-        // Read values from CSS custom properties
-        this.joystickSize = TouchControls.getCSSValue('--joystick-size');
-        this.joystickStickSize = TouchControls.getCSSValue('--joystick-stick-size');
-        this.centerOffset = (this.joystickSize - this.joystickStickSize) / 2;
     }
 
     setupEventListeners() {
-        // Touch events for joystick and camera look
-        // Use canvas element if available to avoid interfering with UI modals
-        const touchTarget = document.querySelector('canvas') || document;
-
-        touchTarget.addEventListener('touchstart', this.boundHandlers.touchStart, { passive: false });
-        touchTarget.addEventListener('touchmove', this.boundHandlers.touchMove, { passive: false });
-        touchTarget.addEventListener('touchend', this.boundHandlers.touchEnd, { passive: false });
-        touchTarget.addEventListener('touchcancel', this.boundHandlers.touchEnd, { passive: false });
-
+        // Joystick and camera look arrive through PointerInput.
         // Interact button - only touchstart to avoid double-fire with click
         if (this.interactButton) {
             this.interactButton.addEventListener('touchstart', this.boundHandlers.interactTouch, { passive: false });
         }
-
-        // Window resize
-        window.addEventListener('resize', this.boundHandlers.resize);
     }
 
     handleInteractTouch(e) {
@@ -134,14 +116,10 @@ export class TouchControls {
         this.handleCenterScreenInteract();
     }
 
-    onResize() {
-        // Re-read dimensions from CSS in case they changed
-        this.updateDimensionsFromCSS();
-    }
-
     /**
      * Check if any overlay (modal or instructions) is currently visible
-     * Uses computed styles to ensure accurate detection of CSS-based visibility
+     * Uses computed styles to ensure accurate detection of CSS-based visibility,
+     * so it is only called when a touch starts or ends, never per move
      * @returns {boolean} True if any blocking overlay is visible
      */
     _isOverlayVisible() {
@@ -154,123 +132,103 @@ export class TouchControls {
         return isModalOpen || isInstructionsOpen;
     }
 
-    onTouchStart(event) {
+    pointerDown(event) {
         // Don't interfere if any overlay is visible
         if (this._isOverlayVisible()) {
             return;
         }
 
-        for (let i = 0; i < event.changedTouches.length; i++) {
-            const touch = event.changedTouches[i];
-            const x = touch.clientX;
-            const y = touch.clientY;
-
-            // Check if touch is on UI element or modal
-            const target = touch.target;
-            if (target.closest('#mobile-joystick') ||
-                target.closest('#mobile-interact-btn') ||
-                target.closest('#clueModal') ||
-                target.closest('#victoryModal') ||
-                target.closest('#instructions')) {
-                continue; // Let UI handle it
-            }
-
-            // Check if touch is on left side (joystick area) or right side (look area)
-            const isLeftSide = x < window.innerWidth / 2;
-
-            if (isLeftSide && !this.joystickTouch) {
-                // Start joystick control
-                event.preventDefault();
-                this.joystickTouch = touch.identifier;
-                this.joystickActive = true;
-                this.joystickCenter = { x, y };
-                this.joystickCurrent = { x, y };
-                this.updateJoystickPosition(x, y);
-            } else if (!isLeftSide && !this.lookTouch) {
-                // Start camera look control
-                event.preventDefault();
-                this.lookTouch = touch.identifier;
-                this.touches.set(touch.identifier, { x, y, startX: x, startY: y });
-            }
+        const x = event.clientX;
+        const y = event.clientY;
+
+        // Check if touch is on UI element or modal
+        const target = event.target;
+        if ((this.touchSurface && target !== this.touchSurface) ||
+            target.closest('#mobile-joystick') ||
+            target.closest('#mobile-interact-btn') ||
+            target.closest('#clueModal') ||
+            target.closest('#victoryModal') ||
+            target.closest('#instructions')) {
+            return; // Let UI handle it
         }
-    }
 
-    onTouchMove(event) {
-        // Don't interfere if any overlay is visible
-        if (this._isOverlayVisible()) {
-            return;
+        // Check if touch is on left side (joystick area) or right side (look area)
+        const isLeftSide = x < window.innerWidth / 2;
+
+        if (isLeftSide && this.joystickTouch === null) {
+            // Start joystick control
+            this.joystickTouch = event.pointerId;
+            this.joystickActive = true;
+            this.joystickCenter = { x, y };
+            this.joystickTarget = { x, y };
+        } else if (!isLeftSide && this.lookTouch === null) {
+            // Start camera look control
+            this.lookTouch = event.pointerId;
+            this.touches.set(event.pointerId, { x, y, startX: x, startY: y, maxDistance: 0 });
         }
+    }
 
-        event.preventDefault();
-
-        for (let i = 0; i < event.changedTouches.length; i++) {
-            const touch = event.changedTouches[i];
-
-            if (touch.identifier === this.joystickTouch) {
-                // Update joystick
-                this.updateJoystickPosition(touch.clientX, touch.clientY);
-            } else if (touch.identifier === this.lookTouch) {
-                // Update camera look - accumulate deltas instead of overwriting
-                const lastTouch = this.touches.get(touch.identifier);
-                if (lastTouch) {
-                    const deltaX = touch.clientX - lastTouch.x;
-                    const deltaY = touch.clientY - lastTouch.y;
-
-                    // Accumulate deltas to prevent lost movements
-                    this.lookDelta.x += deltaX * TouchControls.LOOK_SENSITIVITY;
-                    this.lookDelta.y += deltaY * TouchControls.LOOK_SENSITIVITY;
-
-                    this.touches.set(touch.identifier, {
-                        x: touch.clientX,
-                        y: touch.clientY,
-                        startX: lastTouch.startX,
-                        startY: lastTouch.startY
-                    });
-                }
+    /**
+     * @param {PointerEvent} event
+     * @param {PointerEvent[]} samples - Coalesced samples for this event, oldest first
+     */
+    pointerMove(event, samples) {
+        if (event.pointerId === this.joystickTouch) {
+            // Only the latest position matters; update() moves the stick
+            this.joystickTarget = { x: event.clientX, y: event.clientY };
+        } else if (event.pointerId === this.lookTouch) {
+            // Accumulate deltas over every sample so no movement is lost between frames
+            const touch = this.touches.get(event.pointerId);
+            if (!touch) return;
+            for (const sample of samples) {
+                this.lookDelta.x += (sample.clientX - touch.x) * TouchControls.LOOK_SENSITIVITY;
+                this.lookDelta.y += (sample.clientY - touch.y) * TouchControls.LOOK_SENSITIVITY;
+                touch.x = sample.clientX;
+                touch.y = sample.clientY;
+                const dx = touch.x - touch.startX;
+                const dy = touch.y - touch.startY;
+                touch.maxDistance = Math.max(touch.maxDistance, Math.sqrt(dx * dx + dy * dy));
             }
         }
     }
 
-    onTouchEnd(event) {
-        // Check if any overlay is visible for tap interaction prevention
-        const isOverlayVisible = this._isOverlayVisible();
-
-        for (let i = 0; i < event.changedTouches.length; i++) {
-            const touch = event.changedTouches[i];
-
-            if (touch.identifier === this.joystickTouch) {
-                // End joystick control
-                this.joystickTouch = null;
-                this.joystickActive = false;
-                this.resetJoystick();
-                this.moveState = {
-                    forward: false,
-                    backward: false,
-                    left: false,
-                    right: false
-                };
-            } else if (touch.identifier === this.lookTouch) {
-                // End camera look control
-                const touchData = this.touches.get(touch.identifier);
-
-                // Check if this was a tap (minimal movement) and overlay is NOT visible
-                if (touchData && !isOverlayVisible) {
-                    const dx = Math.abs(touch.clientX - touchData.startX);
-                    const dy = Math.abs(touch.clientY - touchData.startY);
-                    const distance = Math.sqrt(dx * dx + dy * dy);
-
-                    if (distance < TouchControls.TAP_THRESHOLD) {
-                        this.handleTapInteract(touch.clientX, touch.clientY);
-                    }
-                }
-
-                this.lookTouch = null;
-                this.lookDelta = { x: 0, y: 0 };
-                this.touches.delete(touch.identifier);
+    pointerUp(event) {
+        if (event.pointerId === this.joystickTouch) {
+            // End joystick control
+            this.joystickTouch = null;
+            this.joystickActive = false;
+            this.joystickTarget = null;
+            this.resetJoystick();
+            this.moveState = {
+                forward: false,
+                backward: false,
+                left: false,
+                right: false
+            };
+        } else if (event.pointerId === this.lookTouch) {
+            // End camera look control
+            const touchData = this.touches.get(event.pointerId);
+
+            // A tap never strayed far from where it started; overlays block it
+            if (touchData && event.type === 'pointerup' &&
+                touchData.maxDistance < TouchControls.TAP_THRESHOLD &&
+                !this._isOverlayVisible()) {
+                this.handleTapInteract(event.clientX, event.clientY);
             }
+
+            this.lookTouch = null;
+            this.lookDelta = { x: 0, y: 0 };
+            this.touches.delete(event.pointerId);
         }
     }
 
+    // Apply the latest joystick position; called once per frame by the game loop
+    update() {
+        if (!this.joystickTarget) return;
+        this.updateJoystickPosition(this.joystickTarget.x, this.joystickTarget.y);
+        this.joystickTarget = null;
+    }
+
     updateJoystickPosition(x, y) {
         const dx = x - this.joystickCenter.x;
         const dy = y - this.joystickCenter.y;
@@ -284,11 +242,8 @@ export class TouchControls {
             finalY = (dy / distance) * TouchControls.JOYSTICK_MAX_DISTANCE;
         }
 
-        // Update visual position using CSS-derived center offset
-        const stickX = this.centerOffset + finalX;
-        const stickY = this.centerOffset + finalY;
-        this.joystickStick.style.left = stickX + 'px';
-        this.joystickStick.style.top = stickY + 'px';
+        // Offset from the CSS-centered rest position (compositor-only, no layout)
+        this.joystickStick.style.transform = `translate3d(${finalX}px, ${finalY}px, 0)`;
 
         // Update movement state based on direction
         this.moveState.forward = finalY < -TouchControls.JOYSTICK_DEADZONE;
@@ -300,9 +255,7 @@ export class TouchControls {
     }
 
     resetJoystick() {
-        // Reset to center using CSS-derived offset
-        this.joystickStick.style.left = this.centerOffset + 'px';
-        this.joystickStick.style.top = this.centerOffset + 'px';
+        this.joystickStick.style.transform = '';
         this.joystickCurrent = { x: 0, y: 0 };
     }
 
@@ -315,7 +268,7 @@ export class TouchControls {
 
         // Perform raycast - use recursive: false to detect only registered interactables
         this.raycaster.setFromCamera(mouse, this.camera);
-        const intersects = this.raycaster.intersectObjects(this.interactables, false);
+        const intersects = this.pickInteractables();
 
         if (intersects.length > 0 && this.onInteract) {
             const object = intersects[0].object;
@@ -328,7 +281,7 @@ export class TouchControls {
         const centerMouse = { x: 0, y: 0 };
         this.raycaster.setFromCamera(centerMouse, this.camera);
         // Use recursive: false to detect only registered interactables
-        const intersects = this.raycaster.intersectObjects(this.interactables, false);
+        const intersects = this.pickInteractables();
 
         if (intersects.length > 0 && this.onInteract) {
             const object = intersects[0].object;
@@ -336,6 +289,14 @@ export class TouchControls {
         }
     }
 
+    // Raycast the registered interactables, through the BVH when one is available
+    pickInteractables() {
+        if (this.pickIndex) {
+            return this.pickIndex.intersect(this.raycaster, false);
+        }
+        return this.raycaster.intersectObjects(this.interactables, false);
+    }
+
     // Get current movement state (to be read by game loop)
     getMovement() {
         return this.moveState;
@@ -351,19 +312,11 @@ export class TouchControls {
 
     // Cleanup - properly remove all event listeners
     dispose() {
-        // Remove event listeners
-        const touchTarget = document.querySelector('canvas') || document;
-        touchTarget.removeEventListener('touchstart', this.boundHandlers.touchStart);
-        touchTarget.removeEventListener('touchmove', this.boundHandlers.touchMove);
-        touchTarget.removeEventListener('touchend', this.boundHandlers.touchEnd);
-        touchTarget.removeEventListener('touchcancel', this.boundHandlers.touchEnd);
-
+        // Remove event listeners (pointer listeners belong to PointerInput)
         if (this.interactButton) {
             this.interactButton.removeEventListener('touchstart', this.boundHandlers.interactTouch);
         }
 
-        window.removeEventListener('resize', this.boundHandlers.resize);
-
         // Remove DOM elements
         document.getElementById('mobile-joystick')?.remove();
         document.getElementById('mobile-interact-btn')?.remove();
@@ -372,6 +325,7 @@ export class TouchControls {
         this.joystickBase = null;
         this.joystickStick = null;
         this.interactButton = null;
+        this.touchSurface = null;
         this.touches.clear();
     }
 }
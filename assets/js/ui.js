@@ -15,7 +15,6 @@ import {
     resetChain,
     shuffleAllClues
 } from './gameLogic.js';
-import { getNextDescription, hasCyclingDescriptions } from './cyclingDescriptions.js';
 import {
     inventory,
     selectSlot,
@@ -115,11 +114,41 @@ closeBtn.addEventListener('click', (e) => {
     closeModal();
 });
 
+// Cycling description tables are only needed once the player inspects something,
+// so they load as a separate chunk in idle time after the page has loaded
+let cyclingDescriptions = null;
+let cyclingDescriptionsLoad = null;
+
+export function loadCyclingDescriptions() {
+    if (!cyclingDescriptionsLoad) {
+        cyclingDescriptionsLoad = import('./cyclingDescriptions.js').then(module => {
+            cyclingDescriptions = module;
+            return module;
+        });
+    }
+    return cyclingDescriptionsLoad;
+}
+
+function prefetchCyclingDescriptions() {
+    const whenIdle = window.requestIdleCallback || ((callback) => setTimeout(callback, 200));
+    whenIdle(() => loadCyclingDescriptions().catch(() => {}), { timeout: 2000 });
+}
+if (document.readyState === 'complete') prefetchCyclingDescriptions();
+else window.addEventListener('load', prefetchCyclingDescriptions, { once: true });
+
 export function closeModal() {
     isInteracting = false;
     modal.style.display = 'none';
 }
 
+// Forget a win and close every modal so another game can start in this page (game driver)
+export function resetGameUI() {
+    gameWon = false;
+    currentCode = "";
+    closeModal();
+    document.getElementById('victoryModal').style.display = 'none';
+}
+
 // Flavor Text Pool
 const flavorTextPool = {
     "lunchbox": [
@@ -307,6 +336,14 @@ function getFlavorText(objName) {
     return pool[Math.floor(Math.random() * pool.length)];
 }
 
+// Cycling description if the object has one, otherwise fallback flavor text
+function describeObject(objName) {
+    if (cyclingDescriptions && cyclingDescriptions.hasCyclingDescriptions(objName)) {
+        return cyclingDescriptions.getNextDescription(objName);
+    }
+    return getFlavorText(objName);
+}
+
 export function showModal(objName, {
     doorPivot,
     finalTimeStr
@@ -556,15 +593,17 @@ export function showModal(objName, {
         const displayName = objName.replace(/_/g, ' ').toUpperCase();
         modalTitle.textContent = displayName;
 
-        // Use cycling descriptions if available, otherwise fallback to flavor text
-        let description;
-        if (hasCyclingDescriptions(objName)) {
-            description = getNextDescription(objName);
+        if (cyclingDescriptions) {
+            modalContent.innerHTML = `<p>${describeObject(objName)}</p>`;
         } else {
-            description = getFlavorText(objName);
+            // Inspected before the idle prefetch finished: fill in once the tables arrive
+            modalContent.innerHTML = "";
+            loadCyclingDescriptions().catch(() => {}).then(() => {
+                if (isInteracting && modalTitle.textContent === displayName) {
+                    modalContent.innerHTML = `<p>${describeObject(objName)}</p>`;
+                }
+            });
         }
-
-        modalContent.innerHTML = `<p>${description}</p>`;
         modal.style.display = 'block';
         isInteracting = true;
     } else {
@@ -0,0 +1,204 @@
+/**
+ * visibilityZones.js
+ * Zone/portal visibility culling for RoomEngine.
+ *
+ * A room declares zones - areas that can only be seen through an opening,
+ * like the office's hidden room behind the secret bookshelf or the inside of
+ * a drawer - and the portals (door, pivot, drawer) that connect them.
+ * Everything not in a declared zone belongs to MAIN_ZONE.
+ *
+ * update() walks the portal graph once per frame, starting from the zone the
+ * camera stands in and crossing only portals that are open and in view.
+ * Zones it does not reach are culled: their objects move to ZONE_CULLED_LAYER,
+ * which the camera, the shadow cameras and the raycaster never test, so they
+ * are not drawn, shadow-mapped or picked. Lights in a culled zone keep shining
+ * (a changing light count would recompile every material), but their shadow
+ * maps are rendered once and then frozen until the zone is seen again.
+ *
+ * Zone contents may change: objects added under a zone root while it is
+ * culled are hidden on the next update(), and everything hidden is restored
+ * when the zone is shown again, even if it was moved out of the zone meanwhile.
+ */
+
+import * as THREE from 'three';
+import { ZONE_CULLED_LAYER } from './constants.js';
+
+export const MAIN_ZONE = 'main';
+
+function createZone(name, objects, bounds) {
+    return {
+        name,
+        objects,
+        bounds,
+        portals: [],
+        culled: false,
+        savedLayers: new Map(), // Object3D -> layers mask before it was hidden
+        frozenLights: new Set() // Shadow-casting lights whose shadow maps are frozen
+    };
+}
+
+export class VisibilityZones {
+    constructor(camera) {
+        this.camera = camera;
+        // name -> zone (see createZone); MAIN_ZONE holds everything else and is never culled
+        this.zones = new Map();
+        this.zones.set(MAIN_ZONE, createZone(MAIN_ZONE, [], null));
+        this.version = 0; // Bumped whenever a zone is culled or shown again
+
+        this._frustum = new THREE.Frustum();
+        this._viewProjection = new THREE.Matrix4();
+        this._cameraPosition = new THREE.Vector3();
+    }
+
+    /**
+     * Declare a zone. It starts visible; the next update() culls it if it can't be seen.
+     * @param {string} name
+     * @param {Object} options
+     * @param {THREE.Object3D[]} options.objects - Roots of everything in the zone (subtrees included)
+     * @param {THREE.Box3} [options.bounds] - World-space volume the camera can stand in;
+     *   omit for places the player never enters (drawer or cabinet interiors)
+     */
+    addZone(name, { objects, bounds = null }) {
+        if (this.zones.has(name)) throw new Error(`Zone "${name}" already exists`);
+        this.zones.set(name, createZone(name, objects.filter(Boolean), bounds));
+    }
+
+    /**
+     * Connect two zones through an opening.
+     * @param {string} from
+     * @param {string} to
+     * @param {Object} options
+     * @param {Function} options.isOpen - True while the zones can see each other,
+     *   i.e. while the door/pivot/drawer is not fully closed
+     * @param {THREE.Box3} [options.bounds] - World-space box around the opening;
+     *   when given, the portal only counts while it is inside the view frustum
+     */
+    addPortal(from, to, { isOpen, bounds = null }) {
+        const portal = { from, to, isOpen, bounds };
+        [from, to].forEach(name => {
+            const zone = this.zones.get(name);
+            if (!zone) throw new Error(`Portal references unknown zone "${name}"`);
+            zone.portals.push(portal);
+        });
+    }
+
+    // Every object declared in a zone (optimizeStatic must leave these unbatched)
+    get objects() {
+        const objects = [];
+        this.zones.forEach(zone => objects.push(...zone.objects));
+        return objects;
+    }
+
+    isCulled(name) {
+        const zone = this.zones.get(name);
+        return !!zone && zone.culled;
+    }
+
+    // Names of the zones currently culled
+    get culled() {
+        return [...this.zones.values()].filter(zone => zone.culled).map(zone => zone.name);
+    }
+
+    /**
+     * Cull or show zones for the current camera. Call once per frame, before rendering.
+     * @returns {boolean} true if any zone changed state (redraw, re-pick, refresh baked shadows)
+     */
+    update() {
+        if (this.zones.size === 1) return false;
+
+        this.camera.updateMatrixWorld();
+        this._viewProjection.multiplyMatrices(this.camera.projectionMatrix, this.camera.matrixWorldInverse);
+        this._frustum.setFromProjectionMatrix(this._viewProjection);
+
+        // Breadth-first from the camera's zone through open portals in view
+        const start = this._cameraZone();
+        const reached = new Set([start]);
+        const queue = [start];
+        while (queue.length > 0) {
+            const zone = queue.shift();
+            zone.portals.forEach(portal => {
+                const next = this.zones.get(portal.from === zone.name ? portal.to : portal.from);
+                if (reached.has(next) || !portal.isOpen()) return;
+                if (portal.bounds && !this._frustum.intersectsBox(portal.bounds)) return;
+                reached.add(next);
+                queue.push(next);
+            });
+        }
+
+        let changed = false;
+        this.zones.forEach(zone => {
+            const culled = zone.name !== MAIN_ZONE && !reached.has(zone);
+            if (culled !== zone.culled) {
+                this._setCulled(zone, culled);
+                changed = true;
+            } else if (culled && this._hide(zone) > 0) {
+                changed = true; // Objects added to the zone since it was culled
+            }
+        });
+        if (changed) this.version++;
+        return changed;
+    }
+
+    // The zone whose bounds contain the camera, else MAIN_ZONE
+    _cameraZone() {
+        this.camera.getWorldPosition(this._cameraPosition);
+        for (const zone of this.zones.values()) {
+            if (zone.bounds && zone.bounds.containsPoint(this._cameraPosition)) return zone;
+        }
+        return this.zones.get(MAIN_ZONE);
+    }
+
+    _setCulled(zone, culled) {
+        zone.culled = culled;
+        if (culled) {
+            this._hide(zone);
+            return;
+        }
+        zone.savedLayers.forEach((mask, obj) => { obj.layers.mask = mask; });
+        zone.savedLayers.clear();
+        zone.frozenLights.forEach(light => this._freezeShadow(light, false));
+        zone.frozenLights.clear();
+    }
+
+    // Move everything in the zone that is not hidden yet to ZONE_CULLED_LAYER; returns how many
+    _hide(zone) {
+        let hidden = 0;
+        zone.objects.forEach(root => root.traverse(obj => {
+            if (obj.isLight) {
+                if (obj.castShadow && !zone.frozenLights.has(obj)) {
+                    zone.frozenLights.add(obj);
+                    this._freezeShadow(obj, true);
+                    hidden++;
+                }
+                return;
+            }
+            if (zone.savedLayers.has(obj)) return;
+            zone.savedLayers.set(obj, obj.layers.mask);
+            obj.layers.set(ZONE_CULLED_LAYER);
+            hidden++;
+        }));
+        return hidden;
+    }
+
+    // Render the light's shadow map one last time (culled objects included) and keep it
+    _freezeShadow(light, frozen) {
+        const shadow = light.shadow;
+        shadow.autoUpdate = !frozen;
+        if (frozen) {
+            shadow.camera.layers.enable(ZONE_CULLED_LAYER);
+            shadow.needsUpdate = true;
+        } else {
+            shadow.camera.layers.disable(ZONE_CULLED_LAYER);
+        }
+    }
+
+    // Show every zone again and forget them (RoomEngine.dispose())
+    clear() {
+        this.zones.forEach(zone => {
+            if (zone.culled) this._setCulled(zone, false);
+        });
+        this.zones.clear();
+        this.zones.set(MAIN_ZONE, createZone(MAIN_ZONE, [], null));
+        this.version++;
+    }
+}
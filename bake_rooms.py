@@ -0,0 +1,134 @@
+"""
+Bake room snapshots.
+
+Loads each room with ?bake in headless Chromium, lets it build procedurally
+and writes the serialized scene (see assets/js/roomSnapshot.js) to
+assets/snapshots/<room>.bin. Rooms load that file instead of running the
+prefab generators; delete it (or open the room with ?snapshot=0) to build
+procedurally again.
+
+    python3 bake_rooms.py                  # bake every room
+    python3 bake_rooms.py --room office
+    python3 bake_rooms.py --check          # exit 1 if a snapshot is missing or stale
+
+Each snapshot records a hash of the sources that generate it, so --check
+catches a prefab change that was not re-baked.
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import struct
+import sys
+
+from playwright.sync_api import sync_playwright
+
+from conftest import CHROMIUM_ARGS, READY_TIMEOUT, ROOT, static_server
+
+SNAPSHOT_DIR = os.path.join(ROOT, "assets", "snapshots")
+SNAPSHOT_FORMAT = 1  # Matches SNAPSHOT_FORMAT in assets/js/roomSnapshot.js
+MAGIC = b"ERSN"
+
+# Shared generator code; any change to these can change a room's geometry
+COMMON_SOURCES = [
+    "assets/js/prefabs.js",
+    "assets/js/commonPrefabs.js",
+    "assets/js/procedural.js",
+    "assets/js/materials.js",
+    "assets/js/resourceCache.js",
+    "assets/js/constants.js",
+    "assets/js/utils.js",
+    "assets/js/roomSnapshot.js",
+]
+
+ROOMS = {
+    "office": {"path": "/office.html", "sources": ["office.html", "assets/js/office.js"]},
+    "science_lab": {
+        "path": "/science_lab.html",
+        "sources": ["science_lab.html", "assets/js/science_lab.js", "assets/js/lab_prefabs.js"],
+    },
+}
+
+
+def snapshot_path(room):
+    return os.path.join(SNAPSHOT_DIR, f"{room}.bin")
+
+
+def source_hash(room):
+    """Hash of every file that feeds the room's procedural build."""
+    digest = hashlib.sha256()
+    for rel in COMMON_SOURCES + ROOMS[room]["sources"]:
+        digest.update(rel.encode())
+        with open(os.path.join(ROOT, rel), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def read_header(path):
+    """The JSON header of a snapshot file."""
+    with open(path, "rb") as f:
+        magic, version, length = struct.unpack("<4sII", f.read(12))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a room snapshot")
+        if version != SNAPSHOT_FORMAT:
+            raise ValueError(f"{path} has format {version}, expected {SNAPSHOT_FORMAT}")
+        return json.loads(f.read(length))
+
+
+def stale_reason(room):
+    """Why the room's snapshot needs re-baking, or None when it is current."""
+    path = snapshot_path(room)
+    if not os.path.exists(path):
+        return "missing"
+    try:
+        header = read_header(path)
+    except ValueError as error:
+        return str(error)
+    if header.get("source") != source_hash(room):
+        return "sources changed since it was baked"
+    return None
+
+
+def bake(rooms):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    with static_server() as server_url, sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        try:
+            for room in rooms:
+                context = browser.new_context(base_url=server_url)
+                try:
+                    page = context.new_page()
+                    page.goto(f"{ROOMS[room]['path']}?bake={source_hash(room)}")
+                    page.wait_for_function("() => typeof window.roomSnapshot === 'string'", timeout=READY_TIMEOUT)
+                    data = base64.b64decode(page.evaluate("() => window.roomSnapshot"))
+                finally:
+                    context.close()
+                with open(snapshot_path(room), "wb") as f:
+                    f.write(data)
+                print(f"  {room}: {len(data) / 1024:.0f} KiB -> {os.path.relpath(snapshot_path(room), ROOT)}")
+        finally:
+            browser.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--room", action="append", choices=sorted(ROOMS), help="Room to bake (repeatable; default all)")
+    parser.add_argument("--check", action="store_true", help="Only report missing or stale snapshots")
+    args = parser.parse_args(argv)
+    rooms = args.room or list(ROOMS)
+
+    if args.check:
+        stale = {room: reason for room in rooms if (reason := stale_reason(room))}
+        for room, reason in stale.items():
+            print(f"  {room}: {reason} - run python3 bake_rooms.py --room {room}")
+        return 1 if stale else 0
+
+    print(f"Baking {', '.join(rooms)}...")
+    bake(rooms)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
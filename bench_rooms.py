@@ -0,0 +1,306 @@
+"""
+Headless rendering benchmark for each room.
+
+Loads every room in headless Chromium with software WebGL (SwiftShader),
+flies the camera along a fixed path and records frame-time percentiles,
+renderer.info draw calls/triangles, geometry/texture counts, JS heap size,
+time to first frame and time to interactive (first frame drawn with the
+gameplay objects built). Results are compared with a JSON baseline and the
+run fails (exit status 1) when a metric regresses past its threshold.
+
+    python3 bench_rooms.py --update-baseline         # record bench_baseline.json
+    python3 bench_rooms.py                           # compare against it
+    python3 bench_rooms.py --room office --runs 3 --threshold frame_p95_ms=0.5
+
+Baselines are machine specific: record one on the machine that compares
+against it. Rooms are pinned to ?quality=high so the adaptive quality
+governor cannot change tier mid-run.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+
+from playwright.sync_api import sync_playwright
+
+from conftest import CHROMIUM_ARGS, ENGINE_READY, READY_TIMEOUT, ROOT, TEMPLATE_READY, static_server
+
+BASELINE_PATH = os.path.join(ROOT, "bench_baseline.json")
+BASELINE_VERSION = 1
+FIRST_FRAME_MARK = "room-first-frame"  # Matches FIRST_FRAME_MARK in assets/js/constants.js
+INTERACTIVE_MARK = "room-interactive"  # Matches INTERACTIVE_MARK in assets/js/constants.js
+VIEWPORT = {"width": 1280, "height": 720}
+
+ROOMS = {
+    "office": {"path": "/office.html?quality=high", "ready": ENGINE_READY},
+    "science_lab": {"path": "/science_lab.html?quality=high", "ready": ENGINE_READY},
+    "classroom": {"path": "/classroom.html?quality=high", "ready": ENGINE_READY},
+    "blank_room_template": {"path": "/blank_room_template.html", "ready": TEMPLATE_READY},
+}
+
+# Camera keyframes: (position, look-at target). A loop around the middle of
+# the room looking at each wall in turn; every room is ~10 x 10 around the origin.
+CAMERA_PATH = [
+    ((0, 1.6, 3), (0, 1.4, -5)),
+    ((3, 1.6, 0), (-5, 1.2, 0)),
+    ((0, 1.6, -3), (0, 1.4, 5)),
+    ((-3, 1.6, 0), (5, 1.2, 0)),
+    ((0, 1.6, 3), (0, 1.4, -5)),
+]
+WARMUP_FRAMES = 30  # Shader compilation and first shadow-map passes
+MEASURE_FRAMES = 240
+
+# Allowed increase over the baseline, as a fraction (0.25 = 25% worse fails).
+# Every metric is lower-is-better.
+DEFAULT_THRESHOLDS = {
+    "ttff_ms": 0.25,
+    "tti_ms": 0.25,
+    "frame_p50_ms": 0.25,
+    "frame_p95_ms": 0.25,
+    "frame_p99_ms": 0.35,
+    "render_p50_ms": 0.25,
+    "render_p95_ms": 0.35,
+    "draw_calls": 0.10,
+    "triangles": 0.10,
+    "geometries": 0.10,
+    "textures": 0.10,
+    "js_heap_mb": 0.20,
+}
+
+# Absolute change below which a timing is treated as noise regardless of percentage
+MIN_DELTA = {
+    "ttff_ms": 100,
+    "tti_ms": 100,
+    "frame_p50_ms": 2,
+    "frame_p95_ms": 4,
+    "frame_p99_ms": 8,
+    "render_p50_ms": 1,
+    "render_p95_ms": 2,
+    "js_heap_mb": 2,
+}
+
+# Runs in the page: fly the camera along the path and sample every frame
+FLY_PATH_JS = """async ({ path, warmupFrames, frames }) => {
+    const engine = window.engine;
+    const camera = engine ? engine.camera : window.camera;
+    const renderer = engine ? engine.renderer : window.renderer;
+
+    const lerp = (a, b, t) => a + (b - a) * t;
+    const place = (progress) => {
+        const scaled = progress * (path.length - 1);
+        const i = Math.min(Math.floor(scaled), path.length - 2);
+        const t = scaled - i;
+        const [[p0, l0], [p1, l1]] = [path[i], path[i + 1]];
+        camera.position.set(lerp(p0[0], p1[0], t), lerp(p0[1], p1[1], t), lerp(p0[2], p1[2], t));
+        camera.lookAt(lerp(l0[0], l1[0], t), lerp(l0[1], l1[1], t), lerp(l0[2], l1[2], t));
+    };
+    const nextFrame = () => new Promise(resolve => requestAnimationFrame(resolve));
+
+    for (let i = 0; i < warmupFrames; i++) {
+        place(i / warmupFrames);
+        await nextFrame();
+    }
+
+    // Time the render call itself as well as the whole frame
+    const render = renderer.render;
+    const renderTimes = [];
+    renderer.render = function (...args) {
+        const start = performance.now();
+        render.apply(this, args);
+        renderTimes.push(performance.now() - start);
+    };
+
+    const frameTimes = [];
+    const calls = [];
+    const triangles = [];
+    try {
+        let last = await nextFrame();
+        for (let i = 0; i < frames; i++) {
+            place(i / (frames - 1));
+            const now = await nextFrame();
+            frameTimes.push(now - last);
+            last = now;
+            calls.push(renderer.info.render.calls);
+            triangles.push(renderer.info.render.triangles);
+        }
+    } finally {
+        renderer.render = render;
+    }
+
+    return {
+        frameTimes,
+        renderTimes,
+        calls,
+        triangles,
+        geometries: renderer.info.memory.geometries,
+        textures: renderer.info.memory.textures
+    };
+}"""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def measure_room(browser, server_url, room, frames):
+    """Load one room in a fresh context and return its metrics."""
+    spec = ROOMS[room]
+    context = browser.new_context(base_url=server_url, viewport=VIEWPORT)
+    try:
+        page = context.new_page()
+        cdp = context.new_cdp_session(page)
+        cdp.send("Performance.enable")
+
+        page.goto(spec["path"])
+        page.wait_for_function(spec["ready"], timeout=READY_TIMEOUT)
+        marks = {}
+        for mark in (FIRST_FRAME_MARK, INTERACTIVE_MARK):
+            page.wait_for_function(
+                "(name) => performance.getEntriesByName(name).length > 0", arg=mark, timeout=READY_TIMEOUT
+            )
+            marks[mark] = page.evaluate("(name) => performance.getEntriesByName(name)[0].startTime", mark)
+
+        sample = page.evaluate(
+            FLY_PATH_JS, {"path": CAMERA_PATH, "warmupFrames": WARMUP_FRAMES, "frames": frames}
+        )
+
+        cdp.send("HeapProfiler.collectGarbage")
+        heap = {m["name"]: m["value"] for m in cdp.send("Performance.getMetrics")["metrics"]}["JSHeapUsedSize"]
+    finally:
+        context.close()
+
+    render_times = sample["renderTimes"] or [0]
+    return {
+        "ttff_ms": round(marks[FIRST_FRAME_MARK], 1),
+        "tti_ms": round(marks[INTERACTIVE_MARK], 1),
+        "frame_p50_ms": round(percentile(sample["frameTimes"], 50), 2),
+        "frame_p95_ms": round(percentile(sample["frameTimes"], 95), 2),
+        "frame_p99_ms": round(percentile(sample["frameTimes"], 99), 2),
+        "render_p50_ms": round(percentile(render_times, 50), 2),
+        "render_p95_ms": round(percentile(render_times, 95), 2),
+        "draw_calls": max(sample["calls"]),
+        "triangles": max(sample["triangles"]),
+        "geometries": sample["geometries"],
+        "textures": sample["textures"],
+        "js_heap_mb": round(heap / (1024 * 1024), 2),
+    }
+
+
+def run_benchmarks(rooms, runs, frames):
+    """Benchmark each room `runs` times; returns the per-metric median for each room."""
+    results = {}
+    with static_server() as server_url, sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        try:
+            for room in rooms:
+                samples = []
+                for run in range(runs):
+                    print(f"  {room} (run {run + 1}/{runs})...", flush=True)
+                    samples.append(measure_room(browser, server_url, room, frames))
+                results[room] = {
+                    metric: statistics.median(sample[metric] for sample in samples) for metric in samples[0]
+                }
+            version = browser.version
+        finally:
+            browser.close()
+    return results, version
+
+
+def compare(results, baseline_rooms, thresholds):
+    """Return a list of human-readable regressions against the baseline."""
+    regressions = []
+    for room, metrics in results.items():
+        base_metrics = baseline_rooms.get(room)
+        if base_metrics is None:
+            print(f"  {room}: no baseline, skipped")
+            continue
+        for metric, value in metrics.items():
+            base = base_metrics.get(metric)
+            if base is None or metric not in thresholds:
+                continue
+            limit = base * (1 + thresholds[metric])
+            if value > limit and value - base > MIN_DELTA.get(metric, 0):
+                change = (value - base) / base * 100 if base else float("inf")
+                regressions.append(f"{room}.{metric}: {base} -> {value} (+{change:.0f}%, limit +{thresholds[metric] * 100:.0f}%)")
+    return regressions
+
+
+def print_table(results):
+    metrics = list(next(iter(results.values())))
+    print("\n" + "room".ljust(22) + "".join(m.rjust(15) for m in metrics))
+    for room, values in results.items():
+        print(room.ljust(22) + "".join(str(values[m]).rjust(15) for m in metrics))
+    print()
+
+
+def parse_thresholds(overrides):
+    thresholds = dict(DEFAULT_THRESHOLDS)
+    for override in overrides:
+        name, _, value = override.partition("=")
+        if name not in thresholds or not value:
+            raise SystemExit(f"Bad --threshold {override!r}; expected one of {sorted(thresholds)}=<fraction>")
+        thresholds[name] = float(value)
+    return thresholds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--room", action="append", choices=sorted(ROOMS), help="Room to benchmark (repeatable; default all)")
+    parser.add_argument("--runs", type=int, default=1, help="Runs per room; the median of each metric is kept")
+    parser.add_argument("--frames", type=int, default=MEASURE_FRAMES, help="Measured frames along the camera path")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline")
+    parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    parser.add_argument("--threshold", action="append", default=[], metavar="METRIC=FRACTION",
+                        help="Override an allowed regression, e.g. frame_p95_ms=0.5")
+    args = parser.parse_args(argv)
+
+    thresholds = parse_thresholds(args.threshold)
+    rooms = args.room or list(ROOMS)
+
+    print(f"Benchmarking {', '.join(rooms)}...")
+    results, chromium = run_benchmarks(rooms, max(1, args.runs), max(2, args.frames))
+    print_table(results)
+
+    report = {"version": BASELINE_VERSION, "chromium": chromium, "frames": args.frames, "rooms": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.update_baseline:
+        baseline_rooms = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline_rooms = json.load(f).get("rooms", {})
+        report["rooms"] = {**baseline_rooms, **results}
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("chromium") != chromium or baseline.get("frames") != args.frames:
+        print(f"Warning: baseline recorded with Chromium {baseline.get('chromium')} / {baseline.get('frames')} frames")
+
+    regressions = compare(results, baseline.get("rooms", {}), thresholds)
+    if regressions:
+        print("Regressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
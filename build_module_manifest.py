@@ -0,0 +1,238 @@
+"""
+Generate per-room module manifests and <link rel="modulepreload"> hints.
+
+Each room page loads one entry module, which pulls in the rest through
+nested static imports. The browser only discovers a module once its parent
+has downloaded and parsed, so the graph loads as a chain of waterfalls.
+This script walks the static import graph of every room page (resolving
+bare specifiers such as `three` through the page's import map) and writes:
+
+  - assets/module-manifest.json: per room, the entry, every statically
+    imported module and the chunks it loads lazily with import()
+  - a modulepreload block in each page, right after its import map, so
+    the whole graph is requested in parallel with the entry
+
+    python3 build_module_manifest.py                  # regenerate
+    python3 build_module_manifest.py --check          # exit 1 if anything is stale
+    python3 build_module_manifest.py --three local --fetch
+        # download Three.js into assets/vendor/three and point the import maps at it
+    python3 build_module_manifest.py --three cdn      # back to jsDelivr
+
+Lazily imported chunks are listed in the manifest but never preloaded.
+update-version.sh runs this after stamping versions.
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+import urllib.request
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MANIFEST_PATH = os.path.join(ROOT, "assets", "module-manifest.json")
+MANIFEST_VERSION = 1
+
+ROOM_PAGES = {
+    "office": "office.html",
+    "classroom": "classroom.html",
+    "science_lab": "science_lab.html",
+    "blank_room_template": "blank_room_template.html",
+}
+
+THREE_VERSION = "0.160.0"
+THREE_CDN = f"https://cdn.jsdelivr.net/npm/three@{THREE_VERSION}/"
+THREE_VENDOR_DIR = "assets/vendor/three/"
+THREE_IMPORTS = {
+    "cdn": {
+        "three": f"{THREE_CDN}build/three.module.js",
+        "three/addons/": f"{THREE_CDN}examples/jsm/",
+    },
+    "local": {
+        "three": f"{THREE_VENDOR_DIR}build/three.module.js",
+        "three/addons/": f"{THREE_VENDOR_DIR}examples/jsm/",
+    },
+}
+
+PRELOAD_START = "<!-- modulepreload:start (generated by build_module_manifest.py) -->"
+PRELOAD_END = "<!-- modulepreload:end -->"
+
+IMPORT_MAP_RE = re.compile(r'(<script type="importmap">)(.*?)(</script>)', re.S)
+ENTRY_RE = re.compile(r'<script type="module" src="([^"?]+)(?:\?[^"]*)?"></script>')
+PRELOAD_BLOCK_RE = re.compile(r"[ \t]*" + re.escape(PRELOAD_START) + r".*?" + re.escape(PRELOAD_END) + r"\n", re.S)
+# import x from '...', import {a, b} from '...', import '...', export ... from '...'
+STATIC_IMPORT_RE = re.compile(r"""^\s*(?:import|export)\s+(?:[\w*{}\s,$]+?\s+from\s+)?['"]([^'"]+)['"]""", re.M)
+DYNAMIC_IMPORT_RE = re.compile(r"""\bimport\(\s*['"]([^'"]+)['"]\s*\)""")
+COMMENT_RE = re.compile(r"/\*.*?\*/|^\s*//.*?$", re.S | re.M)
+
+
+def is_remote(url):
+    return url.startswith(("http://", "https://", "//"))
+
+
+def read_page(page):
+    with open(os.path.join(ROOT, page), encoding="utf-8") as f:
+        return f.read()
+
+
+def import_map(html):
+    match = IMPORT_MAP_RE.search(html)
+    return json.loads(match.group(2))["imports"] if match else {}
+
+
+def resolve(specifier, parent, imports):
+    """Resolve an import specifier to a repo-relative path or a remote URL."""
+    if specifier.startswith(("./", "../", "/")):
+        if is_remote(parent):
+            return urllib.request.urljoin(parent, specifier)
+        base = "" if specifier.startswith("/") else posixpath.dirname(parent)
+        return posixpath.normpath(posixpath.join(base, specifier.lstrip("/")))
+    if specifier in imports:
+        return imports[specifier]
+    # Longest matching prefix ("three/addons/") wins, as in the import map spec
+    for key in sorted((k for k in imports if k.endswith("/")), key=len, reverse=True):
+        if specifier.startswith(key):
+            return imports[key] + specifier[len(key):]
+    if is_remote(specifier):
+        return specifier
+    raise ValueError(f"{parent}: cannot resolve {specifier!r}")
+
+
+def fetch_vendored(path):
+    """Download a missing assets/vendor/three file from the CDN."""
+    url = THREE_CDN + path[len(THREE_VENDOR_DIR):]
+    print(f"  fetching {url}")
+    with urllib.request.urlopen(url) as response:
+        data = response.read()
+    os.makedirs(os.path.join(ROOT, os.path.dirname(path)), exist_ok=True)
+    with open(os.path.join(ROOT, path), "wb") as f:
+        f.write(data)
+
+
+def module_graph(entry, imports, fetch=False):
+    """
+    Walk the static imports from `entry` in discovery (breadth-first) order.
+    Remote modules are listed but not followed. Returns (modules, lazy) where
+    modules excludes the entry and lazy lists import() targets not loaded statically.
+    """
+    order, lazy = [], []
+    seen = {entry}
+    queue = [entry]
+    while queue:
+        module = queue.pop(0)
+        if is_remote(module):
+            continue
+        path = os.path.join(ROOT, module)
+        if not os.path.exists(path) and fetch and module.startswith(THREE_VENDOR_DIR):
+            fetch_vendored(module)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{module} is imported but missing (vendored Three.js needs --fetch)")
+        with open(path, encoding="utf-8") as f:
+            source = COMMENT_RE.sub("", f.read())
+        for specifier in STATIC_IMPORT_RE.findall(source):
+            child = resolve(specifier, module, imports)
+            if child not in seen:
+                seen.add(child)
+                order.append(child)
+                queue.append(child)
+        for specifier in DYNAMIC_IMPORT_RE.findall(source):
+            child = resolve(specifier, module, imports)
+            if child not in lazy:
+                lazy.append(child)
+    return order, [chunk for chunk in lazy if chunk not in seen]
+
+
+def with_preload_block(html, modules):
+    """The page with its modulepreload block replaced (or added after the import map)."""
+    html = PRELOAD_BLOCK_RE.sub("", html)
+    links = "".join(f'    <link rel="modulepreload" href="{m}">\n' for m in modules)
+    block = f"    {PRELOAD_START}\n{links}    {PRELOAD_END}\n"
+    # After the import map: a module request made before it is parsed would disable the map
+    match = IMPORT_MAP_RE.search(html)
+    if match:
+        insert_at = html.index("\n", match.end()) + 1
+    else:
+        insert_at = html.index(ENTRY_RE.search(html).group(0))
+        insert_at = html.rindex("\n", 0, insert_at) + 1
+    return html[:insert_at] + block + html[insert_at:]
+
+
+def with_three_source(html, mode):
+    """The page with its import map pointing Three.js at the CDN or the vendored copy."""
+    def replace(match):
+        imports = json.loads(match.group(2))
+        imports["imports"].update(THREE_IMPORTS[mode])
+        body = json.dumps(imports, indent=4).replace("\n", "\n        ")
+        return f"{match.group(1)}\n        {body}\n    {match.group(3)}"
+    return IMPORT_MAP_RE.sub(replace, html, count=1)
+
+
+def build(three=None, fetch=False):
+    """Return {relative path: new contents} for every generated file."""
+    outputs = {}
+    # Resolve against the import maps as they will be written
+    pages = {page: read_page(page) for page in ROOM_PAGES.values()}
+    if three:
+        pages = {page: with_three_source(html, three) for page, html in pages.items()}
+
+    manifest = {"version": MANIFEST_VERSION, "rooms": {}}
+    for room, page in ROOM_PAGES.items():
+        html = pages[page]
+        entry = ENTRY_RE.search(html).group(1)
+        modules, lazy = module_graph(entry, import_map(html), fetch)
+        manifest["rooms"][room] = {"page": page, "entry": entry, "preload": modules, "lazy": lazy}
+        outputs[page] = with_preload_block(html, modules)
+
+    outputs[os.path.relpath(MANIFEST_PATH, ROOT)] = json.dumps(manifest, indent=2) + "\n"
+    return outputs
+
+
+def stale_files(outputs):
+    """Generated files whose contents on disk differ from `outputs`."""
+    stale = []
+    for rel, contents in outputs.items():
+        path = os.path.join(ROOT, rel)
+        if not os.path.exists(path):
+            stale.append(rel)
+            continue
+        with open(path, encoding="utf-8") as f:
+            if f.read() != contents:
+                stale.append(rel)
+    return stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="Only report pages or manifest that are out of date")
+    parser.add_argument("--three", choices=sorted(THREE_IMPORTS), help="Point every import map at this Three.js source")
+    parser.add_argument("--fetch", action="store_true", help="Download vendored Three.js files that are missing")
+    args = parser.parse_args(argv)
+
+    try:
+        outputs = build(args.three, args.fetch)
+    except FileNotFoundError as error:
+        print(f"  {error}")
+        return 1
+    stale = stale_files(outputs)
+
+    if args.check:
+        for rel in stale:
+            print(f"  {rel} is out of date - run python3 build_module_manifest.py")
+        return 1 if stale else 0
+
+    for rel in stale:
+        with open(os.path.join(ROOT, rel), "w", encoding="utf-8") as f:
+            f.write(outputs[rel])
+        print(f"  wrote {rel}")
+
+    manifest = json.loads(outputs[os.path.relpath(MANIFEST_PATH, ROOT)])
+    for room, info in manifest["rooms"].items():
+        local = [m for m in [info["entry"], *info["preload"]] if not is_remote(m)]
+        kib = sum(os.path.getsize(os.path.join(ROOT, m)) for m in local) / 1024
+        print(f"  {room}: {len(info['preload'])} preloaded modules, {len(info['lazy'])} lazy chunks, {kib:.0f} KiB local")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+Shared Playwright fixtures for the test and verification scripts.
+
+One static server (server.js, or Python's http.server when Node is not
+installed) is started per session on a free port, and one Chromium is
+shared by every test; each test gets a fresh browser context so storage
+and init scripts never leak between tests.
+
+Run everything in parallel with pytest-xdist. Each worker is its own
+session, with its own server and browser:
+
+    pip install pytest pytest-xdist playwright
+    playwright install chromium
+    pytest -n auto --dist loadfile
+"""
+
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SERVER_START_TIMEOUT = 15  # seconds
+READY_TIMEOUT = 30000  # ms - scene build on software WebGL can be slow
+
+# Software WebGL so headless runs behave the same with or without a GPU
+CHROMIUM_ARGS = ["--use-angle=swiftshader", "--enable-unsafe-swiftshader", "--ignore-gpu-blocklist"]
+
+# Readiness predicates (evaluated in the page)
+ENGINE_READY = "() => !!(window.engine && window.engine.running)"
+GAME_READY = """() => !!(window.gameLogic && window.gameLogic.locationMap &&
+    Object.values(window.gameLogic.locationMap).some(v => v !== null))"""
+TEST_RUNNER_READY = "() => window.testReady === true"
+# blank_room_template.js runs its own loop (no RoomEngine); it exposes the renderer when ready
+TEMPLATE_READY = "() => !!(window.renderer && window.camera)"
+
+
+def _free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port, process=None):
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"server.js exited with code {process.returncode}")
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Server did not start on port {port}")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def static_server(perf_data=None):
+    """Serve the repo root on a free port; yields the base URL.
+
+    perf_data is server.js's PERF_DATA_DIR; by default a scratch directory removed afterwards.
+    """
+    port = _free_port()
+    node = shutil.which("node")
+    if node:
+        # Beacons sent during tests go to a scratch directory, not the repo's perf-data/
+        owned = perf_data is None
+        if owned:
+            perf_data = tempfile.mkdtemp(prefix="perf-data-")
+        process = subprocess.Popen(
+            [node, os.path.join(ROOT, "server.js")],
+            cwd=ROOT,
+            env={**os.environ, "PORT": str(port), "PERF_DATA_DIR": perf_data},
+            stdout=subprocess.DEVNULL,
+            stderr=sys.stderr,
+        )
+        try:
+            _wait_for_port(port, process)
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            process.terminate()
+            process.wait(timeout=5)
+            if owned:
+                shutil.rmtree(perf_data, ignore_errors=True)
+    else:
+        httpd = ThreadingHTTPServer(("127.0.0.1", port), partial(_QuietHandler, directory=ROOT))
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        try:
+            _wait_for_port(port)
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+
+@pytest.fixture(scope="session")
+def server_url():
+    """Base URL of a static server for the repo root, started once per session."""
+    with static_server() as url:
+        yield url
+
+
+@pytest.fixture(scope="session")
+def playwright_instance():
+    with sync_playwright() as p:
+        yield p
+
+
+@pytest.fixture(scope="session")
+def browser(playwright_instance):
+    """One headless Chromium shared by every test in the session."""
+    browser = playwright_instance.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+    yield browser
+    browser.close()
+
+
+@pytest.fixture
+def context_options():
+    """Override in a test module (or parametrize) to change new_context() options."""
+    return {}
+
+
+@pytest.fixture
+def context(browser, server_url, context_options):
+    context = browser.new_context(base_url=server_url, **context_options)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def page(context):
+    return context.new_page()
+
+
+@pytest.fixture
+def dev_page(page):
+    """A page with window.__DEV__ set, so office.html exposes window.gameLogic."""
+    page.add_init_script("window.__DEV__ = true;")
+    return page
+
+
+def wait_for_engine(page, timeout=READY_TIMEOUT):
+    """Block until the room's RoomEngine has started its render loop."""
+    page.wait_for_function(ENGINE_READY, timeout=timeout)
+
+
+def wait_for_game(page, timeout=READY_TIMEOUT):
+    """Block until game logic has placed clues (requires window.gameLogic)."""
+    page.wait_for_function(GAME_READY, timeout=timeout)
+
+
+def wait_for_frames(page, count=2):
+    """Let the render loop draw `count` more frames (e.g. after moving the camera)."""
+    page.evaluate("""(count) => new Promise(resolve => {
+        const step = () => (count-- <= 0 ? resolve() : requestAnimationFrame(step));
+        requestAnimationFrame(step);
+    })""", count)
+
+
+@pytest.fixture
+def open_room(page):
+    """Navigate to a room page and wait until its engine is running."""
+    def _open(path, ready=ENGINE_READY):
+        page.goto(path)
+        page.wait_for_function(ready, timeout=READY_TIMEOUT)
+        return page
+    return _open
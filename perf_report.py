@@ -0,0 +1,99 @@
+"""
+Print the field performance aggregates collected by server.js.
+
+Room pages send performance beacons (assets/js/perfBeacon.js) to server.js,
+which keeps rolling per-room and per-device-tier aggregates: p50 / p95 of
+time to first frame, time to interactive, frame-time percentiles and
+renderer stats over the most recent reports. This prints them as tables,
+from the aggregates file server.js saves or from a running server.
+
+    python3 perf_report.py                                  # perf-data/aggregates.json
+    python3 perf_report.py --url http://127.0.0.1:8081      # live summary
+    python3 perf_report.py --by devices --json
+
+Raw reports stay in perf-data/beacons-*.ndjson, one JSON object per line.
+"""
+
+import argparse
+import json
+import os
+import sys
+import urllib.request
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+AGGREGATES_PATH = os.path.join(ROOT, "perf-data", "aggregates.json")
+SUMMARY_ROUTE = "/api/perf/summary"  # Matches handleApi() in server.js
+
+# (metric, column heading); cells are p50 / p95
+COLUMNS = [
+    ("ttffMs", "first frame"),
+    ("ttiMs", "interactive"),
+    ("frameP50", "frame p50"),
+    ("frameP95", "frame p95"),
+    ("frameP99", "frame p99"),
+    ("drawCalls", "draws"),
+    ("triangles", "triangles"),
+]
+
+
+def load_summary(path=None, url=None):
+    """Summary dict from a running server (url) or a saved aggregates file."""
+    if url:
+        with urllib.request.urlopen(url.rstrip("/") + SUMMARY_ROUTE, timeout=10) as response:
+            return json.load(response)
+    with open(path or AGGREGATES_PATH) as f:
+        return json.load(f)["summary"]
+
+
+def format_value(value):
+    return str(round(value)) if value >= 100 else f"{value:.1f}"
+
+
+def print_table(title, groups):
+    print(f"\n{title}")
+    if not groups:
+        print("  (no reports)")
+        return
+    print("".ljust(22) + "reports".rjust(9) + "".join(heading.rjust(16) for _, heading in COLUMNS))
+    for key in sorted(groups):
+        group = groups[key]
+        cells = []
+        for metric, _ in COLUMNS:
+            stats = group["metrics"].get(metric)
+            cells.append(f"{format_value(stats['p50'])} / {format_value(stats['p95'])}" if stats else "-")
+        print(key.ljust(22) + str(group["reports"]).rjust(9) + "".join(cell.rjust(16) for cell in cells))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--file", help=f"Aggregates file saved by server.js (default {AGGREGATES_PATH})")
+    source.add_argument("--url", help="Base URL of a running server.js")
+    parser.add_argument("--by", choices=["rooms", "devices"], action="append",
+                        help="Group to print (repeatable; default both)")
+    parser.add_argument("--json", action="store_true", help="Print the summary as JSON instead of tables")
+    args = parser.parse_args(argv)
+
+    try:
+        summary = load_summary(args.file, args.url)
+    except FileNotFoundError as error:
+        print(f"No aggregates at {error.filename}; serve the rooms with server.js and play for a while.")
+        return 1
+    except OSError as error:
+        print(f"Could not load the summary: {error}")
+        return 1
+
+    kinds = args.by or ["rooms", "devices"]
+    if args.json:
+        print(json.dumps({kind: summary.get(kind, {}) for kind in kinds}, indent=2))
+        return 0
+
+    print(f"p50 / p95 over the last {summary['window']} reports per group (times in ms); "
+          f"updated {summary['updated']}")
+    for kind in kinds:
+        print_table(f"By {'room' if kind == 'rooms' else 'device tier'}:", summary.get(kind, {}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
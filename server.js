@@ -1,51 +1,612 @@
 const http = require('http');
 const fs = require('fs');
 const path = require('path');
+const zlib = require('zlib');
+const { promisify } = require('util');
 
-const server = http.createServer((req, res) => {
-    // Remove query parameters
-    const cleanUrl = req.url.split('?')[0];
-    let filePath = '.' + cleanUrl;
-    if (filePath === './') {
-        filePath = './office.html';
+const gzip = promisify(zlib.gzip);
+const brotli = promisify(zlib.brotliCompress);
+
+const PORT = Number(process.env.PORT) || 8081;
+const ROOT = path.resolve(__dirname);
+
+// In-memory cache limits. Files above MAX_CACHED_FILE_BYTES are streamed from disk.
+const MAX_CACHE_BYTES = 64 * 1024 * 1024;
+const MAX_CACHED_FILE_BYTES = 2 * 1024 * 1024;
+
+// ?v=<hash> URLs (stamped by update-version.sh) never change, so they can be cached for good.
+const IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable';
+const REVALIDATE_CACHE_CONTROL = 'no-cache';
+
+// Performance beacons from assets/js/perfBeacon.js (POST /api/perf). Raw reports are appended to
+// rotating NDJSON files in PERF_DATA_DIR; rolling per-room / per-device aggregates are served at
+// /api/perf/summary and saved to aggregates.json for perf_report.py.
+const PERF_DATA_DIR = path.resolve(process.env.PERF_DATA_DIR || path.join(ROOT, 'perf-data'));
+const MAX_BEACON_BYTES = 64 * 1024;
+const MAX_REPORTS_PER_BEACON = 50;
+const MAX_LOG_BYTES = 8 * 1024 * 1024;   // Start a new log file past this size
+const MAX_LOG_FILES = 20;                // Oldest log files are deleted beyond this
+const AGGREGATE_WINDOW = 500;            // Most recent values kept per metric per room / device tier
+const AGGREGATE_SAVE_DELAY_MS = 5000;
+
+// Numeric fields of a report's `metrics`; anything else is dropped
+const BEACON_METRICS = [
+    'ttfbMs', 'domContentLoadedMs', 'loadMs', 'ttffMs', 'ttiMs',
+    'frames', 'stalls', 'frameP50', 'frameP95', 'frameP99',
+    'drawCalls', 'triangles', 'geometries', 'textures'
+];
+const DEVICE_TIERS = new Set(['low', 'mid', 'high']);
+// Sent with every page; perfBeacon.js only reports from pages that carry it
+const BEACON_SERVER_TIMING = 'perf-beacon';
+
+const mimeTypes = {
+    '.html': 'text/html',
+    '.js': 'text/javascript',
+    '.css': 'text/css',
+    '.json': 'application/json',
+    '.png': 'image/png',
+    '.jpg': 'image/jpg',
+    '.gif': 'image/gif',
+    '.svg': 'image/svg+xml',
+    '.wav': 'audio/wav',
+    '.mp4': 'video/mp4',
+    '.woff': 'application/font-woff',
+    '.ttf': 'application/font-ttf',
+    '.eot': 'application/vnd.ms-fontobject',
+    '.otf': 'application/font-otf',
+    '.wasm': 'application/wasm',
+    '.bin': 'application/octet-stream' // Baked room snapshots (bake_rooms.py)
+};
+
+// Types worth compressing (images, audio, video and fonts are already compressed)
+const compressibleTypes = new Set([
+    'text/html', 'text/javascript', 'text/css', 'application/json', 'image/svg+xml', 'application/wasm',
+    'application/octet-stream'
+]);
+
+/**
+ * LRU cache of file bodies keyed by absolute path.
+ * Entries are invalidated when the file's mtime or size changes.
+ * Map iteration order is insertion order, so re-inserting on hit keeps the
+ * least recently used entry first.
+ */
+class FileCache {
+    constructor(maxBytes) {
+        this.maxBytes = maxBytes;
+        this.bytes = 0;
+        this.entries = new Map();
+    }
+
+    get(filePath, stat) {
+        const entry = this.entries.get(filePath);
+        if (!entry) return null;
+        if (entry.mtimeMs !== stat.mtimeMs || entry.size !== stat.size) {
+            this.delete(filePath);
+            return null;
+        }
+        this.entries.delete(filePath);
+        this.entries.set(filePath, entry);
+        return entry;
+    }
+
+    set(filePath, entry) {
+        this.delete(filePath);
+        entry.cost = entry.body.length + (entry.gzip ? entry.gzip.length : 0) + (entry.br ? entry.br.length : 0);
+        this.entries.set(filePath, entry);
+        this.bytes += entry.cost;
+        for (const [key, oldest] of this.entries) {
+            if (this.bytes <= this.maxBytes) break;
+            this.entries.delete(key);
+            this.bytes -= oldest.cost;
+        }
+    }
+
+    delete(filePath) {
+        const entry = this.entries.get(filePath);
+        if (entry) {
+            this.entries.delete(filePath);
+            this.bytes -= entry.cost;
+        }
+    }
+}
+
+const cache = new FileCache(MAX_CACHE_BYTES);
+
+// Each encoding is a different body, so it gets its own strong validator
+const ETAG_SUFFIXES = { br: '-br', gzip: '-gz' };
+
+function makeETag(stat, encoding = null) {
+    const suffix = encoding ? ETAG_SUFFIXES[encoding] : '';
+    return `"${stat.size.toString(16)}-${Math.floor(stat.mtimeMs).toString(16)}${suffix}"`;
+}
+
+// If-None-Match is "*" or a comma-separated list of tags, compared weakly (W/ ignored)
+function etagMatches(header, etag) {
+    if (!header) return false;
+    if (header.trim() === '*') return true;
+    return header.split(',').some(tag => tag.trim().replace(/^W\//, '') === etag);
+}
+
+// Read a file and precompute its compressed variants
+async function loadEntry(filePath, stat, contentType) {
+    const body = await fs.promises.readFile(filePath);
+    const entry = { mtimeMs: stat.mtimeMs, size: stat.size, body, gzip: null, br: null };
+    if (compressibleTypes.has(contentType) && body.length > 256) {
+        const [gz, br] = await Promise.all([
+            gzip(body, { level: 9 }),
+            brotli(body, { params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 11 } })
+        ]);
+        if (gz.length < body.length) entry.gzip = gz;
+        if (br.length < body.length) entry.br = br;
+    }
+    return entry;
+}
+
+// Loads in flight, keyed by path and version, so a burst of cold requests compresses a file once
+const pendingLoads = new Map();
+
+function getEntry(filePath, stat, contentType) {
+    const cached = cache.get(filePath, stat);
+    if (cached) return Promise.resolve(cached);
+
+    const key = `${filePath}:${stat.mtimeMs}:${stat.size}`;
+    let pending = pendingLoads.get(key);
+    if (!pending) {
+        pending = loadEntry(filePath, stat, contentType)
+            .then(entry => {
+                cache.set(filePath, entry);
+                return entry;
+            })
+            .finally(() => pendingLoads.delete(key));
+        pendingLoads.set(key, pending);
+    }
+    return pending;
+}
+
+function pickEncoding(req, entry) {
+    const accepted = String(req.headers['accept-encoding'] || '');
+    if (entry.br && /\bbr\b/.test(accepted)) return 'br';
+    if (entry.gzip && /\bgzip\b/.test(accepted)) return 'gzip';
+    return null;
+}
+
+// Parse a single "bytes=start-end" range; returns null for none, false for unsatisfiable
+function parseRange(header, size) {
+    if (!header) return null;
+    const match = /^bytes=(\d*)-(\d*)$/.exec(header.trim());
+    if (!match || (match[1] === '' && match[2] === '')) return false;
+
+    let start;
+    let end;
+    if (match[1] === '') {
+        // Suffix range: last N bytes
+        start = Math.max(0, size - Number(match[2]));
+        end = size - 1;
+    } else {
+        start = Number(match[1]);
+        end = match[2] === '' ? size - 1 : Math.min(Number(match[2]), size - 1);
+    }
+    if (start > end || start >= size) return false;
+    return { start, end };
+}
+
+function sendError(res, error) {
+    if (error.code === 'ENOENT' || error.code === 'EISDIR') {
+        res.writeHead(404);
+        res.end('404 Not Found');
+    } else {
+        res.writeHead(500);
+        res.end('Sorry, check with the site admin for error: ' + error.code + ' ..\n');
+    }
+}
+
+async function serveStatic(req, res) {
+    const [pathname, query = ''] = req.url.split('?');
+    let urlPath;
+    try {
+        urlPath = decodeURIComponent(pathname);
+    } catch (error) {
+        res.writeHead(400);
+        res.end('400 Bad Request');
+        return;
+    }
+    if (urlPath === '/') {
+        urlPath = '/office.html';
+    }
+
+    // Resolve inside ROOT only
+    const filePath = path.join(ROOT, path.normalize(urlPath));
+    if (!filePath.startsWith(ROOT + path.sep)) {
+        res.writeHead(403);
+        res.end('403 Forbidden');
+        return;
+    }
+    // Raw beacons and aggregates are only readable through /api/perf/summary
+    if (filePath === PERF_DATA_DIR || filePath.startsWith(PERF_DATA_DIR + path.sep)) {
+        res.writeHead(404);
+        res.end('404 Not Found');
+        return;
     }
 
     const extname = String(path.extname(filePath)).toLowerCase();
-    const mimeTypes = {
-        '.html': 'text/html',
-        '.js': 'text/javascript',
-        '.css': 'text/css',
-        '.json': 'application/json',
-        '.png': 'image/png',
-        '.jpg': 'image/jpg',
-        '.gif': 'image/gif',
-        '.svg': 'image/svg+xml',
-        '.wav': 'audio/wav',
-        '.mp4': 'video/mp4',
-        '.woff': 'application/font-woff',
-        '.ttf': 'application/font-ttf',
-        '.eot': 'application/vnd.ms-fontobject',
-        '.otf': 'application/font-otf',
-        '.wasm': 'application/wasm'
+    const contentType = mimeTypes[extname] || 'application/octet-stream';
+
+    const stat = await fs.promises.stat(filePath);
+    if (!stat.isFile()) throw Object.assign(new Error('Not a file'), { code: 'EISDIR' });
+
+    const range = parseRange(req.headers.range, stat.size);
+    // Large files and byte ranges are streamed straight from disk, uncompressed
+    const streamed = range !== null || stat.size > MAX_CACHED_FILE_BYTES;
+    const entry = streamed ? null : await getEntry(filePath, stat, contentType);
+    const encoding = entry ? pickEncoding(req, entry) : null;
+
+    const etag = makeETag(stat, encoding);
+    const versioned = new URLSearchParams(query).has('v');
+    const headers = {
+        'Content-Type': contentType,
+        'ETag': etag,
+        'Last-Modified': stat.mtime.toUTCString(),
+        'Cache-Control': versioned ? IMMUTABLE_CACHE_CONTROL : REVALIDATE_CACHE_CONTROL,
+        'Accept-Ranges': 'bytes'
     };
+    if (entry && (entry.gzip || entry.br)) headers['Vary'] = 'Accept-Encoding';
+    if (contentType === 'text/html') headers['Server-Timing'] = BEACON_SERVER_TIMING;
 
-    const contentType = mimeTypes[extname] || 'application/octet-stream';
+    if (etagMatches(req.headers['if-none-match'], etag)) {
+        res.writeHead(304, headers);
+        res.end();
+        return;
+    }
 
-    fs.readFile(filePath, (error, content) => {
-        if (error) {
-            if (error.code == 'ENOENT') {
-                res.writeHead(404);
-                res.end('404 Not Found');
-            } else {
-                res.writeHead(500);
-                res.end('Sorry, check with the site admin for error: ' + error.code + ' ..\n');
-            }
-        } else {
-            res.writeHead(200, { 'Content-Type': contentType });
-            res.end(content, 'utf-8');
+    if (range === false) {
+        res.writeHead(416, { 'Content-Range': `bytes */${stat.size}` });
+        res.end();
+        return;
+    }
+
+    if (streamed) {
+        const start = range ? range.start : 0;
+        const end = range ? range.end : stat.size - 1;
+        headers['Content-Length'] = end - start + 1;
+        if (range) headers['Content-Range'] = `bytes ${start}-${end}/${stat.size}`;
+        res.writeHead(range ? 206 : 200, headers);
+        if (req.method === 'HEAD' || stat.size === 0) {
+            res.end();
+            return;
+        }
+        const stream = fs.createReadStream(filePath, { start, end });
+        stream.on('error', () => res.destroy());
+        stream.pipe(res);
+        return;
+    }
+
+    const body = encoding ? entry[encoding] : entry.body;
+    if (encoding) headers['Content-Encoding'] = encoding;
+    headers['Content-Length'] = body.length;
+
+    res.writeHead(200, headers);
+    res.end(req.method === 'HEAD' ? undefined : body);
+}
+
+/**
+ * Append-only NDJSON log split into beacons-YYYY-MM-DD[-N].ndjson files: a new file
+ * each day and whenever the current one passes MAX_LOG_BYTES. Writes are queued on
+ * one promise chain so lines never interleave and requests never wait on disk.
+ */
+class RotatingLog {
+    constructor(dir) {
+        this.dir = dir;
+        this.file = null; // {date, index, bytes}
+        this.pending = Promise.resolve();
+    }
+
+    append(lines) {
+        this.pending = this.pending
+            .then(() => this._write(lines))
+            .catch(error => console.error(`Beacon log write failed: ${error.message}`));
+        return this.pending;
+    }
+
+    async _write(lines) {
+        const data = Buffer.from(lines.map(line => JSON.stringify(line) + '\n').join(''));
+        const date = new Date().toISOString().slice(0, 10);
+        if (!this.file || this.file.date !== date) {
+            await fs.promises.mkdir(this.dir, { recursive: true });
+            this.file = await this._latest(date);
+        }
+        if (this.file.bytes > 0 && this.file.bytes + data.length > MAX_LOG_BYTES) {
+            this.file = { date, index: this.file.index + 1, bytes: 0 };
+        }
+        if (this.file.bytes === 0) await this._prune();
+        await fs.promises.appendFile(this._path(this.file), data);
+        this.file.bytes += data.length;
+    }
+
+    _path({ date, index }) {
+        return path.join(this.dir, index === 0 ? `beacons-${date}.ndjson` : `beacons-${date}-${index}.ndjson`);
+    }
+
+    // Continue today's newest file after a restart
+    async _latest(date) {
+        const pattern = new RegExp(`^beacons-${date}(?:-(\\d+))?\\.ndjson$`);
+        let index = 0;
+        (await fs.promises.readdir(this.dir)).forEach(name => {
+            const match = pattern.exec(name);
+            if (match) index = Math.max(index, Number(match[1] || 0));
+        });
+        const file = { date, index, bytes: 0 };
+        try {
+            file.bytes = (await fs.promises.stat(this._path(file))).size;
+        } catch (error) {
+            if (error.code !== 'ENOENT') throw error;
+        }
+        return file;
+    }
+
+    // Keep the newest MAX_LOG_FILES - 1 files, leaving room for the one about to be started
+    async _prune() {
+        const names = (await fs.promises.readdir(this.dir)).filter(name => /^beacons-.*\.ndjson$/.test(name));
+        if (names.length < MAX_LOG_FILES) return;
+        const files = await Promise.all(names.map(async name => {
+            const filePath = path.join(this.dir, name);
+            return { filePath, mtimeMs: (await fs.promises.stat(filePath)).mtimeMs };
+        }));
+        files.sort((a, b) => a.mtimeMs - b.mtimeMs);
+        await Promise.all(files.slice(0, files.length - MAX_LOG_FILES + 1).map(file => fs.promises.unlink(file.filePath)));
+    }
+}
+
+function percentile(sorted, p) {
+    return sorted[Math.min(sorted.length - 1, Math.max(0, Math.ceil(p / 100 * sorted.length) - 1))];
+}
+
+/**
+ * Rolling aggregates of beacon metrics, grouped by room and by device tier.
+ * Each group keeps the last AGGREGATE_WINDOW values of every metric; summary()
+ * reduces them to n / mean / p50 / p95. State survives restarts via aggregates.json.
+ */
+class BeaconAggregates {
+    constructor(filePath) {
+        this.filePath = filePath;
+        // kind -> Map(key -> {reports, lastSeen, samples: Map(metric -> number[])}); Maps, so keys
+        // coming from clients can never reach Object.prototype
+        this.groups = { rooms: new Map(), devices: new Map() };
+        this._saveTimer = null;
+    }
+
+    load() {
+        try {
+            const saved = JSON.parse(fs.readFileSync(this.filePath, 'utf8'));
+            if (!saved || !saved.groups) return;
+            Object.keys(this.groups).forEach(kind => {
+                Object.entries(saved.groups[kind] || {}).forEach(([key, group]) => {
+                    this.groups[kind].set(key, {
+                        reports: group.reports,
+                        lastSeen: group.lastSeen,
+                        samples: new Map(Object.entries(group.samples || {}))
+                    });
+                });
+            });
+        } catch (error) {
+            if (error.code !== 'ENOENT') console.error(`Ignoring unreadable ${this.filePath}: ${error.message}`);
+        }
+    }
+
+    add(report) {
+        this._addTo('rooms', report.room, report);
+        this._addTo('devices', report.device.tier, report);
+        this._scheduleSave();
+    }
+
+    _addTo(kind, key, report) {
+        let group = this.groups[kind].get(key);
+        if (!group) {
+            group = { reports: 0, lastSeen: null, samples: new Map() };
+            this.groups[kind].set(key, group);
         }
+        group.reports++;
+        group.lastSeen = report.received;
+        Object.entries(report.metrics).forEach(([name, value]) => {
+            let values = group.samples.get(name);
+            if (!values) {
+                values = [];
+                group.samples.set(name, values);
+            }
+            values.push(value);
+            if (values.length > AGGREGATE_WINDOW) values.splice(0, values.length - AGGREGATE_WINDOW);
+        });
+    }
+
+    summary() {
+        const summary = { updated: new Date().toISOString(), window: AGGREGATE_WINDOW };
+        Object.entries(this.groups).forEach(([kind, groups]) => {
+            summary[kind] = Object.fromEntries([...groups].map(([key, group]) => {
+                const metrics = Object.fromEntries([...group.samples].map(([name, values]) => {
+                    const sorted = [...values].sort((a, b) => a - b);
+                    const mean = sorted.reduce((sum, value) => sum + value, 0) / sorted.length;
+                    return [name, { n: sorted.length, mean, p50: percentile(sorted, 50), p95: percentile(sorted, 95) }];
+                }));
+                return [key, { reports: group.reports, lastSeen: group.lastSeen, metrics }];
+            }));
+        });
+        return summary;
+    }
+
+    // Debounced; the file holds the raw windows plus the summary perf_report.py prints
+    _scheduleSave() {
+        if (this._saveTimer) return;
+        this._saveTimer = setTimeout(() => {
+            this._saveTimer = null;
+            const tmpPath = `${this.filePath}.tmp`;
+            fs.promises.mkdir(path.dirname(this.filePath), { recursive: true })
+                .then(() => fs.promises.writeFile(tmpPath, this._serialize()))
+                .then(() => fs.promises.rename(tmpPath, this.filePath))
+                .catch(error => console.error(`Saving beacon aggregates failed: ${error.message}`));
+        }, AGGREGATE_SAVE_DELAY_MS);
+        this._saveTimer.unref();
+    }
+
+    // Write pending changes before the process exits
+    saveSync() {
+        if (!this._saveTimer) return;
+        clearTimeout(this._saveTimer);
+        this._saveTimer = null;
+        fs.mkdirSync(path.dirname(this.filePath), { recursive: true });
+        fs.writeFileSync(this.filePath, this._serialize());
+    }
+
+    _serialize() {
+        const groups = {};
+        Object.entries(this.groups).forEach(([kind, byKey]) => {
+            groups[kind] = Object.fromEntries([...byKey].map(([key, group]) => [
+                key, { reports: group.reports, lastSeen: group.lastSeen, samples: Object.fromEntries(group.samples) }
+            ]));
+        });
+        return JSON.stringify({ summary: this.summary(), groups });
+    }
+}
+
+const beaconLog = new RotatingLog(PERF_DATA_DIR);
+const aggregates = new BeaconAggregates(path.join(PERF_DATA_DIR, 'aggregates.json'));
+aggregates.load();
+
+// Names that mean something on a plain object; never accepted as labels
+const RESERVED_LABELS = new Set(Object.getOwnPropertyNames(Object.prototype));
+
+function cleanLabel(value, maxLength = 64) {
+    if (typeof value !== 'string' || !/^[\w.-]+$/.test(value) || RESERVED_LABELS.has(value)) return null;
+    return value.slice(0, maxLength);
+}
+
+function cleanNumber(value) {
+    return typeof value === 'number' && Number.isFinite(value) && value >= 0 ? value : null;
+}
+
+// Validate one report from the page; returns the record to store, or null to drop it
+function sanitizeReport(raw, received) {
+    if (!raw || typeof raw !== 'object' || !raw.metrics || typeof raw.metrics !== 'object') return null;
+    const room = cleanLabel(raw.room);
+    if (!room) return null;
+
+    const metrics = {};
+    BEACON_METRICS.forEach(name => {
+        const value = cleanNumber(raw.metrics[name]);
+        if (value !== null) metrics[name] = value;
+    });
+    const device = raw.device && typeof raw.device === 'object' ? raw.device : {};
+    return {
+        received,
+        room,
+        session: cleanLabel(raw.session),
+        seq: cleanNumber(raw.seq),
+        reason: cleanLabel(raw.reason),
+        quality: cleanLabel(raw.quality),
+        snapshot: raw.snapshot === true,
+        device: {
+            tier: DEVICE_TIERS.has(device.tier) ? device.tier : 'unknown',
+            cores: cleanNumber(device.cores),
+            memoryGb: cleanNumber(device.memoryGb),
+            dpr: cleanNumber(device.dpr),
+            screen: typeof device.screen === 'string' ? device.screen.slice(0, 32) : null,
+            touch: device.touch === true,
+            gpu: typeof device.gpu === 'string' ? device.gpu.slice(0, 200) : null
+        },
+        metrics
+    };
+}
+
+function sendJson(res, status, body) {
+    const data = JSON.stringify(body);
+    res.writeHead(status, {
+        'Content-Type': 'application/json',
+        'Content-Length': Buffer.byteLength(data),
+        'Cache-Control': 'no-store'
+    });
+    res.end(data);
+}
+
+// Read a request body up to `limit` bytes; resolves null if it is larger
+function readBody(req, limit) {
+    return new Promise((resolve, reject) => {
+        const chunks = [];
+        let size = 0;
+        req.on('data', chunk => {
+            size += chunk.length;
+            if (size <= limit) chunks.push(chunk);
+        });
+        req.on('end', () => resolve(size <= limit ? Buffer.concat(chunks) : null));
+        req.on('error', reject);
     });
+}
+
+async function receiveBeacon(req, res) {
+    const body = await readBody(req, MAX_BEACON_BYTES);
+    if (body === null) {
+        sendJson(res, 413, { error: `Beacon larger than ${MAX_BEACON_BYTES} bytes` });
+        return;
+    }
+    let payload;
+    try {
+        payload = JSON.parse(body.toString('utf8'));
+    } catch (error) {
+        sendJson(res, 400, { error: 'Beacon is not valid JSON' });
+        return;
+    }
+    if (!payload || !Array.isArray(payload.reports)) {
+        sendJson(res, 400, { error: 'Beacon has no reports array' });
+        return;
+    }
+
+    const received = new Date().toISOString();
+    const reports = payload.reports.slice(0, MAX_REPORTS_PER_BEACON)
+        .map(raw => sanitizeReport(raw, received))
+        .filter(Boolean);
+    reports.forEach(report => aggregates.add(report));
+    if (reports.length > 0) beaconLog.append(reports);
+    // Answer before the log write lands; the browser never reads a beacon response anyway
+    res.writeHead(204);
+    res.end();
+}
+
+// /api/* routes; everything else is a static file
+function handleApi(req, res, pathname) {
+    if (pathname === '/api/perf') {
+        if (req.method !== 'POST') {
+            res.writeHead(405, { 'Allow': 'POST' });
+            res.end();
+            return;
+        }
+        receiveBeacon(req, res).catch(error => sendJson(res, 500, { error: error.message }));
+    } else if (pathname === '/api/perf/summary') {
+        if (req.method !== 'GET' && req.method !== 'HEAD') {
+            res.writeHead(405, { 'Allow': 'GET, HEAD' });
+            res.end();
+            return;
+        }
+        sendJson(res, 200, aggregates.summary());
+    } else {
+        sendJson(res, 404, { error: 'Unknown API route' });
+    }
+}
+
+const server = http.createServer((req, res) => {
+    const pathname = req.url.split('?')[0];
+    if (pathname.startsWith('/api/')) {
+        handleApi(req, res, pathname);
+        return;
+    }
+    if (req.method !== 'GET' && req.method !== 'HEAD') {
+        res.writeHead(405, { 'Allow': 'GET, HEAD' });
+        res.end();
+        return;
+    }
+    serveStatic(req, res).catch(error => sendError(res, error));
 });
 
-server.listen(8081);
-console.log('Server running at http://127.0.0.1:8081/');
+['SIGINT', 'SIGTERM'].forEach(signal => process.on(signal, () => {
+    aggregates.saveSync();
+    process.exit(0);
+}));
+
+server.listen(PORT);
+console.log(`Server running at http://127.0.0.1:${PORT}/`);
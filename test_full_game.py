@@ -1,7 +1,7 @@
 
 import pytest
-from playwright.sync_api import sync_playwright
-import time
+
+from conftest import wait_for_game
 
 def solve_clue(page, location_name):
     print(f"Solving clue at: {location_name}")
@@ -56,94 +56,83 @@ def solve_clue(page, location_name):
     page.wait_for_selector("#clueModal", state="hidden")
 
 
-def test_full_game_walkthrough():
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        context = browser.new_context()
-        page = context.new_page()
-
-        # Enable DEV mode to expose gameLogic
-        page.add_init_script("window.__DEV__ = true;")
-
-        # Abort model requests to speed up test and avoid WebGL complexity
-        page.route("**/*.glb", lambda route: route.abort())
-
-        page.goto("http://localhost:8000/office.html")
-
-        # Wait for instructions and click
-        page.wait_for_selector("#instructions", state="visible")
-        page.click("#instructions")
-
-        # Wait for gameLogic initialization
-        print("Waiting for game initialization...")
-        try:
-            page.wait_for_function("""() => {
-                return window.gameLogic &&
-                       Object.values(window.gameLogic.locationMap).some(v => v !== null);
-            }""", timeout=10000)
-        except Exception as e:
-            pytest.fail(f"Timed out waiting for game init: {e}")
-
-        # Get clue locations from exposed gameLogic
-        clue_locations = page.evaluate("""() => {
-            const locs = [];
-            for (const [loc, slot] of Object.entries(window.gameLogic.locationMap)) {
-                if (slot !== null) {
-                    locs.push({loc: loc, slot: slot});
-                }
+def test_full_game_walkthrough(dev_page):
+    # dev_page sets window.__DEV__ to expose gameLogic
+    page = dev_page
+
+    # Abort model requests to speed up test and avoid WebGL complexity
+    page.route("**/*.glb", lambda route: route.abort())
+
+    page.goto("/office.html")
+
+    # Wait for instructions and click
+    page.wait_for_selector("#instructions", state="visible")
+    page.click("#instructions")
+
+    # Wait for gameLogic initialization
+    print("Waiting for game initialization...")
+    try:
+        wait_for_game(page)
+    except Exception as e:
+        pytest.fail(f"Timed out waiting for game init: {e}")
+
+    # Get clue locations from exposed gameLogic
+    clue_locations = page.evaluate("""() => {
+        const locs = [];
+        for (const [loc, slot] of Object.entries(window.gameLogic.locationMap)) {
+            if (slot !== null) {
+                locs.push({loc: loc, slot: slot});
             }
-            return locs;
-        }""")
+        }
+        return locs;
+    }""")
 
-        print(f"Clues found at: {clue_locations}")
-        assert len(clue_locations) == 4
+    print(f"Clues found at: {clue_locations}")
+    assert len(clue_locations) == 4
 
-        # Solve clues
-        for item in clue_locations:
-            solve_clue(page, item['loc'])
-            time.sleep(0.5)
+    # Solve clues
+    for item in clue_locations:
+        solve_clue(page, item['loc'])
 
-        # Verify solved
-        all_solved = page.evaluate("""() => {
-            return window.gameLogic.activeClues.every(c => c.solved);
-        }""")
-        assert all_solved is True, "Not all clues solved"
+    # Verify solved
+    all_solved = page.evaluate("""() => {
+        return window.gameLogic.activeClues.every(c => c.solved);
+    }""")
+    assert all_solved is True, "Not all clues solved"
 
-        # Safe
-        print("Opening Safe...")
-        page.evaluate("""async () => {
-            const ui = await import('./assets/js/ui.js');
-            ui.showModal("safe", {});
-        }""")
+    # Safe
+    print("Opening Safe...")
+    page.evaluate("""async () => {
+        const ui = await import('./assets/js/ui.js');
+        ui.showModal("safe", {});
+    }""")
 
-        # Enter 1858
-        for digit in "1858":
-             page.locator(f".key-btn:has-text('{digit}')").first.click()
-             time.sleep(0.1)
+    # Enter 1858
+    for digit in "1858":
+        page.locator(f".key-btn:has-text('{digit}')").first.click()
 
-        page.locator(".key-btn:has-text('E')").click()
+    page.locator(".key-btn:has-text('E')").click()
 
-        # Take key
-        page.wait_for_selector("button:has-text('TAKE KEY')")
-        page.click("button:has-text('TAKE KEY')")
+    # Take key
+    page.wait_for_selector("button:has-text('TAKE KEY')")
+    page.click("button:has-text('TAKE KEY')")
 
-        # Verify key
-        has_key = page.evaluate("""() => {
-            return window.gameLogic.hasSkeletonKey;
-        }""")
-        assert has_key is True
+    # Verify key
+    has_key = page.evaluate("""() => {
+        return window.gameLogic.hasSkeletonKey;
+    }""")
+    assert has_key is True
 
-        # Door
-        print("Escaping...")
-        page.evaluate("""async () => {
-            const ui = await import('./assets/js/ui.js');
-            ui.showModal("door", {});
-        }""")
+    # Door
+    print("Escaping...")
+    page.evaluate("""async () => {
+        const ui = await import('./assets/js/ui.js');
+        ui.showModal("door", {});
+    }""")
 
-        page.wait_for_selector("#victoryModal", state="visible")
-        print("Victory!")
+    page.wait_for_selector("#victoryModal", state="visible")
+    print("Victory!")
 
-        browser.close()
 
 if __name__ == "__main__":
-    test_full_game_walkthrough()
+    raise SystemExit(pytest.main([__file__, "-q", "-s"]))
@@ -0,0 +1,47 @@
+import pytest
+
+from conftest import wait_for_game
+
+MODES = ["classic", "code_door", "access_cards", "hidden_key", "trail"]
+
+
+@pytest.fixture
+def driver(dev_page):
+    dev_page.goto("/office.html")
+    wait_for_game(dev_page)
+    dev_page.wait_for_function("() => !!window.gameDriver")
+    return dev_page
+
+
+def play(page, runs):
+    return page.evaluate("(runs) => window.gameDriver.playGames(runs)", runs)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_driver_wins_every_mode(driver, mode):
+    [trace] = play(driver, [{"mode": mode, "seed": f"walkthrough-{mode}"}])
+    assert trace["won"], trace["stuck"]
+    assert trace["violations"] == []
+    assert trace["wrong"] == 0
+
+
+def test_same_seed_replays_the_same_game(driver):
+    runs = [{"mode": "trail", "seed": "replay", "wrongRate": 0.4}] * 2
+    first, second = play(driver, runs)
+    assert first == second
+
+
+def test_randomized_walkthroughs(driver):
+    # Wrong answers move clues (moveClue) and re-deal the trail (shuffleAllClues)
+    runs = [{"mode": mode, "seed": i, "wrongRate": 0.35} for i in range(40) for mode in MODES]
+    traces = play(driver, runs)
+
+    failures = [(t["mode"], t["seed"], t["stuck"], t["violations"]) for t in traces
+                if not t["won"] or t["violations"]]
+    assert failures == []
+    assert sum(t["moves"] for t in traces) > 0
+    assert sum(t["shuffles"] for t in traces) > 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
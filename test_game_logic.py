@@ -1,91 +1,144 @@
 
-from playwright.sync_api import sync_playwright
-
-def test_game_logic_initialization():
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto("http://localhost:8000/test_runner.html")
-        page.wait_for_function("window.testReady === true")
-
-        # Test initGame
-        result = page.evaluate("""() => {
-            window.gameLogic.initGame();
-            return {
-                safeAttempts: window.gameLogic.safeAttempts,
-                activeCluesLength: window.gameLogic.activeClues.length,
-                locationMapKeys: Object.keys(window.gameLogic.locationMap).length
-            };
-        }""")
-
-        assert result['safeAttempts'] == 3  # Assuming SAFE_ATTEMPTS is 3
-        assert result['activeCluesLength'] == 4
-        assert result['locationMapKeys'] > 0
-
-        browser.close()
-
-def test_move_clue():
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto("http://localhost:8000/test_runner.html")
-        page.wait_for_function("window.testReady === true")
-
-        # Initialize game
-        page.evaluate("window.gameLogic.initGame()")
-
-        # Find a location with a clue
-        clue_location = page.evaluate("""() => {
-            const locs = Object.keys(window.gameLogic.locationMap);
-            return locs.find(loc => window.gameLogic.locationMap[loc] !== null);
-        }""")
-
-        assert clue_location is not None
-
-        # Move the clue
-        new_location = page.evaluate(f"""() => {{
-            const slotIndex = window.gameLogic.locationMap["{clue_location}"];
-            return window.gameLogic.moveClue(slotIndex, "{clue_location}");
-        }}""")
-
-        assert new_location is not None
-        assert new_location != clue_location
-
-        # Verify old location is empty
-        old_loc_value = page.evaluate(f"""() => {{
-            return window.gameLogic.locationMap["{clue_location}"];
-        }}""")
-        assert old_loc_value is None
-
-        # Verify new location has the clue
-        new_loc_value = page.evaluate(f"""() => {{
-            return window.gameLogic.locationMap["{new_location}"];
-        }}""")
-        assert new_loc_value is not None
-
-        browser.close()
-
-def test_skeleton_key():
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page()
-        page.goto("http://localhost:8000/test_runner.html")
-        page.wait_for_function("window.testReady === true")
-
-        # Check default
-        has_key = page.evaluate("window.gameLogic.hasSkeletonKey")
-        assert has_key is False
-
-        # Set key
-        page.evaluate("window.gameLogic.setHasSkeletonKey(true)")
-        has_key = page.evaluate("window.gameLogic.hasSkeletonKey")
-        assert has_key is True
-
-        browser.close()
+import pytest
+
+from conftest import TEST_RUNNER_READY
+
+
+@pytest.fixture
+def runner(page):
+    page.goto("/test_runner.html")
+    page.wait_for_function(TEST_RUNNER_READY)
+    return page
+
+
+def test_game_logic_initialization(runner):
+    # Test initGame
+    result = runner.evaluate("""() => {
+        window.gameLogic.initGame();
+        return {
+            safeAttempts: window.gameLogic.safeAttempts,
+            activeCluesLength: window.gameLogic.activeClues.length,
+            locationMapKeys: Object.keys(window.gameLogic.locationMap).length
+        };
+    }""")
+
+    assert result['safeAttempts'] == 3  # Assuming SAFE_ATTEMPTS is 3
+    assert result['activeCluesLength'] == 4
+    assert result['locationMapKeys'] > 0
+
+
+def test_move_clue(runner):
+    # Initialize game
+    runner.evaluate("window.gameLogic.initGame()")
+
+    # Find a location with a clue
+    clue_location = runner.evaluate("""() => {
+        const locs = Object.keys(window.gameLogic.locationMap);
+        return locs.find(loc => window.gameLogic.locationMap[loc] !== null);
+    }""")
+
+    assert clue_location is not None
+
+    # Move the clue
+    new_location = runner.evaluate("""(loc) => {
+        const slotIndex = window.gameLogic.locationMap[loc];
+        return window.gameLogic.moveClue(slotIndex, loc);
+    }""", clue_location)
+
+    assert new_location is not None
+    assert new_location != clue_location
+
+    # Verify old location is empty
+    old_loc_value = runner.evaluate("(loc) => window.gameLogic.locationMap[loc]", clue_location)
+    assert old_loc_value is None
+
+    # Verify new location has the clue
+    new_loc_value = runner.evaluate("(loc) => window.gameLogic.locationMap[loc]", new_location)
+    assert new_loc_value is not None
+
+
+def test_skeleton_key(runner):
+    # Check default
+    has_key = runner.evaluate("window.gameLogic.hasSkeletonKey")
+    assert has_key is False
+
+    # Set key
+    runner.evaluate("window.gameLogic.setHasSkeletonKey(true)")
+    has_key = runner.evaluate("window.gameLogic.hasSkeletonKey")
+    assert has_key is True
+
+
+def test_seeded_game_replays(runner):
+    deal = """(seed) => {
+        window.gameLogic.initGame(seed);
+        return {
+            clues: window.gameLogic.activeClues.map(c => c.qIndex),
+            map: { ...window.gameLogic.locationMap },
+            seed: window.gameLogic.gameSeed
+        };
+    }"""
+    first = runner.evaluate(deal, "replay-42")
+    second = runner.evaluate(deal, "replay-42")
+
+    assert first == second
+    assert first['seed'] == "replay-42"
+    # Four distinct questions on four distinct locations
+    assert len(set(first['clues'])) == 4
+    assert sum(1 for v in first['map'].values() if v is not None) == 4
+
+
+def test_question_bank_draws_without_replacement(runner):
+    result = runner.evaluate("""async () => {
+        const { QuestionBank, LocationSet, createRng } = await import('./assets/js/questionBank.js');
+        const questions = Array.from({ length: 2000 }, (_, i) => ({ t: 'topic' + (i % 7), q: 'Q' + i }));
+        const bank = new QuestionBank(questions);
+        bank.reset(createRng(7));
+        const drawn = new Set();
+        for (let i = 0; i < questions.length; i++) drawn.add(bank.draw());
+
+        const free = new LocationSet(['a', 'b', 'c']);
+        const rng = createRng(7);
+        const taken = [free.take(rng), free.take(rng), free.take(rng), free.take(rng)];
+        return {
+            distinct: drawn.size,
+            topic: bank.byTopic('topic3').length,
+            except: bank.drawExcept(new Set([0, 1, 2])),
+            taken
+        };
+    }""")
+
+    assert result['distinct'] == 2000
+    assert result['topic'] == 286
+    assert result['except'] not in (0, 1, 2)
+    assert sorted(result['taken'][:3]) == ['a', 'b', 'c']
+    assert result['taken'][3] is None
+
+
+def test_draw_except_finds_the_last_candidate(runner):
+    # Small pools across pass boundaries: -1 only when every question is excluded
+    result = runner.evaluate("""async () => {
+        const { QuestionBank, createRng } = await import('./assets/js/questionBank.js');
+        const rng = createRng(17);
+        const misses = [];
+        for (const n of [2, 3, 5, 8]) {
+            const bank = new QuestionBank(Array.from({ length: n }, (_, i) => ({ t: 'x', q: 'Q' + i })));
+            bank.reset(createRng(n));
+            for (let i = 0; i < 20000; i++) {
+                const keep = Math.floor(rng() * n);
+                const exclude = new Set(Array.from({ length: n }, (_, j) => j).filter(j => j !== keep));
+                exclude.add(-1); // Unassigned clues have qIndex -1
+                const index = bank.drawExcept(exclude);
+                if (index !== keep) misses.push({ n, keep, index });
+            }
+        }
+        const full = new QuestionBank([{ q: 'a' }, { q: 'b' }]);
+        return { misses: misses.slice(0, 5), allExcluded: full.drawExcept(new Set([0, 1])) };
+    }""")
+
+    assert result['misses'] == []
+    assert result['allExcluded'] == -1
+
 
 if __name__ == "__main__":
-    # If run directly, run the tests
-    test_game_logic_initialization()
-    test_move_clue()
-    test_skeleton_key()
-    print("All game logic tests passed!")
+    # If run directly, run the tests through pytest so the fixtures apply
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,86 @@
+
+import pytest
+
+from conftest import wait_for_engine, wait_for_frames
+
+GPU_MEMORY = "() => ({ ...window.engine.renderer.info.memory })"
+
+
+def test_tv_remote_does_not_leak(dev_page):
+    # dev_page exposes window.officeState so the shredder can be marked solved
+    page = dev_page
+    page.goto("/office.html")
+    wait_for_engine(page)
+    page.evaluate("() => { window.officeState.shredderSolved = true; }")
+
+    counts = []
+    for _ in range(6):
+        page.evaluate("""async () => {
+            window.engine.config.onInteract('remote', null);
+            const ui = await import('./assets/js/ui.js');
+            ui.closeModal();
+            window.engine.requestRender();
+        }""")
+        wait_for_frames(page)
+        counts.append(page.evaluate(GPU_MEMORY))
+
+    # The first click uploads the clue texture; later clicks must reuse it
+    assert all(c == counts[1] for c in counts[1:]), counts
+    assert page.evaluate("() => window.engine.resourceLeakWarnings") == 0
+
+
+# Hide the tab, pretend `seconds` passed, show it again; returns the countdown before/after
+HIDE_TAB = """async (seconds) => {
+    const engine = window.engine;
+    const setHidden = hidden => {
+        Object.defineProperty(document, 'hidden', { value: hidden, configurable: true });
+        document.dispatchEvent(new Event('visibilitychange'));
+    };
+    let timeUp = false;
+    engine.addEventListener('timeup', () => { timeUp = true; });
+    const before = engine.timeLeft;
+    setHidden(true);
+    engine._hiddenAt -= seconds * 1000;
+    setHidden(false);
+    const resumedPrevTime = engine.prevTime;
+    await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+    return { before, after: engine.timeLeft, timeUp, frameGap: performance.now() - resumedPrevTime };
+}"""
+
+
+def test_countdown_keeps_running_while_hidden(open_room):
+    page = open_room("/classroom.html")
+    wait_for_frames(page)
+
+    result = page.evaluate(HIDE_TAB, 30)
+    assert result["before"] - result["after"] >= 30
+    # Movement and animations restart from a fresh clock, not a 30 s delta
+    assert result["frameGap"] < 1000
+    assert not result["timeUp"]
+
+    page.evaluate("() => { window.engine.timeLeft = 10; }")
+    result = page.evaluate(HIDE_TAB, 30)
+    assert result["after"] == 0
+    assert result["timeUp"]
+
+
+def test_dispose_frees_gpu_resources(open_room):
+    page = open_room("/classroom.html")
+    wait_for_frames(page)
+    assert page.evaluate(GPU_MEMORY)["geometries"] > 0
+
+    after = page.evaluate("""() => {
+        const engine = window.engine;
+        engine.dispose();
+        return {
+            ...engine.renderer.info.memory,
+            running: engine.running,
+            canvases: document.querySelectorAll('canvas').length,
+            cached: engine.resourceStats.geometries.unique + engine.resourceStats.materials.unique
+        };
+    }""")
+    assert after == {"geometries": 0, "textures": 0, "running": False, "canvases": 0, "cached": 0}
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
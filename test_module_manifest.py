@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from build_module_manifest import ROOM_PAGES, build, stale_files
+from conftest import wait_for_engine
+
+
+def test_manifest_and_preloads_are_current():
+    assert stale_files(build()) == []
+
+
+def test_rooms_skip_modules_they_do_not_need():
+    rooms = json.loads(build()["assets/module-manifest.json"])["rooms"]
+    assert set(rooms) == set(ROOM_PAGES)
+    for room in ("classroom", "science_lab"):
+        assert "assets/js/prefabs.js" not in rooms[room]["preload"]
+        assert "assets/js/commonPrefabs.js" in rooms[room]["preload"]
+    for info in rooms.values():
+        # Description tables are a lazy chunk, never preloaded
+        assert "assets/js/cyclingDescriptions.js" not in info["preload"]
+    # The game driver is only imported with window.__DEV__
+    assert sorted(rooms["office"]["lazy"]) == ["assets/js/cyclingDescriptions.js", "assets/js/gameDriver.js"]
+
+
+def test_preloaded_room_reaches_interactive(page):
+    page.goto("/classroom.html")
+    wait_for_engine(page)
+    result = page.evaluate("""async () => {
+        const ui = await import('./assets/js/ui.js');
+        const descriptions = await ui.loadCyclingDescriptions();
+        return {
+            preloads: document.querySelectorAll('link[rel=modulepreload]').length,
+            cycling: descriptions.hasCyclingDescriptions('desk'),
+            interactive: performance.getEntriesByName('room-interactive').length
+        };
+    }""")
+    assert result["preloads"] > 0
+    assert result["cycling"] is True
+    assert result["interactive"] == 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
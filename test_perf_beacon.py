@@ -0,0 +1,110 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from conftest import ROOT, static_server, wait_for_frames
+
+# The beacon endpoint lives in server.js; the Python fallback server only serves files
+pytestmark = pytest.mark.skipif(shutil.which("node") is None, reason="needs server.js (Node)")
+
+SEND_REPORT = """() => {
+    const report = window.engine.beacon.report('test');
+    window.engine.beacon.flush();
+    return report;
+}"""
+
+
+def room_summary(page, room, reports, timeout=5):
+    """Poll /api/perf/summary until `room` has at least `reports` reports."""
+    deadline = time.monotonic() + timeout
+    while True:
+        summary = page.request.get("/api/perf/summary").json()
+        group = summary["rooms"].get(room)
+        if (group and group["reports"] >= reports) or time.monotonic() > deadline:
+            return summary
+        time.sleep(0.1)
+
+
+def test_room_reports_reach_aggregates(open_room):
+    page = open_room("/classroom.html")
+    wait_for_frames(page, 10)
+    # On by default only because server.js marked the page
+    assert page.evaluate("""() => performance.getEntriesByType('navigation')[0]
+        .serverTiming.map(entry => entry.name)""") == ["perf-beacon"]
+    assert page.evaluate("window.engine.beacon.enabled") is True
+
+    report = page.evaluate(SEND_REPORT)
+    assert report["room"] == "classroom"
+    assert report["device"]["tier"] in ("low", "mid", "high")
+    assert report["metrics"]["frames"] > 0
+    assert report["metrics"]["stalls"] >= 0
+    assert report["metrics"]["ttffMs"] > 0
+    assert report["metrics"]["drawCalls"] > 0
+
+    summary = room_summary(page, "classroom", 1)
+    group = summary["rooms"]["classroom"]
+    assert group["reports"] >= 1
+    for metric in ("ttffMs", "frameP95", "drawCalls", "triangles"):
+        assert group["metrics"][metric]["n"] >= 1
+    assert summary["devices"][report["device"]["tier"]]["reports"] >= 1
+
+
+def test_beacons_can_be_turned_off(open_room):
+    page = open_room("/classroom.html?beacon=0")
+    assert page.evaluate("window.engine.beacon.enabled") is False
+    assert page.evaluate(SEND_REPORT) is None
+
+
+def test_endpoint_rejects_bad_beacons(page):
+    api = page.request
+    before = api.get("/api/perf/summary").json()["rooms"]
+
+    assert api.post("/api/perf", data="not json").status == 400
+    assert api.post("/api/perf", data=json.dumps({"reports": "x"})).status == 400
+    assert api.post("/api/perf", data="x" * (65 * 1024)).status == 413
+    assert api.get("/api/perf").status == 405
+    # Unknown metrics and invalid room names are dropped, not stored
+    bad = {"reports": [{"room": "../etc", "metrics": {"ttffMs": 1}},
+                       {"room": "test_room", "metrics": {"ttffMs": -1, "heapMb": 5, "frameP50": "16"}}]}
+    assert api.post("/api/perf", data=json.dumps(bad)).status == 204
+    # Labels that name Object.prototype members must not touch the aggregates' prototypes
+    reserved = {"reports": [{"room": room, "device": {"tier": "high"}, "metrics": {"ttffMs": 1}}
+                            for room in ("__proto__", "constructor", "hasOwnProperty")]}
+    assert api.post("/api/perf", data=json.dumps(reserved)).status == 204
+
+    after = api.get("/api/perf/summary").json()["rooms"]
+    assert "../etc" not in after
+    assert not {"__proto__", "constructor", "hasOwnProperty"} & set(after)
+    assert after["test_room"]["metrics"] == {}
+    assert set(after) - set(before) == {"test_room"}
+
+
+def test_perf_data_is_not_served():
+    # Even when PERF_DATA_DIR sits inside the served root, its files are never served
+    perf_data = tempfile.mkdtemp(prefix="perf-data-", dir=ROOT)
+    name = os.path.basename(perf_data)
+    try:
+        with static_server(perf_data=perf_data) as url:
+            beacon = json.dumps({"reports": [{"room": "test_room", "metrics": {"ttffMs": 1}}]}).encode()
+            with urllib.request.urlopen(urllib.request.Request(f"{url}/api/perf", data=beacon)) as response:
+                assert response.status == 204
+            open(os.path.join(perf_data, "aggregates.json"), "w").close()
+
+            for path in (f"/{name}/aggregates.json", f"/{name}/", f"/{name}%2Faggregates.json"):
+                with pytest.raises(urllib.error.HTTPError) as error:
+                    urllib.request.urlopen(url + path)
+                assert error.value.code == 404
+            with urllib.request.urlopen(f"{url}/api/perf/summary") as response:
+                assert "test_room" in json.load(response)["rooms"]
+    finally:
+        shutil.rmtree(perf_data, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,36 @@
+
+import pytest
+
+from conftest import wait_for_frames
+
+PHASES = {"timer", "animations", "pickIndex", "frame"}
+
+
+def test_perf_snapshot_and_overlay(open_room):
+    page = open_room("/classroom.html?perf")
+    wait_for_frames(page, 10)
+
+    snapshot = page.evaluate("() => window.engine.perf.snapshot()")
+    assert snapshot["frames"] > 0
+    assert PHASES <= set(snapshot["phases"])
+
+    frame = snapshot["phases"]["frame"]
+    assert frame["count"] > 0
+    assert frame["p50"] <= frame["p95"] <= frame["max"]
+    assert sum(frame["buckets"]) == frame["count"]
+    assert len(frame["buckets"]) == len(snapshot["edges"]) + 1
+
+    page.wait_for_selector("#perfOverlay", state="attached")
+
+
+def test_perf_disabled_by_default(open_room):
+    page = open_room("/classroom.html")
+    wait_for_frames(page, 5)
+
+    assert page.evaluate("() => window.engine.perf.enabled") is False
+    assert page.evaluate("() => window.engine.perf.snapshot().frames") == 0
+    assert page.query_selector("#perfOverlay") is None
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
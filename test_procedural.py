@@ -0,0 +1,41 @@
+import pytest
+
+from conftest import wait_for_engine
+
+
+def test_prototype_cache_and_type_resolution(page):
+    warnings = []
+    page.on("console", lambda msg: msg.type == "warning" and warnings.append(msg.text))
+    page.goto("/classroom.html")
+    wait_for_engine(page)
+
+    result = page.evaluate("""async () => {
+        const { generateProceduralObject, resolveProceduralType } = await import('./assets/js/procedural.js');
+        const a = generateProceduralObject('plantsmall1');
+        const b = generateProceduralObject('plantSmall3');
+        const wall = generateProceduralObject('wallWindow');
+        generateProceduralObject('mystery_box');
+        generateProceduralObject('mystery_box');
+        return {
+            distinct: a !== b,
+            sharedGeometry: a.children[0].geometry === b.children[0].geometry,
+            plant: resolveProceduralType('plantsmall2').key,
+            chair: resolveProceduralType('office_chair').generator,
+            wall: resolveProceduralType('wallWindow').key,
+            wallChildren: wall.children.length,
+            fallback: resolveProceduralType('mystery_box').generator
+        };
+    }""")
+
+    assert result["distinct"] and result["sharedGeometry"]
+    assert result["plant"] == "plantSmall"
+    assert result["chair"] == "chair"
+    assert result["wall"] == "wall:Window"
+    assert result["wallChildren"] == 2
+    assert result["fallback"] == "fallback"
+    # Resolution is memoized, so an unknown type warns once
+    assert sum("mystery_box" in text for text in warnings) == 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
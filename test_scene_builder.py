@@ -0,0 +1,71 @@
+import pytest
+
+from conftest import wait_for_engine
+
+# Record when the room finished building (rooms assign window.engine last)
+TRACK_BUILD = """
+window.__build = { engineSetAt: null };
+let engineRef;
+Object.defineProperty(window, 'engine', {
+    configurable: true,
+    get: () => engineRef,
+    set: (value) => { engineRef = value; window.__build.engineSetAt = performance.now(); }
+});
+"""
+
+
+@pytest.mark.parametrize("room", ["/office.html", "/science_lab.html"])
+def test_first_frame_before_build_completes(page, room):
+    page.add_init_script(TRACK_BUILD)
+    page.goto(room)
+    wait_for_engine(page)
+
+    state = page.evaluate("""() => ({
+        firstFrame: performance.getEntriesByName('room-first-frame')[0].startTime,
+        builtAt: window.__build.engineSetAt,
+        progressLeft: !!document.getElementById('loadProgress'),
+        locked: window.engine.interactionLocked,
+        loading: window.engine.loading,
+        interactables: window.engine.interactables.length
+    })""")
+
+    # The shell is drawn while furniture is still being built
+    assert state["firstFrame"] < state["builtAt"]
+    assert not state["progressLeft"]
+    assert not state["locked"] and not state["loading"]
+    assert state["interactables"] > 20
+
+
+# Build one small shadow-casting prop through a SceneBuilder on a running room
+BUILD_PROP = """async () => {
+    const THREE = await import('three');
+    const { SceneBuilder } = await import('./assets/js/sceneBuilder.js');
+    const engine = window.engine;
+    let invalidations = 0;
+    const invalidate = engine.quality.invalidateShadows.bind(engine.quality);
+    engine.quality.invalidateShadows = () => { invalidations++; invalidate(); };
+
+    const prop = new THREE.Mesh(new THREE.BoxGeometry(0.1, 0.1, 0.1), new THREE.MeshStandardMaterial());
+    prop.castShadow = true;
+    const builder = new SceneBuilder(engine, { onProgress: () => {} });
+    builder.add('prop', [0, 0], () => engine.scene.add(prop));
+    builder.start();
+    await builder.done;
+    return { invalidations, propShadow: prop.castShadow };
+}"""
+
+
+@pytest.mark.parametrize("quality, prop_shadow", [("medium", True), ("low", False)])
+def test_build_slices_refresh_baked_shadows(open_room, quality, prop_shadow):
+    page = open_room(f"/classroom.html?quality={quality}")
+    page.wait_for_function("() => !window.engine.loading")
+    result = page.evaluate(BUILD_PROP)
+
+    # Once for the slice, once when the build is done
+    assert result["invalidations"] >= 2
+    # Small props built after the tier was applied follow it
+    assert result["propShadow"] is prop_shadow
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
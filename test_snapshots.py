@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+from bake_rooms import ROOMS, snapshot_path, stale_reason
+from conftest import wait_for_engine
+
+ROOM_STATE = """() => ({
+    snapshotLoaded: window.engine.snapshotLoaded,
+    interactables: window.engine.interactables.map(obj => obj.name).sort()
+})"""
+
+
+def require_snapshot(room):
+    if not os.path.exists(snapshot_path(room)):
+        pytest.skip(f"no baked snapshot for {room} (run python3 bake_rooms.py)")
+
+
+@pytest.mark.parametrize("room", sorted(ROOMS))
+def test_snapshot_is_current(room):
+    require_snapshot(room)
+    assert stale_reason(room) is None
+
+
+@pytest.mark.parametrize("room", sorted(ROOMS))
+def test_snapshot_matches_procedural_build(page, room):
+    require_snapshot(room)
+    path = ROOMS[room]["path"]
+
+    page.goto(f"{path}?snapshot=0")
+    wait_for_engine(page)
+    procedural = page.evaluate(ROOM_STATE)
+
+    page.goto(path)
+    wait_for_engine(page)
+    baked = page.evaluate(ROOM_STATE)
+
+    assert not procedural["snapshotLoaded"]
+    assert baked["snapshotLoaded"]
+    assert baked["interactables"] == procedural["interactables"]
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,124 @@
+import pytest
+
+from conftest import wait_for_frames
+
+LOOK = """([x, z, targetX, targetZ]) => {
+    window.camera.position.set(x, 1.4, z);
+    window.camera.lookAt(targetX, 1.4, targetZ);
+    window.engine.requestRender();
+}"""
+
+# Zone state, draw calls of the last frame and whether a ray at the safe reaches it
+ZONE_STATE = """() => {
+    const engine = window.engine;
+    const safe = engine.interactables.find(obj => obj.name === 'safe');
+    const origin = engine.camera.position;
+    const direction = safe.getWorldPosition(origin.clone()).sub(origin).normalize();
+    engine.raycaster.set(origin, direction);
+    return {
+        culled: engine.zones.culled.sort(),
+        calls: engine.renderer.info.render.calls,
+        safePickable: engine.pickIndex.intersect(engine.raycaster, false).some(hit => hit.object === safe)
+    };
+}"""
+
+
+def look(page, x, z, target_x, target_z):
+    page.evaluate(LOOK, [x, z, target_x, target_z])
+    wait_for_frames(page, 3)
+
+
+def test_hidden_room_and_drawer_culled_until_opened(open_room):
+    page = open_room("/office.html")
+
+    # Facing the closed secret bookshelf: nothing behind it is drawn or pickable
+    look(page, 2, -1.5, 6, -1.5)
+    closed = page.evaluate(ZONE_STATE)
+    assert closed["culled"] == ["hidden_room", "top_drawer"]
+    assert not closed["safePickable"]
+
+    page.evaluate("""() => {
+        window.secretBookshelf.rotation.y = -Math.PI / 2;
+        window.engine.roomBounds.maxX = 8.5; // As office.js does when the globe opens it
+        window.desk.userData.drawers[2].position.z = 0.3;
+        window.engine.requestRender();
+    }""")
+    wait_for_frames(page, 3)
+    opened = page.evaluate(ZONE_STATE)
+    assert opened["culled"] == []
+    assert opened["safePickable"]
+    assert opened["calls"] > closed["calls"]
+
+    # Open, but the doorway is behind the camera
+    look(page, 0, 3, -5, 3)
+    assert "hidden_room" in page.evaluate(ZONE_STATE)["culled"]
+
+    # Standing inside the hidden room it stays visible whichever way the camera faces
+    look(page, 6.7, -1.5, 8, -1.5)
+    assert "hidden_room" not in page.evaluate(ZONE_STATE)["culled"]
+
+
+# A synthetic portal graph with its own camera: main -> a (door) -> b (always open).
+# a's portal sits 5 m in front of the camera at the origin; b is only reachable through a.
+PORTAL_GRAPH = """async () => {
+    const THREE = await import('three');
+    const { VisibilityZones } = await import('./assets/js/visibilityZones.js');
+    const { ZONE_CULLED_LAYER } = await import('./assets/js/constants.js');
+
+    const camera = new THREE.PerspectiveCamera(60, 1, 0.1, 100);
+    const box = (x, z) => new THREE.Box3(new THREE.Vector3(x - 1, -1, z - 1), new THREE.Vector3(x + 1, 1, z + 1));
+    const group = () => {
+        const root = new THREE.Group();
+        root.add(new THREE.Object3D());
+        return root;
+    };
+    const a = group();
+    const b = group();
+    let doorOpen = false;
+
+    const zones = new VisibilityZones(camera);
+    zones.addZone('a', { objects: [a], bounds: box(0, -10) });
+    zones.addZone('b', { objects: [b] });
+    zones.addPortal('main', 'a', { isOpen: () => doorOpen, bounds: box(0, -5) });
+    zones.addPortal('a', 'b', { isOpen: () => true });
+
+    const look = (x, z, targetX, targetZ) => {
+        camera.position.set(x, 0, z);
+        camera.lookAt(targetX, 0, targetZ);
+        zones.update();
+        return zones.culled.sort();
+    };
+    const hidden = obj => obj.layers.mask === (1 << ZONE_CULLED_LAYER);
+
+    const result = {};
+    result.closed = look(0, 0, 0, -1);
+    const late = new THREE.Object3D();
+    a.add(late); // Spawned while the zone is culled
+    zones.update();
+    result.lateHidden = hidden(late);
+
+    doorOpen = true;
+    result.open = look(0, 0, 0, -1);
+    result.restored = [a, ...a.children, b].every(obj => obj.layers.mask === 1);
+    result.openBehind = look(0, 0, 0, 1);
+    result.insideA = look(0, -10, 0, 1);
+    return result;
+}"""
+
+
+def test_portal_graph_culls_closed_and_out_of_view_portals(open_room):
+    page = open_room("/classroom.html")
+    result = page.evaluate(PORTAL_GRAPH)
+
+    assert result["closed"] == ["a", "b"]
+    assert result["lateHidden"]
+    assert result["open"] == []
+    assert result["restored"]
+    # Open, but the portal is behind the camera
+    assert result["openBehind"] == ["a", "b"]
+    # Standing inside a, b is reached through its open portal whichever way the camera faces
+    assert result["insideA"] == []
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
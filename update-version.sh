@@ -13,3 +13,6 @@ for file in *.html; do
 done
 
 echo "✓ Updated cache-busting version to: $COMMIT_HASH"
+
+# Keep the modulepreload hints in step with the import graph
+python3 "$(dirname "$0")/build_module_manifest.py"
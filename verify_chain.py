@@ -1,86 +1,61 @@
-import asyncio
-from playwright.async_api import async_playwright
-import json
-import base64
-
-async def run():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        # Force trail mode via URL param
-        # {"config":{"mode":"trail"}} -> eyJjb25maWciOnsibW9kZSI6InRyYWlsIn19
-        url = "http://127.0.0.1:8081/office.html?data=eyJjb25maWciOnsibW9kZSI6InRyYWlsIn19"
-        print(f"Navigating to {url}")
-        await page.goto(url)
-        
-        # Wait for game to load
-        await page.wait_for_timeout(2000)
-        
-        # Get the first object from gameLogic
-        first_obj = await page.evaluate("""() => {
-            const map = window.gameLogic.locationMap;
-            return Object.keys(map).find(key => map[key] === 0);
-        }""")
-        
-        print(f"First object is: {first_obj}")
-        
-        if not first_obj:
-            print("Error: Could not find first object in locationMap")
-            await browser.close()
-            return
-
-        # Click the object to open modal
-        # We need to simulate a click on the object. 
-        # Since it's a 3D canvas, we can't click the element directly easily.
-        # But we can call showModal directly if we want to test UI logic, 
-        # OR we can try to trigger the interaction via JS if possible.
-        # ui.js exports showModal. We can try to reach it?
-        # ui.js is a module, not exposed.
-        # But we exposed gameLogic. 
-        # Let's try to simulate the "wrong answer" flow by calling the handler directly?
-        # No, that defeats the purpose of integration test.
-        
-        # However, we can use the `showModal` function if we can get a handle to it.
-        # Or we can just inspect the state changes after we *simulate* the logic.
-        
-        # Actually, since we can't easily click 3D objects in headless mode without coordinate mapping,
-        # let's verify the logic by calling the functions directly in the console context
-        # to ensure they modify the state as expected.
-        
-        print("Testing Reset Chain Logic...")
-        
-        # 1. Verify initial state
-        step = await page.evaluate("window.gameLogic.currentStep")
-        print(f"Initial Step: {step}")
-        assert step == 0
-        
-        # 2. Advance step manually to simulate progress
-        await page.evaluate("window.gameLogic.advanceStep()")
-        step = await page.evaluate("window.gameLogic.currentStep")
-        print(f"Step after advance: {step}")
-        assert step == 1
-        
-        # 3. Call resetChain
-        await page.evaluate("window.gameLogic.resetChain()")
-        step = await page.evaluate("window.gameLogic.currentStep")
-        print(f"Step after reset: {step}")
-        assert step == 0
-        print("PASS: Reset Chain logic works")
-        
-        # 4. Test Shuffle
-        print("Testing Shuffle Logic...")
-        initial_map = await page.evaluate("JSON.stringify(window.gameLogic.locationMap)")
-        await page.evaluate("window.gameLogic.shuffleAllClues()")
-        new_map = await page.evaluate("JSON.stringify(window.gameLogic.locationMap)")
-        
-        print(f"Initial Map: {initial_map}")
-        print(f"New Map:     {new_map}")
-        
-        assert initial_map != new_map
-        print("PASS: Shuffle logic works (maps are different)")
-        
-        await browser.close()
+import pytest
+
+from conftest import GAME_READY
+
+# Force trail mode via URL param
+# {"config":{"mode":"trail"}} -> eyJjb25maWciOnsibW9kZSI6InRyYWlsIn19
+TRAIL_URL = "/office.html?data=eyJjb25maWciOnsibW9kZSI6InRyYWlsIn19"
+
+
+def test_trail_chain(open_room):
+    print(f"Navigating to {TRAIL_URL}")
+    page = open_room(TRAIL_URL, ready=GAME_READY)
+
+    # Get the first object from gameLogic
+    first_obj = page.evaluate("""() => {
+        const map = window.gameLogic.locationMap;
+        return Object.keys(map).find(key => map[key] === 0);
+    }""")
+
+    print(f"First object is: {first_obj}")
+    assert first_obj, "Could not find first object in locationMap"
+
+    # Since we can't easily click 3D objects in headless mode without coordinate mapping,
+    # verify the logic by calling the functions directly in the page context
+    # to ensure they modify the state as expected.
+
+    print("Testing Reset Chain Logic...")
+
+    # 1. Verify initial state
+    step = page.evaluate("window.gameLogic.currentStep")
+    print(f"Initial Step: {step}")
+    assert step == 0
+
+    # 2. Advance step manually to simulate progress
+    page.evaluate("window.gameLogic.advanceStep()")
+    step = page.evaluate("window.gameLogic.currentStep")
+    print(f"Step after advance: {step}")
+    assert step == 1
+
+    # 3. Call resetChain
+    page.evaluate("window.gameLogic.resetChain()")
+    step = page.evaluate("window.gameLogic.currentStep")
+    print(f"Step after reset: {step}")
+    assert step == 0
+    print("PASS: Reset Chain logic works")
+
+    # 4. Test Shuffle
+    print("Testing Shuffle Logic...")
+    initial_map = page.evaluate("JSON.stringify(window.gameLogic.locationMap)")
+    page.evaluate("window.gameLogic.shuffleAllClues()")
+    new_map = page.evaluate("JSON.stringify(window.gameLogic.locationMap)")
+
+    print(f"Initial Map: {initial_map}")
+    print(f"New Map:     {new_map}")
+
+    assert initial_map != new_map
+    print("PASS: Shuffle logic works (maps are different)")
+
 
 if __name__ == "__main__":
-    asyncio.run(run())
+    raise SystemExit(pytest.main([__file__, "-q", "-s"]))
@@ -1,27 +1,29 @@
 
-import asyncio
-from playwright.async_api import async_playwright
+import pytest
 
-async def main():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        context = await browser.new_context(has_touch=True)
-        page = await context.new_page()
+from conftest import ENGINE_READY, wait_for_frames
 
-        # Enable DEV mode to expose camera
-        await page.add_init_script("window.__DEV__ = true;")
 
-        await page.goto("http://localhost:8000/office.html")
-        await page.wait_for_selector('#instructions')
-        await page.click('#instructions')
+@pytest.fixture
+def context_options():
+    return {"has_touch": True}
 
-        await page.evaluate('() => { window.camera.position.set(2, 1.6, 2); }')
-        await page.evaluate('() => { window.camera.lookAt(0, 1, 0); }')
 
-        await asyncio.sleep(2)
+def test_scene_screenshot(dev_page):
+    # dev_page sets window.__DEV__ to expose camera
+    page = dev_page
 
-        await page.screenshot(path="verification_scene.png")
+    page.goto("/office.html")
+    page.wait_for_selector('#instructions')
+    page.click('#instructions')
+    page.wait_for_function(ENGINE_READY)
 
-        await browser.close()
+    page.evaluate('() => { window.camera.position.set(2, 1.6, 2); }')
+    page.evaluate('() => { window.camera.lookAt(0, 1, 0); }')
+    wait_for_frames(page)
 
-asyncio.run(main())
+    page.screenshot(path="verification_scene.png")
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -1,67 +1,107 @@
 
-import asyncio
-from playwright.async_api import async_playwright
-import math
-
-async def main():
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        context = await browser.new_context(has_touch=True)
-        page = await context.new_page()
-
-        # Enable DEV mode to expose camera
-        await page.add_init_script("window.__DEV__ = true;")
-
-        print("Navigating to blank_room_template.html...")
-        await page.goto("http://localhost:8000/blank_room_template.html")
-        await page.wait_for_selector('#instructions', state="visible")
-        await page.click('#instructions')
-
-        # Wait for scene initialization (models loading)
-        await asyncio.sleep(2)
-
-        # 1. View Corner (Back-Left: X=-5, Z=-5)
-        # Position camera inside room looking at corner
-        print("Taking screenshot of corner...")
-        await page.evaluate('''() => {
-            window.camera.position.set(-2, 1.5, -2);
-            window.camera.lookAt(-5, 1.5, -5);
-        }''')
-        await asyncio.sleep(0.5)
-        await page.screenshot(path="verification_corner.png")
-
-        # 2. View Ceiling and Floor
-        print("Taking screenshot of ceiling and floor...")
-        await page.evaluate('''() => {
-            window.camera.position.set(0, 1.5, 0);
-            window.camera.lookAt(0, 0, -5); // Look at back wall
-            window.camera.rotateX(0.5); // Look slightly up/down? No, let's just use wide angle or look up then down
-        }''')
-
-        # Look Up (Ceiling)
-        await page.evaluate('''() => {
-             window.camera.lookAt(0, 3, 0);
-        }''')
-        await asyncio.sleep(0.5)
-        await page.screenshot(path="verification_ceiling.png")
-
-        # Look Down (Floor)
-        await page.evaluate('''() => {
-             window.camera.lookAt(0, 0, 0);
-        }''')
-        await asyncio.sleep(0.5)
-        await page.screenshot(path="verification_floor.png")
-
-        # 3. View Door and Timer (Right Wall: X=5)
-        print("Taking screenshot of door...")
-        await page.evaluate('''() => {
-            window.camera.position.set(2, 1.5, 0);
-            window.camera.lookAt(5, 1.5, 0);
-        }''')
-        await asyncio.sleep(0.5)
-        await page.screenshot(path="verification_door.png")
-
-        await browser.close()
-        print("Verification screenshots saved.")
-
-asyncio.run(main())
+import pytest
+
+from conftest import TEMPLATE_READY, wait_for_frames
+
+
+@pytest.fixture
+def context_options():
+    return {"has_touch": True}
+
+
+def test_template_screenshots(dev_page):
+    # dev_page sets window.__DEV__ to expose camera
+    page = dev_page
+
+    print("Navigating to blank_room_template.html...")
+    page.goto("/blank_room_template.html")
+    page.wait_for_selector('#instructions', state="visible")
+    page.click('#instructions')
+
+    # Wait for scene initialization
+    page.wait_for_function(TEMPLATE_READY)
+    wait_for_frames(page)
+
+    # 1. View Corner (Back-Left: X=-5, Z=-5)
+    # Position camera inside room looking at corner
+    print("Taking screenshot of corner...")
+    page.evaluate('''() => {
+        window.camera.position.set(-2, 1.5, -2);
+        window.camera.lookAt(-5, 1.5, -5);
+    }''')
+    wait_for_frames(page)
+    page.screenshot(path="verification_corner.png")
+
+    # 2. View Ceiling and Floor
+    print("Taking screenshot of ceiling and floor...")
+    page.evaluate('''() => {
+        window.camera.position.set(0, 1.5, 0);
+        window.camera.lookAt(0, 0, -5); // Look at back wall
+    }''')
+
+    # Look Up (Ceiling)
+    page.evaluate('''() => {
+         window.camera.lookAt(0, 3, 0);
+    }''')
+    wait_for_frames(page)
+    page.screenshot(path="verification_ceiling.png")
+
+    # Look Down (Floor)
+    page.evaluate('''() => {
+         window.camera.lookAt(0, 0, 0);
+    }''')
+    wait_for_frames(page)
+    page.screenshot(path="verification_floor.png")
+
+    # 3. View Door and Timer (Right Wall: X=5)
+    print("Taking screenshot of door...")
+    page.evaluate('''() => {
+        window.camera.position.set(2, 1.5, 0);
+        window.camera.lookAt(5, 1.5, 0);
+    }''')
+    wait_for_frames(page)
+    page.screenshot(path="verification_door.png")
+
+    print("Verification screenshots saved.")
+
+
+# Synthetic touch pointers on the canvas, as PointerInput receives them from a finger
+TOUCH_DRAG = """([x, y, dx, dy]) => {
+    const canvas = window.renderer.domElement;
+    const send = (type, clientX, clientY) => canvas.dispatchEvent(new PointerEvent(type, {
+        pointerId: 7, pointerType: 'touch', isPrimary: true, bubbles: true, clientX, clientY
+    }));
+    send('pointerdown', x, y);
+    send('pointermove', x + dx, y + dy);
+    window.__touchEnd = () => send('pointerup', x + dx, y + dy);
+}"""
+
+
+def test_template_touch_controls(dev_page):
+    page = dev_page
+    page.goto("/blank_room_template.html")
+    page.wait_for_selector('#instructions', state="visible")
+    page.click('#instructions')
+    page.wait_for_function(TEMPLATE_READY)
+    page.evaluate("() => { window.camera.position.set(0, 1.5, 0); window.camera.lookAt(0, 1.5, -5); }")
+    wait_for_frames(page)
+    size = page.viewport_size
+
+    # Dragging on the right half turns the camera
+    yaw = page.evaluate("() => window.camera.rotation.y")
+    page.evaluate(TOUCH_DRAG, [size["width"] * 0.75, size["height"] / 2, 100, 0])
+    wait_for_frames(page)
+    page.evaluate("() => window.__touchEnd()")
+    assert page.evaluate("() => window.camera.rotation.y") != pytest.approx(yaw)
+
+    # Pushing the joystick (left half) up walks forward
+    start = page.evaluate("() => window.camera.position.toArray()")
+    page.evaluate(TOUCH_DRAG, [size["width"] * 0.25, size["height"] / 2, 0, -60])
+    wait_for_frames(page, 10)
+    page.evaluate("() => window.__touchEnd()")
+    end = page.evaluate("() => window.camera.position.toArray()")
+    assert end != pytest.approx(start)
+
+
+if __name__ == "__main__":
+    raise SystemExit(pytest.main([__file__, "-q", "-s"]))
@@ -1,13 +1,17 @@
 
-from playwright.sync_api import Page, expect, sync_playwright
-import time
+import pytest
+from playwright.sync_api import Page
+
+from conftest import ENGINE_READY, wait_for_frames
 
 def test_ui_elements(page: Page):
     # 1. Go to the page
-    page.goto("http://localhost:8000/classroom.html")
+    page.goto("/classroom.html")
 
-    # Wait for fonts to load (approx)
-    page.wait_for_timeout(1000)
+    # Wait for fonts to load and the first frames to render
+    page.evaluate("() => document.fonts.ready.then(() => true)")
+    page.wait_for_function(ENGINE_READY)
+    wait_for_frames(page)
     
     # 2. Screenshot the full scene without UI overlays
     page.screenshot(path="verification_classroom_scene.png", full_page=True)
@@ -23,7 +27,6 @@ def test_ui_elements(page: Page):
     # but the event listener also hides #instructions on 'lock' event.
     # Let's manually hide it to simulate.
     page.evaluate("document.getElementById('instructions').style.display = 'none'")
-    page.wait_for_timeout(500)
 
     # 4. Trigger a modal to see the new style
     # We can expose a function or just call showModal if it's in scope.
@@ -44,7 +47,7 @@ def test_ui_elements(page: Page):
         const optC = document.getElementById('optionsContainer');
         optC.innerHTML = '<button class="option-btn">Option 1</button><button class="option-btn">Option 2</button>';
     """)
-    page.wait_for_timeout(500)
+    page.wait_for_selector("#clueModal", state="visible")
     page.screenshot(path="verification_classroom_modal.png")
     print("Classroom Modal screenshot taken.")
 
@@ -58,12 +61,4 @@ def test_ui_elements(page: Page):
     # Let's just verify the 2D UI elements for now as that was the bulk of the "Digital Elements" design work.
 
 if __name__ == "__main__":
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
-        try:
-            test_ui_elements(page)
-        except Exception as e:
-            print(f"Error: {e}")
-        finally:
-            browser.close()
+    raise SystemExit(pytest.main([__file__, "-q", "-s"]))